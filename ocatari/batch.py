@@ -0,0 +1,339 @@
+"""
+Batched offline extraction: the neurosymbolic states of recorded RAM states, computed for a whole array
+of shape (N, 128) at once with vectorized numpy kernels, instead of updating the objects frame by frame.
+
+The states are the ones of the per-frame path (:func:`extract_frames`): the objects freshly initialized
+(as after a reset), then updated with every RAM state in order. The sticky objects (kept where they were
+when the RAM does not define them) are forward filled, the objects depending on the previous frames
+(e.g. the bullets of SpaceInvaders) are derived from the shifted RAM states. The games described by a
+declarative spec (see :mod:`ocatari.ram.spec`) use the kernel compiled from it. The games without a kernel,
+or whose RAM states a kernel does not handle, fall back to the per-frame path.
+"""
+
+import numpy as np
+from ocatari.extraction import ExtractionPlan, get_game_module
+from ocatari.ram.extract_ram_info import init_objects
+from ocatari.ns_state import NSStateLayout
+from ocatari.ram._helper_methods import BCD_TABLE
+from ocatari.ram.spec import forward_fill, previous_frames
+
+# Vectorized kernels, per game (lower case)
+_KERNELS = {}
+
+
+def register_batch_kernel(game_name, kernel):
+    """
+    Registers the vectorized extraction of a game, used by :func:`extract_batch`.
+
+    :param game_name: The name of the game (e.g. "Pong")
+    :type game_name: str
+    :param kernel: A function `kernel(rams, hud)`, getting the RAM states as an (N, 128) int64 array,
+                   and returning the positions (N, nb_slots, 2) and visibility (N, nb_slots) of the object slots,
+                   or None if it cannot handle these RAM states (the per-frame path is then used).
+    :type kernel: callable
+    """
+    _KERNELS[game_name.lower()] = kernel
+
+
+def batch_games():
+    """
+    The games with a vectorized kernel (the registered ones, not the ones of the RAM specs).
+
+    :rtype: list of str
+    """
+    return sorted(_KERNELS)
+
+
+def _spec_kernel(game_name):
+    """
+    The kernel compiled from the RAM spec of the game, if its detector is the spec's.
+    """
+    module = get_game_module(game_name)
+    spec = getattr(module, "RAM_SPEC", None)
+    detector = getattr(module, "_detect_objects_ram", None)
+    if spec is None or detector is not spec.detector:
+        return None
+    return lambda rams, hud: spec.batch(
+        rams, init_objects(game_name, hud), hud)
+
+
+def _check_rams(rams):
+    rams = np.asarray(rams)
+    if rams.ndim != 2 or rams.shape[1] != 128:
+        raise ValueError(
+            f"Expected RAM states of shape (N, 128), got {rams.shape}")
+    return rams.astype(np.uint8, copy=False)
+
+
+def extract_frames(game_name, rams, hud=False, dtype=np.int16):
+    """
+    The per-frame path: updates freshly initialized objects with every RAM state in order, with the game's
+    detector (see :class:`ocatari.extraction.ExtractionPlan`), and writes their neurosymbolic states.
+
+    :param game_name: The name of the game (e.g. "Pong")
+    :type game_name: str
+    :param rams: The RAM states, in order
+    :type rams: np.ndarray of uint8, (N, 128)
+    :param hud: Whether to include or not objects from the HUD (e.g. scores, lives)
+    :type hud: bool
+    :param dtype: The dtype of the states
+    :type dtype: np.dtype
+
+    :return: The neurosymbolic states (N, state_size), and the visibility of the object slots (N, nb_slots)
+    :rtype: (np.ndarray, np.ndarray of bool)
+    """
+    rams = _check_rams(rams)
+    plan = ExtractionPlan(game_name, hud)
+    objects = plan.init_objects()
+    layout = NSStateLayout(objects, dtype)
+    size, nb_slots = len(layout), len(objects)
+    states = np.zeros((len(rams), size), dtype=dtype)
+    visible = np.zeros((len(rams), nb_slots), dtype=bool)
+    for t, ram in enumerate(rams):
+        plan(objects, ram)
+        state = layout.write(objects)
+        if len(state) != size or len(objects) != nb_slots:
+            raise ValueError(
+                f"The neurosymbolic state of {game_name} changed size at frame {t}, "
+                "it cannot be stored in an array")
+        states[t] = state
+        visible[t] = [bool(o) for o in objects]
+    return states, visible
+
+
+def extract_batch(game_name, rams, hud=False, dtype=np.int16):
+    """
+    The neurosymbolic states of recorded RAM states (see the module documentation), computed with the
+    vectorized kernel of the game (see :func:`batch_games`) or the one of its RAM spec,
+    or with :func:`extract_frames` if it has none.
+
+    :param game_name: The name of the game (e.g. "Pong")
+    :type game_name: str
+    :param rams: The RAM states, in order (e.g. a recorded episode)
+    :type rams: np.ndarray of uint8, (N, 128)
+    :param hud: Whether to include or not objects from the HUD (e.g. scores, lives)
+    :type hud: bool
+    :param dtype: The dtype of the states
+    :type dtype: np.dtype
+
+    :return: The neurosymbolic states (N, state_size), and the visibility of the object slots (N, nb_slots)
+    :rtype: (np.ndarray, np.ndarray of bool)
+
+    Example::
+
+        rams = np.load("pong_rams.npy")  # (N, 128)
+        states, visible = extract_batch("Pong", rams)
+        ball_xy = states[:, 2:4]
+    """
+    rams = _check_rams(rams)
+    kernel = _KERNELS.get(game_name.lower()) or _spec_kernel(game_name)
+    result = None
+    if kernel is not None and len(rams):
+        # Python int arithmetic on the RAM bytes, as the detectors do with the
+        # numpy scalars
+        result = kernel(rams.astype(np.int64), hud)
+    if result is None:
+        return extract_frames(game_name, rams, hud, dtype)
+    xy, visible = result
+    states = np.where(visible[..., None], xy, 0)
+    states = states.reshape(len(rams), -1).astype(dtype)
+    return states, visible
+
+
+def _slots(n, nb_slots):
+    xy = np.zeros((n, nb_slots, 2), dtype=np.int64)
+    return xy, np.ones((n, nb_slots), dtype=bool)
+
+
+def _pong(rams, hud):
+    xy, visible = _slots(len(rams), 5 if hud else 3)
+    player, ball, enemy = rams[:, 51], rams[:, 49], rams[:, 50]
+    # kept where the RAM has none
+    player_xy = np.stack([np.full_like(player, 140),
+                          np.where(player < 47, 34, player - 13)], 1)
+    xy[:, 0] = forward_fill(player_xy, player > 13, 0)
+    ball_xy = np.stack([ball - 49, rams[:, 54] - 14], 1)
+    xy[:, 1] = forward_fill(ball_xy, (rams[:, 54] != 0) & (ball > 49), 0)
+    enemy_xy = np.stack([np.full_like(enemy, 16),
+                         np.where(enemy - 15 < 34, 34, enemy - 15)], 1)
+    xy[:, 2] = forward_fill(enemy_xy, enemy > 33, 0)
+    if hud:
+        xy[:, 3, 0] = np.where(rams[:, 14] >= 10, 104, 116)
+        xy[:, 4, 0] = np.where(rams[:, 13] >= 10, 24, 36)
+        xy[:, 3:, 1] = 1
+    return xy, visible
+
+
+def _breakout_bitmap_indices():
+    """
+    The (byte, bit) of every block of the bitmap of `breakout._make_block_bitmap`, whose 20 columns read
+    bit 6 of the 6th byte of the row, bits 0, 2, 4, 6 of the 5th to 2nd, and bits 0, 2, 4 of the 1st
+    (reordered by `correct_order`), the rows being read from the last one.
+    """
+    columns = [(5, 6)] + [(a, b) for a in (4, 3, 2, 1)
+                          for b in (0, 2, 4, 6)] + [(0, 0), (0, 2), (0, 4)]
+    order = [0, 4, 3, 2, 1, 5, 6, 7, 8, 11, 12, 16, 15, 14, 13, 17, 18, 19]
+    byte = np.array([[6 * columns[c][0] + 5 - row for c in order]
+                     for row in range(6)])
+    bit = np.array([columns[c][1] for c in order])
+    return byte, bit
+
+
+_BREAKOUT_BYTES, _BREAKOUT_BITS = _breakout_bitmap_indices()
+
+
+def _breakout(rams, hud):
+    # bitmap rows of another length, not handled by the detector either
+    if (rams[:, :6] >= 64).any():
+        return None
+    n = len(rams)
+    xy, visible = _slots(n, 113 if hud else 110)
+    xy[:, 0] = np.stack([rams[:, 72] - 47, np.full(n, 189)], 1)
+    ball_y = rams[:, 101] + 9
+    xy[:, 1] = np.stack([rams[:, 99] - 49, ball_y], 1)
+    visible[:, 1] = (ball_y <= 196) & (rams[:, 101] != 0)
+    # a block slot per column, visible where a run of bricks starts
+    bitmap = (rams[:, _BREAKOUT_BYTES] >> _BREAKOUT_BITS) & 1 == 1
+    starts = bitmap.copy()
+    starts[:, :, 1:] &= ~bitmap[:, :, :-1]
+    visible[:, 2:110] = starts.reshape(n, -1)
+    xy[:, 2:110, 0] = np.tile(8 + 8 * np.arange(18), 6)
+    xy[:, 2:110, 1] = np.repeat(57 + 6 * np.arange(6), 18)
+    if hud:
+        xy[:, 110] = np.where((rams[:, 76] == 1)[:, None], (40, 5), (36, 5))
+        lives = rams[:, 57]
+        lives_xy = np.where((lives == 1)[:, None], (104, 5), (100, 5))
+        xy[:, 111] = forward_fill(lives_xy, lives <= 1, (100, 5))
+        xy[:, 112] = 136, 5
+    return xy, visible
+
+
+def _freeway(rams, hud):
+    xy, visible = _slots(len(rams), 14 if hud else 12)
+    xy[:, 0] = np.stack([np.full(len(rams), 44), 193 - rams[:, 14]], 1)
+    xy[:, 1] = np.stack([np.full(len(rams), 108), 193 - rams[:, 15]], 1)
+    xy[:, 2:12, 0] = rams[:, 117:107:-1] - 3
+    xy[:, 2:12, 1] = 27 + 16 * np.arange(10)
+    if hud:
+        # moved once a score reached 10
+        reached = np.logical_or.accumulate(
+            BCD_TABLE[rams[:, 103:105]] >= 10, axis=0)
+        xy[:, 12:14, 0] = np.where(reached, (41, 105), (49, 113))
+        xy[:, 12:14, 1] = 5
+    return xy, visible
+
+
+def _boxing(rams, hud):
+    xy, visible = _slots(len(rams), 5 if hud else 2)
+    xy[:, 0] = np.stack([rams[:, 32] + 5, rams[:, 34] + 38], 1)
+    xy[:, 1] = np.stack([rams[:, 33] + 4, rams[:, 35] + 38], 1)
+    if hud:
+        xy[:, 2, 0] = np.where(rams[:, 18] > 10, 39, 47)
+        xy[:, 3, 0] = np.where(rams[:, 19] > 10, 103, 111)
+        xy[:, 2:4, 1] = 5
+        xy[:, 4] = 63, 17
+    return xy, visible
+
+
+def _tennis(rams, hud):
+    xy, visible = _slots(len(rams), 6 if hud else 4)
+    orientation = rams[:, 80]
+    up = np.stack([rams[:, 26] - 1, 166 - rams[:, 24]], 1)
+    down = np.stack([rams[:, 27] - 1, 166 - rams[:, 25]], 1)
+    # swapped with the field orientation, kept for the other values
+    player_up = (orientation == 0)[:, None]
+    xy[:, 0] = forward_fill(np.where(player_up, up, down), orientation <= 1, 0)
+    xy[:, 1] = forward_fill(np.where(player_up, down, up), orientation <= 1, 0)
+    in_play = rams[:, 16] > 2
+    ball_x = rams[:, 16] - 2
+    ball_y, shadow_y = 189 - rams[:, 54], 189 - rams[:, 55]
+    xy[:, 2] = np.stack([ball_x, ball_y], 1)
+    xy[:, 3] = np.stack([ball_x, shadow_y], 1)
+    visible[:, 2] = in_play & ~((98 < ball_y) & (ball_y < 113))
+    shadow_hidden = ((100 < shadow_y) & (shadow_y < 113)) \
+        | (shadow_y == ball_y) | (shadow_y == 0)
+    visible[:, 3] = in_play & ~shadow_hidden
+    if hud:
+        player_games, enemy_games = rams[:, 7], rams[:, 6]
+        for slot, points, games, others, x in ((4, rams[:, 69], player_games, enemy_games, 49),
+                                               (5, rams[:, 70], enemy_games, player_games, 113)):
+            score = np.minimum(15 * points, 40)
+            # deuce and advantages
+            deuce = (games == 10) & ((others == 11) | (others == 12))
+            advantage = (games == 8) | deuce
+            wide = advantage | ((score != 0) & (score != 15))
+            xy[:, slot, 0] = np.where(wide, x - 8,
+                                      np.where(score == 0, x, x - 7))
+            xy[:, slot, 1] = 5
+    return xy, visible
+
+
+def _spaceinvaders_bullets(y):
+    """
+    The visibility of a bullet slot: a bullet is shown if the position of the previous frame was on screen,
+    the emptied slots (a new NoObject at (0, 0)) staying empty one more frame. The initial bullet is at (0, 0).
+    """
+    n = len(y)
+    # frame t at index t + 2, t = -1 being the initial bullet
+    on_screen = np.zeros(n + 2, dtype=bool)
+    on_screen[2:] = (20 < y) & (y < 195)
+    visible = np.zeros(n + 2, dtype=bool)
+    visible[1] = True
+    visible[2:] = on_screen[1:-1]
+    # a bullet reappearing right after being emptied stays hidden, in order
+    # (rare, sequential)
+    for t in np.flatnonzero(on_screen[2:-1] & ~on_screen[1:-2]) + 3:
+        if visible[t - 2]:
+            visible[t] = False
+    return visible[2:]
+
+
+def _spaceinvaders(rams, hud):
+    rows = rams[:, 18:24]
+    # bitmap rows of another length, not handled by the detector either
+    if (rows >= 64).any():
+        return None
+    n = len(rams)
+    xy, visible = _slots(n, 47 if hud else 44)
+    xy[:, 0] = np.stack([rams[:, 28] - 1, np.full(n, 185)], 1)
+    # aliens: the k-th slot from the end shows the k-th alien of the bitmap, but the positions are set
+    # on the slots of the previous frame (a new alien is at (0, 0) for a frame)
+    empty_columns = 6 - np.frexp(rows.max(axis=1))[1]
+    shifts = 5 - np.arange(6) - empty_columns[:, None]
+    shifted = rows[:, :, None] >> np.maximum(shifts, 0)[:, None, :]
+    bitmap = shifted & 1 & (shifts >= 0)[:, None, :]
+    aliens = bitmap.reshape(n, 36)[:, ::-1] == 1
+    previous = previous_frames(aliens, True)
+    i, j = np.divmod(np.arange(36), 6)
+    alien_x = rams[:, 26, None] - 1 + (j - empty_columns[:, None]) * 16
+    alien_y = 31 + rams[:, 16, None] * 2 + i * 18
+    xy[:, 8:44, 0] = np.where(previous, alien_x, 0)
+    xy[:, 8:44, 1] = np.where(previous, alien_y, 0)
+    visible[:, 8:44] = aliens
+    # shields: shown again with all the aliens, hidden once an alien reaches
+    # them
+    down = (previous & (alien_y + 10 >= 157)).any(axis=1)
+    shown = forward_fill(~down, down | (rows.sum(axis=1) == 378), True)
+    visible[:, 1:4] = shown[:, None]
+    upper = np.zeros(n, dtype=np.int64)
+    for s in range(3):
+        cells = rams[:, 43 + 9 * s:52 + 9 * s] != 0
+        # kept from the previous shield if empty
+        upper = np.where(cells.any(axis=1), 2 * cells.argmax(axis=1), upper)
+        xy[:, 1 + s] = np.stack([np.full(n, 42 + 32 * s), 157 + upper], 1)
+    for s, (x, y) in enumerate(((83, 81), (84, 82), (87, 85))):
+        xy[:, 4 + s] = np.stack([rams[:, x] - 2, 2 * rams[:, y] + 3], 1)
+        visible[:, 4 + s] = _spaceinvaders_bullets(xy[:, 4 + s, 1])
+    satellite = rams[:, 30]
+    visible[:, 7] = (satellite != 0) & (satellite != 180)
+    xy[:, 7] = np.stack([satellite - 1, np.full(n, 12)], 1)
+    if hud:
+        xy[:, 44:47] = (4, 10), (84, 10), (84, 185)
+        visible[:, 44:46] = ~visible[:, 7, None]
+        visible[:, 46] = rams[:, 120] != 0
+    return xy, visible
+
+
+for _game, _kernel in (("Pong", _pong), ("Breakout", _breakout), ("Freeway", _freeway),
+                       ("Boxing", _boxing), ("Tennis", _tennis), ("SpaceInvaders", _spaceinvaders)):
+    register_batch_kernel(_game, _kernel)
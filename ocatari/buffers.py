@@ -0,0 +1,103 @@
+"""
+Preallocated observation stacks used by the OCAtari environments.
+"""
+
+import numpy as np
+
+
+class FrameStack:
+    """
+    A circular, preallocated stack of the last `window_size` frames, replacing a `deque(maxlen=window_size)`.
+    Every frame is written twice in a buffer of size 2 * window_size, such that the latest window
+    is always available as a contiguous, zero-copy view, ordered from the oldest to the newest frame.
+
+    :param window_size: The number of stacked frames.
+    :type window_size: int
+    :param dtype: The dtype of the frames (e.g. `np.uint8` for images).
+    :type dtype: np.dtype
+    :param shape: The shape of a single frame. If None, it is taken from the first appended frame.
+    :type shape: tuple
+    """
+
+    def __init__(self, window_size, dtype=np.uint8, shape=None):
+        self.window_size = window_size
+        self.dtype = np.dtype(dtype)
+        self._buffer = None
+        self._pos = 0
+        self._len = 0
+        if shape is not None:
+            self._allocate(shape)
+
+    def _allocate(self, shape):
+        self._buffer = np.zeros(
+            (2 * self.window_size,) + tuple(shape), dtype=self.dtype)
+
+    def append(self, frame):
+        """
+        Adds a frame on top of the stack, dropping the oldest one if the stack is full.
+        """
+        if self._buffer is None:
+            self._allocate(np.shape(frame))
+        self._buffer[self._pos] = frame
+        self._buffer[self._pos + self.window_size] = self._buffer[self._pos]
+        self._pos = (self._pos + 1) % self.window_size
+        if self._len < self.window_size:
+            self._len += 1
+
+    def fill(self, frame):
+        """
+        Fills the whole window with the given frame (e.g. after a reset).
+        """
+        if self._buffer is None:
+            self._allocate(np.shape(frame))
+        self._buffer[:] = frame
+        self._pos = 0
+        self._len = self.window_size
+
+    def restore(self, frames):
+        """
+        Replaces the stack with the given frames (oldest first), e.g. from a saved :meth:`view`.
+        """
+        if self._buffer is None:
+            self._allocate(np.shape(frames)[1:])
+        n = len(frames)
+        self._buffer[:n] = frames
+        self._buffer[self.window_size:self.window_size + n] = frames
+        self._pos = n % self.window_size
+        self._len = n
+
+    def clear(self):
+        """
+        Empties the stack (the memory is kept).
+        """
+        self._pos = 0
+        self._len = 0
+
+    def view(self):
+        """
+        The stacked frames (oldest first), as a view on the internal buffer.
+        The view is only valid until the next append.
+
+        :rtype: np.ndarray
+        """
+        if self._buffer is None:
+            return np.zeros((0,), dtype=self.dtype)
+        end = self._pos + self.window_size
+        return self._buffer[end - self._len:end]
+
+    @property
+    def shape(self):
+        return self.view().shape
+
+    def __array__(self, dtype=None, copy=None):
+        # np.array(stack) returns a copy, as for the deques it replaces
+        return np.array(self.view(), dtype=dtype)
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        return self.view()[index]
+
+    def __iter__(self):
+        return iter(self.view())
@@ -1,16 +1,20 @@
-from collections import deque
 import numpy as np
 import gymnasium as gym
-from itertools import chain
 from ocatari.ram.extract_ram_info import (
-    detect_objects_ram, get_max_objects, get_object_state_size,
-    get_class_dict, init_objects, get_masked_dqn_gray_state,
+    get_max_objects,
+    get_class_dict, get_masked_dqn_gray_state,
     get_masked_dqn_bin_state, get_masked_dqn_pix_state
 )
-from ocatari.vision.extract_vision_info import detect_objects_vision
-from ocatari.vision.utils import mark_bb, to_rgba
+from ocatari.extraction import ExtractionPlan
 from ocatari.ram.game_objects import ValueObject
-from ocatari.utils import draw_label, draw_arrow
+from ocatari.buffers import FrameStack
+from ocatari.ns_state import NSStateLayout
+from ocatari.object_table import ObjectTable
+from ocatari.history import TrajectoryHistory, FEATURES
+from ocatari.schema import object_schema
+from ocatari.profiling import StepProfiler, StageTimer, NULL_TIMER
+from ocatari.snapshot import take_snapshot, restore_snapshot
+from ocatari.sticky import use_sticky_actions
 from gymnasium.error import NameNotFound
 
 try:
@@ -20,19 +24,36 @@ except ModuleNotFoundError:
     raise ModuleNotFoundError(
         '\nALE is required when using the ALE env wrapper. Try `pip install "gymnasium[atari, accept-rom-license]"`\n')
 
+# OpenCV and pygame are only imported when needed (DQN observations, rendering with the object overlay),
+# such that headless environments (e.g. RAM mode training on compute nodes) do not load them.
+cv2 = None
+pygame = None
 
-try:
-    # OpenCV is used for processing frames for observation (e.g., resizing, grayscaling)
-    import cv2
-except ModuleNotFoundError:
-    raise ModuleNotFoundError(
-        '\nOpenCV is required when using the ALE env wrapper. Try `pip install opencv-python`.')
 
-try:
-    import pygame  # Pygame is required for rendering the environment for human visualization
-except ModuleNotFoundError:
-    raise ModuleNotFoundError(
-        '\npygame is required for human rendering. Try `pip install pygame`.')
+def _require_cv2():
+    # OpenCV is used for processing frames for observation (e.g., resizing, grayscaling)
+    global cv2
+    if cv2 is None:
+        try:
+            import cv2 as _cv2
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                '\nOpenCV is required when using the ALE env wrapper. Try `pip install opencv-python`.')
+        cv2 = _cv2
+    return cv2
+
+
+def _require_pygame():
+    # Pygame is required for rendering the environment for human visualization
+    global pygame
+    if pygame is None:
+        try:
+            import pygame as _pygame
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                '\npygame is required for human rendering. Try `pip install pygame`.')
+        pygame = _pygame
+    return pygame
 
 # List of available games for the OCAtari environment
 AVAILABLE_GAMES = [
@@ -47,6 +68,8 @@ AVAILABLE_GAMES = [
 
 # Constant to control the upscaling factor for rendering
 UPSCALE_FACTOR = 5
+# The dtype of the neurosymbolic states, of their stacks and of the `obj` observation space
+NS_DTYPE = np.float32
 
 
 # The OCAtari environment provides an interface to interact with Atari 2600 games through Gymnasium, enabling object tracking and analysis. This environment extends the functionality of traditional Atari environments by incorporating different object detection modes (RAM, vision, or both) and supports enhanced observation spaces for advanced tasks like reinforcement learning.
@@ -62,13 +85,17 @@ class OCAtari:
     :type obs_mode: str
     :param buffer_window_size: The size of the buffer window for observation stacks.
     :type buffer_window_size: int
-    :param create_buffer_stacks: Decide what stacks you want to create. The obs_mode automatically add the fitting stack itself. Add "dqn" or "obj" if you want additional stacks.
+    :param create_buffer_stacks: Decide what stacks you want to create. The obs_mode automatically add the fitting stack itself. Add "ori", "dqn" or "obj" if you want additional stacks. RGB frames are only captured if needed (e.g. add "ori" for :meth:`aggregated_render`), see also :meth:`add_buffer_stack`.
     :type create_buffer_stacks: list
+    :param masked_dqn_direct: For the `masked_dqn*` observation modes, rasterize the objects directly at 84x84, instead of rasterizing them at 210x160 and resizing the result.
+    :type masked_dqn_direct: bool
+    :param exact_snapshots: Apply the sticky actions in OCAtari instead of ALE (see :class:`ocatari.sticky.StickyActionALE`), such that the snapshots restore the repeated action, e.g. for tree search. With ALE's sticky actions (the default), the seeded dynamics are the ones of ALE, but a restored snapshot may repeat the action played before the restore.
+    :type exact_snapshots: bool
 
     The remaining \*args and \**kwargs will be passed to the `gymnasium.make` function.
     """
 
-    def __init__(self, env_name, mode="ram", hud=False, obs_mode="obj", render_mode=None, render_oc_overlay=False, buffer_window_size=4, create_buffer_stacks=["ori"], *args, **kwargs):
+    def __init__(self, env_name, mode="ram", hud=False, obs_mode="obj", render_mode=None, render_oc_overlay=False, buffer_window_size=4, create_buffer_stacks=None, masked_dqn_direct=False, *args, exact_snapshots=False, **kwargs):
         # Determine the game name and check if it's supported
         # Extract the game name and ensure it's within the supported games
         game_name = env_name.split("/")[1].split("-")[0].split("No")[0].split("Deterministic")[
@@ -90,6 +117,11 @@ class OCAtari:
         gym_render_mode = "rgb_array" if render_oc_overlay else render_mode
         # Set the buffer window size for observations, allowing customization via kwargs
         self.buffer_window_size = buffer_window_size
+        # Copy, as the obs_mode stacks are added to it
+        create_buffer_stacks = list(create_buffer_stacks or [])
+        if obs_mode != "ori":
+            # The observation of the base env is replaced, let ALE return the RAM instead of copying the screen
+            kwargs.setdefault("obs_type", "ram")
 
         # Attempt to create the environment; fallback if necessary
         # Initialize the Atari environment with the specified rendering options
@@ -114,6 +146,9 @@ class OCAtari:
             self.obs_mode = "dqn"
             create_buffer_stacks.append("dqn")
             self._env.observation_space = gym.spaces.Box(0,255.0,(self.buffer_window_size,84,84))
+            # Reused buffer for the masked states
+            self._masked_dqn_state = np.zeros(
+                (84, 84) if masked_dqn_direct else (210, 160), dtype=np.uint8)
             if obs_mode == "dqn":
                 # Set stack for DQN mode (grayscale, 84x84)
                 self.get_dqn_state = self._get_state_dqn
@@ -136,16 +171,13 @@ class OCAtari:
             # Initialize slots to store all possible game objects
             self._slots = [self._class_dict[c](
             ) for c, n in self.max_objects_per_cat.items() for _ in range(n)]
-            # Initialize the neurosymbolic state representation with zeros
-            self._ns_state = np.zeros(
-                sum([len(o._nsrepr) for o in self._slots]))
-            # Store the meaning of each neurosymbolic state representation
+            # Store the meaning of each neurosymbolic state representation (computed once)
             self.ns_meaning = [
-                f"{o.category} ({o._ns_meaning})" for o in self._slots]
+                f"{s.category} ({s.ns_meaning})" for s in map(object_schema, self._slots)]
             # Create a stack of ns_states (objects, buffer_size x ocss)
             create_buffer_stacks.append("obj")
             self._env.observation_space = gym.spaces.Box(
-                0, 255.0, (self.buffer_window_size, get_object_state_size(self.game_name, self.hud)))
+                0, 255.0, (self.buffer_window_size, sum(len(o._nsrepr) for o in self._slots)), dtype=NS_DTYPE)
         else:
             raise AttributeError("No valid obs_mode was selected")
 
@@ -153,22 +185,38 @@ class OCAtari:
         self.render_mode = render_mode
         self.render_oc_overlay = render_oc_overlay
         self.rendering_initialized = False
+        # Slot layout of the neurosymbolic state, compiled from the first objects (see _write_ns_state)
+        self._ns_layout = None
+        # Structure-of-arrays view of the objects, created on first use (see object_table)
+        self._object_table = None
+        # Trajectory history of the objects, only if enabled (see enable_history)
+        self.history = None
+        self._history_features = False
+        # Per stage timings, only recorded if enabled (see enable_profiling)
+        self._profiler = None
+        self._timer = NULL_TIMER
 
         # Buffers to store RGB, DQN, and neurosymbolic states
         # Store whether to create specific stacks
         self.create_rgb_stack = "ori" in create_buffer_stacks
         self.create_dqn_stack = "dqn" in create_buffer_stacks
+        if self.create_dqn_stack and not (masked_dqn_direct and "masked" in obs_mode):
+            _require_cv2()
         self.create_ns_stack = "obj" in create_buffer_stacks
-        self._state_buffer_rgb = deque(
-            [], maxlen=self.buffer_window_size) if self.create_rgb_stack else None
-        self._state_buffer_ns = deque(
-            [], maxlen=self.buffer_window_size) if self.create_ns_stack else None
-        self._state_buffer_dqn = deque(
-            [], maxlen=self.buffer_window_size) if self.create_dqn_stack else None
+        self._state_buffer_rgb = FrameStack(
+            self.buffer_window_size, np.uint8, (210, 160, 3)) if self.create_rgb_stack else None
+        self._state_buffer_ns = FrameStack(
+            self.buffer_window_size, NS_DTYPE) if self.create_ns_stack else None
+        self._state_buffer_dqn = FrameStack(
+            self.buffer_window_size, np.uint8, (84, 84)) if self.create_dqn_stack else None
         # Set action space based on the environment's action space
         self.action_space = self._env.action_space
         # Store the ALE interface of the environment
         self._ale = self._env.unwrapped.ale
+        # With exact snapshots, the environment acts through the sticky actions of OCAtari, if any (see ocatari.sticky)
+        self._sticky = None
+        if exact_snapshots:
+            self._sticky = use_sticky_actions(self._env)
 
         # Inherit every attribute and method of the base environment
         # Dynamically set attributes of the base Gymnasium environment to this class
@@ -180,19 +228,24 @@ class OCAtari:
                     pass
 
         # Set up object detection methods based on mode
-        global init_objects
+        # The extraction plans bind the game's detector once (see ocatari.extraction)
+        self._ram_plan = self._vision_plan = None
         if mode == "vision":
             # Set object detection to use vision-based extraction
             self.detect_objects = self._detect_objects_vision
-            self.objects = init_objects(self.game_name, self.hud, vision=True)
+            self._vision_plan = ExtractionPlan(self.game_name, self.hud, "vision")
+            self.objects = self._vision_plan.init_objects()
         elif mode in ["ram"]:
             # Set object detection to use RAM-based extraction
             self.detect_objects = self._detect_objects_ram
-            self.objects = init_objects(self.game_name, self.hud)
+            self._ram_plan = ExtractionPlan(self.game_name, self.hud, "ram")
+            self.objects = self._ram_plan.init_objects()
         elif mode == "both":
             # Set object detection to use both RAM and vision-based extraction
             self.detect_objects = self._detect_objects_both
-            self.objects_v = init_objects(self.game_name, self.hud)
+            self._ram_plan = ExtractionPlan(self.game_name, self.hud, "ram")
+            self._vision_plan = ExtractionPlan(self.game_name, self.hud, "vision")
+            self.objects_v = self._vision_plan.init_objects(vision=False)
         else:
             raise ValueError("Undefined mode for information extraction")
 
@@ -212,24 +265,40 @@ class OCAtari:
                  - info: Additional information from the environment.
         :rtype: tuple
         """
+        obs, reward, terminated, truncated, info = self._step_env(*args, **kwargs)
+        # Fill the buffer for observations
+        self._fill_buffer()
+        self._timer.lap("fill_buffer")
+        # Set the observation based on the selected observation mode
+        obs = self._stacked_obs(obs)
+        self._timer.stop("step", info)
+        return obs, reward, truncated, terminated, info
+
+    def _step_env(self, *args, **kwargs):
+        # Steps the base environment and detects the objects, without filling the observation stacks
+        # (shared with the vector environments and the rollouts). The caller stops the timer of the step.
+        timer = self._timer
+        timer.start()
         # Execute the action and obtain the next state and reward
         obs, reward, terminated, truncated, info = self._env.step(
             *args, **kwargs)
+        timer.lap("env_step")
         # Detect objects based on the configured detection mode
         self.detect_objects()
-        # Fill the buffer for observations
-        self._fill_buffer()
-        # Set the observation based on the selected observation mode
+        timer.lap("detect_objects")
+        return obs, reward, terminated, truncated, info
+
+    def _stacked_obs(self, obs):
+        # The observation of the obs_mode (the base env observation for `ori`)
         if self.obs_mode == "dqn":
-            obs = np.array(self._state_buffer_dqn)
+            return self._state_buffer_dqn.view().copy()
         elif self.obs_mode == "obj":
-            obs = np.array(self._state_buffer_ns)
-        return obs, reward, truncated, terminated, info
+            return self._state_buffer_ns.view().copy()
+        return obs
 
     def _detect_objects_ram(self):
         # Detect objects using RAM-based extraction
-        detect_objects_ram(
-            self.objects, self._env.env.unwrapped.ale.getRAM(), self.game_name, self.hud)  # type: ignore
+        self._ram_plan(self.objects, self._ale.getRAM())
 
     def _detect_objects_vision(self):
         """
@@ -240,20 +309,21 @@ class OCAtari:
         Vision-based detection allows for tracking in-game elements through computer vision techniques, providing an alternative to RAM-based methods, which rely on specific memory addresses.
         """
         # Detect objects using vision-based extraction
-        detect_objects_vision(
-            self.objects, self._env.env.unwrapped.ale.getScreenRGB(), self.game_name, self.hud)  # type: ignore
+        self._vision_plan(self.objects, self._ale.getScreenRGB())
 
     def _detect_objects_both(self):
         # Use both RAM and vision-based extraction methods to detect objects
-        detect_objects_ram(
-            self.objects, self._env.env.unwrapped.ale.getRAM(), self.game_name, self.hud)  # type: ignore
-        detect_objects_vision(
-            self.objects_v, self._env.env.unwrapped.ale.getScreenRGB(), self.game_name, self.hud)  # type: ignore
+        self._ram_plan(self.objects, self._ale.getRAM())
+        self._vision_plan(self.objects_v, self._ale.getScreenRGB())
 
     def _reset_buffer(self):
-        # Reset the buffer by filling it with the initial states
-        for _ in range(self.buffer_window_size):
-            self._fill_buffer()
+        # Reset the buffer by filling the whole window with the initial states
+        if self.create_dqn_stack:
+            self._state_buffer_dqn.fill(self._get_dqn_frame())
+        if self.create_rgb_stack:
+            self._state_buffer_rgb.fill(self.getScreenRGB())
+        if self.create_ns_stack:
+            self._state_buffer_ns.fill(self._write_ns_state())
 
     def reset(self, *args, **kwargs):
         """
@@ -269,48 +339,70 @@ class OCAtari:
                  - info: Additional information from the environment.
         :rtype: tuple
         """
-        # Reset the environment and detect objects from the initial state
-        obs, info = self._env.reset(*args, **kwargs)
-        self.objects = init_objects(
-            self.game_name, self.hud, vision=self.mode == "vision")
-        self.detect_objects()
+        obs, info = self._reset_env(*args, **kwargs)
         # Reset the buffer after environment reset
         self._reset_buffer()
+        self._timer.lap("reset_buffer")
         # Set the observation based on the selected observation mode
-        if self.obs_mode == "dqn":
-            obs = np.array(self._state_buffer_dqn)
-        elif self.obs_mode == "obj":
-            obs = np.array(self._state_buffer_ns)
+        obs = self._stacked_obs(obs)
+        self._timer.stop("reset", info)
+        return obs, info
+
+    def _reset_env(self, *args, **kwargs):
+        # Resets the base environment and detects the objects from the initial state, without
+        # filling the observation stacks (see _step_env)
+        timer = self._timer
+        timer.start()
+        obs, info = self._env.reset(*args, **kwargs)
+        timer.lap("env_reset")
+        self.objects = self._init_objects()
+        timer.lap("init_objects")
+        self.detect_objects()
+        timer.lap("detect_objects")
         return obs, info
 
+    def _init_objects(self):
+        # The object slots of the main extraction mode, reset in place
+        if self.history is not None:
+            self.history.clear()
+        plan = self._vision_plan if self.mode == "vision" else self._ram_plan
+        return plan.reset_objects(getattr(self, "objects", None))
+
     def _fill_buffer(self):
         # Fill the RGB, DQN, and neurosymbolic state buffers with the current states
         if self.create_dqn_stack:
-            dqn_obs = cv2.resize(self.get_dqn_state(), (84, 84), interpolation=cv2.INTER_AREA)
-            self._state_buffer_dqn.append(dqn_obs)
+            self._state_buffer_dqn.append(self._get_dqn_frame())
         if self.create_rgb_stack:
             self._state_buffer_rgb.append(self.getScreenRGB())
         if self.create_ns_stack:
-            self._state_buffer_ns.append(self.ns_state)
+            self._state_buffer_ns.append(self._write_ns_state())
+
+    def _get_dqn_frame(self):
+        # The current frame of the DQN stack, resized to 84x84 if needed
+        state = self.get_dqn_state()
+        if state.shape == (84, 84):
+            return state
+        return cv2.resize(state, (84, 84), interpolation=cv2.INTER_AREA)
 
     def _get_state_dqn(self):
-        return cv2.cvtColor(self.getScreenRGB(), cv2.COLOR_RGB2GRAY)
+        return _require_cv2().cvtColor(self.getScreenRGB(), cv2.COLOR_RGB2GRAY)
 
     def _get_state_masked_bin(self):
-        return get_masked_dqn_bin_state(self.objects)
+        return get_masked_dqn_bin_state(self.objects, out=self._masked_dqn_state)
 
     def _get_state_masked_gray(self):
-        return get_masked_dqn_gray_state(self.objects, self._classes)
+        return get_masked_dqn_gray_state(self.objects, self._classes, out=self._masked_dqn_state)
 
     def _get_state_masked_pix(self):
-        return get_masked_dqn_pix_state(self.objects, self._ale.getScreenGrayscale())
+        return get_masked_dqn_pix_state(self.objects, self._ale.getScreenGrayscale(), out=self._masked_dqn_state)
 
-    window: pygame.Surface = None
-    clock: pygame.time.Clock = None
+    window: "pygame.Surface" = None
+    clock: "pygame.time.Clock" = None
 
     def _initialize_rendering(self, sample_image):
         # Initialize rendering with Pygame using a sample image to determine size
         assert sample_image is not None
+        _require_pygame()
         pygame.init()
         if self.render_mode == "human":
             pygame.display.set_caption(self.game_name)
@@ -331,6 +423,12 @@ class OCAtari:
         Compute the render frames (as specified by render_mode during the initialization of the environment).
         If activated, adds an overlay visualizing object properties like position, velocity vector, name, etc.
         """
+        self._timer.start()
+        frame = self._render()
+        self._timer.stop("render")
+        return frame
+
+    def _render(self):
         # Render the environment image
         image = self._env.render()
         if not self.render_oc_overlay:
@@ -340,6 +438,7 @@ class OCAtari:
             return image
         if not self.rendering_initialized:
             self._initialize_rendering(image)
+        from ocatari.utils import draw_label, draw_arrow
 
         # Prepare the image surface for rendering
         image = np.transpose(image, (1, 0, 2))
@@ -370,9 +469,10 @@ class OCAtari:
             # Draw bounding box
             pygame.draw.rect(
                 overlay_surface, color=game_object.rgb, rect=(x, y, w, h), width=2)
-            # Draw label with object category
-            label = game_object.category
-            if isinstance(game_object, ValueObject):
+            # Draw label with object category (and value)
+            schema = object_schema(game_object)
+            label = schema.category
+            if schema.has_value:
                 label += f" ({game_object.value})"
             draw_label(self.window, label, position=(
                 x, y + h + 4), font=self.label_font)
@@ -463,20 +563,247 @@ class OCAtari:
         """
         return self._env.env.env.ale.restoreSystemState(state)
 
+    def snapshot(self, stacks=True):
+        """
+        Captures the full state of the environment: the emulator state (including its random generator),
+        the action repeated by the sticky actions (only with `exact_snapshots`), copies of the object slots (e.g. previous positions, per object counters), the frames of the
+        observation stacks and the detection state kept by the game module.
+        Unlike :meth:`_clone_state`, restoring it gives the same objects, velocities and stacked observations
+        as if the environment had never left this state.
+
+        :param stacks: Whether to capture the observation stacks (skip them if the observations are not used).
+        :type stacks: bool
+        :return: The snapshot, that can be restored any number of times with :meth:`restore`.
+        :rtype: ocatari.snapshot.Snapshot
+        """
+        return take_snapshot(self, stacks)
+
+    def restore(self, snapshot):
+        """
+        Restores a snapshot taken with :meth:`snapshot`, in O(objects).
+
+        :param snapshot: The snapshot to restore
+        :type snapshot: ocatari.snapshot.Snapshot
+        """
+        restore_snapshot(self, snapshot)
+
     @property
     def ns_state(self):
         """
-        Returns the current neurosymbolic state of the environment.
+        Returns the current neurosymbolic state of the environment, i.e. the concatenated
+        representations (`_nsrepr`) of all the objects.
+
+        :rtype: np.ndarray
         """
-        return list(chain.from_iterable([o._nsrepr for o in self.objects]))
+        return self._write_ns_state().copy()
+
+    @property
+    def ns_feature_names(self):
+        """
+        The names of the values of the neurosymbolic state (`obj` observations) of the game slots,
+        as `<category>_<index>_<name>`, the index counting the slots of the category and the names coming
+        from the schemas of the slots (see :meth:`ocatari.schema.ObjectSchema.ns_names`).
+        If in the observations, the kinematic features of the trajectory history follow.
+
+        :rtype: list of str
+        """
+        if self.obs_mode != "obj":
+            raise ValueError(f"The neurosymbolic state is only observed in obj obs_mode, not {self.obs_mode}")
+        labels, counts = [], {}
+        for o in self._slots:
+            category = object_schema(o).category
+            counts[category] = counts.get(category, -1) + 1
+            labels.append(f"{category}_{counts[category]}")
+        names = [f"{label}_{name}" for label, o in zip(labels, self._slots)
+                 for name in object_schema(o).ns_names(len(o._nsrepr))]
+        if self._history_features:
+            if len(labels) != self.history.nb_slots:  # the detected objects are not laid out as the slots
+                labels = [f"slot_{i}" for i in range(self.history.nb_slots)]
+            names.extend(f"{label}_{feature}" for label in labels for feature in FEATURES)
+        return names
+
+    def _write_ns_state(self):
+        # Writes the neurosymbolic state in the preallocated vector of the layout (overwritten at every call)
+        if self._ns_layout is None:
+            self._ns_layout = NSStateLayout(self.objects, NS_DTYPE)
+        state = self._ns_layout.write(self.objects)
+        if self._history_features:
+            return self.history.observation(state)
+        return state
+
+    @property
+    def object_table(self):
+        """
+        The current objects as a structure of arrays (one row per slot), for vectorized computations
+        of positions, velocities, bounding boxes and masks. The table is reused, and refilled
+        from the objects at every access: keep a reference to it for several computations on the same frame.
+
+        :rtype: ocatari.object_table.ObjectTable
+        """
+        if self._object_table is None:
+            try:
+                categories = get_max_objects(self.game_name, True)
+            except (KeyError, AttributeError):
+                categories = ()
+            self._object_table = ObjectTable(categories)
+        return self._object_table.update(self.objects)
+
+    def enable_history(self, length=8, obs_features=False):
+        """
+        Keeps the positions of the object slots over the last `length` frames (see
+        :class:`ocatari.history.TrajectoryHistory`), recorded after every detection, to get the velocities,
+        accelerations and smoothed velocities of all the objects from `env.history`.
+        The history is part of the snapshots.
+
+        :param length: The number of stored frames
+        :type length: int
+        :param obs_features: Whether to append the kinematic features of every slot (`vx, vy, ax, ay, svx, svy`)
+                             to the neurosymbolic states of the `obj` observations, which are then float32.
+        :type obs_features: bool
+        """
+        if obs_features and self.obs_mode != "obj":
+            raise ValueError(f"The history features need the obj obs_mode, not {self.obs_mode}")
+        if self.history is None:
+            self._detect_objects_plain = self.detect_objects
+            self.detect_objects = self._detect_objects_history
+        self.history = TrajectoryHistory(length)
+        self.history.record(self.objects)
+        self._set_history_features(obs_features)
+
+    def disable_history(self):
+        """
+        Stops recording the trajectory history, and removes its features from the observations.
+        """
+        if self.history is None:
+            return
+        self._set_history_features(False)
+        self.detect_objects = self._detect_objects_plain
+        self.history = None
+
+    def _set_history_features(self, enabled):
+        if enabled == self._history_features:
+            return
+        self._history_features = enabled
+        if self.obs_mode == "obj":
+            size = len(self._write_ns_state())
+            self._env.observation_space = gym.spaces.Box(
+                -np.inf if enabled else 0, np.inf if enabled else 255.0,
+                (self.buffer_window_size, size), dtype=NS_DTYPE)
+            self.observation_space = self._env.observation_space
+        if self.create_ns_stack:
+            self.add_buffer_stack("obj")
+
+    def _detect_objects_history(self):
+        self._detect_objects_plain()
+        self.history.record(self.objects)
+
+    def enable_ram_cache(self, maxsize=4096):
+        """
+        Caches the RAM object extraction: the objects detected from a RAM state are stored, and reused
+        when the exact same RAM (and detection state) is met again, e.g. during pauses, death animations
+        or no-op starts, instead of running the game's detection. The velocities stay consistent,
+        the previous positions are the ones of the slots. Worth it for the games with expensive detections.
+
+        :param maxsize: The maximal number of cached frames (least recently used ones are evicted).
+        :type maxsize: int
+        """
+        if self._ram_plan is None:
+            raise ValueError(f"The RAM extraction is not used in {self.mode} mode")
+        self._ram_plan.enable_cache(maxsize)
+
+    def disable_ram_cache(self):
+        """
+        Removes the RAM extraction cache, and its statistics.
+        """
+        if self._ram_plan is not None:
+            self._ram_plan.disable_cache()
+
+    def ram_cache_stats(self):
+        """
+        Returns the statistics of the RAM extraction cache (`hits`, `misses`, `evictions`, `size`, `maxsize`
+        and `hit_rate`), or None if it is not enabled.
+
+        :rtype: dict
+        """
+        cache = self._ram_plan.cache if self._ram_plan is not None else None
+        return cache.stats() if cache is not None else None
+
+    def enable_profiling(self, info=False):
+        """
+        Enables the timing of the stages of :meth:`step` (`env_step`, `detect_objects`, `fill_buffer`),
+        :meth:`reset` (`env_reset`, `init_objects`, `detect_objects`, `reset_buffer`), as well as their totals
+        (`step`, `reset`) and the one of :meth:`render`. While disabled, they call the no-op
+        :data:`ocatari.profiling.NULL_TIMER` instead (about 0.1 us per call).
+
+        :param info: If True, the durations (in seconds) of the stages of the last step/reset
+                     are also added to the returned `info` dictionary, under `profiling`.
+        :type info: bool
+        """
+        if self._profiler is None:
+            self._profiler = StepProfiler()
+        self._timer = StageTimer(self._profiler, info)
+
+    def disable_profiling(self):
+        """
+        Stops the timing of :meth:`step`, :meth:`reset` and :meth:`render`. The statistics are kept.
+        """
+        self._timer = NULL_TIMER
+
+    def profiling_stats(self, clear=False):
+        """
+        Returns the timings of every stage since profiling was enabled: call count, total,
+        mean, min, max, percentiles and a logarithmic histogram (bins in :data:`ocatari.profiling.BIN_EDGES_US`).
+
+        :param clear: Restart the statistics after returning them.
+        :type clear: bool
+        :rtype: dict
+        """
+        profiler = self._profiler
+        stats = {"game": self.game_name, "mode": self.mode, "obs_mode": self.obs_mode,
+                 "stages": profiler.stats() if profiler is not None else {}}
+        if clear and profiler is not None:
+            profiler.clear()
+        return stats
+
+    def _get_rgb_stack(self):
+        # The stacked RGB frames, or only the current one (captured on demand) if no RGB stack is created
+        if self.create_rgb_stack:
+            return self._state_buffer_rgb.view()
+        return self.getScreenRGB()[None]
+
+    def add_buffer_stack(self, stack):
+        """
+        Creates an additional observation stack at runtime, e.g. to opt back into capturing the RGB frames at every step.
+        The whole window is filled with the current state.
+
+        :param stack: The stack to create: one of `ori`, `dqn` or `obj`
+        :type stack: str
+        """
+        if stack == "ori":
+            self.create_rgb_stack = True
+            self._state_buffer_rgb = FrameStack(
+                self.buffer_window_size, np.uint8, (210, 160, 3))
+            self._state_buffer_rgb.fill(self.getScreenRGB())
+        elif stack == "dqn":
+            if not hasattr(self, "get_dqn_state"):
+                self.get_dqn_state = self._get_state_dqn
+            self.create_dqn_stack = True
+            _require_cv2()
+            self._state_buffer_dqn = FrameStack(
+                self.buffer_window_size, np.uint8, (84, 84))
+            self._state_buffer_dqn.fill(self._get_dqn_frame())
+        elif stack == "obj":
+            self.create_ns_stack = True
+            self._state_buffer_ns = FrameStack(
+                self.buffer_window_size, NS_DTYPE)
+            self._state_buffer_ns.fill(self._write_ns_state())
+        else:
+            raise ValueError(f"Unknown buffer stack: {stack}")
 
     def render_explanations(self):
         # Render explanations by highlighting the objects with bounding boxes
-        rendered = np.zeros_like(self._state_buffer_rgb[0]).astype(float)
-        coefs = [0.05, 0.1, 0.25, 0.6]
-        for coef, state_i in zip(coefs, self._state_buffer_rgb):
-            rendered += coef * state_i
-        rendered = rendered.astype(int)
+        from ocatari.vision.utils import mark_bb, to_rgba
+        rendered = self.aggregated_render()
         for obj in self.objects:
             mark_bb(rendered, obj.xywh, color=obj.rgb)
         import matplotlib.pyplot as plt
@@ -495,9 +822,15 @@ class OCAtari:
         plt.show()
 
     def aggregated_render(self, coefs=[0.05, 0.1, 0.25, 0.6]):
-        # Generate a weighted sum of frames for a more informative representation
-        rendered = np.zeros_like(self._state_buffer_rgb[0]).astype(float)
-        for coef, state_i in zip(coefs, self._state_buffer_rgb):
+        """
+        Generate a weighted sum of the last frames for a more informative representation (the last coefficient is for the latest frame).
+        Without RGB stack (see `create_buffer_stacks`), only the current frame is rendered.
+        """
+        frames = self._get_rgb_stack()
+        if len(frames) == 1:
+            return frames[0].astype(int)
+        rendered = np.zeros(frames.shape[1:], dtype=float)
+        for coef, state_i in zip(coefs[::-1], frames[::-1]):
             rendered += coef * state_i
         rendered = rendered.astype(int)
         return rendered
@@ -0,0 +1,420 @@
+"""
+Extraction plans: the object detection of a game, resolved once when an OCAtari environment is created.
+"""
+
+from collections import OrderedDict
+from copy import deepcopy
+import numpy as np
+from termcolor import colored
+from ocatari.ram.extract_ram_info import init_objects, load_game_module
+from ocatari.ram.game_objects import object_state, reset_slots, set_object_state
+from ocatari.snapshot import ABSENT, assigned_globals, copy_object, copy_state, module_state_names, _EMPTY_TYPES, \
+    _MUTABLE_TYPES
+
+# Attributes of the objects set by `_save_prev`, that follow the slots
+# instead of the cached frames
+_PREV_ATTRS = ("_prev_xy", "_prev_value")
+_SCALAR_TYPES = (int, float, str, bytes, type(None), np.generic)
+_CONTAINER_TYPES = (dict, list, tuple, np.ndarray)
+
+# Alternative detectors, registered per (game, mode)
+_DETECTORS = {}
+# The initial detection state of the game modules (see
+# ExtractionPlan.module_state), by module name
+_INITIAL_STATES = {}
+
+
+def register_detector(game_name, detector, mode="ram"):
+    """
+    Registers an alternative detector (e.g. vectorized, cached or instrumented) for a game.
+    It is used by the extraction plans (and thus the OCAtari environments) created afterwards,
+    instead of the `_detect_objects_ram` (or `_detect_objects` for vision) function of the game module.
+
+    :param game_name: The name of the game (e.g. "Pong")
+    :type game_name: str
+    :param detector: A function with the signature of the game module's detection, i.e.
+                     `detector(objects, ram_state, hud)` for `ram`, `detector(objects, obs, hud)` for `vision`.
+    :type detector: callable
+    :param mode: The extraction mode, `ram` or `vision`
+    :type mode: str
+    """
+    if mode not in ("ram", "vision"):
+        raise ValueError(f"Undefined mode for information extraction: {mode}")
+    _DETECTORS[(game_name.lower(), mode)] = detector
+
+
+def unregister_detector(game_name, mode="ram"):
+    """
+    Removes the alternative detector of a game, the game module's detection is used again.
+    """
+    _DETECTORS.pop((game_name.lower(), mode), None)
+
+
+def get_game_module(game_name, mode="ram"):
+    """
+    Returns the RAM or vision module of a game.
+
+    :param game_name: The name of the game (e.g. "Pong")
+    :type game_name: str
+    :param mode: The extraction mode, `ram` or `vision`
+    :type mode: str
+    """
+    game_module = f"ocatari.{mode}.{game_name.lower()}"
+    try:
+        return load_game_module(game_module)
+    except KeyError:
+        raise NotImplementedError(
+            colored(f"Game module does not exist: {game_module}", "red"))
+
+
+def save_prev(objects):
+    """
+    Saves the previous positions (and values) of all the detected objects.
+    """
+    for obj in objects:
+        if obj:
+            obj._save_prev()
+
+
+class ExtractionPlan:
+    """
+    The object extraction of a game, bound once (game module, detector, initial object slots)
+    such that extracting the objects at every step is a direct call.
+
+    :param game_name: The name of the game (e.g. "Pong")
+    :type game_name: str
+    :param hud: Whether to include or not objects from the HUD (e.g. scores, lives)
+    :type hud: bool
+    :param mode: The extraction mode, `ram` or `vision`
+    :type mode: str
+    :param detector: An alternative detector, overriding the registered one and the game module's.
+    :type detector: callable
+
+    :ivar detector: The detection function, called as `detector(objects, state, hud)`.
+                    It can be replaced on an instance, e.g. to wrap it.
+    :vartype detector: callable
+    :ivar module_state: The detection state the game module keeps in global variables (see
+                        :func:`ocatari.snapshot.module_state_names`), owned by this plan: it is loaded
+                        into the module before every detection and saved back after it, such that the
+                        environments of a process do not share it. :data:`ABSENT` if not defined.
+    :vartype module_state: dict
+    """
+
+    def __init__(self, game_name, hud, mode="ram", detector=None):
+        self.game_name = game_name
+        self.hud = hud
+        self.mode = mode
+        self.module = get_game_module(game_name, mode)
+        if detector is None:
+            detector = _DETECTORS.get((game_name.lower(), mode))
+        if detector is None:
+            fname = "_detect_objects_ram" if mode == "ram" else "_detect_objects"
+            try:
+                detector = getattr(self.module, fname)
+            except AttributeError:
+                raise NotImplementedError(colored(
+                    f"{fname} not implemented for game: {game_name}", "red"))
+        self.detector = detector
+        self.save_prev = save_prev
+        self.cache = None
+        # The games initializing their detection state with the objects (e.g. globals referencing them)
+        # need a new initialization at every reset
+        init = getattr(self.module, "_init_objects_ram", None)
+        self._stateful_init = bool(assigned_globals(init))
+        self.module_state = copy_state(_initial_state(self.module), {})
+
+    def load_state(self):
+        """
+        Sets the global variables of the game module to the detection state of this plan.
+        """
+        module_vars = vars(self.module)
+        for name, value in self.module_state.items():
+            if value is ABSENT:
+                module_vars.pop(name, None)
+            else:
+                module_vars[name] = value
+
+    def save_state(self):
+        """
+        Stores the global variables of the game module as the detection state of this plan.
+        """
+        module_vars = vars(self.module)
+        state = self.module_state
+        for name in state:
+            state[name] = module_vars.get(name, ABSENT)
+
+    def init_objects(self, vision=None):
+        """
+        Returns a freshly initialized list of object slots.
+
+        :param vision: Use the vision objects, defaults to the mode of the plan.
+        :type vision: bool
+        """
+        if vision is None:
+            vision = self.mode == "vision"
+        if not self.module_state:
+            return init_objects(self.game_name, self.hud, vision=vision)
+        self.load_state()
+        objects = init_objects(self.game_name, self.hud, vision=vision)
+        self.save_state()
+        return objects
+
+    def reset_objects(self, objects=None):
+        """
+        Returns the object slots reset to their initial objects, in place if they are pooled
+        (see :class:`ocatari.ram.game_objects.ObjectSlots`), else freshly initialized.
+        """
+        if objects is not None and not self._stateful_init \
+                and reset_slots(objects):
+            return objects
+        return self.init_objects()
+
+    def __call__(self, objects, state):
+        """
+        Updates the objects (inplace) from the RAM state (`ram`) or the RGB observation (`vision`).
+        """
+        self.save_prev(objects)
+        if self.module_state:
+            self.load_state()
+        if self.cache is not None:
+            self.cache.extract(objects, state, self.detector, self.hud)
+        else:
+            self.detector(objects, state, self.hud)
+        if self.module_state:
+            self.save_state()
+
+    def enable_cache(self, maxsize=4096):
+        """
+        Caches the extracted objects by RAM state (see :class:`RamCache`), `ram` mode only.
+
+        :param maxsize: The maximal number of cached frames.
+        :type maxsize: int
+        """
+        if self.mode != "ram":
+            raise ValueError("Only the RAM extraction can be cached")
+        # the detectors compiled from a RAM spec only depend on its addresses
+        spec = getattr(self.detector, "spec", None)
+        addresses = None if spec is None else spec.addresses(self.hud)
+        self.cache = RamCache(self.module, maxsize, addresses)
+
+    def disable_cache(self):
+        self.cache = None
+
+    def __repr__(self):
+        return f"ExtractionPlan({self.game_name}, mode={self.mode}, hud={self.hud}, detector={getattr(self.detector, '__qualname__', self.detector)})"
+
+
+def _initial_state(module):
+    # The detection state of a game module as defined at its import, recorded
+    # before any plan detects with it
+    state = _INITIAL_STATES.get(module.__name__)
+    if state is None:
+        module_vars = vars(module)
+        state = {name: copy_state(module_vars.get(name, ABSENT), {})
+                 for name in module_state_names(module)}
+        _INITIAL_STATES[module.__name__] = state
+    return state
+
+
+def _state_key(value):
+    # A hashable summary of a module state value: the values of the scalars,
+    # the types of the objects
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, dict):
+        values = [val if isinstance(val, _SCALAR_TYPES) else
+                  _state_key(val) if isinstance(val, _CONTAINER_TYPES) else
+                  val.__class__ for val in value.values()]
+        return tuple(value), tuple(values)
+    if isinstance(value, (list, tuple)):
+        return tuple([val if isinstance(val, _SCALAR_TYPES) else
+                      _state_key(val) for val in value])
+    if isinstance(value, np.ndarray):
+        return value.tobytes()
+    return value.__class__
+
+
+def _copy_value(value, memo):
+    # Copies a module state value, sharing the scalars, and replacing the objects by their copies
+    # in `memo` (e.g. the objects of a game module dict that are also in the
+    # slots)
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    copy = memo.get(id(value))
+    if copy is not None:
+        return copy
+    if isinstance(value, _EMPTY_TYPES):
+        copy = memo[id(value)] = copy_object(value)
+        return copy
+    if value.__class__ is dict:
+        return {key: _copy_value(val, memo) for key, val in value.items()}
+    if value.__class__ is list:
+        return [_copy_value(val, memo) for val in value]
+    return deepcopy(value, memo)
+
+
+def _copy_state(module_state, memo):
+    return {name: _copy_value(value, memo)
+            for name, value in module_state.items()}
+
+
+class _CacheEntry:
+    # The object slots and the module state after the detection of a frame, and for every slot,
+    # the input slot its object comes from (None for the objects created by
+    # the detector)
+    __slots__ = ("objects", "states", "mutables", "sources", "module_state")
+
+    def __init__(self, before, prevs, objects, module_state):
+        memo = {}
+        indices = {id(obj): i for i, obj in enumerate(before)}
+        self.objects, self.states, self.mutables, self.sources = [], [], [], []
+        for obj in objects:
+            if obj is None:
+                copy, state, mutables, source = obj, None, (), None
+            else:
+                copy = memo.get(id(obj))
+                if copy is None:
+                    copy = memo[id(obj)] = copy_object(obj)
+                source = indices.get(id(obj))
+                state = object_state(copy)
+                if source is not None \
+                        and state.get("_prev_xy") is prevs[source]:
+                    # updated, the previous positions come from the slots
+                    for k in _PREV_ATTRS:
+                        state.pop(k, None)
+                mutables = tuple(k for k, v in state.items()
+                                 if isinstance(v, _MUTABLE_TYPES))
+            self.objects.append(copy)
+            self.states.append(state)
+            self.mutables.append(mutables)
+            self.sources.append(source)
+        self.module_state = (_copy_state(module_state, memo)
+                             if module_state else None)
+
+
+class RamCache:
+    """
+    A bounded LRU cache of the RAM object extraction: the slots detected from a RAM state
+    are stored, and given back when the same RAM is met again (pauses, death animations, no-op starts...)
+    instead of running the detector. A frame is only stored the second time it is met,
+    such that the frames that never repeat cost a lookup only.
+
+    The key is the RAM (the values of the `addresses` if given), the classes of the current slots and the values
+    of the game module state (e.g. the RAM values kept from the previous frames), such that a hit gives the slots
+    the detector would have produced.
+    The objects the detector updates keep their identity and their previous positions and values
+    (`prev_xy`, `prev_value`), the objects it creates are copies of the cached ones.
+
+    :param module: The RAM module of the game, whose detection state (global variables) is cached with the slots.
+    :type module: module
+    :param maxsize: The maximal number of stored frames, the least recently used ones are evicted.
+    :type maxsize: int
+    :param addresses: The RAM addresses the detector depends on (e.g. of a :class:`ocatari.ram.spec.RamSpec`),
+                      the key only holding their values, defaults to the whole RAM.
+    :type addresses: list of int
+
+    :ivar hits: The number of frames given back from the cache.
+    :vartype hits: int
+    :ivar misses: The number of frames that ran the detector.
+    :vartype misses: int
+    :ivar evictions: The number of frames removed from the cache.
+    :vartype evictions: int
+    """
+
+    def __init__(self, module, maxsize=4096, addresses=None):
+        if maxsize < 1:
+            raise ValueError(f"The cache size must be positive, got {maxsize}")
+        self.module = module
+        self.maxsize = maxsize
+        self.addresses = (None if addresses is None
+                          else np.asarray(addresses, dtype=np.intp))
+        self.state_names = [name for name in module_state_names(module)
+                            if name in vars(module)]
+        self._entries = OrderedDict()
+        self._seen = OrderedDict()  # hashes of the keys met once
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _module_state(self):
+        module_vars = vars(self.module)
+        return {name: module_vars[name] for name in self.state_names}
+
+    def extract(self, objects, ram_state, detector, hud):
+        """
+        Updates the objects (inplace) from the RAM state, running the detector on a cache miss.
+        The previous positions must already be saved (see :func:`save_prev`).
+        """
+        ram_key = ram_state if self.addresses is None else ram_state[self.addresses]
+        key = (ram_key.tobytes(), tuple(map(type, objects)))
+        if self.state_names:
+            key += (_state_key(self._module_state()),)
+        entries = self._entries
+        entry = entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            self._apply(entry, objects)
+            return
+        self.misses += 1
+        seen = self._seen
+        digest = hash(key)
+        if digest not in seen:
+            detector(objects, ram_state, hud)
+            seen[digest] = None
+            if len(seen) > self.maxsize:
+                seen.popitem(last=False)
+            return
+        del seen[digest]
+        before = objects[:]
+        prevs = [getattr(obj, "_prev_xy", None) for obj in before]
+        detector(objects, ram_state, hud)
+        module_state = self._module_state() if self.state_names else None
+        entries[key] = _CacheEntry(before, prevs, objects, module_state)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def _apply(self, entry, objects):
+        memo = {}
+        slots = []
+        for cached, state, mutables, source in zip(
+                entry.objects, entry.states, entry.mutables, entry.sources):
+            if state is None:  # slot without object
+                slots.append(None)
+                continue
+            target = memo.get(id(cached))
+            if target is None:
+                if source is None:  # created by the detector
+                    target = cached.__class__.__new__(cached.__class__)
+                else:
+                    # updated by the detector, the previous position (if not
+                    # in the state) is kept
+                    target = objects[source]
+                set_object_state(target, state)
+                for k in mutables:
+                    set_object_state(target, {k: state[k].copy()})
+                memo[id(cached)] = target
+            slots.append(target)
+        objects[:] = slots
+        if entry.module_state is not None:
+            for name, value in _copy_state(entry.module_state, memo).items():
+                setattr(self.module, name, value)
+
+    def clear(self):
+        """
+        Empties the cache, keeping the statistics.
+        """
+        self._entries.clear()
+
+    def stats(self):
+        """
+        The hit statistics of the cache.
+
+        :rtype: dict
+        """
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.}
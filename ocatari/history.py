@@ -0,0 +1,224 @@
+"""
+N-step trajectory history of the object slots, with vectorized kinematics: velocities, accelerations and
+smoothed (least squares) velocities of all the slots at once (see :meth:`ocatari.core.OCAtari.enable_history`).
+"""
+
+import numpy as np
+from ocatari.buffers import FrameStack
+
+# The kinematic features of a slot, in the order of TrajectoryHistory.features
+FEATURES = ("vx", "vy", "ax", "ay", "svx", "svy")
+# The (x, y, visible) of the empty slots (None)
+_EMPTY_ROW = (0, 0, 0)
+
+
+class TrajectoryHistory:
+    """
+    The positions and visibility of every object slot over the last `length` frames, in a ring buffer
+    (:class:`ocatari.buffers.FrameStack`) of shape (length, nb_slots, 3), holding `(x, y, visible)`.
+
+    The history is filled with the first frame after a reset (the objects are static), and refilled if
+    the number of slots changes. The kinematics of a slot are computed on the frames where it was
+    continuously visible until the current frame, and are 0 otherwise:
+
+    - `velocity`: `p[t] - p[t-1]` (as `dx`, `dy` of the objects),
+    - `acceleration`: `p[t] - 2 p[t-1] + p[t-2]`,
+    - `smoothed_velocity`: the slope of the least squares line through the positions of the window,
+      less sensitive to the objects moving every other frame.
+
+    :param length: The number of stored frames (at least 2).
+    :type length: int
+
+    Example::
+
+        env.enable_history(8)
+        env.reset()
+        env.step(0)
+        vx, vy = env.history.smoothed_velocity.T
+    """
+
+    def __init__(self, length=8):
+        if length < 2:
+            raise ValueError(
+                f"The history length must be at least 2, got {length}")
+        self.length = length
+        self._frames = FrameStack(length, np.float32)
+        self._frame = np.zeros((0, 3), dtype=np.float32)
+        self._tracked = np.zeros(0, dtype=np.intp)
+        self._features = np.zeros((0, len(FEATURES)), dtype=np.float32)
+        self._dirty = True
+        self._obs = np.zeros(0, dtype=np.float32)
+        self._weights = self._kinematic_weights(length)
+
+    @staticmethod
+    def _kinematic_weights(length):
+        """
+        Every feature is a weighted sum of the positions of the window. The weights of the velocity,
+        acceleration and least squares slope of a slot visible in the k last frames are in row k
+        (0 if not tracked for long enough), of shape (length + 1, 3, length).
+        """
+        weights = np.zeros((length + 1, 3, length), dtype=np.float32)
+        for k in range(2, length + 1):
+            weights[k, 0, -2:] = (-1, 1)
+            if k > 2:
+                weights[k, 1, -3:] = (1, -2, 1)
+            t = np.arange(k) - (k - 1) / 2
+            weights[k, 2, -k:] = t / (t ** 2).sum()
+        return weights
+
+    def record(self, objects):
+        """
+        Adds the current frame of the objects (the first one after a :meth:`clear` fills the history).
+
+        :param objects: The object slots (e.g. `env.objects`), None for the empty ones
+        :type objects: list of GameObject
+        """
+        if len(objects) != len(self._frame):
+            self._resize(len(objects))
+        frame = self._frame
+        # Flat, converted at once (faster than assigning the rows)
+        values = []
+        for o in objects:
+            values.extend(_EMPTY_ROW if o is None else (*o.xy, bool(o)))
+        frame.ravel()[:] = np.fromiter(values, np.float32, len(values))
+        visible = frame[:, 2] != 0
+        # The number of frames every slot has been visible in, until now
+        if len(self._frames):
+            self._frames.append(frame)
+            np.add(self._tracked, 1, out=self._tracked)
+            np.minimum(self._tracked, self.length, out=self._tracked)
+            self._tracked *= visible
+        else:
+            self._frames.fill(frame)
+            np.multiply(visible, self.length, out=self._tracked)
+        self._dirty = True
+
+    def _resize(self, nb_slots):
+        self._frame = np.zeros((nb_slots, 3), dtype=np.float32)
+        self._tracked = np.zeros(nb_slots, dtype=np.intp)
+        self._features = np.zeros((nb_slots, len(FEATURES)), dtype=np.float32)
+        self._frames = FrameStack(self.length, np.float32)
+
+    def clear(self):
+        """
+        Empties the history (e.g. after a reset), the next recorded frame fills it.
+        """
+        self._frames.clear()
+        self._dirty = True
+
+    def __len__(self):
+        return len(self._frames)
+
+    @property
+    def nb_slots(self):
+        return len(self._frame)
+
+    @property
+    def frames(self):
+        """
+        The stored frames, oldest first, as `(x, y, visible)` per slot.
+
+        :type: np.ndarray of float32, (length, nb_slots, 3)
+        """
+        return self._frames.view()
+
+    def restore(self, frames):
+        """
+        Replaces the history with saved :attr:`frames` (e.g. of a snapshot).
+        """
+        if frames.shape[1] != self.nb_slots:
+            self._resize(frames.shape[1])
+        self._frames.restore(frames)
+        visible = frames[::-1, :, 2] != 0
+        tracked = np.logical_and.accumulate(visible, axis=0)
+        self._tracked[:] = tracked.sum(axis=0)
+        self._dirty = True
+
+    @property
+    def positions(self):
+        """
+        :type: np.ndarray of float32, (length, nb_slots, 2)
+        """
+        return self.frames[..., :2]
+
+    @property
+    def visible(self):
+        """
+        :type: np.ndarray of bool, (length, nb_slots)
+        """
+        return self.frames[..., 2] != 0
+
+    def tracked_frames(self):
+        """
+        The number of frames over which every slot has been continuously visible, until the current frame.
+
+        :rtype: np.ndarray of int, (nb_slots,)
+        """
+        return self._tracked.copy()
+
+    @property
+    def velocity(self):
+        """
+        The last movements of the slots (0 if not visible in both frames).
+
+        :type: np.ndarray of float32, (nb_slots, 2)
+        """
+        return self.features()[:, 0:2].copy()
+
+    @property
+    def acceleration(self):
+        """
+        The last changes of velocity of the slots (0 if not visible in the last 3 frames).
+
+        :type: np.ndarray of float32, (nb_slots, 2)
+        """
+        return self.features()[:, 2:4].copy()
+
+    @property
+    def smoothed_velocity(self):
+        """
+        The least squares velocity of the slots over the frames they were continuously visible in
+        (at most the whole history, 0 if visible in less than 2 frames).
+
+        :type: np.ndarray of float32, (nb_slots, 2)
+        """
+        return self.features()[:, 4:6].copy()
+
+    def features(self):
+        """
+        The kinematic features of every slot (see `FEATURES`): velocity, acceleration and smoothed velocity,
+        computed once per recorded frame, in a preallocated array overwritten by the next ones.
+
+        :rtype: np.ndarray of float32, (nb_slots, 6)
+        """
+        features = self._features
+        if self._dirty:
+            frames = self.frames
+            if len(frames):
+                # The weights sum to 0: relative to the current positions, the
+                # static objects are exactly at 0
+                window = frames[:, :, :2] - frames[-1, :, :2]
+                # (nb_slots, 3, length) @ (nb_slots, length, 2): the three features of every slot at once
+                np.matmul(self._weights[self._tracked],
+                          window.transpose(1, 0, 2),
+                          out=features.reshape(-1, 3, 2))
+            else:
+                features[:] = 0
+            self._dirty = False
+        return features
+
+    def observation(self, state):
+        """
+        The neurosymbolic state followed by the (flattened) kinematic features, in a preallocated vector
+        overwritten at every call.
+
+        :param state: The neurosymbolic state
+        :type state: np.ndarray
+        :rtype: np.ndarray of float32
+        """
+        size = len(state) + self.nb_slots * len(FEATURES)
+        if len(self._obs) != size:
+            self._obs = np.zeros(size, dtype=np.float32)
+        self._obs[:len(state)] = state
+        self._obs[len(state):] = self.features().ravel()
+        return self._obs
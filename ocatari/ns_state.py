@@ -0,0 +1,96 @@
+"""
+Neurosymbolic state layout: the object slots of a game compiled into fixed offsets of a preallocated vector.
+"""
+
+from itertools import accumulate
+import numpy as np
+from ocatari.ram import game_objects as ram_objects
+from ocatari.vision import game_objects as vision_objects
+
+# How the representation of an object class is written (see _nsrepr_kind)
+_POSITION, _NO_OBJECT, _GENERIC = 0, 1, 2
+_NSREPR_KINDS = {}
+
+
+def _nsrepr_kind(cls):
+    """
+    Classes keeping the default `_nsrepr` (i.e. [x, y], or [0, 0] if not visible) are written
+    directly from their position, without building the representation list.
+    """
+    kind = _NSREPR_KINDS.get(cls)
+    if kind is None:
+        empty = (ram_objects.NoObject, vision_objects.NoObject)
+        if issubclass(cls, empty) \
+                and cls._nsrepr in [base._nsrepr for base in empty]:
+            kind = _NO_OBJECT
+        elif any(issubclass(cls, base) and cls._nsrepr is base._nsrepr and cls.x is base.x and cls.y is base.y
+                 for base in (ram_objects.GameObject, vision_objects.GameObject)):
+            kind = _POSITION
+        else:
+            kind = _GENERIC
+        _NSREPR_KINDS[cls] = kind
+    return kind
+
+
+class NSStateLayout:
+    """
+    The layout of the neurosymbolic state of a list of object slots: the offset and length
+    of every object's representation (`_nsrepr`), compiled once from the slots.
+    Writing the state fills a preallocated vector, instead of chaining the representation lists.
+    If an object with a representation of another length takes a slot, the layout is recompiled
+    (and the state changes size, as it would with the chained lists).
+
+    :param objects: The object slots (e.g. `env.objects`).
+    :type objects: list of GameObject
+    :param dtype: The dtype of the state vector.
+    :type dtype: np.dtype
+
+    :ivar state: The state vector, overwritten at every :meth:`write`.
+    :vartype state: np.ndarray
+    """
+
+    def __init__(self, objects, dtype=np.float64):
+        self.dtype = np.dtype(dtype)
+        self.compile(objects)
+
+    def compile(self, objects):
+        """
+        (Re)computes the offsets of the slots from the current objects.
+        """
+        self.lengths = [len(o._nsrepr) for o in objects]
+        self.offsets = list(accumulate(self.lengths, initial=0))
+        self._values = [0] * self.offsets[-1]
+        self.state = np.zeros(self.offsets[-1], dtype=self.dtype)
+
+    def __len__(self):
+        return self.offsets[-1]
+
+    def write(self, objects):
+        """
+        Writes the neurosymbolic state of the objects into :attr:`state` and returns it.
+
+        :rtype: np.ndarray
+        """
+        lengths, values, kinds = self.lengths, self._values, _NSREPR_KINDS
+        if len(objects) != len(lengths):
+            self.compile(objects)
+            return self.write(objects)
+        for o, start, length in zip(objects, self.offsets, lengths):
+            kind = kinds.get(type(o))
+            if kind is None:
+                kind = _nsrepr_kind(type(o))
+            if length == 2 and kind == _POSITION:
+                if o._visible:
+                    values[start], values[start + 1] = o._xy
+                else:
+                    values[start] = values[start + 1] = 0
+            elif length == 2 and kind == _NO_OBJECT and o.nslen == 2:
+                values[start] = values[start + 1] = 0
+            else:
+                repr_ = o._nsrepr
+                if len(repr_) != length:
+                    self.compile(objects)
+                    return self.write(objects)
+                values[start:start + length] = repr_
+        self.state[:] = values
+        return self.state
@@ -0,0 +1,407 @@
+"""
+Structure-of-arrays view of the object slots: one numpy structured array per game, with a row per slot,
+on which the positions, velocities, bounding boxes and masks are computed in a vectorized way
+(see :attr:`ocatari.core.OCAtari.object_table`).
+"""
+
+from math import nan
+import numpy as np
+from ocatari.ram import game_objects as ram_objects
+from ocatari.vision import game_objects as vision_objects
+
+OBJECT_DTYPE = np.dtype([
+    ("x", np.int32), ("y", np.int32), ("w", np.int32), ("h", np.int32),
+    ("prev_x", np.int32), ("prev_y", np.int32), ("visible", np.bool_),
+    ("category", np.int16), ("value", np.float64), ("rgb", np.uint8, (3,)),
+])
+# The category of the empty slots (None or NoObject)
+EMPTY = -1
+
+# How the row of an object class is read (see _reader)
+_RAM, _VISION, _GENERIC = 0, 1, 2
+_READERS = {}
+_NUMBER_TYPES = (int, float, np.number)
+_EMPTY_TYPES = (ram_objects.NoObject, vision_objects.NoObject)
+
+
+def _reader(cls):
+    """
+    Classes keeping the default position properties are read directly from their attributes,
+    the others through their (public) properties.
+    """
+    kind = _READERS.get(cls)
+    if kind is None:
+        ram, vision = ram_objects.GameObject, vision_objects.GameObject
+        ram_properties = ("x", "y", "w", "h", "xy", "xywh", "prev_xy", "rgb")
+        vision_properties = ("x", "y", "w", "h", "xy", "xywh", "h_coords")
+        if issubclass(cls, ram) and all(getattr(cls, p) is getattr(ram, p)
+                                        for p in ram_properties):
+            kind = _RAM
+        elif issubclass(cls, vision) and all(
+                getattr(cls, p) is getattr(vision, p)
+                for p in vision_properties):
+            kind = _VISION
+        else:
+            kind = _GENERIC
+        _READERS[cls] = kind
+    return kind
+
+
+class ObjectRow:
+    """
+    A read-only view of a row of an :class:`ObjectTable`, with the position properties of the game objects.
+    """
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def _get(self, field):
+        return self.table.array[field][self.index].item()
+
+    @property
+    def category(self):
+        return self.table.category_name(self._get("category"))
+
+    @property
+    def x(self):
+        return self._get("x")
+
+    @property
+    def y(self):
+        return self._get("y")
+
+    @property
+    def w(self):
+        return self._get("w")
+
+    @property
+    def h(self):
+        return self._get("h")
+
+    @property
+    def xy(self):
+        return self.x, self.y
+
+    @property
+    def wh(self):
+        return self.w, self.h
+
+    @property
+    def xywh(self):
+        return self.x, self.y, self.w, self.h
+
+    @property
+    def prev_xy(self):
+        return self._get("prev_x"), self._get("prev_y")
+
+    @property
+    def dx(self):
+        return self.x - self._get("prev_x")
+
+    @property
+    def dy(self):
+        return self.y - self._get("prev_y")
+
+    @property
+    def center(self):
+        return self.x + self.w / 2, self.y + self.h / 2
+
+    @property
+    def visible(self):
+        return self._get("visible")
+
+    @property
+    def value(self):
+        value = self._get("value")
+        if value != value:
+            return None
+        return int(value) if value.is_integer() else value
+
+    @property
+    def rgb(self):
+        return tuple(self.table.array["rgb"][self.index].tolist())
+
+    def __bool__(self):
+        return self.visible
+
+    def __repr__(self):
+        if self.visible:
+            return f"{self.category} at ({self.x}, {self.y}), {self.wh}"
+        return "\033[34m" + "NaO" + "\033[39m"  # blue color
+
+
+class ObjectTable:
+    """
+    The object slots of a game as a structure of arrays: a numpy structured array (see `OBJECT_DTYPE`)
+    with one row per slot, holding the position, size, previous position, visibility, category id,
+    value (NaN without value) and color of its object. The empty slots have the category `EMPTY` (-1).
+
+    The detectors keep updating the game objects, the table is filled from them by :meth:`update`
+    (once per frame), then the derived quantities of all the slots are computed at once.
+
+    :param categories: The object categories (class names) of the game, giving the category ids.
+                       The categories met later are appended.
+    :type categories: list of str
+
+    :ivar array: The rows of the slots.
+    :vartype array: np.ndarray
+    :ivar categories: The object categories, by category id.
+    :vartype categories: list of str
+
+    Example::
+
+        table = env.object_table
+        moving = table.visible & ((table.dx != 0) | (table.dy != 0))
+        boxes = table.bounding_boxes[moving]
+    """
+
+    def __init__(self, categories=()):
+        self.categories = list(categories)
+        self._ids = {name: i for i, name in enumerate(self.categories)}
+        self.array = np.zeros(0, dtype=OBJECT_DTYPE)
+
+    def _category_id(self, name):
+        idx = self._ids.get(name)
+        if idx is None:
+            idx = self._ids[name] = len(self.categories)
+            self.categories.append(name)
+        return idx
+
+    def category_name(self, idx):
+        """
+        The category of a category id (`NoObject` for the empty slots).
+
+        :rtype: str
+        """
+        return "NoObject" if idx == EMPTY else self.categories[idx]
+
+    def _row(self, o):
+        kind = _READERS.get(o.__class__)
+        if kind is None:
+            kind = _reader(o.__class__)
+        value = getattr(o, "value", None)
+        if not isinstance(value, _NUMBER_TYPES):
+            value = nan
+        if isinstance(o, _EMPTY_TYPES):
+            category = EMPTY
+        else:
+            category = self._category_id(o.category)
+        if kind == _RAM:
+            x, y = o._xy
+            w, h = o.wh
+            prev = o._xy if o._prev_xy is None else o._prev_xy
+            rgb = o._rgb if o._visible else (0, 0, 0)
+        elif kind == _VISION:
+            x, y = o._xy
+            w, h = o.wh
+            prev = o._prev_xy
+            rgb = o.rgb
+        else:
+            x, y, w, h = o.xywh
+            if isinstance(o, ram_objects.GameObject):
+                prev = o.prev_xy
+            else:
+                prev = o.h_coords[1]
+            rgb = o.rgb
+        return x, y, w, h, prev[0], prev[1], bool(o), category, value, rgb
+
+    def update(self, objects):
+        """
+        Fills the table from the object slots (e.g. `env.objects`), resized if the number of slots changed.
+
+        :return: The table
+        :rtype: ObjectTable
+        """
+        rows = [(0, 0, 0, 0, 0, 0, False, EMPTY, nan, (0, 0, 0))
+                if o is None else self._row(o) for o in objects]
+        array = self.array
+        if len(rows) != len(array):
+            array = self.array = np.zeros(len(rows), dtype=OBJECT_DTYPE)
+        if rows:  # column by column, faster than converting the rows
+            for name, column in zip(OBJECT_DTYPE.names, zip(*rows)):
+                array[name] = column
+        return self
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, key):
+        """
+        A column (by field name, e.g. `table["x"]`) or a row view (by slot index, see :class:`ObjectRow`).
+        """
+        if isinstance(key, str):
+            return self.array[key]
+        if key < 0:
+            key += len(self.array)
+        if not 0 <= key < len(self.array):
+            raise IndexError(f"Slot index out of range: {key}")
+        return ObjectRow(self, key)
+
+    def __iter__(self):
+        return (ObjectRow(self, i) for i in range(len(self.array)))
+
+    @property
+    def visible(self):
+        """
+        :type: np.ndarray of bool, (nb_slots,)
+        """
+        return self.array["visible"]
+
+    @property
+    def category(self):
+        """
+        The category ids.
+
+        :type: np.ndarray of int16, (nb_slots,)
+        """
+        return self.array["category"]
+
+    def category_mask(self, name):
+        """
+        The slots holding an object of the given category.
+
+        :rtype: np.ndarray of bool
+        """
+        idx = self._ids.get(name)
+        if idx is None:
+            return np.zeros(len(self.array), dtype=bool)
+        return self.array["category"] == idx
+
+    @property
+    def xy(self):
+        """
+        :type: np.ndarray of int32, (nb_slots, 2)
+        """
+        return np.stack((self.array["x"], self.array["y"]), axis=-1)
+
+    @property
+    def wh(self):
+        """
+        :type: np.ndarray of int32, (nb_slots, 2)
+        """
+        return np.stack((self.array["w"], self.array["h"]), axis=-1)
+
+    @property
+    def xywh(self):
+        """
+        :type: np.ndarray of int32, (nb_slots, 4)
+        """
+        a = self.array
+        return np.stack((a["x"], a["y"], a["w"], a["h"]), axis=-1)
+
+    @property
+    def prev_xy(self):
+        """
+        :type: np.ndarray of int32, (nb_slots, 2)
+        """
+        return np.stack((self.array["prev_x"], self.array["prev_y"]), axis=-1)
+
+    @property
+    def dx(self):
+        """
+        The horizontal movements since the previous frame (`x - prev_x`).
+
+        :type: np.ndarray of int32, (nb_slots,)
+        """
+        return self.array["x"] - self.array["prev_x"]
+
+    @property
+    def dy(self):
+        """
+        The vertical movements since the previous frame (`y - prev_y`).
+
+        :type: np.ndarray of int32, (nb_slots,)
+        """
+        return self.array["y"] - self.array["prev_y"]
+
+    @property
+    def dxy(self):
+        """
+        :type: np.ndarray of int32, (nb_slots, 2)
+        """
+        return self.xy - self.prev_xy
+
+    @property
+    def centers(self):
+        """
+        The centers of the bounding boxes.
+
+        :type: np.ndarray of float64, (nb_slots, 2)
+        """
+        return self.xy + self.wh / 2
+
+    @property
+    def bounding_boxes(self):
+        """
+        The bounding boxes as (x0, y0, x1, y1).
+
+        :type: np.ndarray of int32, (nb_slots, 4)
+        """
+        a = self.array
+        return np.stack((a["x"], a["y"], a["x"] + a["w"], a["y"] + a["h"]),
+                        axis=-1)
+
+    @property
+    def positions(self):
+        """
+        The positions of the visible objects, (0, 0) for the others: the default neurosymbolic representation.
+
+        :type: np.ndarray of int32, (nb_slots, 2)
+        """
+        return self.xy * self.array["visible"][:, None]
+
+    def masked_boxes(self, shape=(210, 160)):
+        """
+        The bounding boxes clipped to the screen, as (row0, row1, col0, col1), and the slots whose clipped box
+        is not empty, as rasterized by :func:`ocatari.ram.extract_ram_info.get_masked_dqn_bin_state`.
+        For a smaller `shape` (e.g. (84, 84)), the boxes are scaled down, covering at least one pixel.
+
+        :rtype: (np.ndarray, np.ndarray)
+        """
+        a = self.array
+        x, y = a["x"].astype(np.int64), a["y"].astype(np.int64)
+        x1, y1 = x + a["w"], y + a["h"]
+        keep = (x1 > 0) & (y1 > 0)
+        y0, y1 = np.maximum(y, 0), np.minimum(y1, 209)
+        x0, x1 = np.maximum(x, 0), np.minimum(x1, 159)
+        keep &= (y0 < y1) & (x0 < x1)
+        rows, cols = shape
+        if rows != 210:
+            y0, y1 = y0 * rows // 210, -(-y1 * rows // 210)
+        if cols != 160:
+            x0, x1 = x0 * cols // 160, -(-x1 * cols // 160)
+        return np.stack((y0, y1, x0, x1), axis=-1), keep
+
+    def binary_mask(self, shape=(210, 160), out=None):
+        """
+        Rasterizes the bounding boxes of the objects (255) on a black screen,
+        as :func:`ocatari.ram.extract_ram_info.get_masked_dqn_bin_state`.
+
+        :param shape: The resolution of the mask
+        :type shape: (int, int)
+        :param out: A (reused) uint8 buffer to write the mask into, of shape `shape`
+        :type out: np.ndarray
+        :rtype: np.ndarray
+        """
+        boxes, keep = self.masked_boxes(shape)
+        if out is None:
+            out = np.zeros(shape, dtype=np.uint8)
+        else:
+            out.fill(0)
+        for y0, y1, x0, x1 in boxes[keep].tolist():
+            out[y0:y1, x0:x1] = 255
+        return out
+
+
+def stack_tables(tables):
+    """
+    Stacks the tables of environments of the same game (e.g. of a vector environment)
+    into a single structured array of shape (nb_envs, nb_slots), for batched computations.
+
+    :type tables: list of ObjectTable
+    :rtype: np.ndarray
+    """
+    return np.stack([table.array for table in tables])
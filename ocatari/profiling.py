@@ -0,0 +1,169 @@
+"""
+Opt-in per-stage timing of the OCAtari environments (see :meth:`ocatari.core.OCAtari.enable_profiling`).
+"""
+
+from math import log2
+from time import perf_counter
+import numpy as np
+
+# Histogram bins, in microseconds, 4 per octave from 1 us to ~8 s: bin 0 is [0, 1),
+# bin i is [2**((i-1)/4), 2**(i/4)), the last one is unbounded.
+BINS_PER_OCTAVE = 4
+NB_BINS = 2 + 23 * BINS_PER_OCTAVE
+BIN_EDGES_US = [0.] + [2. ** (i / BINS_PER_OCTAVE)
+                       for i in range(NB_BINS - 1)] + [float("inf")]
+
+
+class StageStats:
+    """
+    The timings of one stage (e.g. `detect_objects`): call count, total, min, max
+    and a logarithmic histogram of the durations.
+    """
+
+    __slots__ = ("count", "total", "min", "max", "hist")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.
+        self.min = float("inf")
+        self.max = 0.
+        self.hist = [0] * NB_BINS
+
+    def add(self, duration):
+        """
+        Records a duration (in seconds).
+        """
+        self.count += 1
+        self.total += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        us = duration * 1e6
+        self.hist[min(int(BINS_PER_OCTAVE * log2(us)) + 1,
+                      NB_BINS - 1) if us >= 1 else 0] += 1
+
+    def percentile(self, q):
+        """
+        Estimates the q-th percentile (in seconds) from the histogram, as the upper edge of its bin.
+        """
+        if not self.count:
+            return 0.
+        idx = int(np.searchsorted(np.cumsum(self.hist), q / 100 * self.count))
+        return min(BIN_EDGES_US[idx + 1] * 1e-6, self.max)
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "total_s": self.total,
+            "mean_us": self.total / self.count * 1e6 if self.count else 0.,
+            "min_us": self.min * 1e6 if self.count else 0.,
+            "max_us": self.max * 1e6,
+            "p50_us": self.percentile(50) * 1e6,
+            "p90_us": self.percentile(90) * 1e6,
+            "p99_us": self.percentile(99) * 1e6,
+            "hist": list(self.hist),
+        }
+
+
+class StepProfiler:
+    """
+    Accumulates the timings of the stages of an environment.
+
+    :ivar stages: The statistics of every recorded stage.
+    :vartype stages: dict of str: StageStats
+    :ivar last: The durations (in seconds) of the stages of the last step (or reset).
+    :vartype last: dict of str: float
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.last = {}
+
+    def record(self, stage, duration):
+        """
+        Records the duration (in seconds) of a stage.
+        """
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = StageStats()
+        stats.add(duration)
+        self.last[stage] = duration
+
+    def clear(self):
+        self.stages.clear()
+        self.last.clear()
+
+    def stats(self):
+        """
+        The statistics of every stage, as (JSON serializable) dictionaries.
+        The histogram bins are given by `BIN_EDGES_US` (in microseconds).
+
+        :rtype: dict
+        """
+        return {stage: stats.as_dict() for stage, stats in self.stages.items()}
+
+
+class StageTimer:
+    """
+    Times the consecutive stages of a call (e.g. :meth:`ocatari.core.OCAtari.step`) into a profiler:
+    :meth:`start` at its beginning, :meth:`lap` at the end of every stage and :meth:`stop` at its end.
+
+    :param profiler: The profiler recording the durations
+    :type profiler: StepProfiler
+    :param info: Whether to add the durations of the stages of the call to its `info` dictionary,
+                 under `profiling`.
+    :type info: bool
+    """
+
+    __slots__ = ("profiler", "info", "_start", "_last", "_stages")
+
+    def __init__(self, profiler, info=False):
+        self.profiler = profiler
+        self.info = info
+        self._start = self._last = 0.
+        self._stages = []
+
+    def start(self):
+        self._start = self._last = perf_counter()
+        self._stages.clear()
+
+    def lap(self, stage):
+        """
+        Records the duration of a stage, since the previous lap (or the start).
+        """
+        now = perf_counter()
+        self.profiler.record(stage, now - self._last)
+        self._stages.append(stage)
+        self._last = now
+
+    def stop(self, total, info=None):
+        """
+        Records the duration of the whole call as the stage `total`, and adds the durations of its stages
+        to the `info` dictionary if enabled (and given, e.g. not by :meth:`ocatari.core.OCAtari.render`).
+        """
+        self.profiler.record(total, perf_counter() - self._start)
+        self._stages.append(total)
+        if self.info and info is not None:
+            last = self.profiler.last
+            info["profiling"] = {stage: last[stage] for stage in self._stages}
+
+
+class NullTimer:
+    """
+    A :class:`StageTimer` recording nothing, used while the profiling is disabled.
+    """
+
+    __slots__ = ()
+
+    def start(self):
+        pass
+
+    def lap(self, stage):
+        pass
+
+    def stop(self, total, info=None):
+        pass
+
+
+NULL_TIMER = NullTimer()
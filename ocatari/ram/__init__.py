@@ -1,10 +1,13 @@
 """
 RAM Extraction submodule of OCAtari
+
+The game modules are only imported when they are first accessed
+(e.g. `ocatari.ram.pong` or `from ocatari.ram import pong`).
 """
 
 from .game_objects import GameObject  # To avoid circular imports
-from . import *
 from os.path import dirname, basename, isfile, join
+import importlib
 import glob
 
 modules = glob.glob(join(dirname(__file__), "*.py"))
@@ -13,5 +16,12 @@ modules = [mod for mod in modules if not "_old" in mod]
 __all__ = [basename(f)[:-3] for f in modules if isfile(f)
            and not f.endswith('__init__.py')]
 
-for module in __all__:
-    __import__(f"{__name__}.{module}")
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
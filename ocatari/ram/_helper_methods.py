@@ -2,6 +2,29 @@
 Set of helper methods that are used in multiple Atari games
 """
 
+from operator import index
+
+import numpy as np
+
+
+def _hex_digits_value(number):
+    # The hexadecimal digits of the number read as a decimal number, 0 if some are not decimal digits
+    try:
+        return int(hex(number)[2:])
+    except ValueError:
+        return 0
+
+
+# Lookup tables of the RAM bytes: the values of the BCD numbers (see `_convert_number`), the bits from the most
+# significant one (see `number_to_bitfield`) and from the least significant one
+BCD_VALUES = tuple(_hex_digits_value(n) for n in range(256))
+BITFIELDS = tuple(tuple((n >> (7 - i)) & 1 for i in range(8)) for n in range(256))
+REVERSED_BITFIELDS = tuple(bits[::-1] for bits in BITFIELDS)
+# and their arrays, indexed by arrays of bytes (see `convert_numbers` and `numbers_to_bitfields`)
+BCD_TABLE = np.array(BCD_VALUES, dtype=np.int64)
+BITFIELD_TABLE = np.array(BITFIELDS, dtype=np.uint8)
+REVERSED_BITFIELD_TABLE = np.ascontiguousarray(BITFIELD_TABLE[:, ::-1])
+
 
 def _convert_number(number):
     """
@@ -18,22 +41,26 @@ def _convert_number(number):
     :return: The number in decimal
     :rtype: int
     """
-    number_str = str(hex(number))
-    number_list = [*number_str]
-    number_str = ""
-    count = 0
-    for x in number_list:
-        if count > 1:
-            number_str += x
-        count += 1
-    try:
-        number = int(number_str)
-    except ValueError as e:
-        number = 0
-    return number
+    number = index(number)  # the comparisons of numpy scalars are slow
+    if 0 <= number < 256:
+        return BCD_VALUES[number]
+    return _hex_digits_value(number) if number > 0 else 0
+
+
+def convert_numbers(numbers):
+    """
+    The vectorized :func:`_convert_number`, on an array of bytes (e.g. the RAM states of many frames).
 
+    :param numbers: The hexadecimal numbers to be converted
+    :type numbers: np.ndarray of uint8
 
-def number_to_bitfield(n):
+    :return: The numbers in decimal
+    :rtype: np.ndarray of int64
+    """
+    return BCD_TABLE[numbers]
+
+
+def number_to_bitfield(n, reverse=False):
     """
     Convert number to 8 bit bitfield.
 
@@ -43,13 +70,26 @@ def number_to_bitfield(n):
 
     :param n: The number to be converted
     :type n: uint8
+    :param reverse: Start from the least significant bit.
+    :type reverse: bool
     :return: The number in decimal
     :rtype: list of int
     """
-    lst = [1 if digit == '1' else 0 for digit in bin(n)[2:]]
-    buffer = [0] * (8 - len(lst))
-    buffer.extend(lst)
-    return buffer
+    return list(REVERSED_BITFIELDS[n] if reverse else BITFIELDS[n])
+
+
+def numbers_to_bitfields(numbers, reverse=False):
+    """
+    The vectorized :func:`number_to_bitfield`, on an array of bytes.
+
+    :param numbers: The numbers to be converted
+    :type numbers: np.ndarray of uint8
+    :param reverse: Start from the least significant bit.
+    :type reverse: bool
+    :return: The bits of the numbers, along a new last axis of size 8
+    :rtype: np.ndarray of uint8
+    """
+    return (REVERSED_BITFIELD_TABLE if reverse else BITFIELD_TABLE)[numbers]
 
 
 def bitfield_to_number(b, flip=False):
@@ -64,19 +104,9 @@ def bitfield_to_number(b, flip=False):
     :return: The bit list corresponding to this number.
     :rtype: list of int
     """
-    exp = len(b)-1
-    if flip:
-        exp = 0
     res = 0
-    for bit in b:
-        if bit == 1:
-            res = res + pow(2, exp)
-
-        if flip:
-            exp = exp + 1
-        else:
-            exp = exp - 1
-
+    for bit in (reversed(b) if flip else b):
+        res = 2 * res + (bit == 1)
     return res
 
 
@@ -10,6 +10,8 @@ https://atariage.com/2600/archives/strategy_adventuremap.html?SystemID=2600
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [252, 252, 84]
@@ -18,6 +20,8 @@ class Player(GameObject):
 
 # Each dragon has a different purpose that's why I thought it might be more relevant to have a class for each dragon
 class YellowDragon(GameObject):
+    __slots__ = ("alive",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [223, 192, 111]
@@ -26,6 +30,8 @@ class YellowDragon(GameObject):
 
 
 class GreenDragon(GameObject):
+    __slots__ = ("alive",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [223, 192, 111]
@@ -34,6 +40,8 @@ class GreenDragon(GameObject):
 
 
 class RedDragon(GameObject):
+    __slots__ = ("alive",)
+
     def __init__(self, *args, **kwargs):
         self.rgb = [223, 192, 111]
         self.wh = 1, 1
@@ -41,6 +49,8 @@ class RedDragon(GameObject):
 
 
 class BlackBat(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [0, 0, 0]
@@ -48,6 +58,8 @@ class BlackBat(GameObject):
 
 
 class DragonSword(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [223, 192, 111]
@@ -55,6 +67,8 @@ class DragonSword(GameObject):
 
 
 class YellowKey(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [223, 192, 111]
@@ -62,6 +76,8 @@ class YellowKey(GameObject):
 
 
 class BlackKey(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [0, 0, 0]
@@ -69,6 +85,8 @@ class BlackKey(GameObject):
 
 
 class WhiteKey(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [255, 255, 255]
@@ -76,6 +94,8 @@ class WhiteKey(GameObject):
 
 
 class Magnet(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [0, 0, 0]
@@ -83,6 +103,8 @@ class Magnet(GameObject):
 
 
 class BridgeEdge(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [168, 72, 158]
@@ -90,6 +112,8 @@ class BridgeEdge(GameObject):
 
 
 class Gate(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [0, 0, 0]
@@ -97,6 +121,8 @@ class Gate(GameObject):
 
 
 class Chalice(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args: object, **kwargs: object) -> object:
         super().__init__(*args, **kwargs)
         self.rgb = [168, 72, 158]
@@ -1,5 +1,6 @@
 import sys
 from .game_objects import GameObject, NoObject
+from ._helper_methods import _convert_number
 import numpy as np
 
 """
@@ -304,9 +305,9 @@ def _detect_objects_ram(objects, ram_state, hud=False):
     player_score = NoObject()
     if hud:
         player_score = PlayerScore()
-        a = ram_state[40] % 16 + 10 * (ram_state[40] // 16)
-        b = ram_state[41] % 16 + 10 * (ram_state[41] // 16)
-        c = ram_state[42] % 16 + 10 * (ram_state[42] // 16)
+        a = _convert_number(ram_state[40])
+        b = _convert_number(ram_state[41])
+        c = _convert_number(ram_state[42])
         player_score.score = a * 10000 + b * 100 + c
 
         if player_score.score < 10:
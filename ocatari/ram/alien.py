@@ -1,4 +1,4 @@
-from .game_objects import GameObject, ValueObject, NoObject
+from .game_objects import GameObject, ValueObject, NoObject, spawn_object, ensure_object, clear_slot
 import sys
 
 MAX_NB_OBJECTS = {"Player": 1, "Alien": 3,
@@ -94,7 +94,7 @@ def _init_objects_ram(hud=False):
     """
     objects = [Player()]
 
-    objects.extend([NoObject()] * 173)
+    objects.extend(NoObject() for _ in range(173))
     if hud:
         objects.extend([Score(), NoObject()])
     return objects
@@ -111,8 +111,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
     # y 110 = 43 152 = 22
     for i in range(3):
         if ram_state[42+i] and ram_state[49+i]:
-            if type(objects[1+i]) is NoObject:
-                objects[1+i] = Alien()
+            ensure_object(objects, 1+i, Alien)
             alien = objects[1+i]
             alien.xy = ram_state[49+i] + 17, 196 - ram_state[42+i]*2
             if ram_state[117] == 139:
@@ -128,11 +127,10 @@ def _detect_objects_ram(objects, ram_state, hud=False):
                 alien.rgb = 236, 140, 224
                 alien.vulnerable = False
         else:
-            objects[1+i] = NoObject()
+            clear_slot(objects, 1+i)
 
     if ram_state[103]:
-        if type(objects[4]) is NoObject:
-            objects[4] = Pulsar()
+        ensure_object(objects, 4, Pulsar)
 
         if ram_state[103] == 1:
             objects[4].xy = 123, 137
@@ -141,14 +139,13 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         elif ram_state[103] == 3:
             objects[4].xy = 77, 17
     else:
-        objects[4] = NoObject()
+        clear_slot(objects, 4)
 
     if ram_state[47]:
-        if type(objects[5]) is NoObject:
-            objects[5] = Rocket()
+        ensure_object(objects, 5, Rocket)
         objects[5].xy = 17+15*(ram_state[60] & 7), 197-(2*ram_state[47])
     else:
-        objects[5] = NoObject()
+        clear_slot(objects, 5)
 
 ##############################################
 # ============================================
@@ -156,80 +153,68 @@ def _detect_objects_ram(objects, ram_state, hud=False):
     y = 19
     for i in range(13):
         if ram_state[65+i] & 4:
-            if type(objects[6+i*6]) is NoObject:
-                objects[6+i*6] = Egg(x=26, y=y)
+            ensure_object(objects, 6+i*6, Egg, 26, y)
         else:
-            objects[6+i*6] = NoObject()
+            clear_slot(objects, 6+i*6)
 
         if ram_state[65+i] & 8:
-            if type(objects[7+i*6]) is NoObject:
-                objects[7+i*6] = Egg(x=56, y=y)
+            ensure_object(objects, 7+i*6, Egg, 56, y)
         else:
-            objects[7+i*6] = NoObject()
+            clear_slot(objects, 7+i*6)
 
         if ram_state[65+i] & 16:
-            if type(objects[8+i*6]) is NoObject:
-                objects[8+i*6] = Egg(x=34, y=y+2)
+            ensure_object(objects, 8+i*6, Egg, 34, y+2)
         else:
-            objects[8+i*6] = NoObject()
+            clear_slot(objects, 8+i*6)
 
         if ram_state[65+i] & 32:
-            if type(objects[9+i*6]) is NoObject:
-                objects[9+i*6] = Egg(x=64, y=y+2)
+            ensure_object(objects, 9+i*6, Egg, 64, y+2)
         else:
-            objects[9+i*6] = NoObject()
+            clear_slot(objects, 9+i*6)
 
         if ram_state[65+i] & 64:
-            if type(objects[10+i*6]) is NoObject:
-                objects[10+i*6] = Egg(x=42, y=y+4)
+            ensure_object(objects, 10+i*6, Egg, 42, y+4)
         else:
-            objects[10+i*6] = NoObject()
+            clear_slot(objects, 10+i*6)
 
         if ram_state[65+i] & 128:
-            if type(objects[11+i*6]) is NoObject:
-                objects[11+i*6] = Egg(x=72, y=y+4)
+            ensure_object(objects, 11+i*6, Egg, 72, y+4)
         else:
-            objects[11+i*6] = NoObject()
+            clear_slot(objects, 11+i*6)
 
         y += 12
 
     y = 19
     for i in range(13):
         if ram_state[78+i] & 4:
-            if type(objects[84+i*6]) is NoObject:
-                objects[84+i*6] = Egg(x=89, y=y)
+            ensure_object(objects, 84+i*6, Egg, 89, y)
         else:
-            objects[84+i*6] = NoObject()
+            clear_slot(objects, 84+i*6)
 
         if ram_state[78+i] & 8:
-            if type(objects[85+i*6]) is NoObject:
-                objects[85+i*6] = Egg(x=118, y=y)
+            ensure_object(objects, 85+i*6, Egg, 118, y)
         else:
-            objects[85+i*6] = NoObject()
+            clear_slot(objects, 85+i*6)
 
         if ram_state[78+i] & 16:
-            if type(objects[86+i*6]) is NoObject:
-                objects[86+i*6] = Egg(x=97, y=y+2)
+            ensure_object(objects, 86+i*6, Egg, 97, y+2)
         else:
-            objects[86+i*6] = NoObject()
+            clear_slot(objects, 86+i*6)
 
         if ram_state[78+i] & 32:
-            if type(objects[87+i*6]) is NoObject:
-                objects[87+i*6] = Egg(x=126, y=y+2)
+            ensure_object(objects, 87+i*6, Egg, 126, y+2)
         else:
-            objects[87+i*6] = NoObject()
+            clear_slot(objects, 87+i*6)
 
         if ram_state[78+i] & 64:
-            if type(objects[88+i*6]) is NoObject:
-                objects[88+i*6] = Egg(x=105, y=y+4)
+            ensure_object(objects, 88+i*6, Egg, 105, y+4)
         else:
-            objects[88+i*6] = NoObject()
+            clear_slot(objects, 88+i*6)
 
         if ram_state[78+i] & 128:
-            if type(objects[89+i*6]) is NoObject:
-                objects[89+i*6] = Egg(x=134, y=y+4)
+            ensure_object(objects, 89+i*6, Egg, 134, y+4)
         else:
-            objects[89+i*6] = NoObject()
+            clear_slot(objects, 89+i*6)
 
         y += 12
 
@@ -251,11 +236,11 @@ def _detect_objects_ram(objects, ram_state, hud=False):
 
         if lives:
             if type(objects[174]) is NoObject:
-                objects[174] = Life()
+                spawn_object(objects, 174, Life)
             objects[174].wh = 5 + 8*(lives-1), 5
             objects[174].value = lives
         else:
-            objects[174] = NoObject()
+            clear_slot(objects, 174)
 
 
 def _detect_objects_alien_raw(info, ram_state):
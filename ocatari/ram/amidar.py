@@ -11,6 +11,8 @@ MAX_NB_OBJECTS_HUD = {"Player": 1, "Warrior": 6, "Pig": 6,
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Player, self).__init__()
         self._xy = 0, 160
@@ -20,6 +22,8 @@ class Player(GameObject):
 
 
 class Warrior(GameObject):
+    __slots__ = ()
+
     def __init__(self, x=0, y=160, w=7, h=7):
         super(Warrior, self).__init__()
         self._xy = x, y
@@ -29,6 +33,8 @@ class Warrior(GameObject):
 
 
 class Pig(GameObject):
+    __slots__ = ()
+
     def __init__(self, x=0, y=160, w=7, h=7):
         super(Pig, self).__init__()
         self._xy = x, y
@@ -38,6 +44,8 @@ class Pig(GameObject):
 
 
 class Shadow(GameObject):
+    __slots__ = ()
+
     def __init__(self, x=0, y=160, w=7, h=7):
         super(Shadow, self).__init__()
         self._xy = x, y
@@ -47,6 +55,8 @@ class Shadow(GameObject):
 
 
 class Chicken(GameObject):
+    __slots__ = ()
+
     def __init__(self, x=0, y=160, w=7, h=7):
         super(Chicken, self).__init__()
         self._xy = x, y
@@ -56,6 +66,8 @@ class Chicken(GameObject):
 
 
 class Score(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 0, 0
@@ -65,6 +77,8 @@ class Score(ValueObject):
 
 
 class Life(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 0, 0
@@ -16,6 +16,8 @@ class Player(GameObject):
     The player figure i.e., the cannon.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.visible = True
@@ -30,6 +32,8 @@ class PlayerMissileVertical(GameObject):
     The projectile shot in the vertical direction from the cannon.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.visible = True
@@ -44,6 +48,8 @@ class PlayerMissileHorizontal(GameObject):
     The projectiles shot in the horizontal direction from the cannon.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.visible = True
@@ -59,6 +65,8 @@ class MotherShip(GameObject):
     The mother ship at the top, that continually deploys the smaller drones.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.visible = True
@@ -73,6 +81,8 @@ class Enemy(GameObject):
     The enemy drones deployed by the mother ship.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.visible = True
@@ -87,6 +97,8 @@ class EnemyMissile(GameObject):
     The projectiles shot at the player by the enemy drones.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.visible = True
@@ -101,6 +113,8 @@ class PlayerScore(ValueObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ("score",)
+
     def __init__(self):
         super().__init__()
         self.visible = True
@@ -119,6 +133,8 @@ class Lives(GameObject):
     The indicator for the remaining lives of the player (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.visible = True
@@ -133,6 +149,8 @@ class Health(GameObject):
     The temperature meter of the cannon (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.visible = True
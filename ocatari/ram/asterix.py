@@ -29,6 +29,8 @@ class Enemy(GameObject):
 
 
 class Score(GameObject):
+    __slots__ = ("value",)
+
     def __init__(self):
         super().__init__()
         self.rgb = 187, 187, 53
@@ -15,6 +15,8 @@ MAX_NB_OBJECTS_HUD = {"Player":  1, "Enemy": 8,
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 187, 187, 53
@@ -25,6 +27,8 @@ class Player(GameObject):
 
 
 class Cauldron(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 167, 26, 26
@@ -34,6 +38,8 @@ class Cauldron(GameObject):
 
 
 class Enemy(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 228, 111, 111
@@ -43,6 +49,8 @@ class Enemy(GameObject):
 
 
 class Score(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 187, 187, 53
@@ -52,6 +60,8 @@ class Score(GameObject):
 
 
 class Lives(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 187, 187, 53
@@ -61,6 +71,8 @@ class Lives(GameObject):
 
 
 class Helmet(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 240, 128, 128
@@ -70,6 +82,8 @@ class Helmet(GameObject):
 
 
 class Shield(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 214, 214, 214
@@ -79,6 +93,8 @@ class Shield(GameObject):
 
 
 class Lamp(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 187, 53, 53
@@ -88,6 +104,8 @@ class Lamp(GameObject):
 
 
 class Apple(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 184, 50, 50
@@ -97,6 +115,8 @@ class Apple(GameObject):
 
 
 class Fish(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 198, 89, 179
@@ -106,6 +126,8 @@ class Fish(GameObject):
 
 
 class Meat(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 184, 50, 50
@@ -115,6 +137,8 @@ class Meat(GameObject):
 
 
 class Mug(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 184, 50, 50
@@ -124,6 +148,8 @@ class Mug(GameObject):
 
 
 class Reward50(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 198, 89, 179
@@ -133,6 +159,8 @@ class Reward50(GameObject):
 
 
 class Reward100(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 135, 183, 84
@@ -142,6 +170,8 @@ class Reward100(GameObject):
 
 
 class Reward200(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 195, 144, 61
@@ -151,6 +181,8 @@ class Reward200(GameObject):
 
 
 class Reward300(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 213, 130, 74
@@ -160,6 +192,8 @@ class Reward300(GameObject):
 
 
 class Reward400(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 135, 183, 84
@@ -169,6 +203,8 @@ class Reward400(GameObject):
 
 
 class Reward500(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 163, 57, 21
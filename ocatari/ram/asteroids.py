@@ -22,6 +22,8 @@ class Player(GameObject):
     The player figure i.e., the space ship on patrol.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 84, 99
@@ -56,6 +58,8 @@ class Asteroid(GameObject):
     The asteroid boulders.
     """
 
+    __slots__ = ()
+
     def __init__(self, x=8, y=87, w=16, h=28):
         super().__init__()
         self._xy = x, y
@@ -77,6 +81,8 @@ class PlayerMissile(GameObject):
     The photon torpedoes that can be fired from the space ship.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -98,6 +104,8 @@ class PlayerScore(GameObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 68, 5
@@ -122,6 +130,8 @@ class Lives(GameObject):
     The indicator for remaining lives of the player (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 132, 5
@@ -143,6 +153,8 @@ class NoObjectPlayer(NoObject):
     A placeholder class for empty slots where no game object is present.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.orientation = 0
@@ -17,6 +17,8 @@ class Sentry(GameObject):
     The left and right sentry posts.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Sentry, self).__init__()
         self._xy = 0, 124
@@ -31,6 +33,8 @@ class Projectile(GameObject):
     The projectiles shot from the sentry posts or the Acropolis Command Post.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -44,6 +48,8 @@ class AquaPlane(GameObject):
     The Aqua Plain district of the city.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(AquaPlane, self).__init__()
         self._xy = 16, 171
@@ -57,6 +63,8 @@ class DomedPalace(GameObject):
     The Doomed Palace district of the city.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(DomedPalace, self).__init__()
         self._xy = 38, 148
@@ -70,6 +78,8 @@ class Generator(GameObject):
     The three Generator Stations.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Generator, self).__init__()
         self._xy = 62, 137
@@ -83,6 +93,8 @@ class BridgedBazaar(GameObject):
     The Bridged Bazaar district of the city.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(BridgedBazaar, self).__init__()
         self._xy = 96, 159
@@ -96,6 +108,8 @@ class AcropolisCommandPost(GameObject):
     The Acropolis Command Post that defends the centre of Atlantis.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(AcropolisCommandPost, self).__init__()
         self._xy = 72, 112
@@ -109,6 +123,8 @@ class BanditBomber(GameObject):
     The fast Gorgon Bandit Bombers.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(BanditBomber, self).__init__()
         self._xy = 0, 0
@@ -122,6 +138,8 @@ class GorgonShip(GameObject):
     The Large Gorgon Vessels.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(GorgonShip, self).__init__()
         self._xy = 0, 0
@@ -135,6 +153,8 @@ class Deathray(GameObject):
     The deathray fired by close Gorgon units.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Deathray, self).__init__()
         self._xy = 0, 92
@@ -148,6 +168,8 @@ class Score(GameObject):
     The player's score display.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 96, 188
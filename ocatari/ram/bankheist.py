@@ -8,6 +8,8 @@ MAX_NB_OBJECTS_HUD = {"Player": 1, "Bank": 3, "Police": 3,
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Player, self).__init__()
         self._xy = 0, 160
@@ -17,6 +19,8 @@ class Player(GameObject):
 
 
 class Bank(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Bank, self).__init__()
         self._xy = 0, 160
@@ -26,6 +30,8 @@ class Bank(GameObject):
 
 
 class Police(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Police, self).__init__()
         self._xy = 0, 160
@@ -35,6 +41,8 @@ class Police(GameObject):
 
 
 class Dynamite(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Dynamite, self).__init__()
         self._xy = 0, 160
@@ -44,6 +52,8 @@ class Dynamite(GameObject):
 
 
 class Score(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 98, 179
@@ -54,6 +64,8 @@ class Score(ValueObject):
 
 
 class Life(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 0, 0
@@ -63,6 +75,8 @@ class Life(GameObject):
 
 
 class Gas_Tank(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Gas_Tank, self).__init__()
         self._xy = 42, 12
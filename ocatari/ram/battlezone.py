@@ -9,6 +9,8 @@ MAX_NB_OBJECTS_HUD = {"Player": 1, "Blue_Tank": 1, "Crosshair": 1,
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Player, self).__init__()
         self._xy = 19, 140
@@ -18,6 +20,8 @@ class Player(GameObject):
 
 
 class Crosshair(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Crosshair, self).__init__()
         self._xy = 78, 79
@@ -27,6 +31,8 @@ class Crosshair(GameObject):
 
 
 class Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Shot, self).__init__()
         self._xy = 78, 79
@@ -36,6 +42,8 @@ class Shot(GameObject):
 
 
 class Radar(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Radar, self).__init__()
         self._xy = 74, 3
@@ -45,6 +53,8 @@ class Radar(GameObject):
 
 
 class Radar_Content(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Radar_Content, self).__init__()
         self._xy = 74, 3
@@ -54,6 +64,8 @@ class Radar_Content(GameObject):
 
 
 class Blue_Tank(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Blue_Tank, self).__init__()
         self._xy = 74, 3
@@ -63,6 +75,8 @@ class Blue_Tank(GameObject):
 
 
 class Yellow_Blue_Tank(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Yellow_Blue_Tank, self).__init__()
         self._xy = 74, 3
@@ -72,6 +86,8 @@ class Yellow_Blue_Tank(GameObject):
 
 
 class Red_Thing(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Red_Thing, self).__init__()
         self._xy = 74, 3
@@ -81,6 +97,8 @@ class Red_Thing(GameObject):
 
 
 class Boss(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Boss, self).__init__()
         self._xy = 74, 3
@@ -90,6 +108,8 @@ class Boss(GameObject):
 
 
 class Score(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 0, 0
@@ -99,6 +119,8 @@ class Score(ValueObject):
 
 
 class Life(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 0, 0
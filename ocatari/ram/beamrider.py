@@ -17,6 +17,8 @@ class Player(GameObject):
     The player figure i.e., the space ship.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Player, self).__init__()
         self.visible = True
@@ -31,6 +33,8 @@ class Player_Projectile(GameObject):
     The laser lariats that can be fired from the space ship.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 198, 108, 58
@@ -41,6 +45,8 @@ class Torpedos(GameObject):
     The limited torpedoes that can be fired from the space ship.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 164, 89, 208
@@ -51,6 +57,8 @@ class Saucer(GameObject):
     The White Enemy Saucers.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.visible = True
@@ -65,6 +73,8 @@ class Rejuvenator(GameObject):
     The Yellow Rejuvinators occasionally floating through the beam matrix.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 187, 187, 53
@@ -75,6 +85,8 @@ class Sentinel(GameObject):
     The Sector Sentinel Ship, which appears once a sector has been cleared.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 184, 50, 50
@@ -85,12 +97,16 @@ class Blocker(GameObject):
     The Green Blocker Ships (sector 6).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 135, 183, 84
 
 
 class Jumper(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = None
@@ -101,6 +117,8 @@ class Charger(GameObject):
     The Blue Chargers (sector 10).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = None
@@ -111,6 +129,8 @@ class Bouncecraft(GameObject):
     The Green Bounce Craft (sector 8).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = None
@@ -121,6 +141,8 @@ class Chriper(GameObject):
     The Yellow Chirper Ships (sector 4).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = None
@@ -131,6 +153,8 @@ class Rock(GameObject):
     The Brown Space Debris (sector 2).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 134, 134, 29
@@ -141,6 +165,8 @@ class Torpedos_Available(GameObject):
     The torpedoe availability display.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 104, 25, 154
@@ -151,12 +177,16 @@ class Enemy_Projectile(GameObject):
     Enemy projectiles.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 164, 89, 208
 
 
 class HUD(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 210, 164, 74
@@ -167,6 +197,8 @@ class Enemy_Amount(GameObject):
     The count display for the remaining Enemy Saucers in the current sector.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 82, 126, 45
@@ -177,6 +209,8 @@ class Life(GameObject):
     The lives-indicator of the player.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 210, 210, 64
@@ -72,6 +72,8 @@ class PlayerScore(ValueObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 88, 183
@@ -88,6 +90,8 @@ class BonusPoints(ValueObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 56, 183
@@ -101,6 +105,8 @@ class Lives(ValueObject):
     The Atari logo, which is displayed in place of the score if the score is zero (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 63, 183
@@ -231,14 +237,14 @@ def _detect_objects_ram(objects, ram_state, hud=False):
             if objects[12]:
                 objects[12] = NoObject()
             nb_lives = ram_state[90]
-            if not objects[13] and nb_lives > 0:
+            lives = objects[13]
+            if not lives and nb_lives > 0:
                 lives = Lives()
                 objects[13] = lives
-            else:
-                lives = objects[13]
-            lives.value = nb_lives
-            lives.xy = 104 - 8*nb_lives, 183
-            lives.wh = 8*nb_lives-2, 7
+            if lives:
+                lives.value = nb_lives
+                lives.xy = 104 - 8*nb_lives, 183
+                lives.wh = 8*nb_lives-2, 7
         elif np.count_nonzero(ram_state[65:74]) == 0:  # no score, but bonus
             if objects[11]:
                 objects[11] = NoObject()
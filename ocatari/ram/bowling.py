@@ -1,6 +1,7 @@
 import sys
 from ._helper_methods import _convert_number
-from .game_objects import GameObject, NoObject
+from .game_objects import GameObject
+from .spec import RamSpec, Slot, Ram, Table, choose
 
 """
 RAM extraction for the game BOWLING. Supported modes: ram
@@ -19,6 +20,8 @@ class Player(GameObject):
     The player figure.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -32,6 +35,8 @@ class Ball(GameObject):
     The bowling ball.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 22, 139
@@ -45,6 +50,8 @@ class Pin(GameObject):
     The pins.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -58,6 +65,8 @@ class PlayerScore(GameObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 32, 19
@@ -74,6 +83,8 @@ class PlayerRound(GameObject):
     The round display for the first player (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 40, 7
@@ -87,6 +98,8 @@ class Player2Round(GameObject):
     The round display for the second player (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 120, 7
@@ -126,63 +139,6 @@ def _init_objects_ram(hud=False):
     return objects
 
 
-def _detect_objects_ram(objects, ram_state, hud=False):
-    """
-    For all objects:
-    (x, y, w, h, r, g, b)
-    """
-
-    # set default coord if object does not exist
-    player, ball = objects[:2]
-    player.xy = ram_state[29] + 8, 139 - 2 * (ram_state[40] - 1)
-    ball.xy = ram_state[30] + 7, 161 - 2 * (ram_state[41] - 1)
-
-    for i in range(10):
-        pin = objects[2 + i]
-        if ram_state[57 + i] < 250:    # pin is knocked down in this case
-            if not pin:
-                pin = Pin()
-                objects[2 + i] = pin
-            pin.xy = pin_location(
-                ram_state[57 + i]) + 9, 169 - 2 * (ram_state[47 + i])
-        else:
-            if pin:
-                objects[2 + i] = NoObject()
-
-    if hud:
-        p1s, p1r, p2r = objects[12:]
-        # score
-        sc = _convert_number(ram_state[33])
-        # ones digit is a one
-        if ram_state[38] != 0:  # hundreds
-            if ram_state[38] == 1:
-                p1s.xy = 24, 19
-                p1s.wh = 36, 15
-            else:
-                p1s.xy = 16, 19
-                p1s.wh = 44, 15
-        else:
-            if sc == 1:
-                p1s.xy = 56, 19
-                p1s.wh = 4, 15
-            elif sc < 10:
-                p1s.xy = 48, 19
-                p1s.wh = 12, 15
-            elif sc < 20:
-                p1s.xy = 40, 19
-                p1s.wh = 20, 15
-            else:
-                p1s.xy = 32, 19
-                p1s.wh = 28, 15
-        # round
-        if _convert_number(ram_state[36]) == 10:
-            p1r.xy = 24, 7
-            p1r.wh = 20, 10
-        elif _convert_number(ram_state[36]) != 1:
-            p1r.xy = 32, 7
-            p1r.wh = 12, 10
-
-
 def _detect_objects_bowling_raw(info, ram_state):
     # player_x, player_y  y: from 1 (down) to 28 (up)
     player = [ram_state[29], ram_state[40]]
@@ -228,3 +184,36 @@ def pins_standing_count(ram_state):
         if x == 255:
             count = count - 1
     return count
+
+
+_score = Table(_convert_number)
+_pin_x = Table(pin_location)
+
+
+def _player_score_xywh():
+    # the score display grows to the left with the digits, hundreds from ram[38]
+    score = _score(Ram(33))
+    return choose((Ram(38) == 1, (24, 19, 36, 15)), (Ram(38) != 0, (16, 19, 44, 15)),
+                  (score == 1, (56, 19, 4, 15)), (score < 10, (48, 19, 12, 15)),
+                  (score < 20, (40, 19, 20, 15)), default=(32, 19, 28, 15))
+
+
+def _ram_spec():
+    x, y, w, h = _player_score_xywh()
+    rounds = _score(Ram(36))
+    # the pins are knocked down for ram[57 + i] >= 250
+    pins = [Slot(Pin, present=Ram(57 + i) < 250, xy=(_pin_x(Ram(57 + i)) + 9, 169 - 2 * Ram(47 + i)))
+            for i in range(10)]
+    return RamSpec([
+        Slot(Player, xy=(Ram(29) + 8, 139 - 2 * (Ram(40) - 1))),
+        Slot(Ball, xy=(Ram(30) + 7, 161 - 2 * (Ram(41) - 1))),
+        *pins,
+        Slot(PlayerScore, hud=True, xy=(x, y), wh=(w, h)),
+        Slot(PlayerRound, hud=True).when(rounds != 1, xy=choose((rounds == 10, (24, 7)), default=(32, 7)),
+                                         wh=choose((rounds == 10, (20, 10)), default=(12, 10))),
+        Slot(Player2Round, hud=True),
+    ])
+
+
+RAM_SPEC = _ram_spec()
+_detect_objects_ram = RAM_SPEC.detector
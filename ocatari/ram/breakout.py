@@ -1,6 +1,6 @@
 import numpy as np
-from .game_objects import GameObject, NoObject
-from ._helper_methods import _convert_number
+from .game_objects import GameObject, NoObject, spawn_object, ensure_object, clear_slot
+from ._helper_methods import _convert_number, numbers_to_bitfields
 import sys
 
 """
@@ -21,6 +21,8 @@ class Player(GameObject):
     The player figure i.e., the paddle.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 99, 189
@@ -34,6 +36,8 @@ class Ball(GameObject):
     The game ball.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -47,6 +51,8 @@ class PlayerScore(GameObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 36, 5
@@ -63,6 +69,8 @@ class Live(GameObject):
     The indicator for the remaining balls (lives) (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 100, 5
@@ -76,6 +84,8 @@ class Block(GameObject):
     The rows of the brickwall.
     """
 
+    __slots__ = ()
+
     def __init__(self, x=0, y=0, rgb=(66, 72, 200)):
         super().__init__()
         self.xy = x, y
@@ -89,6 +99,8 @@ class PlayerNumber(GameObject):
     The player index display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.xy = 136, 5
@@ -144,21 +156,11 @@ def _make_block_bitmap(ram_state):
     input ram
     output ordered block bitmap
     """
-    array = ram_state[:36].reshape(-1, 6)
-    blocks_str = ""
-    for row in np.array(array).T:
-        row_str = ""
-        for j, bitnumber in enumerate(row):
-            if j == 0:
-                row_str = '{0:06b}'.format(bitnumber)[::-2] + row_str
-            elif j == 5:
-                row_str = '{0:08b}'.format(bitnumber)[1::-2] + row_str
-            else:
-                row_str = '{0:08b}'.format(bitnumber)[::-2] + row_str
-        blocks_str = row_str + "\n" + blocks_str
-    # convert str to binary array
-    blocks_int = np.array([list(el)
-                          for el in blocks_str.split("\n") if el], dtype=int)
+    # the bits of the 6 bytes of every row, from the least significant one
+    bits = numbers_to_bitfields(ram_state[:36].reshape(-1, 6).T, reverse=True)
+    # the columns: bit 6 of the 6th byte, bits 0, 2, 4, 6 of the 5th to 2nd bytes and bits 0, 2, 4 of the 1st one
+    blocks_int = np.concatenate([bits[:, 5, 6:7], bits[:, 4, ::2], bits[:, 3, ::2], bits[:, 2, ::2],
+                                 bits[:, 1, ::2], bits[:, 0, :6:2]], axis=1)[::-1].astype(int)
     correct_order = [0, 4, 3, 2, 1, 5, 6, 7,
                      8, 11, 12, 16, 15, 14, 13, 17, 18, 19]
     blocks_int = blocks_int.T[correct_order].T
@@ -181,31 +183,31 @@ def _detect_objects_ram(objects, ram_state, hud=False):
 
     # ball
     if ram_state[101] + 9 <= 196 and ram_state[101] != 0:  # else no ball
-        if type(objects[1]) is NoObject:
-            objects[1] = Ball()
-        objects[1].xy = ram_state[99] - 49, ram_state[101] + 9
+        ensure_object(objects, 1, Ball).xy = ram_state[99] - 49, ram_state[101] + 9
     else:
-        objects[1] = NoObject()
+        clear_slot(objects, 1)
 
     blocks_per_row = _calculate_blocks(ram_state)
     for i in range(6):
         block_color = block_colors[i]
-        blocks = blocks_per_row[i]
-        if blocks:
-            block = blocks.pop(0)
-        else:
-            block = NoObject()
+        blocks = iter(blocks_per_row[i])
+        block = next(blocks, None)
         for j in range(18):
-            if block and block.x == 8 * (j + 1):
-                if not objects[2 + i * 18 + j]:
-                    objects[2 + i * 18 + j] = block
+            idx = 2 + i * 18 + j
+            if block is not None and block[0] == 8 * (j + 1):
+                x, y, width, rgb = block
+                if not objects[idx]:
+                    new_block = spawn_object(objects, idx, Block)
+                    new_block.rgb = rgb
+                    new_block.xy = x, y
+                    new_block.wh = width, 6
                 else:
-                    objects[2 + i * 18 + j].xywh = block.xywh
-                    objects[2 + i * 18 + j].rgb = block_color
-                block = blocks.pop(0) if blocks else NoObject()
+                    objects[idx].xywh = x, y, width, 6
+                    objects[idx].rgb = block_color
+                block = next(blocks, None)
             else:
-                if objects[2 + i * 18 + j]:
-                    objects[2 + i * 18 + j] = NoObject()
+                if objects[idx]:
+                    clear_slot(objects, idx)
 
     # separated block parsing
     # ram[30] == lowest row left side always -6 in ram for next row
@@ -283,7 +285,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
 
 def _calculate_blocks(ram_state):
     """
-    Calculate the block lengths for all rows.
+    Calculate the blocks of all rows, as (x, y, width, rgb) tuples.
     """
     bitmap = _make_block_bitmap(ram_state)
     blocks = []
@@ -305,12 +307,8 @@ def _calculate_blocks(ram_state):
                 width += 8
 
             if (bitmap[row, column] == 0 or column == 17) and row_empty is False and start_of_new_block is False:
-                block = Block()
                 # uses the blockRow color dictionary
-                block.rgb = blockRow_colors.get(str(row))
-                block.xy = x, 57 + 6 * row
-                block.wh = width, 6
-                blockrow.append(block)
+                blockrow.append((x, 57 + 6 * row, width, blockRow_colors.get(str(row))))
                 start_of_new_block = True
         blocks.append(blockrow)
     return blocks
@@ -17,6 +17,8 @@ class Player(GameObject):
     The player figure i.e, the gun.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 66, 186
@@ -30,6 +32,8 @@ class PlayerMissile(GameObject):
     Projectiles fired from the player's gun.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -43,6 +47,8 @@ class Owl(GameObject):
     The owl targets.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -56,6 +62,8 @@ class Duck(GameObject):
     The duck targets.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -69,6 +77,8 @@ class FlyingDuck(GameObject):
     The ducks that fly down the screen to eat some of the bullets.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -82,6 +92,8 @@ class Rabbit(GameObject):
     The rabbit targets.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -95,6 +107,8 @@ class ExtraBullets(GameObject):
     The extra-bullet boxes.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -108,6 +122,8 @@ class PlayerScore(ValueObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 65, 0
@@ -124,6 +140,8 @@ class AmmoBar(GameObject):
     The ammunition bar display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 203
@@ -137,6 +155,8 @@ class BonusSign(GameObject):
     The bonus (or penalty) points/ammunition target (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 12, 29
@@ -150,6 +170,8 @@ class BonusValue(GameObject):
     The value of the bonus/penalty target.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 22, 29
@@ -163,6 +185,8 @@ class Wheel(GameObject):
     The spinning pipe target.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 70, 15
@@ -1,5 +1,5 @@
 from .game_objects import GameObject, ValueObject
-from ._helper_methods import bitfield_to_number, number_to_bitfield, _convert_number
+from ._helper_methods import _convert_number, BITFIELDS
 import math
 import sys
 
@@ -134,6 +134,8 @@ class Score(ValueObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 96, 7
@@ -204,16 +206,10 @@ def _number_lowpass(number):
     """
     if number < 20:
         return number
-    bitfield = number_to_bitfield(number)
-    for i in range(3):
-        bitfield[i] = 0
-    ret = bitfield_to_number(bitfield)
+    ret = number & 0b11111  # without the 3 most significant bits
     if ret < 20:
         return ret
-    bitfield = number_to_bitfield(ret)
-    bitfield[4] = 0
-    bitfield[5] = 0
-    return bitfield_to_number(bitfield)
+    return ret & 0b10011  # nor the bits 2 and 3
 
 
 def _create_walls_from_bitfield(bitfield, offset_x, offset_y, switch=False):
@@ -300,6 +296,7 @@ prev_centipede_x = [0, 0, 0, 0, 0, 0, 0, 0, 0]
 
 
 def _detect_objects_ram(objects, ram_state, hud=False):
+    global prev_centipede_x
     player, projectile = objects[:2]  # bug, ghost, crab1, crab2, crab3
     ground = objects[-1]
 
@@ -330,16 +327,19 @@ def _detect_objects_ram(objects, ram_state, hud=False):
             if b.x < 160 and b.y < 210:
                 objects.append(b)
 
+    # a new list every frame (assigned, not mutated), such that snapshots and the RAM cache keep the previous ones
+    prev_x = prev_centipede_x[:]
     for i in range(9):
         x = 17 + ram_state[100 + i]
-        dx = prev_centipede_x[i] - x
+        dx = prev_x[i] - x
         if dx != 0:
             centipede_segment = CentipedeSegment()
             centipede_segment.xy = x, _column_to_y(
                 19 - _number_lowpass(ram_state[91 + i]))
-            prev_centipede_x[i] = centipede_segment.x
+            prev_x[i] = centipede_segment.x
             if centipede_segment.x < 160 and centipede_segment.y < 210:
                 objects.append(centipede_segment)
+    prev_centipede_x = prev_x
 
     for i in range(19):   # way too complicated
         offset_y = _column_to_y(i) + 2
@@ -348,7 +348,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
             swap = i % 2 == 0
             if swap:
                 offset_x += 4
-            objects.extend(_create_walls_from_bitfield(number_to_bitfield(ram_state[45 + i * 2 + u]),
+            objects.extend(_create_walls_from_bitfield(BITFIELDS[ram_state[45 + i * 2 + u]],
                                                        offset_x, offset_y, swap))
     lvl = ram_state[109] % 8
     for obj in objects:
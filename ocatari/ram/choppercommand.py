@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from ._helper_methods import number_to_bitfield, bitfield_to_number, _convert_number
+from ._helper_methods import bitfield_to_number, _convert_number, BITFIELDS, REVERSED_BITFIELDS
 from .game_objects import GameObject, ValueObject
 import sys
 from math import ceil
@@ -153,6 +153,8 @@ class Score(ValueObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 75, 16
@@ -290,9 +292,9 @@ def _detect_objects_ram(objects, ram_state, hud):
 
     # mini_player
     mini_player = objects[1]
-    b_mini_x = number_to_bitfield(ram_state[71])[:3]
+    b_mini_x = BITFIELDS[ram_state[71]][:3]
     mini_x = 74+bitfield_to_number(b_mini_x)
-    b_mini_y = number_to_bitfield(ram_state[72])[1:4]
+    b_mini_y = BITFIELDS[ram_state[72]][1:4]
     mini_y = 184-bitfield_to_number(b_mini_y)
     mini_player.xy = mini_x, mini_y
 
@@ -326,7 +328,7 @@ def _detect_objects_ram(objects, ram_state, hud):
         objects[10] = None
         objects[11] = None
 
-    mid_mid_group = number_to_bitfield(ram_state[7])[2:8]
+    mid_mid_group = BITFIELDS[ram_state[7]][2:8]
     # [68] counts down and [67] counts 1 up after [68] reaching 0 and jumping to 159 (one frame width)
     # the first bit of [68] decides the x_position of the player being locked to a side
     # backplate = ram_state[68]+backplate_offset
@@ -501,23 +503,10 @@ def _detect_objects_ram(objects, ram_state, hud):
     # b_shot_line = number_to_bitfield(ram_state[49])
     shot_lines = [ram_state[52], ram_state[55],
                   ram_state[58], ram_state[61], ram_state[64]]
-    b_shot_line = number_to_bitfield(ram_state[52])
-    for i in range(6):
-        del b_shot_line[2]
-    i = 0
-    for shot_line in shot_lines:
-        b_shot_line.extend(number_to_bitfield(shot_line))
-
-    for i in range(4):
-        tmp = b_shot_line[10+i]
-        b_shot_line[10+i] = b_shot_line[17-i]
-        b_shot_line[17-i] = tmp
-        tmp = b_shot_line[34+i]
-        b_shot_line[34+i] = b_shot_line[41-i]
-        b_shot_line[41-i] = tmp
-
-    for i in range(4):
-        del b_shot_line[22]
+    # the first 2 bits of [52], then the bits of the shot lines, [55] and [64] being reversed
+    # and the last 4 bits of [58] dropped
+    b_shot_line = list(BITFIELDS[shot_lines[0]][:2] + BITFIELDS[shot_lines[0]] + REVERSED_BITFIELDS[shot_lines[1]]
+                       + BITFIELDS[shot_lines[2]][:4] + BITFIELDS[shot_lines[3]] + REVERSED_BITFIELDS[shot_lines[4]])
 
     # [0,0,0,0,1,1,0,0,0,0,1,1,1,1,1,0]
 
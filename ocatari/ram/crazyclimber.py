@@ -1,4 +1,4 @@
-from .game_objects import GameObject, ValueObject
+from .game_objects import GameObject, ValueObject, spawn_object
 import sys
 
 MAX_NB_OBJECTS = {"Player": 1, "Window": 72, "Enemy_Red": 1,
@@ -7,6 +7,8 @@ MAX_NB_OBJECTS_HUD = {}  # 'Score': 1}
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Player, self).__init__()
         self._xy = 0, 160
@@ -16,6 +18,8 @@ class Player(GameObject):
 
 
 class Window(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Window, self).__init__()
         self._xy = 0, 0
@@ -26,6 +30,8 @@ class Window(GameObject):
 
 
 class Enemy_Red(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Red, self).__init__()
         self._xy = 0, 0
@@ -35,6 +41,8 @@ class Enemy_Red(GameObject):
 
 
 class Enemy_Bird(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Bird, self).__init__()
         self._xy = 0, 0
@@ -45,6 +53,8 @@ class Enemy_Bird(GameObject):
 
 
 class Yellow_Projectile(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Yellow_Projectile, self).__init__()
         self._xy = 0, 0
@@ -54,6 +64,8 @@ class Yellow_Projectile(GameObject):
 
 
 class Purple_Projectile(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Purple_Projectile, self).__init__()
         self._xy = 0, 0
@@ -63,6 +75,8 @@ class Purple_Projectile(GameObject):
 
 
 class Blue_Projectile(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Blue_Projectile, self).__init__()
         self._xy = 0, 0
@@ -72,6 +86,8 @@ class Blue_Projectile(GameObject):
 
 
 class Yellow_Ball(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Yellow_Ball, self).__init__()
         self._xy = 0, 0
@@ -81,6 +97,8 @@ class Yellow_Ball(GameObject):
 
 
 class Helicopter(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Helicopter, self).__init__()
         self._xy = 0, 0
@@ -91,6 +109,8 @@ class Helicopter(GameObject):
 
 
 class Score(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 49, 21
@@ -100,6 +120,8 @@ class Score(ValueObject):
 
 
 class Life(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 58, 13
@@ -158,8 +180,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
     for i in range(12):
         for j in range(6):
             if ram_state[46+i] == 4 and 0 < j < 5:
-                win = Window()
-                objects[1+(6*i)+j] = win
+                win = spawn_object(objects, 1+(6*i)+j, Window)
 
                 # Window closing constellation
                 if 2 <= i < 10 and ram_state[108+i-2] == 4 and j in [1, 4]:
@@ -178,8 +199,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
                     win.wh = 8, 8-closing
 
             elif ram_state[46+i] == 8 and (j < 2 or j > 3):
-                win = Window()
-                objects[1+(6*i)+j] = win
+                win = spawn_object(objects, 1+(6*i)+j, Window)
 
                 # Window closing constellation
                 if 2 <= i < 10 and ram_state[108+i-2] == 8 and j not in [1, 4]:
@@ -198,8 +218,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
                     win.wh = 8, 8-closing
 
             elif (ram_state[46+i] == 12 or ram_state[46+i] == 16) and 1 < j < 4:
-                win = Window()
-                objects[1+(6*i)+j] = win
+                win = spawn_object(objects, 1+(6*i)+j, Window)
 
                 # Window closing constellation
                 if 2 <= i < 10 and ram_state[108+i-2] == 12 or ram_state[108+i-2] == 14 or ram_state[108+i-2] == 16 or ram_state[108+i-2] == 18:
@@ -216,8 +235,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
                     win.wh = 8, 8-closing
 
             elif not ram_state[46+i]:
-                win = Window()
-                objects[1+(6*i)+j] = win
+                win = spawn_object(objects, 1+(6*i)+j, Window)
 
                 # Window closing constellation
                 if 2 <= i < 10 and ram_state[108+i-2] == 0 and j not in [1, 4]:
@@ -244,7 +262,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
 
     if ram_state[16] and ram_state[14]:
         if ram_state[84] == 253:
-            enemy = Enemy_Red()
+            enemy = spawn_object(objects, 73, Enemy_Red)
             if ram_state[14] < 6:
                 enemy.xy = 45 + \
                     (12*(ram_state[14]-3)), 81 + \
@@ -264,7 +282,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
             if type(objects[73]) == Enemy_Bird:
                 enemy = objects[73]
             else:
-                enemy = Enemy_Bird()
+                enemy = spawn_object(objects, 73, Enemy_Bird)
             if ram_state[74] > ram_state[75]:
                 enemy.orientation = 1
             elif ram_state[74] < ram_state[75]:
@@ -288,15 +306,15 @@ def _detect_objects_ram(objects, ram_state, hud=False):
     if ram_state[81]:
         x = ram_state[85]-10
         if ram_state[83] == 239:
-            projectile = Yellow_Projectile()
+            projectile = spawn_object(objects, 74, Yellow_Projectile)
         elif ram_state[83] == 229:
-            projectile = Blue_Projectile()
+            projectile = spawn_object(objects, 74, Blue_Projectile)
             x += 1
         elif ram_state[83] == 219:
-            projectile = Purple_Projectile()
+            projectile = spawn_object(objects, 74, Purple_Projectile)
             x += 2
         elif ram_state[83] == 145:
-            projectile = Yellow_Ball()
+            projectile = spawn_object(objects, 74, Yellow_Ball)
         else:
             projectile = None
         objects[74] = projectile
@@ -313,8 +331,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
 
     if ram_state[9] > 50:
         if objects[75] is None:
-            heli = Helicopter()
-            objects[75] = heli
+            heli = spawn_object(objects, 75, Helicopter)
         else:
             heli = objects[75]
         if ram_state[34] <= 30:
@@ -333,6 +350,5 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         for i in range(3):
             objects[77+i] = None
             if ram_state[42] > i:
-                life = Life()
-                objects[77+i] = life
+                life = spawn_object(objects, 77+i, Life)
                 life.xy = 58 + (i*16), 13  # 74
@@ -1,5 +1,5 @@
 from .game_objects import GameObject
-from ._helper_methods import bitfield_to_number, number_to_bitfield, _convert_number
+from ._helper_methods import _convert_number, BITFIELDS
 import math
 import sys
 
@@ -17,6 +17,8 @@ class Player(GameObject):
     The player figure i.e., the laser cannon.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Player, self).__init__()
         self._xy = 0, 0
@@ -30,6 +32,8 @@ class Enemy(GameObject):
     The enemy demons.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy, self).__init__()
         self._xy = 0, 0
@@ -43,6 +47,8 @@ class ProjectileFriendly(GameObject):
     The projectiles shot from the player's laser cannon.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(ProjectileFriendly, self).__init__()
         self._xy = 0, 0
@@ -56,6 +62,8 @@ class ProjectileHostile(GameObject):
     Projectiles shot by the enemy demons.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(ProjectileHostile, self).__init__()
         self._xy = 0, 0
@@ -69,6 +77,8 @@ class Score(GameObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):  # TODO
         super(Score, self).__init__()
         self._xy = 96, 7
@@ -82,6 +92,8 @@ class Live(GameObject):
     The indicator for remaining additional bunkers (lives) (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Live, self).__init__()
         self._xy = 0, 0
@@ -112,7 +124,7 @@ def calculate_small_projectiles_from_bitmap(bitmap, basex):
 
     current_y = 183
     for number in bitmap:
-        bitfield = number_to_bitfield(number)
+        bitfield = BITFIELDS[number]
 
         index = 0
         for b in bitfield:
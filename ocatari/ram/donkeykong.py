@@ -119,6 +119,8 @@ class Score(ValueObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 72, 7
@@ -133,6 +135,8 @@ class Life(GameObject):
     The player's remaining lives (HUD).
     """
 
+    __slots__ = ("value",)
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 116, 23
@@ -1,5 +1,6 @@
 from .game_objects import GameObject, ValueObject
 from ._helper_methods import _convert_number
+from .spec import RamSpec, Slot, Ram, Table
 import sys
 
 MAX_NB_OBJECTS = {"Player_Small": 1, "Player_Big": 1, "Opponent_Small": 1,
@@ -104,6 +105,8 @@ class Player_Score(ValueObject):
     Players points in the game
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Player_Score, self).__init__()
         self._xy = 46, 9
@@ -118,6 +121,8 @@ class Opponent_Score(GameObject):
     Enemy points in the game
     """
 
+    __slots__ = ("value",)
+
     def __init__(self):
         super(Opponent_Score, self).__init__()
         self._xy = 110, 9
@@ -157,36 +162,22 @@ def _init_objects_ram(hud=False):
     return objects
 
 
-def _detect_objects_ram(objects, ram_state, hud=False):
-    """
-    For all 3 objects:
-    (x, y, w, h, r, g, b)
-    """
-
-    # ram[37-40] == x, ram[33-36] == y, odd player, even enemy
-    # x == 69 -> 80, x == 80 -> 91
-    # y == 100 -> 59, y == 99 -> 60
-
-    objects[0].xy = ram_state[39] + 11, 163 - ram_state[35]
-    objects[1].xy = ram_state[37] + 11, 159 - ram_state[33]
-    objects[2].xy = ram_state[40] + 11, 163 - ram_state[36]
-    objects[3].xy = ram_state[38] + 11, 159 - ram_state[34]
-
-    # ram[46] == ball_y, ram[47] == ball_x
-    objects[4].xy = ram_state[47] + 12, 178 - ram_state[46]
-
-    if hud:
-        if ram_state[118] > 15:
-            objects[7].xy = 38, 9
-            objects[7].wh = 13, 7
-            try:
-                objects[7].value = _convert_number(ram_state[118])
-            except:
-                pass
-        if ram_state[119] > 15:
-            objects[8].xy = 102, 9
-            objects[8].wh = 13, 7
-            try:
-                objects[8].value = _convert_number(ram_state[119])
-            except:
-                pass
+# ram[37-40] == x, ram[33-36] == y, odd player, even enemy
+# x == 69 -> 80, x == 80 -> 91
+# y == 100 -> 59, y == 99 -> 60
+# ram[46] == ball_y, ram[47] == ball_x
+_score = Table(_convert_number)
+
+RAM_SPEC = RamSpec([
+    Slot(Player_Small, xy=(Ram(39) + 11, 163 - Ram(35))),
+    Slot(Player_Big, xy=(Ram(37) + 11, 159 - Ram(33))),
+    Slot(Opponent_Small, xy=(Ram(40) + 11, 163 - Ram(36))),
+    Slot(Opponent_Big, xy=(Ram(38) + 11, 159 - Ram(34))),
+    Slot(Ball, xy=(Ram(47) + 12, 178 - Ram(46))),
+    Slot(Basket),
+    Slot(Backboard),
+    Slot(Player_Score, hud=True).when(Ram(118) > 15, xy=(38, 9), wh=(13, 7), value=_score(Ram(118))),
+    Slot(Opponent_Score, hud=True).when(Ram(119) > 15, xy=(102, 9), wh=(13, 7), value=_score(Ram(119))),
+])
+
+_detect_objects_ram = RAM_SPEC.detector
@@ -15,6 +15,8 @@ MAX_NB_OBJECTS_HUD = {"Player": 1, "Car": 27,
 
 class Player(GameObject):
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -24,6 +26,8 @@ class Player(GameObject):
 
 
 class Car(GameObject):
+    __slots__ = ()
+
     def __init__(self, x=0, y=0, w=16, h=10):
         super().__init__()
         self._xy = x, y
@@ -33,6 +37,8 @@ class Car(GameObject):
 
 
 class PlayerScore(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -42,6 +48,8 @@ class PlayerScore(GameObject):
 
 
 class NumberOfCars(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -51,6 +59,8 @@ class NumberOfCars(GameObject):
 
 
 class Level(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -1,7 +1,24 @@
-import sys
+import importlib
 from termcolor import colored
 import numpy as np
 from ocatari.vision.game_objects import NoObject
+from ocatari.ram.game_objects import ObjectSlots
+
+
+def load_game_module(game_module):
+    """
+    Returns the given game module (e.g. `ocatari.ram.pong`), importing it on first use.
+    Raises a KeyError if the module does not exist, as a lookup in `sys.modules` would.
+
+    :param game_module: The full name of the game module
+    :type game_module: str
+    """
+    try:
+        return importlib.import_module(game_module)
+    except ModuleNotFoundError as err:
+        if err.name != game_module:  # a dependency of the module is missing
+            raise
+        raise KeyError(game_module) from None
 
 
 # parses MAX_NB* dicts, returns default init list of objects
@@ -10,7 +27,7 @@ def instantiate_max_objects(game_name, max_obj_dict):
     p_module = __name__.split('.')[:-1] + [game_name.lower()]
     game_module = '.'.join(p_module)
     try:
-        mod = sys.modules[game_module]
+        mod = load_game_module(game_module)
     except KeyError as err:
         return []
     for k, v in max_obj_dict.items():
@@ -23,7 +40,7 @@ def get_class_dict(game_name):
     p_module = __name__.split('.')[:-1] + [game_name.lower()]
     game_module = '.'.join(p_module)
     try:
-        mod = sys.modules[game_module]
+        mod = load_game_module(game_module)
         classes = {}
         for name, number in mod.MAX_NB_OBJECTS_HUD.items():
             classes[name] = getattr(mod, name)
@@ -39,7 +56,7 @@ def get_max_objects(game_name, hud):
     p_module = __name__.split('.')[:-1] + [game_name.lower()]
     game_module = '.'.join(p_module)
     try:
-        mod = sys.modules[game_module]
+        mod = load_game_module(game_module)
         if hud:
             return mod.MAX_NB_OBJECTS_HUD
         return mod.MAX_NB_OBJECTS
@@ -55,7 +72,7 @@ def use_vision_objects(objects, game_module):
     replaces ram objects with their equivalent vision objects
     """
     game_module_vision = game_module.replace('ram', 'vision')
-    mod = sys.modules[game_module_vision]
+    mod = load_game_module(game_module_vision)
     for i, obj in enumerate(objects):
         if obj:  # skip None objects
             objects[i] = getattr(mod, objects[i].category)(*obj.xywh)
@@ -68,10 +85,10 @@ def init_objects(game_name, hud, vision=False):
     p_module = __name__.split('.')[:-1] + [game_name.lower()]
     game_module = '.'.join(p_module)
     try:
-        mod = sys.modules[game_module]
+        mod = load_game_module(game_module)
         if vision:
-            return use_vision_objects(mod._init_objects_ram(hud), game_module)
-        return mod._init_objects_ram(hud)
+            return ObjectSlots(use_vision_objects(mod._init_objects_ram(hud), game_module))
+        return ObjectSlots(mod._init_objects_ram(hud))
     except KeyError as err:
         raise KeyError(f"Game module does not exist: {game_module}")
     except AttributeError as err:
@@ -84,7 +101,7 @@ def detect_objects_raw(info, ram_state, game_name):
     game_module = '.'.join(p_module)
 
     try:
-        mod = sys.modules[game_module]
+        mod = load_game_module(game_module)
         mod._detect_objects_raw(info, ram_state)
     except KeyError as err:
         raise KeyError(f"Game module does not exist: {game_module}")
@@ -100,7 +117,7 @@ def detect_objects_ram(objects, ram_state, game_name, hud):
         if obj:
             obj._save_prev()
     try:
-        mod = sys.modules[game_module]
+        mod = load_game_module(game_module)
         mod._detect_objects_ram(objects, ram_state, hud)
     except KeyError as err:
         raise KeyError(f"Game module does not exist: {game_module}")
@@ -123,7 +140,7 @@ def get_object_state(reference_list, objects, game_name):
     p_module = __name__.split('.')[:-1] + [game_name.lower()]
     game_module = '.'.join(p_module)
     try:
-        mod = sys.modules[game_module]
+        mod = load_game_module(game_module)
         state = mod._get_object_state(reference_list, objects)
         return state
     except KeyError as err:
@@ -147,41 +164,88 @@ def get_object_state(reference_list, objects, game_name):
             raise err
 
 
-def get_masked_dqn_bin_state(objects):
-    state = np.zeros((210, 160))
+def _masked_boxes(objects, shape=(210, 160)):
+    """
+    Yields the objects with their bounding box as (row, column) slices, clipped to the screen.
+    For a smaller `shape` (e.g. (84, 84)), the boxes are scaled down, covering at least one pixel.
+    """
+    rows, cols = shape
     for o in objects:
-        if o is not None:
-            x,y,w,h = o.xywh
+        if o is None:
+            continue
+        x, y, w, h = o.xywh
+        if x + w <= 0 or y + h <= 0:
+            continue
+        y0, y1 = max(0, y), min(y + h, 209)
+        x0, x1 = max(0, x), min(x + w, 159)
+        if y0 >= y1 or x0 >= x1:
+            continue
+        if rows != 210:
+            y0, y1 = y0 * rows // 210, -(-y1 * rows // 210)
+        if cols != 160:
+            x0, x1 = x0 * cols // 160, -(-x1 * cols // 160)
+        yield o, slice(y0, y1), slice(x0, x1)
+
+
+def _masked_state_buffer(out, shape):
+    if out is None:
+        return np.zeros(shape, dtype=np.uint8)
+    out.fill(0)
+    return out
+
+
+def get_masked_dqn_bin_state(objects, out=None, shape=(210, 160)):
+    """
+    Rasterizes the bounding boxes of the objects (255) on a black screen.
 
-            if x+w > 0 and y+h > 0:
-                for i in range(max(0, y), min(y+h, 209)):
-                    for j in range(max(0, x), min(x+w, 159)):
-                        state[i, j] = 255
+    :param objects: The detected objects
+    :type objects: list of GameObject
+    :param out: A (reused) uint8 buffer to write the state into, of shape `shape`
+    :type out: np.ndarray
+    :param shape: The resolution of the state, (210, 160) or smaller (e.g. (84, 84)) to rasterize directly at that resolution
+    :type shape: (int, int)
+
+    :return: The masked state
+    :rtype: np.ndarray
+    """
+    state = _masked_state_buffer(out, shape)
+    for _, rows, cols in _masked_boxes(objects, state.shape):
+        state[rows, cols] = 255
     return state
 
 
-def get_masked_dqn_gray_state(objects, object_types):
-    state = np.zeros((210, 160))
-    for o in objects:
-        if not (o is None or o.category == "NoObject"):
-            x,y,w,h = o.xywh
-            value = 255 * (1 + object_types.index(o.category)) // len(object_types)
-
-            if x+w > 0 and y+h > 0:
-                for i in range(max(0, y), min(y+h, 209)):
-                    for j in range(max(0, x), min(x+w, 159)):
-                        state[i, j] = value
+def get_masked_dqn_gray_state(objects, object_types, out=None, shape=(210, 160)):
+    """
+    Rasterizes the bounding boxes of the objects on a black screen, each object category with its own gray level.
+
+    :param object_types: The object categories of the game, giving the gray levels
+    :type object_types: list of str
+
+    See :func:`get_masked_dqn_bin_state` for the other parameters.
+    """
+    state = _masked_state_buffer(out, shape)
+    values = {cat: 255 * (1 + i) // len(object_types) for i, cat in enumerate(object_types)}
+    for o, rows, cols in _masked_boxes(objects, state.shape):
+        if o.category != "NoObject":
+            state[rows, cols] = values[o.category]
     return state
 
 
-def get_masked_dqn_pix_state(objects, gray_scale_img):
-    state = np.zeros((210, 160))
-    for o in objects:
-        if o is not None:
-            x,y,w,h = o.xywh
-
-            if x+w > 0 and y+h > 0:
-                for i in range(max(0, y), min(y+h, 209)):
-                    for j in range(max(0, x), min(x+w, 159)):
-                        state[i, j] = gray_scale_img[i, j]
-    return state
\ No newline at end of file
+def get_masked_dqn_pix_state(objects, gray_scale_img, out=None, shape=(210, 160)):
+    """
+    Copies the pixels of the grayscale screen inside the bounding boxes of the objects on a black screen.
+
+    :param gray_scale_img: The grayscale screen, of shape (210, 160)
+    :type gray_scale_img: np.ndarray
+
+    See :func:`get_masked_dqn_bin_state` for the other parameters.
+    """
+    state = _masked_state_buffer(out, shape)
+    if state.shape != gray_scale_img.shape:
+        # nearest neighbour downsampling of the screen, to the rows and columns of the state
+        rows_idx = np.arange(state.shape[0]) * gray_scale_img.shape[0] // state.shape[0]
+        cols_idx = np.arange(state.shape[1]) * gray_scale_img.shape[1] // state.shape[1]
+        gray_scale_img = gray_scale_img[np.ix_(rows_idx, cols_idx)]
+    for _, rows, cols in _masked_boxes(objects, state.shape):
+        state[rows, cols] = gray_scale_img[rows, cols]
+    return state
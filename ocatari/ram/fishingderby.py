@@ -37,6 +37,7 @@ class Shark(GameObject):
         self.xy = 0, 0
         self.wh = 35, 13
         self.is_going_left_to_right = True  # is the shark going from left to right
+        self.is_right_to_left = False
         self.previous_pos = 0
 
 
@@ -50,6 +50,8 @@ class Score(ValueObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 49, 5
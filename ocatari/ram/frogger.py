@@ -19,6 +19,8 @@ class Frog(GameObject):
     The player figure i.e., the frog.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Frog, self).__init__()
         self._xy = 0, 0
@@ -32,6 +34,8 @@ class Car(GameObject):
     A car.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Car, self).__init__()
         self._xy = 0, 0
@@ -41,30 +45,40 @@ class Car(GameObject):
 
 
 class Log(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 105, 105, 15
 
 
 class Turtle(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 144, 72, 17
 
 
 class Alligator(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 105, 105, 15
 
 
 class LadyFrog(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 236, 236
 
 
 class HappyFrog(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # self._xy = 0, 0
@@ -73,6 +87,8 @@ class HappyFrog(GameObject):
 
 
 class AlligatorHead(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 110, 156, 66
@@ -80,18 +96,24 @@ class AlligatorHead(GameObject):
 
 
 class Fly(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 110, 156, 66
 
 
 class Snake(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 82, 126, 45
 
 
 class Score(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 195, 144, 61
@@ -99,6 +121,8 @@ class Score(GameObject):
 
 
 class Lives(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 236, 236
@@ -106,6 +130,8 @@ class Lives(GameObject):
 
 
 class Time(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
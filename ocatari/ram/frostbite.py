@@ -1,4 +1,5 @@
 from .game_objects import GameObject, NoObject
+from ._helper_methods import _convert_number
 from .utils import match_objects
 import sys
 
@@ -17,6 +18,8 @@ class Player(GameObject):
     The player figure: Frostbite Bailey.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -30,6 +33,8 @@ class Bear(GameObject):
     The dangerous grizzly polar bears on the shore (level 4).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 111, 111, 111
@@ -43,6 +48,8 @@ class House(GameObject):
     The igloo Frostbite Bailey is trying to build.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 142, 142, 142
@@ -56,6 +63,8 @@ class Door(GameObject):
     The finished igloo.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 123, 47
@@ -69,6 +78,8 @@ class FloatingBlock(GameObject):
     The white, untouched ice floes, turning blue once jumped over.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 214, 214, 214
@@ -94,6 +105,8 @@ class Bird(GameObject):
     The wild snowgeese.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 132, 144, 252
@@ -107,6 +120,8 @@ class Crab(GameObject):
     The dangerous Alaskan king crabs.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 213, 130, 74
@@ -120,6 +135,8 @@ class GreenFish(GameObject):
     The fresh fish swimming by regularly.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 111, 210, 111
@@ -133,6 +150,8 @@ class Clam(GameObject):
     The dangerous clams.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 210, 210, 64
@@ -146,6 +165,8 @@ class Lives(GameObject):
     The indicator for the player's lives.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 63, 22
@@ -159,6 +180,8 @@ class Temperature(GameObject):
     The temperature display.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 23, 22
@@ -172,6 +195,8 @@ class Score(GameObject):
     The player's score display.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 63, 10
@@ -398,9 +423,9 @@ def _detect_objects_ram(objects, ram_state, hud=False):
             else:
                 score.xy = 55, 10
                 score.wh = 14, 8
-        svalue += int(hex(ram_state[72])[2:]) * 10000
-        svalue += int(hex(ram_state[73])[2:]) * 100
-        svalue += int(hex(ram_state[74])[2:])
+        svalue += _convert_number(ram_state[72]) * 10000
+        svalue += _convert_number(ram_state[73]) * 100
+        svalue += _convert_number(ram_state[74])
 
 
 def _detect_objects_frostbite_raw(info, ram_state):
@@ -20,6 +20,8 @@ class Player(GameObject):
     The player figure i.e, the gun.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 66, 186
@@ -33,6 +35,8 @@ class PlayerMissile(GameObject):
     The projectiles fired by the player.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 66, 186
@@ -46,6 +50,8 @@ class EnemyMissile(GameObject):
     The projectiles fired by the Enemy.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 66, 186
@@ -59,6 +65,8 @@ class EnemyShip(GameObject):
     The Enemy Ships.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 66, 186
@@ -72,6 +80,8 @@ class DivingEnemy(GameObject):
     The Diving Enemies.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -85,6 +95,8 @@ class Score(GameObject):
     The player's remaining lives (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 232, 204, 99
@@ -98,6 +110,8 @@ class Round(GameObject):
     The round counter display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 214, 214, 214
@@ -111,6 +125,8 @@ class Lives(GameObject):
     The remaining lives of the player (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 214, 214, 214
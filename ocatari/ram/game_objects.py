@@ -1,5 +1,6 @@
 from enum import Enum
 from typing import Tuple
+from ocatari.schema import object_schema
 
 
 class Orientation(Enum):  # 16-wind compass directions
@@ -66,8 +67,13 @@ class GameObject:
 
     :ivar hud: True, if part of the Heads Up Display, and thus not interactable.
     :vartype hud: bool
+
+    The attributes are stored in slots (no instance dict), the subclasses without `__slots__`
+    get an instance dict for their own additional attributes.
     """
 
+    __slots__ = ("_rgb", "_xy", "wh", "_prev_xy", "_orientation", "hud", "_visible")
+
     GET_COLOR = False
     GET_WH = False
 
@@ -308,18 +314,12 @@ class GameObject:
     @property
     def properties(self):
         """
-        All the properties of the object in a list.
+        All the properties of the object in a list, from the schema of its class (see :func:`ocatari.schema.object_schema`).
 
         :return: The properties of the object.
         :rtype: list
         """
-        ignore = ["properties", "GET_COLOR", "GET_WH",
-                  "xy", "wh", "prev_xy", "h_coords", "xywh"]
-        properties = [prop for prop in self.__dir__()]
-        [properties.remove(p) for p in ignore if p in properties]
-        return [prop for prop in properties
-                if not prop.startswith("_") and
-                not callable(self.__getattribute__(prop))]
+        return list(object_schema(self).properties)
 
     def __bool__(self):
         return self._visible
@@ -330,6 +330,9 @@ class NoObject(GameObject):
     This class represents a non-existent object. It is used to fill in the gaps when no object is detected.
     """
 
+    # the detectors may set attributes (e.g. `value`) on the empty slots, kept in a dict created on demand
+    __slots__ = ("nslen", "__dict__")
+
     def __init__(self, nslen=2):
         super().__init__()
         self.nslen = nslen
@@ -374,6 +377,8 @@ class ValueObject(GameObject):
     :vartype value: int
     """
 
+    __slots__ = ("_value", "_prev_value")
+
     def __init__(self):
         super().__init__()
         self._value = 0
@@ -401,3 +406,155 @@ class ValueObject(GameObject):
     @property
     def value_diff(self):
         return self.value - self.prev_value
+
+
+_STATE_SLOTS = {}
+
+
+def _state_slots(cls):
+    # The slot descriptors of the class and its bases, by attribute name
+    slots = _STATE_SLOTS.get(cls)
+    if slots is None:
+        slots = _STATE_SLOTS[cls] = {}
+        for klass in reversed(cls.__mro__):
+            names = klass.__dict__.get("__slots__", ())
+            for name in (names,) if isinstance(names, str) else names:
+                if name not in ("__dict__", "__weakref__"):
+                    slots[name] = klass.__dict__[name]
+    return slots
+
+
+def object_state(obj):
+    """
+    The attributes of a game object (ram or vision), stored in its slots and in its instance dict (if any).
+
+    :return: A new dict of the attributes, by name.
+    :rtype: dict
+    """
+    state = {}
+    for name, slot in _state_slots(obj.__class__).items():
+        try:
+            state[name] = slot.__get__(obj)
+        except AttributeError:  # unset slot
+            pass
+    attrs = getattr(obj, "__dict__", None)
+    if attrs:
+        state.update(attrs)
+    return state
+
+
+def set_object_state(obj, state):
+    """
+    Sets the attributes of a game object (ram or vision) from a dict, as given by :func:`object_state`.
+    The attributes that are not in the dict are left unchanged.
+    """
+    slots = _state_slots(obj.__class__)
+    for name, value in state.items():
+        slot = slots.get(name)
+        if slot is None:
+            obj.__dict__[name] = value
+        else:
+            slot.__set__(obj, value)
+
+
+class ObjectSlots(list):
+    """
+    The object slots of a game (a list), pooling the objects of every slot: each slot keeps one
+    object per class it held, reused (reinitialized in place) by :func:`spawn_object` and :func:`clear_slot`
+    instead of allocating new objects every frame, and the initial objects, restored in place by :func:`reset_slots`.
+
+    The detectors using the pool must keep the objects in their slots (no object moved to another slot).
+    """
+
+    __slots__ = ("_pool", "_templates")
+
+    def __init__(self, objects=()):
+        super().__init__(objects)
+        self._pool = {}
+        self._templates = [(None, None) if obj is None else (obj.__class__, _copy_attrs(object_state(obj)))
+                           for obj in self]
+
+
+def _copy_attrs(attrs):
+    # one level copy, such that the mutable attributes (e.g. rgb lists) are not shared
+    return {k: v.copy() if isinstance(v, (list, dict, set)) else v for k, v in attrs.items()}
+
+
+def _pooled(objects, idx, cls):
+    # The object of class cls owned by the slot (reinitialized by the caller), if the slots are pooled
+    pool = getattr(objects, "_pool", None)
+    if pool is None:
+        return None
+    if idx < 0:
+        idx += len(objects)
+    obj = pool.get((idx, cls))
+    if obj is None:
+        obj = pool[(idx, cls)] = cls.__new__(cls)
+    return obj
+
+
+def spawn_object(objects, idx, cls, *args):
+    """
+    Puts a new object of class `cls` in the slot, as `objects[idx] = cls(*args)` would,
+    reusing the object of this class owned by the slot if the slots are pooled (see :class:`ObjectSlots`).
+
+    :return: The new object
+    :rtype: GameObject
+    """
+    obj = _pooled(objects, idx, cls)
+    if obj is None:
+        obj = cls(*args)
+    else:
+        attrs = getattr(obj, "__dict__", None)
+        if attrs:
+            attrs.clear()
+        obj.__init__(*args)
+    objects[idx] = obj
+    return obj
+
+
+def ensure_object(objects, idx, cls, *args):
+    """
+    Returns the object of the slot if it is of class `cls`, else puts a new one in it (see :func:`spawn_object`).
+
+    :rtype: GameObject
+    """
+    obj = objects[idx]
+    if obj.__class__ is cls:
+        return obj
+    return spawn_object(objects, idx, cls, *args)
+
+
+def clear_slot(objects, idx):
+    """
+    Empties the slot: puts a new `NoObject` in it, unless it is already empty.
+    """
+    if objects[idx].__class__ is not NoObject:
+        spawn_object(objects, idx, NoObject)
+
+
+def reset_slots(objects):
+    """
+    Restores (in place) the initial objects of pooled slots, as created by the game's `_init_objects_ram`.
+
+    :return: False if the slots are not pooled, and thus not reset.
+    :rtype: bool
+    """
+    templates = getattr(objects, "_templates", None)
+    if templates is None:
+        return False
+    del objects[len(templates):]
+    for idx, template in enumerate(templates):
+        if idx == len(objects):
+            objects.append(None)
+        cls, attrs = template
+        if cls is None:
+            objects[idx] = None
+            continue
+        obj = _pooled(objects, idx, cls)
+        extra = getattr(obj, "__dict__", None)
+        if extra:
+            extra.clear()
+        set_object_state(obj, _copy_attrs(attrs))
+        objects[idx] = obj
+    return True
@@ -62,6 +62,8 @@ class Floor(GameObject):
 
 
 class Score(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 98, 10
@@ -184,6 +184,7 @@ def _init_objects_ram(hud=False):
 
 number_of_added_enemies = 0
 objects_map = {}
+walls_screen = None  # the (level, screen) whose walls are in the objects map
 
 
 def _detect_objects_ram(objects, ram_state, hud=False):
@@ -473,9216 +474,533 @@ def _detect_objects_hero_raw(info, ram_state):
 
 
 def add_walls_to_object_list(ram_state, objects_map):
-    if ram_state[117] == 0:
-        if ram_state[28] == 0:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (88, 101)
-            wall_instance4.wh = (72, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (64, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 61)
-            wall_instance2.wh = (24, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (152, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 1:
-        if ram_state[28] == 0:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (88, 101)
-            wall_instance4.wh = (72, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (64, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (120, 101)
-            wall_instance4.wh = (40, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (48, 101)
-            wall_instance5.wh = (64, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (32, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (120, 21)
-            wall_instance0.wh = (40, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (64, 61)
-            wall_instance4.wh = (44, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 61)
-            wall_instance5.wh = (20, 37)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (104, 101)
-            wall_instance6.wh = (56, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (8, 101)
-            wall_instance7.wh = (48, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            number_of_walls = 8
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (144, 61)
-            wall_instance1.wh = (16, 37)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (88, 101)
-            wall_instance3.wh = (72, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (64, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 2:
-        if ram_state[28] == 0:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (88, 101)
-            wall_instance4.wh = (72, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (64, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (136, 101)
-            wall_instance4.wh = (24, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (16, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (112, 101)
-            wall_instance4.wh = (48, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (56, 101)
-            wall_instance5.wh = (48, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (40, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (56, 21)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 61)
-            wall_instance4.wh = (8, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (120, 101)
-            wall_instance5.wh = (40, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (48, 101)
-            wall_instance6.wh = (64, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (8, 101)
-            wall_instance7.wh = (32, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            number_of_walls = 8
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (120, 21)
-            wall_instance0.wh = (40, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 61)
-            wall_instance4.wh = (8, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (88, 101)
-            wall_instance5.wh = (72, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (64, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 61)
-            wall_instance2.wh = (24, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (152, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 3:
-        if ram_state[28] == 0:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (140, 61)
-            wall_instance2.wh = (20, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (12, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (88, 101)
-            wall_instance4.wh = (72, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (64, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (140, 101)
-            wall_instance4.wh = (20, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (28, 101)
-            wall_instance5.wh = (104, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (12, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (140, 21)
-            wall_instance0.wh = (20, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (28, 21)
-            wall_instance1.wh = (104, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (12, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (40, 61)
-            wall_instance4.wh = (80, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 61)
-            wall_instance5.wh = (8, 37)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (128, 101)
-            wall_instance6.wh = (32, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (44, 101)
-            wall_instance7.wh = (72, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            wall_instance8 = Wall()
-            wall_instance8.xy = (8, 101)
-            wall_instance8.wh = (24, 38)
-            objects_map['fixed wall 8'] = wall_instance8
-            number_of_walls = 9
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (128, 21)
-            wall_instance0.wh = (32, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (44, 21)
-            wall_instance1.wh = (72, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (140, 61)
-            wall_instance3.wh = (20, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (48, 61)
-            wall_instance4.wh = (64, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 61)
-            wall_instance5.wh = (12, 37)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (144, 101)
-            wall_instance6.wh = (16, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (32, 101)
-            wall_instance7.wh = (96, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            wall_instance8 = Wall()
-            wall_instance8.xy = (8, 101)
-            wall_instance8.wh = (8, 38)
-            objects_map['fixed wall 8'] = wall_instance8
-            number_of_walls = 9
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (32, 21)
-            wall_instance1.wh = (96, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (8, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (140, 61)
-            wall_instance3.wh = (20, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 61)
-            wall_instance4.wh = (12, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (88, 101)
-            wall_instance5.wh = (72, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (64, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (140, 101)
-            wall_instance4.wh = (20, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (28, 101)
-            wall_instance5.wh = (104, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (12, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (140, 21)
-            wall_instance0.wh = (20, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (28, 21)
-            wall_instance1.wh = (104, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (12, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 61)
-            wall_instance4.wh = (8, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (100, 101)
-            wall_instance5.wh = (60, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (52, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (100, 21)
-            wall_instance0.wh = (60, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (52, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 61)
-            wall_instance2.wh = (24, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (72, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 61)
-            wall_instance4.wh = (16, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (152, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 4:
-        if ram_state[28] == 0:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (88, 101)
-            wall_instance4.wh = (72, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (64, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (152, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (144, 61)
-            wall_instance1.wh = (16, 37)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (136, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (112, 61)
-            wall_instance0.wh = (48, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (40, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (84, 101)
-            wall_instance2.wh = (76, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (68, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (84, 21)
-            wall_instance0.wh = (76, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (68, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (136, 101)
-            wall_instance4.wh = (24, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (32, 101)
-            wall_instance5.wh = (96, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (16, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (32, 21)
-            wall_instance1.wh = (96, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (88, 101)
-            wall_instance3.wh = (72, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (64, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (120, 101)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (48, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (32, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (120, 21)
-            wall_instance0.wh = (40, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 61)
-            wall_instance4.wh = (8, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (152, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 5:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (140, 101)
-            wall_instance4.wh = (20, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (56, 101)
-            wall_instance5.wh = (48, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (12, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (140, 21)
-            wall_instance0.wh = (20, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (56, 21)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (12, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (88, 101)
-            wall_instance3.wh = (72, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (64, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 61)
-            wall_instance2.wh = (24, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (132, 101)
-            wall_instance4.wh = (28, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (104, 101)
-            wall_instance5.wh = (20, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (64, 101)
-            wall_instance6.wh = (32, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (36, 101)
-            wall_instance7.wh = (20, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            wall_instance8 = Wall()
-            wall_instance8.xy = (8, 101)
-            wall_instance8.wh = (20, 38)
-            objects_map['fixed wall 8'] = wall_instance8
-            number_of_walls = 9
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (112, 61)
-            wall_instance0.wh = (48, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (40, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (132, 21)
-            wall_instance0.wh = (28, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (104, 21)
-            wall_instance1.wh = (20, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (64, 21)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (36, 21)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 21)
-            wall_instance4.wh = (20, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (108, 101)
-            wall_instance5.wh = (52, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (60, 101)
-            wall_instance6.wh = (40, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (8, 101)
-            wall_instance7.wh = (44, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            number_of_walls = 8
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (108, 21)
-            wall_instance0.wh = (52, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (60, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (44, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (132, 61)
-            wall_instance3.wh = (28, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (52, 61)
-            wall_instance4.wh = (44, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 61)
-            wall_instance5.wh = (8, 37)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (120, 101)
-            wall_instance6.wh = (40, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (8, 101)
-            wall_instance7.wh = (32, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            number_of_walls = 8
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (120, 21)
-            wall_instance0.wh = (40, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (32, 101)
-            wall_instance3.wh = (96, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (32, 21)
-            wall_instance1.wh = (96, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 61)
-            wall_instance4.wh = (8, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (112, 101)
-            wall_instance5.wh = (48, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (56, 101)
-            wall_instance6.wh = (48, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (8, 101)
-            wall_instance7.wh = (40, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            number_of_walls = 8
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (136, 61)
-            wall_instance0.wh = (24, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (16, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (56, 21)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (88, 101)
-            wall_instance3.wh = (72, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (64, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 61)
-            wall_instance2.wh = (24, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (152, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 6:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (140, 61)
-            wall_instance0.wh = (20, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (12, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (140, 61)
-            wall_instance2.wh = (20, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (12, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (136, 101)
-            wall_instance4.wh = (24, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (32, 101)
-            wall_instance5.wh = (96, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (16, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (32, 21)
-            wall_instance1.wh = (96, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (84, 101)
-            wall_instance3.wh = (76, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (68, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (84, 21)
-            wall_instance0.wh = (76, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (68, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 61)
-            wall_instance2.wh = (48, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (40, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (108, 101)
-            wall_instance4.wh = (52, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (60, 101)
-            wall_instance5.wh = (40, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (44, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (64, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (24, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (108, 21)
-            wall_instance0.wh = (52, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (60, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (44, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (136, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (40, 101)
-            wall_instance4.wh = (80, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (16, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (40, 21)
-            wall_instance1.wh = (80, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (128, 61)
-            wall_instance3.wh = (32, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 61)
-            wall_instance4.wh = (24, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (144, 101)
-            wall_instance5.wh = (16, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (48, 101)
-            wall_instance6.wh = (64, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (8, 101)
-            wall_instance7.wh = (8, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            number_of_walls = 8
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (136, 61)
-            wall_instance0.wh = (24, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (56, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (32, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (8, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (36, 101)
-            wall_instance4.wh = (88, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (8, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (36, 21)
-            wall_instance1.wh = (88, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (8, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (132, 61)
-            wall_instance3.wh = (28, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 61)
-            wall_instance4.wh = (20, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (88, 101)
-            wall_instance5.wh = (72, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (64, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (132, 61)
-            wall_instance0.wh = (28, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (20, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (128, 101)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (48, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (24, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (128, 21)
-            wall_instance0.wh = (32, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (136, 61)
-            wall_instance3.wh = (24, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 61)
-            wall_instance4.wh = (16, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (96, 101)
-            wall_instance5.wh = (64, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (72, 101)
-            wall_instance6.wh = (16, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (8, 101)
-            wall_instance7.wh = (56, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            number_of_walls = 8
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (96, 21)
-            wall_instance0.wh = (64, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (72, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (56, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (128, 101)
-            wall_instance3.wh = (32, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (24, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 101)
-            wall_instance1.wh = (152, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            number_of_walls = 2
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 7:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (140, 61)
-            wall_instance0.wh = (20, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (12, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 101)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (92, 61)
-            wall_instance0.wh = (68, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (60, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 101)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (56, 101)
-            wall_instance3.wh = (48, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (40, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (124, 61)
-            wall_instance0.wh = (36, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (60, 61)
-            wall_instance1.wh = (40, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (28, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (56, 21)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (128, 101)
-            wall_instance3.wh = (32, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (52, 101)
-            wall_instance4.wh = (56, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (24, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (124, 61)
-            wall_instance0.wh = (36, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (28, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (128, 21)
-            wall_instance0.wh = (32, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (52, 21)
-            wall_instance1.wh = (56, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (88, 101)
-            wall_instance3.wh = (72, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (64, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (32, 101)
-            wall_instance3.wh = (96, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (64, 61)
-            wall_instance1.wh = (32, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (32, 21)
-            wall_instance1.wh = (96, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (112, 101)
-            wall_instance3.wh = (48, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (56, 101)
-            wall_instance4.wh = (48, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (40, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (132, 61)
-            wall_instance0.wh = (28, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (72, 61)
-            wall_instance1.wh = (16, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (20, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (56, 21)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (56, 101)
-            wall_instance4.wh = (48, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (8, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (128, 61)
-            wall_instance0.wh = (32, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (48, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (24, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (56, 21)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (8, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (136, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (64, 101)
-            wall_instance4.wh = (32, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (16, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (64, 21)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (120, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (32, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (56, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (116, 101)
-            wall_instance2.wh = (44, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (36, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (128, 101)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 101)
-            wall_instance1.wh = (152, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            number_of_walls = 2
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 8:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (40, 101)
-            wall_instance3.wh = (80, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (140, 61)
-            wall_instance0.wh = (20, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (44, 61)
-            wall_instance1.wh = (72, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (12, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (40, 21)
-            wall_instance1.wh = (80, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (136, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (128, 61)
-            wall_instance0.wh = (32, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (44, 61)
-            wall_instance1.wh = (72, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (24, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (116, 61)
-            wall_instance0.wh = (44, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (56, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (36, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (108, 61)
-            wall_instance0.wh = (52, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (64, 61)
-            wall_instance1.wh = (32, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (44, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (108, 61)
-            wall_instance0.wh = (52, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (44, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (104, 101)
-            wall_instance2.wh = (56, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (72, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (48, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (104, 21)
-            wall_instance0.wh = (56, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (72, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (136, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (32, 101)
-            wall_instance4.wh = (96, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (16, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (32, 21)
-            wall_instance1.wh = (96, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (88, 101)
-            wall_instance3.wh = (72, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (64, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (92, 61)
-            wall_instance0.wh = (68, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (60, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 101)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (128, 101)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (140, 101)
-            wall_instance1.wh = (20, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (12, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (64, 61)
-            wall_instance1.wh = (32, 37)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 101)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 14:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 15:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 101)
-            wall_instance1.wh = (152, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            number_of_walls = 2
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 9:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (32, 101)
-            wall_instance3.wh = (96, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (32, 21)
-            wall_instance1.wh = (96, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (84, 101)
-            wall_instance3.wh = (76, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (68, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (84, 21)
-            wall_instance0.wh = (76, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (68, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (132, 101)
-            wall_instance2.wh = (28, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (84, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (36, 101)
-            wall_instance4.wh = (40, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (20, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (136, 61)
-            wall_instance0.wh = (24, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (56, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (32, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (132, 21)
-            wall_instance0.wh = (28, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (84, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (36, 21)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 21)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (132, 101)
-            wall_instance4.wh = (28, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (36, 101)
-            wall_instance5.wh = (88, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (20, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (44, 61)
-            wall_instance1.wh = (72, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (132, 21)
-            wall_instance0.wh = (28, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (36, 21)
-            wall_instance1.wh = (88, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (124, 101)
-            wall_instance3.wh = (36, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (48, 101)
-            wall_instance4.wh = (64, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (28, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (124, 21)
-            wall_instance0.wh = (36, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (28, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (140, 101)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (88, 101)
-            wall_instance4.wh = (36, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (36, 101)
-            wall_instance5.wh = (36, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (12, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (136, 61)
-            wall_instance0.wh = (24, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (84, 61)
-            wall_instance1.wh = (44, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (32, 61)
-            wall_instance2.wh = (44, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            wall_instance3 = LavaWall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['lava wall 3'] = wall_instance3
-            number_of_lava_walls = 4
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (140, 21)
-            wall_instance0.wh = (20, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (88, 21)
-            wall_instance1.wh = (36, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (36, 21)
-            wall_instance2.wh = (36, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 21)
-            wall_instance3.wh = (12, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (144, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (8, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (88, 61)
-            wall_instance0.wh = (72, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (8, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (8, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (96, 61)
-            wall_instance0.wh = (64, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (56, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (8, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (48, 61)
-            wall_instance0.wh = (64, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (128, 101)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (132, 101)
-            wall_instance1.wh = (28, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (72, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 14:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (120, 101)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (32, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 15:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 101)
-            wall_instance1.wh = (152, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            number_of_walls = 2
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 10:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (140, 61)
-            wall_instance0.wh = (20, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (12, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (88, 61)
-            wall_instance0.wh = (72, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 101)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (72, 61)
-            wall_instance1.wh = (16, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (140, 101)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (28, 101)
-            wall_instance3.wh = (104, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (12, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (140, 21)
-            wall_instance0.wh = (20, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (28, 21)
-            wall_instance1.wh = (104, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (12, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (88, 101)
-            wall_instance3.wh = (72, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (64, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (92, 61)
-            wall_instance1.wh = (12, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (56, 61)
-            wall_instance2.wh = (12, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            wall_instance3 = LavaWall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['lava wall 3'] = wall_instance3
-            number_of_lava_walls = 4
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (140, 101)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (116, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (84, 101)
-            wall_instance4.wh = (24, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (52, 101)
-            wall_instance5.wh = (24, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (28, 101)
-            wall_instance6.wh = (16, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (8, 101)
-            wall_instance7.wh = (12, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            number_of_walls = 8
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (140, 61)
-            wall_instance0.wh = (20, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (120, 61)
-            wall_instance1.wh = (12, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (28, 61)
-            wall_instance2.wh = (12, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            wall_instance3 = LavaWall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (12, 37)
-            objects_map['lava wall 3'] = wall_instance3
-            number_of_lava_walls = 4
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (140, 21)
-            wall_instance0.wh = (20, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (116, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (84, 21)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (52, 21)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (28, 21)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 21)
-            wall_instance5.wh = (12, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (140, 101)
-            wall_instance6.wh = (20, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (28, 101)
-            wall_instance7.wh = (104, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            wall_instance8 = Wall()
-            wall_instance8.xy = (8, 101)
-            wall_instance8.wh = (12, 38)
-            objects_map['fixed wall 8'] = wall_instance8
-            number_of_walls = 9
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (140, 21)
-            wall_instance0.wh = (20, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (28, 21)
-            wall_instance1.wh = (104, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (12, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (112, 101)
-            wall_instance3.wh = (48, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (40, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (88, 61)
-            wall_instance0.wh = (72, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (8, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (104, 61)
-            wall_instance0.wh = (56, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (72, 61)
-            wall_instance1.wh = (16, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (48, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (8, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (8, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (88, 61)
-            wall_instance0.wh = (72, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (8, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 101)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (104, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (72, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (40, 61)
-            wall_instance4.wh = (16, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (136, 101)
-            wall_instance5.wh = (24, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (68, 101)
-            wall_instance6.wh = (24, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (8, 101)
-            wall_instance7.wh = (16, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            number_of_walls = 8
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (128, 101)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (72, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (112, 101)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (64, 101)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 14:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (48, 101)
-            wall_instance2.wh = (64, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 15:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 101)
-            wall_instance1.wh = (152, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            number_of_walls = 2
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 11:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (132, 61)
-            wall_instance0.wh = (28, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (20, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (136, 61)
-            wall_instance0.wh = (24, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (16, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (132, 101)
-            wall_instance2.wh = (28, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (36, 101)
-            wall_instance3.wh = (88, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (20, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (132, 21)
-            wall_instance0.wh = (28, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (36, 21)
-            wall_instance1.wh = (88, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (152, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (120, 101)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (48, 101)
-            wall_instance2.wh = (64, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (32, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (120, 21)
-            wall_instance0.wh = (40, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (88, 101)
-            wall_instance3.wh = (72, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (64, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (120, 61)
-            wall_instance0.wh = (40, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (32, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (48, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (8, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (128, 61)
-            wall_instance0.wh = (32, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (40, 61)
-            wall_instance1.wh = (80, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (24, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (8, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (136, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (152, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (60, 61)
-            wall_instance1.wh = (40, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (112, 101)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (56, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 101)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (72, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (68, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (144, 101)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (68, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (8, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (72, 61)
-            wall_instance1.wh = (16, 37)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 101)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (144, 101)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (8, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 14:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (72, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 15:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (112, 101)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 12:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (92, 61)
-            wall_instance1.wh = (12, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (56, 61)
-            wall_instance2.wh = (12, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            wall_instance3 = LavaWall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['lava wall 3'] = wall_instance3
-            number_of_lava_walls = 4
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (140, 101)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (116, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (88, 101)
-            wall_instance4.wh = (20, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (52, 101)
-            wall_instance5.wh = (20, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (28, 101)
-            wall_instance6.wh = (16, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (8, 101)
-            wall_instance7.wh = (12, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            number_of_walls = 8
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (140, 61)
-            wall_instance0.wh = (20, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (120, 61)
-            wall_instance1.wh = (12, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (28, 61)
-            wall_instance2.wh = (12, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            wall_instance3 = LavaWall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (12, 37)
-            objects_map['lava wall 3'] = wall_instance3
-            number_of_lava_walls = 4
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (140, 21)
-            wall_instance0.wh = (20, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (116, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 21)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (52, 21)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (28, 21)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 21)
-            wall_instance5.wh = (12, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (144, 101)
-            wall_instance6.wh = (16, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (32, 101)
-            wall_instance7.wh = (96, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            wall_instance8 = Wall()
-            wall_instance8.xy = (8, 101)
-            wall_instance8.wh = (8, 38)
-            objects_map['fixed wall 8'] = wall_instance8
-            number_of_walls = 9
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (140, 61)
-            wall_instance0.wh = (20, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (12, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (32, 21)
-            wall_instance1.wh = (96, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (8, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (120, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (48, 101)
-            wall_instance4.wh = (64, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (32, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (128, 61)
-            wall_instance0.wh = (32, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (24, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (120, 21)
-            wall_instance0.wh = (40, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (40, 101)
-            wall_instance4.wh = (80, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (8, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (136, 61)
-            wall_instance0.wh = (24, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (40, 61)
-            wall_instance1.wh = (80, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (40, 21)
-            wall_instance1.wh = (80, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (8, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (32, 101)
-            wall_instance4.wh = (96, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (8, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (40, 61)
-            wall_instance1.wh = (80, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (32, 21)
-            wall_instance1.wh = (96, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (8, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (152, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (88, 101)
-            wall_instance1.wh = (72, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (64, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (116, 101)
-            wall_instance4.wh = (44, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (52, 101)
-            wall_instance5.wh = (56, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (36, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (116, 21)
-            wall_instance0.wh = (44, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (52, 21)
-            wall_instance1.wh = (56, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (36, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (152, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 101)
-            wall_instance1.wh = (152, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            number_of_walls = 2
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (68, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (68, 61)
-            wall_instance0.wh = (24, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 14:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (112, 101)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (64, 101)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 15:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (112, 101)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 13:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (80, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (152, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (88, 101)
-            wall_instance1.wh = (72, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (64, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (152, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (40, 101)
-            wall_instance3.wh = (32, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (84, 61)
-            wall_instance0.wh = (76, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (68, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (88, 21)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (40, 21)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 21)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (112, 101)
-            wall_instance4.wh = (48, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (40, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (128, 61)
-            wall_instance0.wh = (32, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (48, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (140, 101)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (44, 101)
-            wall_instance3.wh = (72, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (12, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (140, 21)
-            wall_instance0.wh = (20, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (44, 21)
-            wall_instance1.wh = (72, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (12, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (152, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (52, 101)
-            wall_instance2.wh = (56, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (120, 61)
-            wall_instance0.wh = (40, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (32, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (52, 21)
-            wall_instance1.wh = (56, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (84, 101)
-            wall_instance3.wh = (76, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (68, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (84, 21)
-            wall_instance0.wh = (76, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (68, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (104, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (40, 61)
-            wall_instance3.wh = (16, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (140, 101)
-            wall_instance4.wh = (20, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (12, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (68, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (68, 61)
-            wall_instance0.wh = (24, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 14:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (96, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (48, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 15:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (112, 101)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 14:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (124, 61)
-            wall_instance0.wh = (36, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (28, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 101)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (56, 101)
-            wall_instance3.wh = (48, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (40, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (64, 61)
-            wall_instance1.wh = (56, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (32, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (56, 21)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (104, 101)
-            wall_instance3.wh = (56, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (48, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (104, 21)
-            wall_instance0.wh = (56, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (128, 101)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (40, 101)
-            wall_instance3.wh = (80, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (24, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (128, 21)
-            wall_instance0.wh = (32, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (40, 21)
-            wall_instance1.wh = (80, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (96, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (56, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (96, 21)
-            wall_instance0.wh = (64, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (56, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (84, 101)
-            wall_instance3.wh = (44, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (32, 101)
-            wall_instance4.wh = (44, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (16, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (64, 61)
-            wall_instance1.wh = (32, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (84, 21)
-            wall_instance1.wh = (44, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (32, 21)
-            wall_instance2.wh = (44, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 21)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (136, 101)
-            wall_instance4.wh = (24, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (48, 101)
-            wall_instance5.wh = (64, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (16, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (136, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (32, 101)
-            wall_instance4.wh = (96, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (16, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (32, 21)
-            wall_instance1.wh = (96, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (136, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (84, 101)
-            wall_instance4.wh = (44, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (32, 101)
-            wall_instance5.wh = (44, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (16, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (84, 61)
-            wall_instance0.wh = (76, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (68, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (84, 21)
-            wall_instance1.wh = (44, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (32, 21)
-            wall_instance2.wh = (44, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 21)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (88, 101)
-            wall_instance4.wh = (72, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (64, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (128, 61)
-            wall_instance2.wh = (32, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (48, 61)
-            wall_instance3.wh = (32, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (120, 101)
-            wall_instance4.wh = (40, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (32, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (144, 101)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (8, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (120, 61)
-            wall_instance1.wh = (16, 37)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (40, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (64, 101)
-            wall_instance4.wh = (32, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (8, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (48, 61)
-            wall_instance0.wh = (64, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 14:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 101)
-            wall_instance1.wh = (152, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            number_of_walls = 2
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 15:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (112, 101)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (60, 101)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 15:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (88, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (32, 101)
-            wall_instance4.wh = (40, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (16, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (64, 61)
-            wall_instance1.wh = (32, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (88, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (32, 21)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 21)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (152, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (68, 61)
-            wall_instance1.wh = (24, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (128, 101)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (104, 61)
-            wall_instance0.wh = (56, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (128, 21)
-            wall_instance0.wh = (32, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 101)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (72, 61)
-            wall_instance1.wh = (16, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (140, 101)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (28, 101)
-            wall_instance3.wh = (104, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (12, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (68, 61)
-            wall_instance1.wh = (24, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (140, 21)
-            wall_instance0.wh = (20, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (28, 21)
-            wall_instance1.wh = (104, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (12, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (108, 101)
-            wall_instance3.wh = (52, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (44, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (104, 61)
-            wall_instance0.wh = (56, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (64, 61)
-            wall_instance1.wh = (32, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (48, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (108, 21)
-            wall_instance0.wh = (52, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (44, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (8, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (84, 61)
-            wall_instance0.wh = (76, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (68, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (8, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (8, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (112, 61)
-            wall_instance0.wh = (48, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (84, 61)
-            wall_instance1.wh = (20, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (56, 61)
-            wall_instance2.wh = (20, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            wall_instance3 = LavaWall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (40, 37)
-            objects_map['lava wall 3'] = wall_instance3
-            number_of_lava_walls = 4
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (8, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (8, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (92, 61)
-            wall_instance0.wh = (68, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (60, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (8, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (128, 101)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (72, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (128, 21)
-            wall_instance0.wh = (32, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (48, 61)
-            wall_instance0.wh = (64, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (132, 101)
-            wall_instance1.wh = (28, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (40, 61)
-            wall_instance0.wh = (80, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 14:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (128, 101)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (68, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 15:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (72, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (112, 101)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 16:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (128, 61)
-            wall_instance0.wh = (32, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (24, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (48, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (8, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (136, 61)
-            wall_instance0.wh = (24, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (40, 61)
-            wall_instance1.wh = (80, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (16, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (8, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (128, 101)
-            wall_instance3.wh = (32, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (24, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (128, 21)
-            wall_instance0.wh = (32, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 61)
-            wall_instance2.wh = (48, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (40, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (144, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (8, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (104, 61)
-            wall_instance0.wh = (56, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (8, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 101)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (104, 61)
-            wall_instance0.wh = (56, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (84, 101)
-            wall_instance2.wh = (76, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (68, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (84, 21)
-            wall_instance0.wh = (76, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (68, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (32, 101)
-            wall_instance3.wh = (96, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (32, 21)
-            wall_instance1.wh = (96, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (152, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (80, 61)
-            wall_instance0.wh = (32, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (24, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (84, 61)
-            wall_instance0.wh = (76, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (68, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (108, 101)
-            wall_instance2.wh = (52, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (44, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (108, 21)
-            wall_instance0.wh = (52, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (44, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (36, 101)
-            wall_instance3.wh = (88, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (132, 101)
-            wall_instance2.wh = (28, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (132, 101)
-            wall_instance1.wh = (28, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (132, 101)
-            wall_instance1.wh = (28, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 14:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (48, 61)
-            wall_instance0.wh = (64, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 15:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (124, 101)
-            wall_instance1.wh = (36, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (28, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 17:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (88, 101)
-            wall_instance2.wh = (72, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (48, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (36, 61)
-            wall_instance1.wh = (88, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (132, 101)
-            wall_instance3.wh = (28, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (48, 101)
-            wall_instance4.wh = (64, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (20, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (132, 21)
-            wall_instance0.wh = (28, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (88, 101)
-            wall_instance3.wh = (72, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (64, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (88, 21)
-            wall_instance0.wh = (72, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (32, 101)
-            wall_instance3.wh = (96, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (32, 21)
-            wall_instance1.wh = (96, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (152, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (128, 101)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (68, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (112, 61)
-            wall_instance0.wh = (48, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (40, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (128, 21)
-            wall_instance0.wh = (32, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (68, 21)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (84, 101)
-            wall_instance3.wh = (76, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (68, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (84, 61)
-            wall_instance0.wh = (76, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (68, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (84, 21)
-            wall_instance0.wh = (76, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (68, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (84, 101)
-            wall_instance2.wh = (76, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (68, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (92, 61)
-            wall_instance1.wh = (12, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (56, 61)
-            wall_instance2.wh = (12, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            wall_instance3 = LavaWall()
-            wall_instance3.xy = (8, 61)
-            wall_instance3.wh = (8, 37)
-            objects_map['lava wall 3'] = wall_instance3
-            number_of_lava_walls = 4
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (84, 21)
-            wall_instance0.wh = (76, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (68, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (140, 101)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (112, 101)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (84, 101)
-            wall_instance4.wh = (20, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (56, 101)
-            wall_instance5.wh = (20, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (28, 101)
-            wall_instance6.wh = (20, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (8, 101)
-            wall_instance7.wh = (12, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            number_of_walls = 8
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (116, 61)
-            wall_instance0.wh = (12, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (32, 61)
-            wall_instance1.wh = (12, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (140, 21)
-            wall_instance0.wh = (20, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (112, 21)
-            wall_instance1.wh = (20, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (84, 21)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (56, 21)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (28, 21)
-            wall_instance4.wh = (20, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 21)
-            wall_instance5.wh = (12, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (152, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (132, 101)
-            wall_instance2.wh = (28, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (48, 61)
-            wall_instance0.wh = (64, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (132, 101)
-            wall_instance1.wh = (28, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 14:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (112, 101)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 15:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (72, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (120, 101)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-
-    elif ram_state[117] == 18:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (84, 101)
-            wall_instance2.wh = (76, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (68, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (84, 21)
-            wall_instance0.wh = (76, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (68, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (120, 101)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (48, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (32, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (148, 61)
-            wall_instance0.wh = (12, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (68, 61)
-            wall_instance1.wh = (40, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (20, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (120, 21)
-            wall_instance0.wh = (40, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (100, 101)
-            wall_instance3.wh = (60, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (52, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (128, 61)
-            wall_instance0.wh = (32, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (24, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (100, 21)
-            wall_instance0.wh = (60, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (52, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (44, 101)
-            wall_instance3.wh = (72, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (8, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (136, 61)
-            wall_instance0.wh = (24, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (56, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (32, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (44, 21)
-            wall_instance1.wh = (72, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (8, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (144, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (36, 101)
-            wall_instance4.wh = (88, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (8, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (136, 61)
-            wall_instance0.wh = (24, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (16, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (36, 21)
-            wall_instance1.wh = (88, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (8, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (84, 101)
-            wall_instance3.wh = (76, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (68, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (92, 61)
-            wall_instance0.wh = (68, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (60, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (84, 21)
-            wall_instance0.wh = (76, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (68, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (112, 101)
-            wall_instance2.wh = (48, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (40, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (112, 21)
-            wall_instance0.wh = (48, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (40, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (152, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (72, 61)
-            wall_instance3.wh = (48, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 61)
-            wall_instance4.wh = (32, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (116, 101)
-            wall_instance5.wh = (44, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (8, 101)
-            wall_instance6.wh = (36, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            number_of_walls = 7
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (88, 61)
-            wall_instance0.wh = (72, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (116, 21)
-            wall_instance0.wh = (44, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (36, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (8, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (96, 61)
-            wall_instance0.wh = (64, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (72, 61)
-            wall_instance1.wh = (16, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (56, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (8, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (128, 101)
-            wall_instance2.wh = (32, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (128, 21)
-            wall_instance0.wh = (32, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (92, 61)
-            wall_instance2.wh = (40, 37)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (28, 61)
-            wall_instance3.wh = (40, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (140, 101)
-            wall_instance4.wh = (20, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (12, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (56, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (132, 101)
-            wall_instance2.wh = (28, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (48, 61)
-            wall_instance0.wh = (64, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (128, 101)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (72, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (24, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 14:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (72, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (132, 101)
-            wall_instance1.wh = (28, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 15:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (72, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (112, 101)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
+    """
+    Puts the walls of the current screen of the mineshafts into the objects map, from their boxes in `WALLS`
+    and `LAVA_WALLS`. The walls only change with the screen, so they are only updated when entering another one.
+    """
+    global walls_screen
+    screen = int(ram_state[117]), int(ram_state[28])
+    if screen != walls_screen:
+        walls_screen = screen
+        if screen in WALLS:
+            _set_walls(objects_map, "lava wall", LavaWall, LAVA_WALLS.get(screen, ()))
+            _set_walls(objects_map, "fixed wall", Wall, WALLS[screen])
+    return objects_map
 
-    elif ram_state[117] == 19:
-        if ram_state[28] == 0:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (84, 101)
-            wall_instance2.wh = (76, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (68, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 1:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (8, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (84, 21)
-            wall_instance0.wh = (76, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (68, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (48, 101)
-            wall_instance3.wh = (64, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 2:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (48, 21)
-            wall_instance1.wh = (64, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (128, 61)
-            wall_instance3.wh = (32, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (40, 61)
-            wall_instance4.wh = (80, 37)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 61)
-            wall_instance5.wh = (24, 37)
-            objects_map['fixed wall 5'] = wall_instance5
-            wall_instance6 = Wall()
-            wall_instance6.xy = (144, 101)
-            wall_instance6.wh = (16, 38)
-            objects_map['fixed wall 6'] = wall_instance6
-            wall_instance7 = Wall()
-            wall_instance7.xy = (8, 101)
-            wall_instance7.wh = (8, 38)
-            objects_map['fixed wall 7'] = wall_instance7
-            number_of_walls = 8
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 3:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (128, 61)
-            wall_instance0.wh = (32, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (40, 61)
-            wall_instance1.wh = (80, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (24, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (8, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (8, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 4:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (104, 61)
-            wall_instance0.wh = (56, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (8, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (144, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (8, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 5:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (92, 61)
-            wall_instance0.wh = (68, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (8, 61)
-            wall_instance1.wh = (60, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            number_of_lava_walls = 2
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (144, 21)
-            wall_instance0.wh = (16, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (8, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (16, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 6:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (48, 61)
-            wall_instance1.wh = (64, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (16, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (120, 101)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (8, 101)
-            wall_instance3.wh = (32, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            number_of_walls = 4
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 7:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (112, 61)
-            wall_instance0.wh = (48, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (56, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (40, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (120, 21)
-            wall_instance0.wh = (40, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (8, 21)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (136, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (64, 101)
-            wall_instance3.wh = (32, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (8, 101)
-            wall_instance4.wh = (16, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            number_of_walls = 5
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 8:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (144, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (56, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (8, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (136, 21)
-            wall_instance0.wh = (24, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (64, 21)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (128, 101)
-            wall_instance3.wh = (32, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (64, 101)
-            wall_instance4.wh = (32, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (24, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 9:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (112, 61)
-            wall_instance0.wh = (48, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            wall_instance1 = LavaWall()
-            wall_instance1.xy = (56, 61)
-            wall_instance1.wh = (48, 37)
-            objects_map['lava wall 1'] = wall_instance1
-            wall_instance2 = LavaWall()
-            wall_instance2.xy = (8, 61)
-            wall_instance2.wh = (40, 37)
-            objects_map['lava wall 2'] = wall_instance2
-            number_of_lava_walls = 3
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (128, 21)
-            wall_instance0.wh = (32, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (64, 21)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (140, 101)
-            wall_instance3.wh = (20, 38)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (64, 101)
-            wall_instance4.wh = (32, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (12, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 10:
-            number_of_lava_walls = 0
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (140, 21)
-            wall_instance0.wh = (20, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (64, 21)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 21)
-            wall_instance2.wh = (12, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            wall_instance3 = Wall()
-            wall_instance3.xy = (32, 61)
-            wall_instance3.wh = (96, 37)
-            objects_map['fixed wall 3'] = wall_instance3
-            wall_instance4 = Wall()
-            wall_instance4.xy = (140, 101)
-            wall_instance4.wh = (20, 38)
-            objects_map['fixed wall 4'] = wall_instance4
-            wall_instance5 = Wall()
-            wall_instance5.xy = (8, 101)
-            wall_instance5.wh = (12, 38)
-            objects_map['fixed wall 5'] = wall_instance5
-            number_of_walls = 6
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 11:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (40, 61)
-            wall_instance0.wh = (80, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (136, 101)
-            wall_instance1.wh = (24, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (16, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 12:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (72, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (132, 101)
-            wall_instance1.wh = (28, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 13:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (64, 61)
-            wall_instance0.wh = (32, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (128, 101)
-            wall_instance1.wh = (32, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (24, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 14:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (72, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (132, 101)
-            wall_instance1.wh = (28, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (20, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
-        elif ram_state[28] == 15:
-            wall_instance0 = LavaWall()
-            wall_instance0.xy = (72, 61)
-            wall_instance0.wh = (16, 37)
-            objects_map['lava wall 0'] = wall_instance0
-            number_of_lava_walls = 1
-            i = 0
-            while (objects_map.get(f"lava wall {number_of_lava_walls + i}") != None):
-                objects_map.pop(f"lava wall {number_of_lava_walls + i}")
-                i += 1
-            wall_instance0 = Wall()
-            wall_instance0.xy = (8, 21)
-            wall_instance0.wh = (152, 38)
-            objects_map['fixed wall 0'] = wall_instance0
-            wall_instance1 = Wall()
-            wall_instance1.xy = (112, 101)
-            wall_instance1.wh = (48, 38)
-            objects_map['fixed wall 1'] = wall_instance1
-            wall_instance2 = Wall()
-            wall_instance2.xy = (8, 101)
-            wall_instance2.wh = (40, 38)
-            objects_map['fixed wall 2'] = wall_instance2
-            number_of_walls = 3
-            i = 0
-            while (objects_map.get(f"fixed wall {number_of_walls + i}") != None):
-                objects_map.pop(f"fixed wall {number_of_walls + i}")
-                i += 1
 
-    return objects_map
+def _set_walls(objects_map, name, cls, boxes):
+    """
+    Sets the walls `name 0`, `name 1`... of the objects map to the given (x, y, w, h) boxes,
+    and removes the walls beyond them.
+    """
+    for i, (x, y, w, h) in enumerate(boxes):
+        wall = cls()
+        wall.xy = x, y
+        wall.wh = w, h
+        objects_map[f"{name} {i}"] = wall
+    i = len(boxes)
+    while f"{name} {i}" in objects_map:
+        objects_map.pop(f"{name} {i}")
+        i += 1
+
+
+# The (x, y, w, h) boxes of the walls on each screen of the mineshafts, by level and screen
+# (ram_state[117], ram_state[28])
+WALLS = {
+    (0, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (144, 61, 16, 37), (8, 61, 8, 37), (88, 101, 72, 38),
+             (8, 101, 64, 38)),
+    (0, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (136, 61, 24, 37), (8, 61, 16, 37), (8, 101, 152, 38)),
+    (1, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (144, 61, 16, 37), (8, 61, 8, 37), (88, 101, 72, 38),
+             (8, 101, 64, 38)),
+    (1, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (144, 61, 16, 37), (8, 61, 8, 37), (120, 101, 40, 38),
+             (48, 101, 64, 38), (8, 101, 32, 38)),
+    (1, 2): ((120, 21, 40, 38), (48, 21, 64, 38), (8, 21, 32, 38), (144, 61, 16, 37), (64, 61, 44, 37),
+             (8, 61, 20, 37), (104, 101, 56, 38), (8, 101, 48, 38)),
+    (1, 3): ((8, 21, 152, 38), (144, 61, 16, 37), (8, 61, 8, 37), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (2, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (144, 61, 16, 37), (8, 61, 8, 37), (88, 101, 72, 38),
+             (8, 101, 64, 38)),
+    (2, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (144, 61, 16, 37), (8, 61, 8, 37), (136, 101, 24, 38),
+             (8, 101, 16, 38)),
+    (2, 2): ((136, 21, 24, 38), (8, 21, 16, 38), (144, 61, 16, 37), (8, 61, 8, 37), (112, 101, 48, 38),
+             (56, 101, 48, 38), (8, 101, 40, 38)),
+    (2, 3): ((112, 21, 48, 38), (56, 21, 48, 38), (8, 21, 40, 38), (144, 61, 16, 37), (8, 61, 8, 37),
+             (120, 101, 40, 38), (48, 101, 64, 38), (8, 101, 32, 38)),
+    (2, 4): ((120, 21, 40, 38), (48, 21, 64, 38), (8, 21, 32, 38), (144, 61, 16, 37), (8, 61, 8, 37),
+             (88, 101, 72, 38), (8, 101, 64, 38)),
+    (2, 5): ((88, 21, 72, 38), (8, 21, 64, 38), (136, 61, 24, 37), (8, 61, 16, 37), (8, 101, 152, 38)),
+    (3, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (140, 61, 20, 37), (8, 61, 12, 37), (88, 101, 72, 38),
+             (8, 101, 64, 38)),
+    (3, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (144, 61, 16, 37), (8, 61, 8, 37), (140, 101, 20, 38),
+             (28, 101, 104, 38), (8, 101, 12, 38)),
+    (3, 2): ((140, 21, 20, 38), (28, 21, 104, 38), (8, 21, 12, 38), (144, 61, 16, 37), (40, 61, 80, 37),
+             (8, 61, 8, 37), (128, 101, 32, 38), (44, 101, 72, 38), (8, 101, 24, 38)),
+    (3, 3): ((128, 21, 32, 38), (44, 21, 72, 38), (8, 21, 24, 38), (140, 61, 20, 37), (48, 61, 64, 37),
+             (8, 61, 12, 37), (144, 101, 16, 38), (32, 101, 96, 38), (8, 101, 8, 38)),
+    (3, 4): ((144, 21, 16, 38), (32, 21, 96, 38), (8, 21, 8, 38), (140, 61, 20, 37), (8, 61, 12, 37),
+             (88, 101, 72, 38), (8, 101, 64, 38)),
+    (3, 5): ((88, 21, 72, 38), (8, 21, 64, 38), (144, 61, 16, 37), (8, 61, 8, 37), (140, 101, 20, 38),
+             (28, 101, 104, 38), (8, 101, 12, 38)),
+    (3, 6): ((140, 21, 20, 38), (28, 21, 104, 38), (8, 21, 12, 38), (144, 61, 16, 37), (8, 61, 8, 37),
+             (100, 101, 60, 38), (8, 101, 52, 38)),
+    (3, 7): ((100, 21, 60, 38), (8, 21, 52, 38), (136, 61, 24, 37), (72, 61, 16, 37), (8, 61, 16, 37),
+             (8, 101, 152, 38)),
+    (4, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (144, 61, 16, 37), (8, 61, 8, 37), (88, 101, 72, 38),
+             (8, 101, 64, 38)),
+    (4, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (8, 101, 152, 38)),
+    (4, 2): ((8, 21, 152, 38), (144, 61, 16, 37), (8, 61, 8, 37), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (4, 3): ((136, 21, 24, 38), (8, 21, 16, 38), (84, 101, 76, 38), (8, 101, 68, 38)),
+    (4, 4): ((84, 21, 76, 38), (8, 21, 68, 38), (144, 61, 16, 37), (8, 61, 8, 37), (136, 101, 24, 38),
+             (32, 101, 96, 38), (8, 101, 16, 38)),
+    (4, 5): ((136, 21, 24, 38), (32, 21, 96, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (4, 6): ((88, 21, 72, 38), (8, 21, 64, 38), (120, 101, 40, 38), (48, 101, 64, 38), (8, 101, 32, 38)),
+    (4, 7): ((120, 21, 40, 38), (48, 21, 64, 38), (8, 21, 32, 38), (144, 61, 16, 37), (8, 61, 8, 37),
+             (8, 101, 152, 38)),
+    (5, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (5, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (144, 61, 16, 37), (8, 61, 8, 37), (140, 101, 20, 38),
+             (56, 101, 48, 38), (8, 101, 12, 38)),
+    (5, 2): ((140, 21, 20, 38), (56, 21, 48, 38), (8, 21, 12, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (5, 3): ((88, 21, 72, 38), (8, 21, 64, 38), (136, 61, 24, 37), (8, 61, 16, 37), (132, 101, 28, 38),
+             (104, 101, 20, 38), (64, 101, 32, 38), (36, 101, 20, 38), (8, 101, 20, 38)),
+    (5, 4): ((132, 21, 28, 38), (104, 21, 20, 38), (64, 21, 32, 38), (36, 21, 20, 38), (8, 21, 20, 38),
+             (108, 101, 52, 38), (60, 101, 40, 38), (8, 101, 44, 38)),
+    (5, 5): ((108, 21, 52, 38), (60, 21, 40, 38), (8, 21, 44, 38), (132, 61, 28, 37), (52, 61, 44, 37),
+             (8, 61, 8, 37), (120, 101, 40, 38), (8, 101, 32, 38)),
+    (5, 6): ((120, 21, 40, 38), (8, 21, 32, 38), (136, 101, 24, 38), (32, 101, 96, 38), (8, 101, 16, 38)),
+    (5, 7): ((136, 21, 24, 38), (32, 21, 96, 38), (8, 21, 16, 38), (144, 61, 16, 37), (8, 61, 8, 37),
+             (112, 101, 48, 38), (56, 101, 48, 38), (8, 101, 40, 38)),
+    (5, 8): ((112, 21, 48, 38), (56, 21, 48, 38), (8, 21, 40, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (5, 9): ((88, 21, 72, 38), (8, 21, 64, 38), (136, 61, 24, 37), (8, 61, 16, 37), (8, 101, 152, 38)),
+    (6, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (6, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (140, 61, 20, 37), (8, 61, 12, 37), (136, 101, 24, 38),
+             (32, 101, 96, 38), (8, 101, 16, 38)),
+    (6, 2): ((136, 21, 24, 38), (32, 21, 96, 38), (8, 21, 16, 38), (84, 101, 76, 38), (8, 101, 68, 38)),
+    (6, 3): ((84, 21, 76, 38), (8, 21, 68, 38), (112, 61, 48, 37), (8, 61, 40, 37), (108, 101, 52, 38),
+             (60, 101, 40, 38), (8, 101, 44, 38)),
+    (6, 4): ((108, 21, 52, 38), (60, 21, 40, 38), (8, 21, 44, 38), (136, 101, 24, 38), (40, 101, 80, 38),
+             (8, 101, 16, 38)),
+    (6, 5): ((136, 21, 24, 38), (40, 21, 80, 38), (8, 21, 16, 38), (128, 61, 32, 37), (8, 61, 24, 37),
+             (144, 101, 16, 38), (48, 101, 64, 38), (8, 101, 8, 38)),
+    (6, 6): ((144, 21, 16, 38), (48, 21, 64, 38), (8, 21, 8, 38), (144, 101, 16, 38), (36, 101, 88, 38),
+             (8, 101, 8, 38)),
+    (6, 7): ((144, 21, 16, 38), (36, 21, 88, 38), (8, 21, 8, 38), (132, 61, 28, 37), (8, 61, 20, 37),
+             (88, 101, 72, 38), (8, 101, 64, 38)),
+    (6, 8): ((88, 21, 72, 38), (8, 21, 64, 38), (128, 101, 32, 38), (48, 101, 64, 38), (8, 101, 24, 38)),
+    (6, 9): ((128, 21, 32, 38), (48, 21, 64, 38), (8, 21, 24, 38), (136, 61, 24, 37), (8, 61, 16, 37),
+             (96, 101, 64, 38), (72, 101, 16, 38), (8, 101, 56, 38)),
+    (6, 10): ((96, 21, 64, 38), (72, 21, 16, 38), (8, 21, 56, 38), (128, 101, 32, 38), (8, 101, 24, 38)),
+    (6, 11): ((8, 21, 152, 38), (8, 101, 152, 38)),
+    (7, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (7, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (7, 2): ((112, 21, 48, 38), (8, 21, 40, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (7, 3): ((88, 21, 72, 38), (8, 21, 64, 38), (112, 101, 48, 38), (56, 101, 48, 38), (8, 101, 40, 38)),
+    (7, 4): ((112, 21, 48, 38), (56, 21, 48, 38), (8, 21, 40, 38), (128, 101, 32, 38), (52, 101, 56, 38),
+             (8, 101, 24, 38)),
+    (7, 5): ((128, 21, 32, 38), (52, 21, 56, 38), (8, 21, 24, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (7, 6): ((88, 21, 72, 38), (8, 21, 64, 38), (136, 101, 24, 38), (32, 101, 96, 38), (8, 101, 16, 38)),
+    (7, 7): ((136, 21, 24, 38), (32, 21, 96, 38), (8, 21, 16, 38), (112, 101, 48, 38), (56, 101, 48, 38),
+             (8, 101, 40, 38)),
+    (7, 8): ((112, 21, 48, 38), (56, 21, 48, 38), (8, 21, 40, 38), (144, 101, 16, 38), (56, 101, 48, 38),
+             (8, 101, 8, 38)),
+    (7, 9): ((144, 21, 16, 38), (56, 21, 48, 38), (8, 21, 8, 38), (136, 101, 24, 38), (64, 101, 32, 38),
+             (8, 101, 16, 38)),
+    (7, 10): ((136, 21, 24, 38), (64, 21, 32, 38), (8, 21, 16, 38), (120, 101, 40, 38), (8, 101, 32, 38)),
+    (7, 11): ((8, 21, 152, 38), (56, 61, 48, 37), (116, 101, 44, 38), (8, 101, 36, 38)),
+    (7, 12): ((8, 21, 152, 38), (128, 101, 32, 38), (72, 101, 16, 38), (8, 101, 24, 38)),
+    (7, 13): ((8, 21, 152, 38), (8, 101, 152, 38)),
+    (8, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (8, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (136, 101, 24, 38), (40, 101, 80, 38), (8, 101, 16, 38)),
+    (8, 2): ((136, 21, 24, 38), (40, 21, 80, 38), (8, 21, 16, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (8, 3): ((136, 21, 24, 38), (8, 21, 16, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (8, 4): ((136, 21, 24, 38), (8, 21, 16, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (8, 5): ((136, 21, 24, 38), (8, 21, 16, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (8, 6): ((136, 21, 24, 38), (8, 21, 16, 38), (104, 101, 56, 38), (72, 101, 16, 38), (8, 101, 48, 38)),
+    (8, 7): ((104, 21, 56, 38), (72, 21, 16, 38), (8, 21, 48, 38), (136, 101, 24, 38), (32, 101, 96, 38),
+             (8, 101, 16, 38)),
+    (8, 8): ((136, 21, 24, 38), (32, 21, 96, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (8, 9): ((88, 21, 72, 38), (8, 21, 64, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (8, 10): ((136, 21, 24, 38), (8, 21, 16, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (8, 11): ((8, 21, 152, 38), (128, 101, 32, 38), (8, 101, 24, 38)),
+    (8, 12): ((8, 21, 152, 38), (140, 101, 20, 38), (72, 101, 16, 38), (8, 101, 12, 38)),
+    (8, 13): ((8, 21, 152, 38), (64, 61, 32, 37), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (8, 14): ((8, 21, 152, 38), (48, 61, 64, 37), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (8, 15): ((8, 21, 152, 38), (8, 101, 152, 38)),
+    (9, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (9, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (136, 101, 24, 38), (32, 101, 96, 38), (8, 101, 16, 38)),
+    (9, 2): ((136, 21, 24, 38), (32, 21, 96, 38), (8, 21, 16, 38), (84, 101, 76, 38), (8, 101, 68, 38)),
+    (9, 3): ((84, 21, 76, 38), (8, 21, 68, 38), (132, 101, 28, 38), (84, 101, 40, 38), (36, 101, 40, 38),
+             (8, 101, 20, 38)),
+    (9, 4): ((132, 21, 28, 38), (84, 21, 40, 38), (36, 21, 40, 38), (8, 21, 20, 38), (132, 101, 28, 38),
+             (36, 101, 88, 38), (8, 101, 20, 38)),
+    (9, 5): ((132, 21, 28, 38), (36, 21, 88, 38), (8, 21, 20, 38), (124, 101, 36, 38), (48, 101, 64, 38),
+             (8, 101, 28, 38)),
+    (9, 6): ((124, 21, 36, 38), (48, 21, 64, 38), (8, 21, 28, 38), (140, 101, 20, 38), (88, 101, 36, 38),
+             (36, 101, 36, 38), (8, 101, 12, 38)),
+    (9, 7): ((140, 21, 20, 38), (88, 21, 36, 38), (36, 21, 36, 38), (8, 21, 12, 38), (144, 101, 16, 38),
+             (8, 101, 8, 38)),
+    (9, 8): ((144, 21, 16, 38), (8, 21, 8, 38), (144, 101, 16, 38), (8, 101, 8, 38)),
+    (9, 9): ((144, 21, 16, 38), (8, 21, 8, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (9, 10): ((136, 21, 24, 38), (8, 21, 16, 38), (128, 101, 32, 38), (8, 101, 24, 38)),
+    (9, 11): ((8, 21, 152, 38), (132, 101, 28, 38), (8, 101, 20, 38)),
+    (9, 12): ((8, 21, 152, 38), (136, 101, 24, 38), (72, 101, 16, 38), (8, 101, 16, 38)),
+    (9, 13): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (9, 14): ((8, 21, 152, 38), (120, 101, 40, 38), (72, 101, 16, 38), (8, 101, 32, 38)),
+    (9, 15): ((8, 21, 152, 38), (8, 101, 152, 38)),
+    (10, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (10, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (10, 2): ((112, 21, 48, 38), (8, 21, 40, 38), (140, 101, 20, 38), (28, 101, 104, 38), (8, 101, 12, 38)),
+    (10, 3): ((140, 21, 20, 38), (28, 21, 104, 38), (8, 21, 12, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (10, 4): ((88, 21, 72, 38), (8, 21, 64, 38), (140, 101, 20, 38), (116, 101, 16, 38), (84, 101, 24, 38),
+              (52, 101, 24, 38), (28, 101, 16, 38), (8, 101, 12, 38)),
+    (10, 5): ((140, 21, 20, 38), (116, 21, 16, 38), (84, 21, 24, 38), (52, 21, 24, 38), (28, 21, 16, 38),
+              (8, 21, 12, 38), (140, 101, 20, 38), (28, 101, 104, 38), (8, 101, 12, 38)),
+    (10, 6): ((140, 21, 20, 38), (28, 21, 104, 38), (8, 21, 12, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (10, 7): ((112, 21, 48, 38), (8, 21, 40, 38), (144, 101, 16, 38), (8, 101, 8, 38)),
+    (10, 8): ((144, 21, 16, 38), (8, 21, 8, 38), (144, 101, 16, 38), (8, 101, 8, 38)),
+    (10, 9): ((144, 21, 16, 38), (8, 21, 8, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (10, 10): ((112, 21, 48, 38), (8, 21, 40, 38), (104, 61, 16, 37), (72, 61, 16, 37), (40, 61, 16, 37),
+               (136, 101, 24, 38), (68, 101, 24, 38), (8, 101, 16, 38)),
+    (10, 11): ((8, 21, 152, 38), (128, 101, 32, 38), (72, 101, 16, 38), (8, 101, 24, 38)),
+    (10, 12): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (10, 13): ((8, 21, 152, 38), (112, 101, 48, 38), (64, 101, 32, 38), (8, 101, 40, 38)),
+    (10, 14): ((8, 21, 152, 38), (136, 101, 24, 38), (48, 101, 64, 38), (8, 101, 16, 38)),
+    (10, 15): ((8, 21, 152, 38), (8, 101, 152, 38)),
+    (11, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (11, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (132, 101, 28, 38), (36, 101, 88, 38), (8, 101, 20, 38)),
+    (11, 2): ((132, 21, 28, 38), (36, 21, 88, 38), (8, 21, 20, 38), (8, 101, 152, 38)),
+    (11, 3): ((8, 21, 152, 38), (120, 101, 40, 38), (48, 101, 64, 38), (8, 101, 32, 38)),
+    (11, 4): ((120, 21, 40, 38), (48, 21, 64, 38), (8, 21, 32, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (11, 5): ((88, 21, 72, 38), (8, 21, 64, 38), (144, 101, 16, 38), (48, 101, 64, 38), (8, 101, 8, 38)),
+    (11, 6): ((144, 21, 16, 38), (48, 21, 64, 38), (8, 21, 8, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (11, 7): ((136, 21, 24, 38), (8, 21, 16, 38), (8, 101, 152, 38)),
+    (11, 8): ((8, 21, 152, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (11, 9): ((112, 21, 48, 38), (8, 21, 40, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (11, 10): ((112, 21, 48, 38), (8, 21, 40, 38), (136, 101, 24, 38), (68, 101, 24, 38), (8, 101, 16, 38)),
+    (11, 11): ((8, 21, 152, 38), (144, 101, 16, 38), (68, 101, 24, 38), (8, 101, 8, 38)),
+    (11, 12): ((8, 21, 152, 38), (72, 61, 16, 37), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (11, 13): ((8, 21, 152, 38), (144, 101, 16, 38), (72, 101, 16, 38), (8, 101, 8, 38)),
+    (11, 14): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (11, 15): ((8, 21, 152, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (12, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (12, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (140, 101, 20, 38), (116, 101, 16, 38), (88, 101, 20, 38),
+              (52, 101, 20, 38), (28, 101, 16, 38), (8, 101, 12, 38)),
+    (12, 2): ((140, 21, 20, 38), (116, 21, 16, 38), (88, 21, 20, 38), (52, 21, 20, 38), (28, 21, 16, 38),
+              (8, 21, 12, 38), (144, 101, 16, 38), (32, 101, 96, 38), (8, 101, 8, 38)),
+    (12, 3): ((144, 21, 16, 38), (32, 21, 96, 38), (8, 21, 8, 38), (120, 101, 40, 38), (48, 101, 64, 38),
+              (8, 101, 32, 38)),
+    (12, 4): ((120, 21, 40, 38), (48, 21, 64, 38), (8, 21, 32, 38), (144, 101, 16, 38), (40, 101, 80, 38),
+              (8, 101, 8, 38)),
+    (12, 5): ((144, 21, 16, 38), (40, 21, 80, 38), (8, 21, 8, 38), (144, 101, 16, 38), (32, 101, 96, 38),
+              (8, 101, 8, 38)),
+    (12, 6): ((144, 21, 16, 38), (32, 21, 96, 38), (8, 21, 8, 38), (8, 101, 152, 38)),
+    (12, 7): ((8, 21, 152, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (12, 8): ((88, 21, 72, 38), (8, 21, 64, 38), (144, 61, 16, 37), (8, 61, 8, 37), (116, 101, 44, 38),
+              (52, 101, 56, 38), (8, 101, 36, 38)),
+    (12, 9): ((116, 21, 44, 38), (52, 21, 56, 38), (8, 21, 36, 38), (8, 101, 152, 38)),
+    (12, 10): ((8, 21, 152, 38), (8, 101, 152, 38)),
+    (12, 11): ((8, 21, 152, 38), (136, 101, 24, 38), (68, 101, 24, 38), (8, 101, 16, 38)),
+    (12, 12): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (12, 13): ((8, 21, 152, 38), (136, 101, 24, 38), (72, 101, 16, 38), (8, 101, 16, 38)),
+    (12, 14): ((8, 21, 152, 38), (112, 101, 48, 38), (64, 101, 32, 38), (8, 101, 40, 38)),
+    (12, 15): ((8, 21, 152, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (13, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (13, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (8, 101, 152, 38)),
+    (13, 2): ((8, 21, 152, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (13, 3): ((88, 21, 72, 38), (8, 21, 64, 38), (8, 101, 152, 38)),
+    (13, 4): ((8, 21, 152, 38), (136, 101, 24, 38), (88, 101, 32, 38), (40, 101, 32, 38), (8, 101, 16, 38)),
+    (13, 5): ((136, 21, 24, 38), (88, 21, 32, 38), (40, 21, 32, 38), (8, 21, 16, 38), (112, 101, 48, 38),
+              (8, 101, 40, 38)),
+    (13, 6): ((112, 21, 48, 38), (8, 21, 40, 38), (140, 101, 20, 38), (44, 101, 72, 38), (8, 101, 12, 38)),
+    (13, 7): ((140, 21, 20, 38), (44, 21, 72, 38), (8, 21, 12, 38), (8, 101, 152, 38)),
+    (13, 8): ((8, 21, 152, 38), (136, 101, 24, 38), (52, 101, 56, 38), (8, 101, 16, 38)),
+    (13, 9): ((136, 21, 24, 38), (52, 21, 56, 38), (8, 21, 16, 38), (84, 101, 76, 38), (8, 101, 68, 38)),
+    (13, 10): ((84, 21, 76, 38), (8, 21, 68, 38), (104, 61, 16, 37), (40, 61, 16, 37), (140, 101, 20, 38),
+               (8, 101, 12, 38)),
+    (13, 11): ((8, 21, 152, 38), (136, 101, 24, 38), (68, 101, 24, 38), (8, 101, 16, 38)),
+    (13, 12): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (13, 13): ((8, 21, 152, 38), (136, 101, 24, 38), (72, 101, 16, 38), (8, 101, 16, 38)),
+    (13, 14): ((8, 21, 152, 38), (136, 101, 24, 38), (96, 101, 16, 38), (48, 101, 16, 38), (8, 101, 16, 38)),
+    (13, 15): ((8, 21, 152, 38), (112, 101, 48, 38), (72, 101, 16, 38), (8, 101, 40, 38)),
+    (14, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (14, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (112, 101, 48, 38), (56, 101, 48, 38), (8, 101, 40, 38)),
+    (14, 2): ((112, 21, 48, 38), (56, 21, 48, 38), (8, 21, 40, 38), (104, 101, 56, 38), (8, 101, 48, 38)),
+    (14, 3): ((104, 21, 56, 38), (8, 21, 48, 38), (128, 101, 32, 38), (40, 101, 80, 38), (8, 101, 24, 38)),
+    (14, 4): ((128, 21, 32, 38), (40, 21, 80, 38), (8, 21, 24, 38), (96, 101, 64, 38), (8, 101, 56, 38)),
+    (14, 5): ((96, 21, 64, 38), (8, 21, 56, 38), (136, 101, 24, 38), (84, 101, 44, 38), (32, 101, 44, 38),
+              (8, 101, 16, 38)),
+    (14, 6): ((136, 21, 24, 38), (84, 21, 44, 38), (32, 21, 44, 38), (8, 21, 16, 38), (136, 101, 24, 38),
+              (48, 101, 64, 38), (8, 101, 16, 38)),
+    (14, 7): ((136, 21, 24, 38), (48, 21, 64, 38), (8, 21, 16, 38), (136, 101, 24, 38), (32, 101, 96, 38),
+              (8, 101, 16, 38)),
+    (14, 8): ((136, 21, 24, 38), (32, 21, 96, 38), (8, 21, 16, 38), (136, 101, 24, 38), (84, 101, 44, 38),
+              (32, 101, 44, 38), (8, 101, 16, 38)),
+    (14, 9): ((136, 21, 24, 38), (84, 21, 44, 38), (32, 21, 44, 38), (8, 21, 16, 38), (88, 101, 72, 38),
+              (8, 101, 64, 38)),
+    (14, 10): ((88, 21, 72, 38), (8, 21, 64, 38), (128, 61, 32, 37), (48, 61, 32, 37), (120, 101, 40, 38),
+               (8, 101, 32, 38)),
+    (14, 11): ((8, 21, 152, 38), (144, 101, 16, 38), (72, 101, 16, 38), (8, 101, 8, 38)),
+    (14, 12): ((8, 21, 152, 38), (120, 61, 16, 37), (40, 61, 16, 37), (144, 101, 16, 38), (64, 101, 32, 38),
+               (8, 101, 8, 38)),
+    (14, 13): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (14, 14): ((8, 21, 152, 38), (8, 101, 152, 38)),
+    (14, 15): ((8, 21, 152, 38), (112, 101, 48, 38), (60, 101, 40, 38), (8, 101, 40, 38)),
+    (15, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (136, 101, 24, 38), (88, 101, 40, 38), (32, 101, 40, 38),
+              (8, 101, 16, 38)),
+    (15, 1): ((136, 21, 24, 38), (88, 21, 40, 38), (32, 21, 40, 38), (8, 21, 16, 38), (8, 101, 152, 38)),
+    (15, 2): ((8, 21, 152, 38), (128, 101, 32, 38), (8, 101, 24, 38)),
+    (15, 3): ((128, 21, 32, 38), (8, 21, 24, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (15, 4): ((112, 21, 48, 38), (8, 21, 40, 38), (140, 101, 20, 38), (28, 101, 104, 38), (8, 101, 12, 38)),
+    (15, 5): ((140, 21, 20, 38), (28, 21, 104, 38), (8, 21, 12, 38), (108, 101, 52, 38), (8, 101, 44, 38)),
+    (15, 6): ((108, 21, 52, 38), (8, 21, 44, 38), (144, 101, 16, 38), (8, 101, 8, 38)),
+    (15, 7): ((144, 21, 16, 38), (8, 21, 8, 38), (144, 101, 16, 38), (8, 101, 8, 38)),
+    (15, 8): ((144, 21, 16, 38), (8, 21, 8, 38), (144, 101, 16, 38), (8, 101, 8, 38)),
+    (15, 9): ((144, 21, 16, 38), (8, 21, 8, 38), (128, 101, 32, 38), (8, 101, 24, 38)),
+    (15, 10): ((128, 21, 32, 38), (8, 21, 24, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (15, 11): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (15, 12): ((8, 21, 152, 38), (132, 101, 28, 38), (72, 101, 16, 38), (8, 101, 20, 38)),
+    (15, 13): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (15, 14): ((8, 21, 152, 38), (128, 101, 32, 38), (68, 101, 24, 38), (8, 101, 24, 38)),
+    (15, 15): ((8, 21, 152, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (16, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (16, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (144, 101, 16, 38), (48, 101, 64, 38), (8, 101, 8, 38)),
+    (16, 2): ((144, 21, 16, 38), (48, 21, 64, 38), (8, 21, 8, 38), (128, 101, 32, 38), (8, 101, 24, 38)),
+    (16, 3): ((128, 21, 32, 38), (8, 21, 24, 38), (112, 61, 48, 37), (8, 61, 40, 37), (144, 101, 16, 38),
+              (8, 101, 8, 38)),
+    (16, 4): ((144, 21, 16, 38), (8, 21, 8, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (16, 5): ((112, 21, 48, 38), (8, 21, 40, 38), (84, 101, 76, 38), (8, 101, 68, 38)),
+    (16, 6): ((84, 21, 76, 38), (8, 21, 68, 38), (136, 101, 24, 38), (32, 101, 96, 38), (8, 101, 16, 38)),
+    (16, 7): ((136, 21, 24, 38), (32, 21, 96, 38), (8, 21, 16, 38), (8, 101, 152, 38)),
+    (16, 8): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (16, 9): ((136, 21, 24, 38), (8, 21, 16, 38), (108, 101, 52, 38), (8, 101, 44, 38)),
+    (16, 10): ((108, 21, 52, 38), (8, 21, 44, 38), (136, 101, 24, 38), (36, 101, 88, 38), (8, 101, 16, 38)),
+    (16, 11): ((8, 21, 152, 38), (48, 61, 64, 37), (132, 101, 28, 38), (8, 101, 20, 38)),
+    (16, 12): ((8, 21, 152, 38), (132, 101, 28, 38), (72, 101, 16, 38), (8, 101, 20, 38)),
+    (16, 13): ((8, 21, 152, 38), (132, 101, 28, 38), (72, 101, 16, 38), (8, 101, 20, 38)),
+    (16, 14): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (16, 15): ((8, 21, 152, 38), (124, 101, 36, 38), (8, 101, 28, 38)),
+    (17, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (17, 1): ((88, 21, 72, 38), (8, 21, 64, 38), (136, 101, 24, 38), (48, 101, 64, 38), (8, 101, 16, 38)),
+    (17, 2): ((136, 21, 24, 38), (48, 21, 64, 38), (8, 21, 16, 38), (132, 101, 28, 38), (48, 101, 64, 38),
+              (8, 101, 20, 38)),
+    (17, 3): ((132, 21, 28, 38), (48, 21, 64, 38), (8, 21, 20, 38), (88, 101, 72, 38), (8, 101, 64, 38)),
+    (17, 4): ((88, 21, 72, 38), (8, 21, 64, 38), (136, 101, 24, 38), (32, 101, 96, 38), (8, 101, 16, 38)),
+    (17, 5): ((136, 21, 24, 38), (32, 21, 96, 38), (8, 21, 16, 38), (8, 101, 152, 38)),
+    (17, 6): ((8, 21, 152, 38), (128, 101, 32, 38), (68, 101, 24, 38), (8, 101, 24, 38)),
+    (17, 7): ((128, 21, 32, 38), (68, 21, 24, 38), (8, 21, 24, 38), (84, 101, 76, 38), (8, 101, 68, 38)),
+    (17, 8): ((84, 21, 76, 38), (8, 21, 68, 38), (84, 101, 76, 38), (8, 101, 68, 38)),
+    (17, 9): ((84, 21, 76, 38), (8, 21, 68, 38), (140, 101, 20, 38), (112, 101, 20, 38), (84, 101, 20, 38),
+              (56, 101, 20, 38), (28, 101, 20, 38), (8, 101, 12, 38)),
+    (17, 10): ((140, 21, 20, 38), (112, 21, 20, 38), (84, 21, 20, 38), (56, 21, 20, 38), (28, 21, 20, 38),
+               (8, 21, 12, 38), (8, 101, 152, 38)),
+    (17, 11): ((8, 21, 152, 38), (48, 61, 64, 37), (132, 101, 28, 38), (8, 101, 20, 38)),
+    (17, 12): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (17, 13): ((8, 21, 152, 38), (132, 101, 28, 38), (72, 101, 16, 38), (8, 101, 20, 38)),
+    (17, 14): ((8, 21, 152, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (17, 15): ((8, 21, 152, 38), (120, 101, 40, 38), (8, 101, 32, 38)),
+    (18, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (84, 101, 76, 38), (8, 101, 68, 38)),
+    (18, 1): ((84, 21, 76, 38), (8, 21, 68, 38), (120, 101, 40, 38), (48, 101, 64, 38), (8, 101, 32, 38)),
+    (18, 2): ((120, 21, 40, 38), (48, 21, 64, 38), (8, 21, 32, 38), (100, 101, 60, 38), (8, 101, 52, 38)),
+    (18, 3): ((100, 21, 60, 38), (8, 21, 52, 38), (144, 101, 16, 38), (44, 101, 72, 38), (8, 101, 8, 38)),
+    (18, 4): ((144, 21, 16, 38), (44, 21, 72, 38), (8, 21, 8, 38), (144, 101, 16, 38), (36, 101, 88, 38),
+              (8, 101, 8, 38)),
+    (18, 5): ((144, 21, 16, 38), (36, 21, 88, 38), (8, 21, 8, 38), (84, 101, 76, 38), (8, 101, 68, 38)),
+    (18, 6): ((84, 21, 76, 38), (8, 21, 68, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (18, 7): ((112, 21, 48, 38), (8, 21, 40, 38), (152, 61, 8, 37), (72, 61, 48, 37), (8, 61, 32, 37),
+              (116, 101, 44, 38), (8, 101, 36, 38)),
+    (18, 8): ((116, 21, 44, 38), (8, 21, 36, 38), (144, 101, 16, 38), (8, 101, 8, 38)),
+    (18, 9): ((144, 21, 16, 38), (8, 21, 8, 38), (128, 101, 32, 38), (8, 101, 24, 38)),
+    (18, 10): ((128, 21, 32, 38), (8, 21, 24, 38), (92, 61, 40, 37), (28, 61, 40, 37), (140, 101, 20, 38),
+               (8, 101, 12, 38)),
+    (18, 11): ((8, 21, 152, 38), (56, 61, 48, 37), (132, 101, 28, 38), (8, 101, 20, 38)),
+    (18, 12): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (18, 13): ((8, 21, 152, 38), (128, 101, 32, 38), (72, 101, 16, 38), (8, 101, 24, 38)),
+    (18, 14): ((8, 21, 152, 38), (132, 101, 28, 38), (8, 101, 20, 38)),
+    (18, 15): ((8, 21, 152, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+    (19, 0): ((136, 21, 24, 38), (8, 21, 16, 38), (84, 101, 76, 38), (8, 101, 68, 38)),
+    (19, 1): ((84, 21, 76, 38), (8, 21, 68, 38), (136, 101, 24, 38), (48, 101, 64, 38), (8, 101, 16, 38)),
+    (19, 2): ((136, 21, 24, 38), (48, 21, 64, 38), (8, 21, 16, 38), (128, 61, 32, 37), (40, 61, 80, 37),
+              (8, 61, 24, 37), (144, 101, 16, 38), (8, 101, 8, 38)),
+    (19, 3): ((144, 21, 16, 38), (8, 21, 8, 38), (144, 101, 16, 38), (8, 101, 8, 38)),
+    (19, 4): ((144, 21, 16, 38), (8, 21, 8, 38), (144, 101, 16, 38), (8, 101, 8, 38)),
+    (19, 5): ((144, 21, 16, 38), (8, 21, 8, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (19, 6): ((136, 21, 24, 38), (8, 21, 16, 38), (120, 101, 40, 38), (8, 101, 32, 38)),
+    (19, 7): ((120, 21, 40, 38), (8, 21, 32, 38), (136, 101, 24, 38), (64, 101, 32, 38), (8, 101, 16, 38)),
+    (19, 8): ((136, 21, 24, 38), (64, 21, 32, 38), (8, 21, 16, 38), (128, 101, 32, 38), (64, 101, 32, 38),
+              (8, 101, 24, 38)),
+    (19, 9): ((128, 21, 32, 38), (64, 21, 32, 38), (8, 21, 24, 38), (140, 101, 20, 38), (64, 101, 32, 38),
+              (8, 101, 12, 38)),
+    (19, 10): ((140, 21, 20, 38), (64, 21, 32, 38), (8, 21, 12, 38), (32, 61, 96, 37), (140, 101, 20, 38),
+               (8, 101, 12, 38)),
+    (19, 11): ((8, 21, 152, 38), (136, 101, 24, 38), (8, 101, 16, 38)),
+    (19, 12): ((8, 21, 152, 38), (132, 101, 28, 38), (8, 101, 20, 38)),
+    (19, 13): ((8, 21, 152, 38), (128, 101, 32, 38), (8, 101, 24, 38)),
+    (19, 14): ((8, 21, 152, 38), (132, 101, 28, 38), (8, 101, 20, 38)),
+    (19, 15): ((8, 21, 152, 38), (112, 101, 48, 38), (8, 101, 40, 38)),
+}
+
+# The boxes of the lava walls, for the screens having some
+LAVA_WALLS = {
+    (4, 1): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (4, 3): ((112, 61, 48, 37), (8, 61, 40, 37)),
+    (4, 5): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (4, 6): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (5, 0): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (5, 2): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (5, 4): ((112, 61, 48, 37), (8, 61, 40, 37)),
+    (5, 6): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (5, 8): ((136, 61, 24, 37), (8, 61, 16, 37)),
+    (6, 0): ((140, 61, 20, 37), (8, 61, 12, 37)),
+    (6, 2): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (6, 4): ((144, 61, 16, 37), (64, 61, 48, 37), (8, 61, 24, 37)),
+    (6, 6): ((136, 61, 24, 37), (56, 61, 64, 37), (8, 61, 32, 37)),
+    (6, 8): ((132, 61, 28, 37), (8, 61, 20, 37)),
+    (7, 0): ((140, 61, 20, 37), (8, 61, 12, 37)),
+    (7, 1): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (7, 2): ((92, 61, 68, 37), (8, 61, 60, 37)),
+    (7, 3): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (7, 4): ((124, 61, 36, 37), (60, 61, 40, 37), (8, 61, 28, 37)),
+    (7, 5): ((124, 61, 36, 37), (8, 61, 28, 37)),
+    (7, 6): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (7, 7): ((144, 61, 16, 37), (64, 61, 32, 37), (8, 61, 8, 37)),
+    (7, 8): ((132, 61, 28, 37), (72, 61, 16, 37), (8, 61, 20, 37)),
+    (7, 9): ((128, 61, 32, 37), (48, 61, 64, 37), (8, 61, 24, 37)),
+    (8, 0): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (8, 1): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (8, 2): ((140, 61, 20, 37), (44, 61, 72, 37), (8, 61, 12, 37)),
+    (8, 3): ((128, 61, 32, 37), (44, 61, 72, 37), (8, 61, 24, 37)),
+    (8, 4): ((116, 61, 44, 37), (56, 61, 48, 37), (8, 61, 36, 37)),
+    (8, 5): ((108, 61, 52, 37), (64, 61, 32, 37), (8, 61, 44, 37)),
+    (8, 6): ((108, 61, 52, 37), (8, 61, 44, 37)),
+    (8, 7): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (8, 8): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (8, 9): ((92, 61, 68, 37), (8, 61, 60, 37)),
+    (9, 0): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (9, 1): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (9, 2): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (9, 3): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (9, 4): ((136, 61, 24, 37), (56, 61, 64, 37), (8, 61, 32, 37)),
+    (9, 5): ((144, 61, 16, 37), (44, 61, 72, 37), (8, 61, 8, 37)),
+    (9, 6): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (9, 7): ((136, 61, 24, 37), (84, 61, 44, 37), (32, 61, 44, 37), (8, 61, 16, 37)),
+    (9, 8): ((88, 61, 72, 37), (8, 61, 64, 37)),
+    (9, 9): ((96, 61, 64, 37), (8, 61, 56, 37)),
+    (9, 10): ((48, 61, 64, 37),),
+    (9, 13): ((72, 61, 16, 37),),
+    (10, 0): ((140, 61, 20, 37), (8, 61, 12, 37)),
+    (10, 1): ((88, 61, 72, 37), (8, 61, 64, 37)),
+    (10, 2): ((144, 61, 16, 37), (72, 61, 16, 37), (8, 61, 8, 37)),
+    (10, 3): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (10, 4): ((144, 61, 16, 37), (92, 61, 12, 37), (56, 61, 12, 37), (8, 61, 8, 37)),
+    (10, 5): ((140, 61, 20, 37), (120, 61, 12, 37), (28, 61, 12, 37), (8, 61, 12, 37)),
+    (10, 6): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (10, 7): ((88, 61, 72, 37), (8, 61, 64, 37)),
+    (10, 8): ((104, 61, 56, 37), (72, 61, 16, 37), (8, 61, 48, 37)),
+    (10, 9): ((88, 61, 72, 37), (8, 61, 64, 37)),
+    (10, 12): ((72, 61, 16, 37),),
+    (11, 0): ((132, 61, 28, 37), (8, 61, 20, 37)),
+    (11, 1): ((136, 61, 24, 37), (8, 61, 16, 37)),
+    (11, 2): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (11, 3): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (11, 4): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (11, 5): ((120, 61, 40, 37), (8, 61, 32, 37)),
+    (11, 6): ((128, 61, 32, 37), (40, 61, 80, 37), (8, 61, 24, 37)),
+    (11, 7): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (11, 8): ((144, 61, 16, 37), (60, 61, 40, 37), (8, 61, 8, 37)),
+    (11, 9): ((144, 61, 16, 37), (56, 61, 48, 37), (8, 61, 8, 37)),
+    (11, 10): ((72, 61, 16, 37),),
+    (11, 14): ((72, 61, 16, 37),),
+    (12, 0): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (12, 1): ((144, 61, 16, 37), (92, 61, 12, 37), (56, 61, 12, 37), (8, 61, 8, 37)),
+    (12, 2): ((140, 61, 20, 37), (120, 61, 12, 37), (28, 61, 12, 37), (8, 61, 12, 37)),
+    (12, 3): ((140, 61, 20, 37), (8, 61, 12, 37)),
+    (12, 4): ((128, 61, 32, 37), (8, 61, 24, 37)),
+    (12, 5): ((136, 61, 24, 37), (40, 61, 80, 37), (8, 61, 16, 37)),
+    (12, 6): ((144, 61, 16, 37), (40, 61, 80, 37), (8, 61, 8, 37)),
+    (12, 7): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (12, 9): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (12, 12): ((68, 61, 24, 37),),
+    (13, 0): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (13, 1): ((80, 61, 16, 37), (8, 61, 8, 37)),
+    (13, 2): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (13, 3): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (13, 4): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (13, 5): ((84, 61, 76, 37), (8, 61, 68, 37)),
+    (13, 6): ((128, 61, 32, 37), (48, 61, 48, 37), (8, 61, 8, 37)),
+    (13, 7): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (13, 8): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (13, 9): ((120, 61, 40, 37), (8, 61, 32, 37)),
+    (13, 12): ((68, 61, 24, 37),),
+    (14, 0): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (14, 1): ((124, 61, 36, 37), (8, 61, 28, 37)),
+    (14, 2): ((144, 61, 16, 37), (64, 61, 56, 37), (8, 61, 32, 37)),
+    (14, 3): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (14, 4): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (14, 5): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (14, 6): ((144, 61, 16, 37), (64, 61, 32, 37), (8, 61, 8, 37)),
+    (14, 7): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (14, 8): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (14, 9): ((84, 61, 76, 37), (8, 61, 68, 37)),
+    (14, 13): ((48, 61, 64, 37),),
+    (15, 0): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (15, 1): ((144, 61, 16, 37), (64, 61, 32, 37), (8, 61, 8, 37)),
+    (15, 2): ((144, 61, 16, 37), (68, 61, 24, 37), (8, 61, 8, 37)),
+    (15, 3): ((104, 61, 56, 37), (8, 61, 48, 37)),
+    (15, 4): ((144, 61, 16, 37), (72, 61, 16, 37), (8, 61, 8, 37)),
+    (15, 5): ((144, 61, 16, 37), (68, 61, 24, 37), (8, 61, 8, 37)),
+    (15, 6): ((104, 61, 56, 37), (64, 61, 32, 37), (8, 61, 48, 37)),
+    (15, 7): ((84, 61, 76, 37), (8, 61, 68, 37)),
+    (15, 8): ((112, 61, 48, 37), (84, 61, 20, 37), (56, 61, 20, 37), (8, 61, 40, 37)),
+    (15, 9): ((92, 61, 68, 37), (8, 61, 60, 37)),
+    (15, 10): ((72, 61, 16, 37),),
+    (15, 11): ((48, 61, 64, 37),),
+    (15, 13): ((40, 61, 80, 37),),
+    (15, 15): ((72, 61, 16, 37),),
+    (16, 0): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (16, 1): ((128, 61, 32, 37), (8, 61, 24, 37)),
+    (16, 2): ((136, 61, 24, 37), (40, 61, 80, 37), (8, 61, 16, 37)),
+    (16, 4): ((104, 61, 56, 37), (8, 61, 48, 37)),
+    (16, 5): ((104, 61, 56, 37), (8, 61, 48, 37)),
+    (16, 6): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (16, 7): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (16, 8): ((80, 61, 32, 37), (8, 61, 24, 37)),
+    (16, 9): ((84, 61, 76, 37), (8, 61, 68, 37)),
+    (16, 14): ((48, 61, 64, 37),),
+    (17, 0): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (17, 1): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (17, 2): ((144, 61, 16, 37), (36, 61, 88, 37), (8, 61, 8, 37)),
+    (17, 3): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (17, 4): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (17, 5): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (17, 6): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (17, 7): ((112, 61, 48, 37), (8, 61, 40, 37)),
+    (17, 8): ((84, 61, 76, 37), (8, 61, 68, 37)),
+    (17, 9): ((144, 61, 16, 37), (92, 61, 12, 37), (56, 61, 12, 37), (8, 61, 8, 37)),
+    (17, 10): ((116, 61, 12, 37), (32, 61, 12, 37)),
+    (17, 12): ((48, 61, 64, 37),),
+    (17, 15): ((72, 61, 16, 37),),
+    (18, 0): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (18, 1): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (18, 2): ((148, 61, 12, 37), (68, 61, 40, 37), (8, 61, 20, 37)),
+    (18, 3): ((128, 61, 32, 37), (8, 61, 24, 37)),
+    (18, 4): ((136, 61, 24, 37), (56, 61, 64, 37), (8, 61, 32, 37)),
+    (18, 5): ((136, 61, 24, 37), (8, 61, 16, 37)),
+    (18, 6): ((92, 61, 68, 37), (8, 61, 60, 37)),
+    (18, 8): ((88, 61, 72, 37), (8, 61, 64, 37)),
+    (18, 9): ((96, 61, 64, 37), (72, 61, 16, 37), (8, 61, 56, 37)),
+    (18, 12): ((48, 61, 64, 37),),
+    (18, 14): ((72, 61, 16, 37),),
+    (18, 15): ((72, 61, 16, 37),),
+    (19, 0): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (19, 1): ((144, 61, 16, 37), (8, 61, 8, 37)),
+    (19, 3): ((128, 61, 32, 37), (40, 61, 80, 37), (8, 61, 24, 37)),
+    (19, 4): ((104, 61, 56, 37), (8, 61, 48, 37)),
+    (19, 5): ((92, 61, 68, 37), (8, 61, 60, 37)),
+    (19, 6): ((144, 61, 16, 37), (48, 61, 64, 37), (8, 61, 8, 37)),
+    (19, 7): ((112, 61, 48, 37), (56, 61, 48, 37), (8, 61, 40, 37)),
+    (19, 8): ((144, 61, 16, 37), (56, 61, 48, 37), (8, 61, 8, 37)),
+    (19, 9): ((112, 61, 48, 37), (56, 61, 48, 37), (8, 61, 40, 37)),
+    (19, 11): ((40, 61, 80, 37),),
+    (19, 12): ((72, 61, 16, 37),),
+    (19, 13): ((64, 61, 32, 37),),
+    (19, 14): ((72, 61, 16, 37),),
+    (19, 15): ((72, 61, 16, 37),),
+}
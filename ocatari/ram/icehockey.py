@@ -15,6 +15,8 @@ class Player(GameObject):
     The player figure i.e., the current hockey player (goalie or forward).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -28,6 +30,8 @@ class Enemy(GameObject):
     The enemy player(s).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 82, 126, 45
@@ -41,6 +45,8 @@ class Ball(GameObject):
     The puck.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 0, 0, 0
@@ -54,6 +60,8 @@ class PlayerScore(GameObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 84, 92, 214
@@ -67,6 +75,8 @@ class EnemyScore(GameObject):
     The enemy's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 236, 200, 96
@@ -80,6 +90,8 @@ class Timer(GameObject):
     The game-clock (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 84, 92, 214
@@ -7,6 +7,8 @@ MAX_NB_OBJECTS_HUD = {}  # 'Score': 1}
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Player, self).__init__()
         self._xy = 0, 160
@@ -16,6 +18,8 @@ class Player(GameObject):
 
 
 class Player_Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Player_Shot, self).__init__()
         self._xy = 0, 160
@@ -25,6 +29,8 @@ class Player_Shot(GameObject):
 
 
 class Helicopter(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Helicopter, self).__init__()
         self._xy = 0, 160
@@ -34,6 +40,8 @@ class Helicopter(GameObject):
 
 
 class Hornet(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Hornet, self).__init__()
         self._xy = 0, 160
@@ -43,6 +51,8 @@ class Hornet(GameObject):
 
 
 class Enemy_Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Shot, self).__init__()
         self._xy = 0, 160
@@ -52,6 +62,8 @@ class Enemy_Shot(GameObject):
 
 
 class Ice(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Ice, self).__init__()
         self._xy = 0, 160
@@ -61,6 +73,8 @@ class Ice(GameObject):
 
 
 class Fire_Hole(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Fire_Hole, self).__init__()
         self._xy = 0, 160
@@ -70,6 +84,8 @@ class Fire_Hole(GameObject):
 
 
 class Eruption(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Eruption, self).__init__()
         self._xy = 0, 125
@@ -79,6 +95,8 @@ class Eruption(GameObject):
 
 
 class Diver(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Diver, self).__init__()
         self._xy = 0, 125
@@ -88,6 +106,8 @@ class Diver(GameObject):
 
 
 class Score(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 0, 0
@@ -97,6 +117,8 @@ class Score(ValueObject):
 
 
 class Life(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 0, 0
@@ -16,6 +16,8 @@ class Kop(GameObject):
     The player figure i.e., the Kop.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 220, 175, 111
@@ -27,6 +29,8 @@ class Krook(GameObject):
     A thief.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 220, 175, 11
@@ -34,6 +38,8 @@ class Krook(GameObject):
 
 
 class Ball(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -42,12 +48,16 @@ class Ball(GameObject):
 
 
 class Moneybag(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 128, 88, 0
 
 
 class Suitcase(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 128, 88, 0
@@ -55,6 +65,8 @@ class Suitcase(GameObject):
 
 
 class Elevator(GameObject):
+    __slots__ = ("is_open",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 72, 164, 164
@@ -62,30 +74,40 @@ class Elevator(GameObject):
 
 
 class Escalator(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 52, 0, 128
 
 
 class SecuritySystem(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
 
 
 class Radio(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 236, 236
 
 
 class Cart(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 210, 210, 210
 
 
 class Biplane(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 238, 209, 128
@@ -94,6 +116,8 @@ class Biplane(GameObject):
 
 
 class BonusKops(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -101,6 +125,8 @@ class BonusKops(GameObject):
 
 
 class Score(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 236, 236
@@ -108,6 +134,8 @@ class Score(GameObject):
 
 
 class Timer(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -10,6 +10,8 @@ MAX_NB_OBJECTS_HUD = {"Player": 1, "Enemy": 1, "Girlfriend": 1, "Bomb": 8, "Ladd
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Player, self).__init__()
         self._xy = 38, 94
@@ -19,6 +21,8 @@ class Player(GameObject):
 
 
 class Girlfriend(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Girlfriend, self).__init__()
         self._xy = 95, 28
@@ -28,6 +32,8 @@ class Girlfriend(GameObject):
 
 
 class Enemy(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy, self).__init__()
         self._xy = 51, 94
@@ -37,11 +43,15 @@ class Enemy(GameObject):
 
 
 class Bomb(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
 
 class Ladder(GameObject):
+    __slots__ = ()
+
     def __init__(self, x=140, y=207):
         super(Ladder, self).__init__()
         self._xy = x, y
@@ -51,11 +61,15 @@ class Ladder(GameObject):
 
 
 class Score(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
 
 class BonusPoints(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -1,4 +1,4 @@
-from .game_objects import GameObject, ValueObject
+from .game_objects import GameObject, ValueObject, spawn_object
 from ._helper_methods import number_to_bitfield
 import sys
 
@@ -9,6 +9,8 @@ MAX_NB_OBJECTS_HUD = {"Player": 1, 'Lyssa': 1, 'Slayers': 20, 'Slayer_Shot': 1,
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Player, self).__init__()
         self._xy = 0, 160
@@ -18,6 +20,8 @@ class Player(GameObject):
 
 
 class Lyssa(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Lyssa, self).__init__()
         self._xy = 0, 160
@@ -27,6 +31,8 @@ class Lyssa(GameObject):
 
 
 class Slayers(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Slayers, self).__init__()
         self._xy = 0, 160
@@ -36,6 +42,8 @@ class Slayers(GameObject):
 
 
 class Slayer_Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Slayer_Shot, self).__init__()
         self._xy = 0, 160
@@ -45,6 +53,8 @@ class Slayer_Shot(GameObject):
 
 
 class Fire_Mare(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Fire_Mare, self).__init__()
         self._xy = 0, 160
@@ -54,6 +64,8 @@ class Fire_Mare(GameObject):
 
 
 class Spider(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Spider, self).__init__()
         self._xy = 0, 160
@@ -63,6 +75,8 @@ class Spider(GameObject):
 
 
 class Weapon(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Weapon, self).__init__()
         self._xy = 0, 0
@@ -72,6 +86,8 @@ class Weapon(GameObject):
 
 
 class Enemy_Weapon(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Weapon, self).__init__()
         self._xy = 0, 0
@@ -81,6 +97,8 @@ class Enemy_Weapon(GameObject):
 
 
 class Beast(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Beast, self).__init__()
         self._xy = 0, 0
@@ -90,6 +108,8 @@ class Beast(GameObject):
 
 
 class Wall(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Wall, self).__init__()
         self._xy = 0, 0
@@ -99,6 +119,8 @@ class Wall(GameObject):
 
 
 class Window(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Window, self).__init__()
         self._xy = 76, 23
@@ -108,6 +130,8 @@ class Window(GameObject):
 
 
 class Line(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Line, self).__init__()
         self._xy = 0, 0
@@ -117,6 +141,8 @@ class Line(GameObject):
 
 
 class Star(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Star, self).__init__()
         self._xy = 0, 0
@@ -126,6 +152,8 @@ class Star(GameObject):
 
 
 class Castle(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Castle, self).__init__()
         self._xy = 0, 0
@@ -135,6 +163,8 @@ class Castle(GameObject):
 
 
 class Life(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 0, 0
@@ -144,6 +174,8 @@ class Life(GameObject):
 
 
 class Sun(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Sun, self).__init__()
         self._xy = 0, 0
@@ -153,6 +185,8 @@ class Sun(ValueObject):
 
 
 class Hour_Glass(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Hour_Glass, self).__init__()
         self._xy = 0, 0
@@ -162,6 +196,8 @@ class Hour_Glass(ValueObject):
 
 
 class Score(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 0, 0
@@ -171,6 +207,8 @@ class Score(ValueObject):
 
 
 class Life_HUD(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Life_HUD, self).__init__()
         self._xy = 0, 0
@@ -180,6 +218,8 @@ class Life_HUD(GameObject):
 
 
 class Weapon_HUD(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Weapon_HUD, self).__init__()
         self._xy = 0, 0
@@ -233,8 +273,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         if ram_state[114]:
             player.xy = ram_state[90] + 9, (ram_state[98]*2) + 16
             if ram_state[73] != 80:
-                lyssa = Lyssa()
-                objects[1] = lyssa
+                lyssa = spawn_object(objects, 1, Lyssa)
                 lyssa.xy = ram_state[89] + 9, (ram_state[97]*2) + 15
             else:
                 objects[1] = None
@@ -243,37 +282,31 @@ def _detect_objects_ram(objects, ram_state, hud=False):
                 objects[2+i] = None
                 if ram_state[99+i] and enemies < ram_state[82] and not (ram_state[73] == 80 and ram_state[91+i] >= 69):
                     enemies += 1
-                    slayer = Slayers()
-                    objects[2+i] = slayer
+                    slayer = spawn_object(objects, 2+i, Slayers)
                     slayer.xy = ram_state[83+i] + 9, (ram_state[91+i]*2) + 15
                 for j in range(3):
                     objects[7+i+j*5] = None
                     if ram_state[99+i] & 2**j and objects[2+i] is not None:
-                        slayer2 = Slayers()
-                        objects[7+i+j*5] = slayer2
+                        slayer2 = spawn_object(objects, 7+i+j*5, Slayers)
                         slayer2.xy = ram_state[83+i] + 9 + (
                             16 * (ram_state[99+i] & 2**j)), (ram_state[91+i]*2) + 15
         else:
             player.xy = ram_state[89] + 9, (ram_state[97]*2) + 16
-            lyssa = Lyssa()
-            objects[1] = lyssa
+            lyssa = spawn_object(objects, 1, Lyssa)
             lyssa.xy = ram_state[83] + 9, (ram_state[91]*2) + 15
             for i in range(5):
                 objects[2+i] = None
                 if ram_state[100+i] and ram_state[82] > i:
-                    slayer = Slayers()
-                    objects[2+i] = slayer
+                    slayer = spawn_object(objects, 2+i, Slayers)
                     slayer.xy = ram_state[84+i] + 9, (ram_state[92+i]*2) + 15
                     for j in range(3):
                         objects[7+i+j*5] = None
                         if ram_state[100+i] & 2**j:
-                            slayer2 = Slayers()
-                            objects[7+i+j*5] = slayer2
+                            slayer2 = spawn_object(objects, 7+i+j*5, Slayers)
                             slayer2.xy = ram_state[84+i] + 9 + (
                                 16 * (ram_state[100+i] & 2**j)), (ram_state[92+i]*2) + 15
         if ram_state[77]:
-            shot = Slayer_Shot()
-            objects[22] = shot
+            shot = spawn_object(objects, 22, Slayer_Shot)
             if ram_state[79] & 16:
                 shot.wh = 7, 7
                 if ram_state[79] & 128:
@@ -294,8 +327,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         player.wh = 7, 16
 
         if ram_state[97] < 80:
-            weapon = Weapon()
-            objects[1] = weapon
+            weapon = spawn_object(objects, 1, Weapon)
             weapon.rgb = 224, 236, 124
             if ram_state[47] == 24:
                 weapon.xy = ram_state[89] + 11, (ram_state[97]*2) + 16
@@ -309,23 +341,20 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         else:
             objects[1] = None
 
-        lyssa = Lyssa()
-        objects[2] = lyssa
+        lyssa = spawn_object(objects, 2, Lyssa)
         if ram_state[109] == 42:
             lyssa.xy = ram_state[85] + 9, (ram_state[93]*2) + 15
         else:
             lyssa.xy = ram_state[85] + 8, (ram_state[93]*2) + 15
 
-        boss = Beast()
-        objects[3] = boss
+        boss = spawn_object(objects, 3, Beast)
         if ram_state[100] == 157:
             boss.xy = ram_state[84] + 13, (ram_state[92]*2) + 15
         else:
             boss.xy = ram_state[84] + 9, (ram_state[92]*2) + 15
 
         if ram_state[77] < 83:
-            bossw = Enemy_Weapon()
-            objects[4] = bossw
+            bossw = spawn_object(objects, 4, Enemy_Weapon)
             bossw.xy = ram_state[79] + 7, (ram_state[77]*2) + 7
         else:
             objects[4] = None
@@ -333,14 +362,12 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         for j in range(4):
             for i in range(8):
                 if ram_state[115+j*2] & 2**i:
-                    wall = Wall()
-                    objects[5+16*j+i] = wall
+                    wall = spawn_object(objects, 5+16*j+i, Wall)
                     wall.xy = 48 + 4*i, 39 + 4*j
                 else:
                     objects[5+16*j+i] = None
                 if ram_state[116+j*2] & 2**i:
-                    wall = Wall()
-                    objects[13+16*j+i] = wall
+                    wall = spawn_object(objects, 13+16*j+i, Wall)
                     wall.xy = 108 - 4*i, 39 + 4*j
                 else:
                     objects[13+16*j+i] = None
@@ -352,26 +379,19 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         player.xy = ram_state[83] + 8, (ram_state[91]*2) + 20
         player.wh = 6, 16
         if ram_state[68] == 41:
-            star = Star()
-            objects[1] = star
+            star = spawn_object(objects, 1, Star)
             star.xy = ram_state[89] + 10, (ram_state[97]*2) + 21
         else:
-            spider = Spider()
-            objects[1] = spider
+            spider = spawn_object(objects, 1, Spider)
             spider.xy = ram_state[89] + 8, (ram_state[97]*2) + 21
 
-        window = Window()
-        objects[2] = window
+        window = spawn_object(objects, 2, Window)
 
         # r115 == lines right; 44 == 75-115, 63 == 118-158
         # 24 pixels between lines
         for i in range(40):
-            line1, line2, line3, line4, line5, line6 = Line(
-            ), Line(), Line(), Line(), Line(), Line()
-            objects[3+(i*3)], objects[4+(i*3)], objects[5 +
-                                                        (i*3)] = line1, line2, line3
-            objects[234+(i*3)], objects[235+(i*3)], objects[236 +
-                                                            (i*3)] = line4, line5, line6
+            line1, line2, line3 = [spawn_object(objects, k+(i*3), Line) for k in (3, 4, 5)]
+            line4, line5, line6 = [spawn_object(objects, k+(i*3), Line) for k in (234, 235, 236)]
             line1.xy = 7 + i + ram_state[115], 17 + i*2
             line2.xy = 31 + i + ram_state[115], 17 + i*2
             line3.xy = 55 + i + ram_state[115], 17 + i*2
@@ -379,12 +399,8 @@ def _detect_objects_ram(objects, ram_state, hud=False):
             line5.xy = 30 - i + ram_state[116], 19 + i*2
             line6.xy = 54 - i + ram_state[116], 19 + i*2
         for i in range(37):
-            line1, line2, line3, line4, line5, line6 = Line(
-            ), Line(), Line(), Line(), Line(), Line()
-            objects[123+(i*3)], objects[124+(i*3)], objects[125 +
-                                                            (i*3)] = line1, line2, line3
-            objects[354+(i*3)], objects[355+(i*3)], objects[356 +
-                                                            (i*3)] = line4, line5, line6
+            line1, line2, line3 = [spawn_object(objects, k+(i*3), Line) for k in (123, 124, 125)]
+            line4, line5, line6 = [spawn_object(objects, k+(i*3), Line) for k in (354, 355, 356)]
             line1.xy = 47 - i + ram_state[115], 97 + i*2
             line2.xy = 71 - i + ram_state[115], 97 + i*2
             line3.xy = 95 - i + ram_state[115], 97 + i*2
@@ -398,8 +414,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
 
         player.xy = ram_state[90] + 8, 145
         player.wh = 8, 9
-        mare = Fire_Mare()
-        objects[1] = mare
+        mare = spawn_object(objects, 1, Fire_Mare)
         mare.xy = ram_state[89] + 8, 145
         offset = 8
         if ram_state[76] & 128:
@@ -411,18 +426,15 @@ def _detect_objects_ram(objects, ram_state, hud=False):
                 if ram_state[76] & 2**(i+3):
                     offset -= 1
         if ram_state[70] == 226:
-            weapon = Weapon()
-            objects[2] = weapon
+            weapon = spawn_object(objects, 2, Weapon)
             weapon.xy = ram_state[78] + offset, 157
         elif ram_state[70] == 233:
-            life = Life()
-            objects[2] = life
+            life = spawn_object(objects, 2, Life)
             life.xy = ram_state[78] + offset, 157
         else:
             objects[2] = None
         if ram_state[80]:
-            castle = Castle()
-            objects[3] = castle
+            castle = spawn_object(objects, 3, Castle)
             castle.xy = 48, 145 - ram_state[80]
             castle.wh = 64, ram_state[80] + 3
     # r33 type?
@@ -439,8 +451,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
 
         # Sun
         if 25 < ram_state[23] < 42:
-            sun = Sun()
-            objects[-9] = sun
+            sun = spawn_object(objects, -9, Sun)
             top = 0
             bottom = 0
             xoff = 0
@@ -463,8 +474,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
 
         # Hour Glass
         if ram_state[26]:
-            time = Hour_Glass()
-            objects[-8] = time
+            time = spawn_object(objects, -8, Hour_Glass)
             yoff = 0
             h = 0
             for i in range(8):
@@ -481,8 +491,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
             objects[-8] = None
 
         # Score
-        score = Score()
-        objects[-7] = score
+        score = spawn_object(objects, -7, Score)
         if ram_state[28] > 15:
             score.xy = 57, 176
             score.wh = 45, 7
@@ -505,8 +514,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         # Lives
         for i in range(3):
             if i < ram_state[31]:
-                life = Life_HUD()
-                objects[-6+i] = life
+                life = spawn_object(objects, -6+i, Life_HUD)
                 life.xy = 56+(i*8), 188
             else:
                 objects[-6+i] = None
@@ -514,8 +522,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         # Weapons
         for i in range(3):
             if i < ram_state[32]:
-                life = Weapon_HUD()
-                objects[-3+i] = life
+                life = spawn_object(objects, -3+i, Weapon_HUD)
                 life.xy = 79+(i*8), 188
             else:
                 objects[-3+i] = None
@@ -195,6 +195,8 @@ class Score(ValueObject):
     Score of the game
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 63, 20
@@ -209,6 +211,8 @@ class Time(ValueObject):
     Time left to beat the level
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Time, self).__init__()
         self._xy = 63, 20
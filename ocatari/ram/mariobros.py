@@ -54,6 +54,8 @@ class PowBlock(GameObject):
 
 
 class Life(GameObject):
+    __slots__ = ("value",)
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 71, 12
@@ -65,6 +67,8 @@ class Life(GameObject):
 
 
 class Score(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self.xy = 55, 12
@@ -104,6 +108,8 @@ class BonusCoin(GameObject):
 
 
 class Time(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Time, self).__init__()
         self._xy = 72, 180
@@ -114,6 +120,8 @@ class Time(ValueObject):
 
 
 class Level(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Level, self).__init__()
         self._xy = 72, 180
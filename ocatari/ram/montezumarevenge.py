@@ -186,6 +186,8 @@ class Score(ValueObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Score, self).__init__()
         self._xy = 97, 6
@@ -200,6 +202,8 @@ class Life(ValueObject):
     The player's remaining additional lives (displayed as hats) (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Life, self).__init__()
         self._xy = 56, 15
@@ -335,6 +339,58 @@ class Disappearing_Platform(GameObject):
         self.hud = False
 
 
+# The static objects of the lit rooms (ram_state[3]): their slots, classes, (x, y, w, h) boxes and colors if not
+# the default ones. Entering a room clears the slots 1 to 52 and places them (the dark rooms have none).
+_BEAM_BLUE = 101, 111, 228
+ROOM_LAYOUTS = {
+    0: ((25, Wall, (0, 53, 4, 42), _BEAM_BLUE), (29, Ladder, (72, 94, 16, 102)), (32, Platform, (4, 94, 154, 1))),
+    1: ((23, Rope, (112, 96, 1, 39)),
+        (25, Wall, (0, 96, 8, 40)), (26, Wall, (0, 136, 16, 45)), (27, Wall, (152, 96, 8, 40)),
+        (28, Wall, (144, 136, 16, 45)),
+        (29, Ladder, (72, 93, 16, 42)), (30, Ladder, (16, 136, 16, 45)), (31, Ladder, (128, 136, 16, 45)),
+        (32, Platform, (0, 93, 56, 2)), (33, Platform, (104, 93, 56, 2)), (34, Platform, (68, 93, 23, 2)),
+        (35, Platform, (76, 136, 8, 5)), (36, Platform, (8, 136, 28, 2)), (37, Platform, (124, 136, 28, 2)),
+        (38, Platform, (16, 180, 128, 1)),
+        (51, Conveyer_Belt, (60, 136, 15, 5)), (52, Conveyer_Belt, (85, 136, 15, 5))),
+    2: ((25, Wall, (156, 52, 4, 42)), (29, Ladder, (72, 93, 16, 102)), (32, Platform, (4, 93, 154, 1))),
+    3: ((25, Wall, (0, 53, 4, 41)), (29, Ladder, (72, 93, 16, 102)), (32, Platform, (4, 93, 154, 1))),
+    4: ((29, Ladder, (72, 52, 16, 39)), (30, Ladder, (72, 93, 16, 102)), (32, Platform, (4, 93, 154, 1))),
+    5: ((23, Rope, (41, 97, 1, 24), (236, 236, 236)), (24, Rope, (125, 95, 2, 52)),
+        (25, Wall, (32, 53, 4, 40)), (26, Wall, (124, 53, 4, 40)), (27, Wall, (0, 96, 4, 77)),
+        (28, Wall, (156, 96, 4, 77)),
+        (29, Ladder, (72, 171, 16, 26)),
+        (32, Platform, (0, 93, 48, 2)), (33, Platform, (112, 93, 48, 2)), (34, Platform, (48, 130, 64, 3)),
+        (35, Platform, (4, 171, 154, 1)), (36, Platform, (76, 93, 8, 5)),
+        (51, Conveyer_Belt, (60, 93, 15, 5)), (52, Conveyer_Belt, (85, 93, 15, 5))),
+    6: ((29, Ladder, (72, 53, 16, 38)), (32, Platform, (0, 93, 160, 1))),
+    7: ((25, Wall, (156, 53, 4, 42), _BEAM_BLUE), (29, Ladder, (72, 94, 16, 102)), (32, Platform, (4, 94, 154, 1))),
+    8: ((23, Rope, (80, 96, 1, 51)),
+        (25, Wall, (0, 53, 4, 121)), (26, Wall, (156, 97, 4, 77)),
+        (32, Platform, (4, 143, 12, 4)), (33, Platform, (144, 143, 12, 4)), (34, Platform, (4, 93, 43, 3)),
+        (35, Platform, (76, 93, 8, 3)), (36, Platform, (112, 93, 48, 3)), (37, Platform, (4, 173, 152, 1))),
+    9: ((25, Wall, (156, 52, 3, 41)), (29, Ladder, (72, 53, 16, 38)), (32, Platform, (0, 93, 158, 1))),
+    10: ((25, Wall, (0, 53, 3, 40)), (29, Ladder, (72, 53, 16, 38)),
+         (32, Platform, (0, 93, 36, 1)), (33, Platform, (124, 93, 36, 1))),
+    11: ((29, Ladder, (72, 52, 16, 39)), (30, Ladder, (72, 93, 16, 102)), (32, Platform, (0, 93, 160, 1))),
+    12: ((38, Platform, (0, 94, 160, 1)),),
+    13: ((29, Ladder, (72, 52, 16, 39)), (30, Ladder, (72, 93, 16, 102)), (32, Platform, (0, 93, 160, 1))),
+    14: ((23, Rope, (71, 96, 1, 48)), (24, Rope, (87, 97, 2, 33)),
+         (29, Ladder, (72, 169, 16, 25)),
+         (32, Platform, (0, 93, 40, 3)), (33, Platform, (68, 93, 24, 3)), (34, Platform, (120, 93, 40, 3)),
+         (35, Platform, (16, 168, 128, 1)), (36, Platform, (0, 97, 16, 73)), (37, Platform, (144, 97, 16, 73))),
+    15: ((38, Platform, (0, 94, 160, 1)),),
+    16: ((38, Platform, (0, 93, 160, 1)),),
+    17: ((38, Platform, (0, 94, 160, 1)),),
+    18: ((32, Platform, (0, 94, 36, 1)), (33, Platform, (124, 94, 36, 1))),
+    19: ((29, Ladder, (72, 53, 16, 38)), (32, Platform, (0, 93, 160, 1))),
+    20: ((25, Wall, (156, 52, 3, 42)), (32, Platform, (0, 94, 36, 1)), (33, Platform, (124, 94, 32, 1))),
+    21: ((25, Wall, (0, 53, 3, 40)), (29, Ladder, (72, 53, 16, 38)), (32, Platform, (0, 93, 158, 1))),
+    22: ((29, Ladder, (72, 53, 16, 38)), (32, Platform, (0, 93, 36, 1)), (33, Platform, (124, 93, 36, 1))),
+    23: ((25, Wall, (156, 53, 3, 40)), (37, Platform, (0, 93, 158, 1))),
+}
+room_layout = None  # the room (and whether it is lit) whose static objects are placed
+
+
 # parses MAX_NB* dicts, returns default init list of objects
 def _get_max_objects(hud=False):
 
@@ -366,6 +422,7 @@ def _init_objects_ram(hud=True):
 
 # levels: ram_state[36], total of 3 levels: 0,1 and 2
 def _detect_objects_ram(objects, ram_state, hud=True):
+    global room_layout
     player = objects[0]
     key = objects[1]
     amulet = objects[2]
@@ -382,6 +439,7 @@ def _detect_objects_ram(objects, ram_state, hud=True):
 
     enviroment_objects = objects[18:36]
 
+    ram_state = ram_state.tolist()
     room = ram_state[3]
     level = ram_state[57]
     # score = _convert_number(ram_state[19]) * 10000 + _convert_number(ram_state[20]) * 100 + _convert_number(ram_state[21])
@@ -519,10 +577,18 @@ def _detect_objects_ram(objects, ram_state, hud=True):
             for i in range(1, 13):
                 objects[i] = NoObject()
 
-    if room < 16 or ram_state[65] & 128:
+    # the static objects of a room (walls, ladders, ropes, platforms) are only placed when entering it
+    lit = bool(room < 16 or ram_state[65] & 128)
+    if room in ROOM_LAYOUTS:
+        layout = ROOM_LAYOUTS[room] if lit else ()
+        if (room, lit) != room_layout or layout and type(objects[layout[0][0]]) is NoObject:
+            room_layout = room, lit
+            _place_room(objects, layout)
+
+    if lit:
         if room == 0:
             if ram_state[26] != 117:
-                if type(beam0) is NoObject:
+                if type(objects[15]) is NoObject:
                     beam0 = Beam()
                     objects[15] = beam0
                     beam1 = Beam()
@@ -544,38 +610,7 @@ def _detect_objects_ram(objects, ram_state, hud=True):
                 for i in range(6):
                     objects[15+i] = NoObject()
 
-            if type(objects[25]) is NoObject or objects[25].xywh != (0, 53, 4, 42):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[25] = Wall(x=0, y=53, w=4, h=42, rgb=(101, 111, 228))
-                objects[29] = Ladder(x=72, y=94, w=16, h=102)
-                objects[32] = Platform(x=4, y=94, w=154, h=1)
-
         elif room == 1:
-            if type(objects[23]) is NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[23] = Rope()
-
-                objects[25] = Wall(x=0, y=96, w=8, h=40)
-                objects[26] = Wall(x=0, y=136, w=16, h=45)
-                objects[27] = Wall(x=152, y=96, w=8, h=40)
-                objects[28] = Wall(x=144, y=136, w=16, h=45)
-
-                objects[29] = Ladder(x=72, y=93, w=16, h=42)
-                objects[30] = Ladder(x=16, y=136, w=16, h=45)
-                objects[31] = Ladder(x=128, y=136, w=16, h=45)
-
-                objects[32] = Platform(x=0, y=93, w=56, h=2)
-                objects[33] = Platform(x=104, y=93, w=56, h=2)
-                objects[34] = Platform(x=68, y=93, w=23, h=2)
-                objects[35] = Platform(x=76, y=136, w=8, h=5)
-                objects[36] = Platform(x=8, y=136, w=28, h=2)
-                objects[37] = Platform(x=124, y=136, w=28, h=2)
-                objects[38] = Platform(x=16, y=180, w=128, h=1)
-
-                objects[51] = Conveyer_Belt(x=60, y=136, w=15, h=5)
-                objects[52] = Conveyer_Belt(x=85, y=136, w=15, h=5)
             # skull
             if ram_state[67] & 2:
                 if type(objects[8]) is NoObject:
@@ -601,57 +636,7 @@ def _detect_objects_ram(objects, ram_state, hud=True):
             else:
                 objects[14] = NoObject()
 
-        elif room == 2:
-            if type(objects[25]) is NoObject or objects[25].xy != (156, 52):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[25] = Wall(x=156, y=52, w=4, h=42)
-                objects[29] = Ladder(x=72, y=93, w=16, h=102)
-                objects[32] = Platform(x=4, y=93, w=154, h=1)
-
-        elif room == 3:
-            if type(objects[25]) is NoObject or objects[25].xywh != (0, 53, 4, 41):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[25] = Wall(x=0, y=53, w=4, h=41)
-                objects[29] = Ladder(x=72, y=93, w=16, h=102)
-                objects[32] = Platform(x=4, y=93, w=154, h=1)
-
-        elif room == 4:
-            if type(objects[29]) is NoObject or type(objects[30]) is NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[29] = Ladder(x=72, y=52, w=16, h=39)
-                objects[30] = Ladder(x=72, y=93, w=16, h=102)
-                objects[32] = Platform(x=4, y=93, w=154, h=1)
-
         elif room == 5:
-            if type(objects[23]) is NoObject or objects[23].xy != (41, 97):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                # rope
-                rope = Rope()
-                rope.rgb = 236, 236, 236
-                rope.xy = 41, 97
-                rope.wh = 1, 24
-                objects[23] = rope
-                objects[24] = Rope(x=125, y=95, w=2, h=52)
-
-                objects[25] = Wall(x=32, y=53, w=4, h=40)
-                objects[26] = Wall(x=124, y=53, w=4, h=40)
-                objects[27] = Wall(x=0, y=96, w=4, h=77)
-                objects[28] = Wall(x=156, y=96, w=4, h=77)
-
-                objects[29] = Ladder(x=72, y=171, w=16, h=26)
-
-                objects[32] = Platform(x=0, y=93, w=48, h=2)
-                objects[33] = Platform(x=112, y=93, w=48, h=2)
-                objects[34] = Platform(x=48, y=130, w=64, h=3)
-                objects[35] = Platform(x=4, y=171, w=154, h=1)
-                objects[36] = Platform(x=76, y=93, w=8, h=5)
-                objects[51] = Conveyer_Belt(x=60, y=93, w=15, h=5)
-                objects[52] = Conveyer_Belt(x=85, y=93, w=15, h=5)
-
             # skull
             if ram_state[69] & 2:
                 if type(objects[8]) is NoObject:
@@ -677,21 +662,7 @@ def _detect_objects_ram(objects, ram_state, hud=True):
             else:
                 objects[14] = NoObject()
 
-        elif room == 6:
-            if type(objects[29]) is NoObject or objects[29].xy != (72, 53):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[29] = Ladder(x=72, y=53, w=16, h=38)
-                objects[32] = Platform(x=0, y=93, w=160, h=1)
-
         elif room == 7:
-            if type(objects[25]) is NoObject or objects[25].xy != (156, 53):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[25] = Wall(x=156, y=53, w=4, h=42, rgb=(101, 111, 228))
-                objects[29] = Ladder(x=72, y=94, w=16, h=102)
-                objects[32] = Platform(x=4, y=94, w=154, h=1)
-
             # beam
             if ram_state[26] != 117:
                 if type(objects[15]) is NoObject:
@@ -717,29 +688,8 @@ def _detect_objects_ram(objects, ram_state, hud=True):
                     objects[15+i] = NoObject()
 
         elif room == 8:
-
-            if type(objects[23]) is NoObject or objects[23].wh != (1, 51):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-            # rope
-                rope = Rope()
-                rope.xy = 80, 96
-                rope.wh = 1, 51
-                objects[23] = Rope()
-
-                objects[25] = Wall(x=0, y=53, w=4, h=121)
-                objects[26] = Wall(x=156, y=97, w=4, h=77)
-
-                objects[32] = Platform(4, 143, 12, 4)
-                objects[33] = Platform(144, 143, 12, 4)
-
-                objects[34] = Platform(4, 93, 43, 3)
-                objects[35] = Platform(76, 93, 8, 3)
-                objects[36] = Platform(112, 93, 48, 3)
-                objects[37] = Platform(4, 173, 152, 1)
-
             if ram_state[34] != 144:
-                if type(ram_state[36]) is NoObject:
+                if type(objects[39]) is NoObject:
                     objects[39] = Disappearing_Platform(4, 103, 12, 4)
                     objects[40] = Disappearing_Platform(4, 113, 12, 4)
                     objects[41] = Disappearing_Platform(4, 123, 12, 4)
@@ -756,44 +706,16 @@ def _detect_objects_ram(objects, ram_state, hud=True):
                     objects[49] = Disappearing_Platform(144, 153, 12, 4)
                     objects[50] = Disappearing_Platform(144, 163, 12, 4)
             else:
-                for i in range(36, 48):
-                    objects[i] = NoObject()
-
-        elif room == 9:
-            if type(objects[25]) is NoObject or objects[25].xy != (156, 52):
-                for i in range(1, 53):
+                for i in range(39, 51):
                     objects[i] = NoObject()
-                objects[25] = Wall(x=156, y=52, w=3, h=41)
-                objects[29] = Ladder(x=72, y=53, w=16, h=38)
-                objects[32] = Platform(x=0, y=93, w=158, h=1)
 
         elif room == 10:
-            if type(objects[25]) is NoObject or objects[25].xy != (0, 53):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[25] = Wall(x=0, y=53, w=3, h=40)
-                objects[29] = Ladder(x=72, y=53, w=16, h=38)
-                objects[32] = Platform(x=0, y=93, w=36, h=1)
-                objects[33] = Platform(x=124, y=93, w=36, h=1)
             if ram_state[34] != 232:
                 objects[39] = Disappearing_Platform(x=36, y=93, w=88, h=7)
             else:
                 objects[39] = NoObject()
 
-        elif room == 11:
-            if type(objects[29]) is NoObject or type(objects[30]) is NoObject or objects[30].xy != (72, 93):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[29] = Ladder(x=72, y=52, w=16, h=39)
-                objects[30] = Ladder(x=72, y=93, w=16, h=102)
-                objects[32] = Platform(x=0, y=93, w=160, h=1)
-
         elif room == 12:
-            if type(objects[38]) is NoObject or objects[38].xy != (0, 94):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[38] = Platform(x=0, y=94, w=160, h=1)
-
             # beam
             if ram_state[26] != 117:
                 if type(objects[15]) is NoObject:
@@ -825,49 +747,7 @@ def _detect_objects_ram(objects, ram_state, hud=True):
                 for i in range(15, 23):
                     objects[i] = NoObject()
 
-        elif room == 13:
-            if type(objects[29]) is NoObject or type(objects[30]) is NoObject or objects[30].xy != (72, 93):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[29] = Ladder(x=72, y=52, w=16, h=39)
-                objects[30] = Ladder(x=72, y=93, w=16, h=102)
-                objects[32] = Platform(x=0, y=93, w=160, h=1)
-
-        elif room == 14:
-            if type(objects[23]) is NoObject or type(objects[24]) is NoObject or objects[23].xy != (71, 96):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                # rope
-                objects[23] = Rope(x=71, y=96, w=1, h=48)
-                objects[24] = Rope(x=87, y=97, w=2, h=33)
-
-                objects[29] = Ladder(72, 169, 16, 25)
-
-                objects[32] = Platform(0, 93, 40, 3)
-                objects[33] = Platform(68, 93, 24, 3)
-                objects[34] = Platform(120, 93, 40, 3)
-                objects[35] = Platform(16, 168, 128, 1)
-                objects[36] = Platform(x=0, y=97, w=16, h=73)
-                objects[37] = Platform(x=144, y=97, w=16, h=73)
-
-        elif room == 15:
-            if type(objects[38]) is NoObject or objects[38].xy != (0, 94):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[38] = Platform(x=0, y=94, w=160, h=1)
-
-        elif room == 16:
-            if type(objects[38]) is NoObject or objects[38].xy != (0, 93):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[38] = Platform(x=0, y=93, w=160, h=1)
-
         elif room == 17:
-            if type(objects[38]) is NoObject or objects[38].xy != (0, 94):
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[38] = Platform(x=0, y=94, w=160, h=1)
-
             # barrier
             if ram_state[26] != 117:
                 if type(objects[13]) is NoObject:
@@ -884,15 +764,9 @@ def _detect_objects_ram(objects, ram_state, hud=True):
                 objects[14] = NoObject()
 
         elif room == 18:
-            if type(objects[33]) is NoObject or objects[33].xy != (124, 94) or type(objects[25]) is not NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[32] = Platform(x=0, y=94, w=36, h=1)
-                objects[33] = Platform(x=124, y=94, w=36, h=1)
-
             # skull
             if ram_state[76] & 32:
-                if type(objects[8]) is NoObject():
+                if type(objects[8]) is NoObject:
                     objects[8] = Skull()
                 objects[8].xy = ram_state[47] - 1, ram_state[46] - 147
             else:
@@ -903,69 +777,20 @@ def _detect_objects_ram(objects, ram_state, hud=True):
             else:
                 objects[39] = NoObject()
 
-        elif room == 19:
-            if type(objects[29]) is NoObject or type(objects[30]) is not NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[29] = Ladder(x=72, y=53, w=16, h=38)
-                objects[32] = Platform(x=0, y=93, w=160, h=1)
-
         elif room == 20:
-            if type(objects[33]) is NoObject or objects[33].xy != (124, 94) or type(objects[25]) is NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[29] = Wall(x=156, y=52, w=3, h=42)
-                objects[32] = Platform(x=0, y=94, w=36, h=1)
-                objects[33] = Platform(x=124, y=94, w=32, h=1)
-
             if ram_state[34] != 232:
                 objects[39] = Disappearing_Platform(x=36, y=94, w=88, h=7)
             else:
                 objects[39] = NoObject()
 
-        elif room == 21:
-            if type(objects[29]) is NoObject or type(objects[30]) is not NoObject or type(objects[25]) is NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[25] = Wall(x=0, y=53, w=3, h=40)
-                objects[29] = Ladder(x=72, y=53, w=16, h=38)
-                objects[32] = Platform(x=0, y=93, w=158, h=1)
-
         elif room == 22:
-            if type(objects[33]) is NoObject or objects[33].xy != (124, 94) or type(objects[29]) is NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[29] = Ladder(x=72, y=53, w=16, h=38)
-                objects[32] = Platform(x=0, y=93, w=36, h=1)
-                objects[33] = Platform(x=124, y=93, w=36, h=1)
-
             if ram_state[34] != 232:
                 objects[39] = Disappearing_Platform(x=36, y=93, w=88, h=7)
             else:
                 objects[39] = NoObject()
 
-        elif room == 23:
-            if type(objects[37]) is NoObject or objects[37].xy != (0, 93) or type(objects[25]) is NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-                objects[25] = Wall(x=156, y=53, w=3, h=40)
-                objects[37] = Platform(x=0, y=93, w=158, h=1)
-
     else:
-        if room == 16:
-            if type(objects[32]) is not NoObject or type(objects[37]) is not NoObject or type(objects[38]) is not NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-
-        elif room == 17:
-            if type(objects[32]) is not NoObject or type(objects[37]) is not NoObject or type(objects[38]) is not NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-
-        elif room == 18:
-            if type(objects[32]) is not NoObject or type(objects[37]) is not NoObject or type(objects[38]) is not NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
+        if room == 18:
             # skull
             if ram_state[76] & 32:
                 if type(objects[8]) is NoObject:
@@ -979,39 +804,18 @@ def _detect_objects_ram(objects, ram_state, hud=True):
             else:
                 objects[39] = NoObject()
 
-        elif room == 19:
-            if type(objects[32]) is not NoObject or type(objects[37]) is not NoObject or type(objects[38]) is not NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-
         elif room == 20:
-            if type(objects[32]) is not NoObject or type(objects[37]) is not NoObject or type(objects[38]) is not NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
             if ram_state[34] != 214:
                 objects[39] = Disappearing_Platform(x=36, y=94, w=88, h=7)
             else:
                 objects[39] = NoObject()
 
-        elif room == 21:
-            if type(objects[32]) is not NoObject or type(objects[37]) is not NoObject or type(objects[38]) is not NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-
         elif room == 22:
-            if type(objects[32]) is not NoObject or type(objects[37]) is not NoObject or type(objects[38]) is not NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
             if ram_state[34] != 214:
                 objects[39] = Disappearing_Platform(x=36, y=93, w=88, h=7)
             else:
                 objects[39] = NoObject()
 
-        elif room == 23:
-            if type(objects[32]) is not NoObject or type(objects[37]) is not NoObject or type(objects[38]) is not NoObject:
-                for i in range(1, 53):
-                    objects[i] = NoObject()
-
     x = 56
     y = 28
 
@@ -1117,5 +921,18 @@ def _detect_objects_ram(objects, ram_state, hud=True):
     return objects
 
 
+def _place_room(objects, layout):
+    """
+    Clears the slots 1 to 52 and places the static objects of a room layout (see `ROOM_LAYOUTS`).
+    """
+    for i in range(1, 53):
+        objects[i] = NoObject()
+    for slot, cls, box, *rgb in layout:
+        obj = cls(*box)
+        if rgb:
+            obj.rgb = rgb[0]
+        objects[slot] = obj
+
+
 def _detect_objects_montezumarevenge_raw(info, ram_state):
     pass
@@ -85,6 +85,8 @@ class Score(ValueObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 95, 187
@@ -99,6 +101,8 @@ class Life(ValueObject):
     The indicator for remaining lives (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 12, 173
@@ -78,6 +78,8 @@ class Treasure(GameObject):
     Treasure to be protected. Represents the remaining lives
     """
 
+    __slots__ = ("value",)
+
     def __init__(self):
         super(Treasure, self).__init__()
         self._xy = 72, 163
@@ -1,5 +1,5 @@
 from .game_objects import GameObject
-from ._helper_methods import _convert_number
+from ._helper_methods import _convert_number, BITFIELDS
 import math
 import sys
 
@@ -77,12 +77,15 @@ class Score(GameObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ("value",)
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 96, 207
         self.wh = 6, 7
         self.rgb = 0, 0, 0
         self.hud = True
+        self.value = 0
 
 
 class Life(GameObject):
@@ -90,6 +93,8 @@ class Life(GameObject):
     The indicator for remaining lives (HUD).
     """
 
+    __slots__ = ("value",)
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 8, 217
@@ -130,9 +135,6 @@ def _init_objects_ram(hud=False):
     return objects
 
 
-def get_bin(x): return format(int(x), 'b').zfill(8)
-
-
 def _detect_objects_ram(objects, ram_state, hud=True):
     player = objects[0]
     ghosts = objects[1:5]
@@ -147,14 +149,14 @@ def _detect_objects_ram(objects, ram_state, hud=True):
             objects[0] = player
         player.xy = ram_state[49], 2*ram_state[89]+1
     # ghosts
-    ghst_bs = get_bin(ram_state[26])
+    ghst_bs = BITFIELDS[ram_state[26]]
     global ghost_vulnerable
     for i, gi in enumerate(ghosts):
         gi.xy = ram_state[50+i], 2*ram_state[55+i]+25
 
-    if ghst_bs[0] == "1":
+    if ghst_bs[0]:
         for gi in ghosts:
-            gi.rgb = gcolor[int(ghst_bs[1])]
+            gi.rgb = gcolor[ghst_bs[1]]
         ghost_vulnerable = True
     elif ghost_vulnerable:
         for gi in ghosts:
@@ -162,7 +164,7 @@ def _detect_objects_ram(objects, ram_state, hud=True):
         ghost_vulnerable = False
     # pps_o = objects[5:9]
     for i in range(4):
-        if ghst_bs[2+i] == "0":
+        if not ghst_bs[2+i]:
             objects[5+i] = None
         elif objects[5+i] == None:
             objects[5+i] = PowerPill(*pps[i])
@@ -256,6 +256,8 @@ class LifeCount(GameObject):
     The indicator for the remaining lives (HUD).
     """
 
+    __slots__ = ("value",)
+
     def __init__(self):
         super().__init__()
         self.xy = 0, 0
@@ -270,6 +272,8 @@ class PlayerScore(GameObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ("value",)
+
     def __init__(self):
         super().__init__()
         self.xy = 0, 0
@@ -284,6 +288,8 @@ class Timer(GameObject):
     The 20-minute countdown (HUD).
     """
 
+    __slots__ = ("value",)
+
     def __init__(self):
         super().__init__()
         self.xy = 31, 22
@@ -354,6 +360,8 @@ def _init_objects_ram(hud=False):
     ram_18 = 10
     global prev_x
     prev_x = 78
+    global scene
+    scene = None
     objects = [Player(), Wall(), Logs(), Logs(), Logs(), StairPit(),
                Stair(), Pit(), Pit(), Scorpion()]  # 10
     objects.extend([Rope(), Snake(), Tarpit(), Waterhole(),
@@ -369,6 +377,37 @@ def _init_objects_ram(hud=False):
     return objects
 
 
+# The static objects of the scenes (ram_state[20]) with fixed holes: their slots, classes and positions
+# (with the sizes of the platforms)
+SCENES = {
+    0: ((5, StairPit, (76, 122)), (6, Stair, (78, 136)),
+        (20, Platform, (8, 125, 68, 8)), (21, Platform, (84, 125, 77, 8))),
+    1: ((5, StairPit, (76, 122)), (6, Stair, (78, 136)), (7, Pit, (48, 122)), (8, Pit, (100, 122)),
+        (20, Platform, (8, 125, 40, 8)), (21, Platform, (60, 125, 16, 8)), (22, Platform, (84, 125, 16, 8)),
+        (23, Platform, (112, 125, 48, 8))),
+    2: ((12, Tarpit, (48, 120)), (20, Platform, (8, 125, 40, 8)), (21, Platform, (112, 125, 48, 8))),
+    3: ((13, Waterhole, (48, 120)), (20, Platform, (8, 125, 40, 8)), (21, Platform, (112, 125, 48, 8))),
+    4: ((13, Waterhole, (48, 120)), (20, Platform, (8, 125, 40, 8)), (21, Platform, (112, 125, 48, 8))),
+}
+scene = None  # the scene whose static objects are built
+scene_objects = ()
+
+
+def _build_scene(scene):
+    """
+    The slots and the objects of the static objects of a scene: the ground, and the objects in `SCENES`.
+    """
+    built = [(19, Platform(x=8, y=180, w=152, h=1))]
+    for slot, cls, box in SCENES.get(scene, ()):
+        if cls is Platform:
+            obj = Platform(*box)
+        else:
+            obj = cls()
+            obj.xy = box
+        built.append((slot, obj))
+    return built
+
+
 def _detect_objects_ram(objects, ram_state, hud=False):
     """
     For all 3 objects:
@@ -376,63 +415,23 @@ def _detect_objects_ram(objects, ram_state, hud=False):
     """
     # There are 8 treasures Define all the classes and at the time of detection replace with GoldenBar index
     player, = objects[:1]
+    ram_state = ram_state.tolist()
     # snapshot = pickle.load(open("/home/anurag/Desktop/HiWi_OC/OC_Atari/pit_4.pkl", "rb"))
     objects[:] = [None] * 26
     # env._env.env.env.ale.restoreState(snapshot)
     player.xy = ram_state[97], ram_state[105] + 72
     objects[0] = player
 
-    objects[19] = Platform(x=8, y=180, w=152, h=1)
-
-    # Implementing Pits,waterholes etc
+    # the static objects of a scene (ground, pits, tar pits, waterholes) are only built when entering it
+    global scene, scene_objects
     objects[5:17] = [None] * 12
-    if ram_state[20] == 0:
-        s = StairPit()
-        s.xy = 76, 122
-        st = Stair()
-        st.xy = 78, 136
-        objects[5] = s
-        objects[6] = st
-        objects[20] = Platform(x=8, y=125, w=68, h=8)
-        objects[21] = Platform(x=84, y=125, w=77, h=8)
-
-    elif ram_state[20] == 1:
-        s = StairPit()
-        s.xy = 76, 122
-        st = Stair()
-        st.xy = 78, 136
-        p1 = Pit()
-        p2 = Pit()
-        p1.xy = 48, 122
-        p2.xy = 100, 122
-        objects[5] = s
-        objects[6] = st
-        objects[7] = p1
-        objects[8] = p2
-        objects[20] = Platform(x=8, y=125, w=40, h=8)
-        objects[21] = Platform(x=60, y=125, w=16, h=8)
-        objects[22] = Platform(x=84, y=125, w=16, h=8)
-        objects[23] = Platform(x=112, y=125, w=48, h=8)
-
-    elif ram_state[20] == 2:
-        t = Tarpit()
-        t.xy = 48, 120
-        objects[12] = t
-        objects[20] = Platform(x=8, y=125, w=40, h=8)
-        objects[21] = Platform(x=112, y=125, w=48, h=8)
+    if ram_state[20] != scene:
+        scene = ram_state[20]
+        scene_objects = _build_scene(scene)
+    for i, obj in scene_objects:
+        objects[i] = obj
 
-    # Waterhole
-    elif ram_state[20] == 3:
-        w = Waterhole()
-        w.xy = 48, 120
-        objects[13] = w
-        objects[20] = Platform(x=8, y=125, w=40, h=8)
-        objects[21] = Platform(x=112, y=125, w=48, h=8)
-
-    elif ram_state[20] == 4:
-        w = Waterhole()
-        w.xy = 48, 120
-        objects[13] = w
+    if ram_state[20] == 4:
         y1 = 122 if ram_state[46] == 255 else 119
         wh1 = (8, 6) if ram_state[46] == 255 else (8, 9)
         c1 = Crocodile()
@@ -447,8 +446,6 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         c3.xy = 92, y1
         c3.wh = wh1
         objects[17] = c3
-        objects[20] = Platform(x=8, y=125, w=40, h=8)
-        objects[21] = Platform(x=112, y=125, w=48, h=8)
 
     # Disappearing Waterhole
     elif ram_state[20] == 7:
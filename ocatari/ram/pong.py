@@ -17,6 +17,8 @@ class Player(GameObject):
     The player figure i.e., the movable bar at the side.
     """
 
+    __slots__ = ("_above_10",)
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -31,6 +33,8 @@ class Enemy(GameObject):
     The enemy bar on the opposite side.
     """
 
+    __slots__ = ("_above_10",)
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
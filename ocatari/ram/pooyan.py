@@ -1,5 +1,6 @@
 import sys
 from .game_objects import GameObject, NoObject
+from ._helper_methods import _convert_number
 import numpy as np
 
 """
@@ -349,8 +350,8 @@ def _detect_objects_ram(objects, ram_state, hud=False):
     player_score = NoObject()
     if hud:
         player_score = PlayerScore()
-        a = ram_state[9] % 16 + 10 * (ram_state[9] // 16)
-        b = ram_state[10] % 16 + 10 * (ram_state[10] // 16)
+        a = _convert_number(ram_state[9])
+        b = _convert_number(ram_state[10])
         player_score.score = a * 100 + b
 
         if player_score.score < 10:
@@ -341,6 +341,8 @@ class Score(ValueObject):
     The player's merit score display.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Score, self).__init__()
         self._xy = 97, 6
@@ -354,6 +356,8 @@ class Clock(ValueObject):
     The statue of limitation (game clock display) for the current case.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Clock, self).__init__()
         self._xy = 88, 15
@@ -32,6 +32,8 @@ class Player(GameObject):
     The player figure: Q*bert.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Player, self).__init__()
         self._xy = 78, 103
@@ -45,6 +47,8 @@ class Cube(GameObject):
     The cubes.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = (0, 0)
@@ -58,6 +62,8 @@ class Disk(GameObject):
     The lift disks at the sides.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = (0, 0)
@@ -71,6 +77,8 @@ class PurpleBall(GameObject):
     The purple ball, which hatches Coily when reaching the bottom of the pyramid.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(PurpleBall, self).__init__()
         self._xy = 78, 103
@@ -84,6 +92,8 @@ class RedBall(GameObject):
     The red ball.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(RedBall, self).__init__()
         self._xy = 78, 103
@@ -97,6 +107,8 @@ class GreenBall(GameObject):
     The green ball.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(GreenBall, self).__init__()
         self._xy = 78, 103
@@ -110,6 +122,8 @@ class Coily(GameObject):
     A class representing Coily, one of Q*bert's enemies, who hatches from the purple ball.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Coily, self).__init__()
         self._xy = 78, 103
@@ -123,6 +137,8 @@ class Sam(GameObject):
     A class representing Sam, one of Q*bert's enemies, who changes the cubes' color back to original.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Sam, self).__init__()
         self._xy = 78, 103
@@ -136,6 +152,8 @@ class Score(GameObject):
     The player score display.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 34, 6
@@ -149,6 +167,8 @@ class Lives(GameObject):
     The indicator for the remaining lives.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super(Lives, self).__init__()
         self._xy = 33, 16
@@ -28,6 +28,8 @@ class _DescendingObject(GameObject):
     A support class for objects descending on the screen.
     """
 
+    __slots__ = ()
+
     _offset = None
 
     def __init__(self, xfr, x_off):
@@ -43,6 +45,8 @@ class Player(GameObject):
     The player figure i.e., the jet.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 77, 145
@@ -56,6 +60,8 @@ class PlayerMissile(GameObject):
     The missles shot from the player's jet.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -69,6 +75,8 @@ class Helicopter(_DescendingObject):
     The enemy helicopters.
     """
 
+    __slots__ = ()
+
     _offset = 16
     fh = 10  # final height
 
@@ -90,6 +98,8 @@ class Tanker(_DescendingObject):
     The enemy tankers.
     """
 
+    __slots__ = ()
+
     _offset = 13
     fh = 8
 
@@ -105,6 +115,8 @@ class Jet(_DescendingObject):
     The enemy jets.
     """
 
+    __slots__ = ()
+
     _offset = 15
     fh = 6
 
@@ -120,6 +132,8 @@ class Bridge(_DescendingObject):
     The bridge targets.
     """
 
+    __slots__ = ()
+
     _offset = 17
     fh = 18
 
@@ -135,6 +149,8 @@ class FuelDepot(_DescendingObject):
     Fuel depots targets.
     """
 
+    __slots__ = ()
+
     _offset = 23
     fh = 24
 
@@ -151,6 +167,8 @@ class PlayerScore(ValueObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 97, 165
@@ -167,6 +185,8 @@ class Lives(GameObject):
     The indicator for remaining jets (lives) (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 57, 192
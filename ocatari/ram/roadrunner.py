@@ -14,6 +14,8 @@ class Player(GameObject):
     The player figure i.e, the Road Runner.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -27,6 +29,8 @@ class Enemy(GameObject):
     Wile E. Coyote.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -40,6 +44,8 @@ class BirdSeeds(GameObject):
     The collectable piles of birdseed on the roadway.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -53,6 +59,8 @@ class Truck(GameObject):
     The speeding trucks.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -66,6 +74,8 @@ class RoadCrack(GameObject):
     Damaged road segments (cliffs??).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -79,6 +89,8 @@ class AcmeMine(GameObject):
     The landmines planted along the road.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 255, 255, 255  # 84,92,214
@@ -92,6 +104,8 @@ class Turret(GameObject):
     Wile E. Coyote's cannons along the road.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 66, 72, 200
@@ -105,6 +119,8 @@ class TurretBall(GameObject):
     The projectiles shot from the cannons.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 198, 108, 58
@@ -118,6 +134,8 @@ class Stone(GameObject):
     The rocks tumbling down on the road.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 181, 83, 40
@@ -131,6 +149,8 @@ class Cactus(GameObject):
     Cactus in the background (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -144,6 +164,8 @@ class Sign(GameObject):
     The occasional road signs and billboards (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -157,6 +179,8 @@ class Bird(GameObject):
     The birds flying by.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 252, 188, 116
@@ -170,6 +194,8 @@ class PlayerScore(GameObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.rgb = 0, 0, 0
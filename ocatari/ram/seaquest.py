@@ -2,7 +2,7 @@ import sys
 from typing import Type, Sequence, Dict
 
 from ._helper_methods import _convert_number
-from .game_objects import GameObject, ValueObject, Orientation, NoObject
+from .game_objects import GameObject, ValueObject, Orientation, NoObject, spawn_object, ensure_object, clear_slot
 from itertools import chain
 
 """
@@ -131,6 +131,8 @@ class PlayerScore(ValueObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 99, 9
@@ -148,6 +150,8 @@ class Lives(ValueObject):
     The indidcator for remaining reserve subs (lives) (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 58, 22
@@ -162,6 +166,8 @@ class OxygenBar(ValueObject):
     The oxygen gauge (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 49, 170
@@ -176,6 +182,8 @@ class OxygenBarDepleted(ValueObject):
     The empty oxygen bar (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 49, 170
@@ -256,10 +264,10 @@ def _detect_objects_ram(objects, ram_state, hud=False):
     player.orientation = Orientation.E if ram_state[86] == 0 else Orientation.W
     if 0 < ram_state[105] < 15:
         if player:
-            objects[0] = NoObject()
+            clear_slot(objects, 0)
     else:
         if not player:
-            objects[0] = Player()
+            spawn_object(objects, 0, Player)
     # player.crashed = ram_state[105] > 0
 
     # """The diving area is divided into 4 lanes (plus the surface lane).
@@ -284,67 +292,50 @@ def _detect_objects_ram(objects, ram_state, hud=False):
                 if -5 <= x <= 165:  # Only track objects that are on the screen
                     # Sharks float up and down, determined by an offset
                     if present_enemy_type == Shark:
-                        enemy = objects[idx]
-                        if type(enemy) is not Shark:
-                            enemy = Shark()
+                        enemy = ensure_object(objects, idx, Shark)
                         y += ram_state[93] - 4
                         enemy.xy = x, y
-                        objects[idx] = enemy
                     else:
-                        enemy = objects[idx+12]
-                        if type(enemy) is not Submarine:
-                            enemy = Submarine()
+                        enemy = ensure_object(objects, idx+12, Submarine)
                         enemy.xy = x, y
-                        objects[idx+12] = enemy
                 else:
-                    objects[idx] = NoObject()
-                    objects[idx+12] = NoObject()
+                    clear_slot(objects, idx)
+                    clear_slot(objects, idx+12)
             else:
-                objects[idx] = NoObject()
-                objects[idx+12] = NoObject()
+                clear_slot(objects, idx)
+                clear_slot(objects, idx+12)
             # _remove_object(hidden_enemy_type, idx)  # always remove the invisible enemy
 
     # divers and enemy_missiles share a ram position
     for i in range(4):
         if _is_submarine(3-i, ram_state):  # then, it's an enemy missile
             if 0 < ram_state[74 - i] < 160:
-                missile = objects[29+i]
-                if type(missile) != EnemyMissile:
-                    missile = EnemyMissile()
+                missile = ensure_object(objects, 29+i, EnemyMissile)
                 missile.xy = ram_state[74 - i] + 3, 145 - (3-i) * 24
-                objects[29+i] = missile
-                objects[25+i] = NoObject()
+                clear_slot(objects, 25+i)
             else:
-                objects[29+i] = NoObject()
+                clear_slot(objects, 29+i)
         else:
             if 0 < ram_state[74 - i] < 160:
-                diver = objects[25+i]
-                if type(diver) != Diver:
-                    diver = Diver()
+                diver = ensure_object(objects, 25+i, Diver)
                 diver.xy = ram_state[74 - i], 141 - (3-i) * 24
-                objects[25+i] = diver
-                objects[29+i] = NoObject()
+                clear_slot(objects, 29+i)
             else:
-                objects[25+i] = NoObject()
+                clear_slot(objects, 25+i)
 
     # only spawns in late game
     if ram_state[60] >= 2 and ram_state[118] < 160:
-        if type(objects[33]) is NoObject:
-            objects[33] = SurfaceSubmarine()
-        objects[33].xy = ram_state[118], 45
+        ensure_object(objects, 33, SurfaceSubmarine).xy = ram_state[118], 45
     else:
-        objects[33] = NoObject()
+        clear_slot(objects, 33)
 
     if 0 < ram_state[103] < 160:
-        if type(objects[34]) is NoObject:
-            objects[34] = PlayerMissile()
-        objects[34].xy = ram_state[103], ram_state[97] + 40
+        ensure_object(objects, 34, PlayerMissile).xy = ram_state[103], ram_state[97] + 40
     else:
-        objects[34] = NoObject()
+        clear_slot(objects, 34)
 
     if ram_state[102] != 0:
-        if type(objects[35]) != OxygenBar:
-            objects[35] = OxygenBar()
+        ensure_object(objects, 35, OxygenBar)
         if ram_state[102] == 64:
             new_wh = 63, 5
         else:
@@ -352,16 +343,15 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         objects[35].wh = new_wh
         objects[35].value = new_wh[0]
     else:
-        objects[35] = NoObject()
+        clear_slot(objects, 35)
 
     # If you have six collected divers they blink. Blinking is ignored here
     for i in range(6):
         if i < ram_state[62]:
             if type(objects[36+i]) != CollectedDiver:
-                objects[36+i] = CollectedDiver()
-                objects[36+i].xy = 58 + i * 8, 178
+                spawn_object(objects, 36+i, CollectedDiver).xy = 58 + i * 8, 178
         else:
-            objects[36+i] = NoObject()
+            clear_slot(objects, 36+i)
 
     if hud:
         score_value = _convert_number(ram_state[56]) * 10000 + \
@@ -402,20 +392,19 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         if num_lives > 0:  # Up to 6 lives possible
             new_wh = 7 + 8 * (num_lives - 1), 8
             if type(objects[-1]) != Lives:
-                objects[-2] = Lives()
+                spawn_object(objects, -2, Lives)
             objects[-2].wh = new_wh
             objects[-2].value = num_lives
         else:
-            objects[-2] = NoObject()
+            clear_slot(objects, -2)
 
         if ram_state[102] != 64:
-            if type(objects[-1]) != OxygenBarDepleted:
-                objects[-1] = OxygenBarDepleted()
+            ensure_object(objects, -1, OxygenBarDepleted)
             objects[-1].xy = 49 + ram_state[102], 170
             objects[-1].wh = 63 - ram_state[102], 5
             objects[-1].value = 63 - ram_state[102]
         else:
-            objects[-1] = NoObject()
+            clear_slot(objects, -1)
 
 
 def _is_submarine(i: int, ram_state) -> bool:
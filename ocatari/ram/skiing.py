@@ -60,6 +60,8 @@ class Flag(GameObject):
 
     """
 
+    __slots__ = ("_highest", "_ram_id", "_subtype")
+
     def __init__(self, x=0, y=0, subtype=0):
         super().__init__()
         self.rgb = FLAG_COLOR[subtype]
@@ -96,6 +98,8 @@ class Mogul(GameObject):
 
     """
 
+    __slots__ = ("_highest", "_ram_id")
+
     def __init__(self, x=0, y=0, subtype=None):
         super().__init__()
         self.rgb = (214, 214, 214)
@@ -128,6 +132,8 @@ class Tree(GameObject):
 
     """
 
+    __slots__ = ("_highest", "_ram_id", "_subtype")
+
     def __init__(self, x=0, y=0, subtype=2):
         super().__init__()
         self.rgb = TREE_COLOR[subtype]
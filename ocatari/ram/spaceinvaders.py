@@ -1,4 +1,5 @@
-from .game_objects import GameObject, NoObject
+from .game_objects import GameObject, NoObject, spawn_object, clear_slot
+from ._helper_methods import REVERSED_BITFIELDS
 import numpy as np
 from termcolor import colored
 import sys
@@ -14,8 +15,15 @@ MAX_NB_OBJECTS_HUD = {'Player': 1, 'Shield': 3, 'Bullet': 3,
 
 
 def make_bitmap(alien_states):
+    """
+    The aliens alive (1 or 0) in the order of their slots, from the rows of the alien bitmap: the set bits of
+    every row from the right to the left, the rows being shifted to the left over the empty columns.
+    """
     emptc = 6 - int(max(alien_states)).bit_length()  # nb empty columns
-    return [(format(el, '06b')[emptc:] + "0" * emptc) for el in alien_states], emptc
+    alive = []
+    for row in reversed(alien_states):
+        alive.extend(REVERSED_BITFIELDS[(int(row) << emptc) & 63][:6])
+    return alive, emptc
 
 
 class Player(GameObject):
@@ -118,12 +126,15 @@ class Lives(GameObject):
     The indicator for the player's remaining lives (HUD).
     """
 
+    __slots__ = ("value",)
+
     def __init__(self):
         super().__init__()
         self.rgb = 162, 134, 56
         self._xy = 84, 185
         self.wh = 12, 10
         self.hud = True
+        self.value = 3
 
 
 def _detect_objects_spaceinvaders_raw(info, ram_state):
@@ -225,14 +236,12 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         for s in shields:
             s.visible = True
     # aliens (permanent) deletion from array aliens:
-    for i in range(6):
-        for j in range(6):
-            # enemies alive are saved in ram_state[18:24]
-            if aliens[35 - (i * 6 + j)] and not int(bitmap[i][j]):
-                objects[43 - (i * 6 + j)] = NoObject()
-            elif not aliens[35 - (i * 6 + j)] and int(bitmap[i][j]):
-                # 5 = max(range(6)) so we are counting lines in the other way around
-                objects[43 - (i * 6 + j)] = Alien()
+    for i, alive in enumerate(bitmap):
+        # enemies alive are saved in ram_state[18:24]
+        if aliens[i] and not alive:
+            clear_slot(objects, 8 + i)
+        elif not aliens[i] and alive:
+            spawn_object(objects, 8 + i, Alien)
     for i in range(6):
         for j in range(6):
             alien = aliens[i * 6 + j]
@@ -266,12 +275,10 @@ def _detect_objects_ram(objects, ram_state, hud=False):
     for i in range(3):
         if bullets_visible[i]:
             if not bullets[i]:
-                bullet = Bullet()
-                objects[4+i] = bullet
-                bullets[i] = bullet
+                bullets[i] = spawn_object(objects, 4+i, Bullet)
         else:
             if bullets[i]:
-                objects[4+i] = NoObject()
+                clear_slot(objects, 4+i)
         if i < 2:
             bullets[i].xy = ram_state[83 + i] - 2, 2 * ram_state[81 + i] + 3
             if bullets[i].xy[1] < 194:
@@ -285,15 +292,14 @@ def _detect_objects_ram(objects, ram_state, hud=False):
                 ram_state[85] + 3  # for player
     if ram_state[30] and ram_state[30] != 180:
         if not satellite:
-            satellite = Satellite()
-            objects[7] = satellite
+            satellite = spawn_object(objects, 7, Satellite)
         satellite.xy = ram_state[30] - 1, 12
         if hud:
             for s in range(2):
                 objects[44+s].visible = False
     else:
         if satellite in objects:
-            objects[7] = NoObject()
+            clear_slot(objects, 7)
         if hud:
             for s in range(2):
                 objects[44+s].visible = True
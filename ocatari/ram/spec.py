@@ -0,0 +1,534 @@
+"""
+Declarative RAM extraction specs: the object slots of a game described by expressions of the RAM
+(addresses, offsets, transforms, visibility predicates and sizes), compiled once into a per-frame detector,
+a batched numpy kernel (see :func:`ocatari.batch.extract_batch`) and the RAM addresses every slot depends on
+(used e.g. as the key of the RAM extraction cache).
+
+A game adopts it by describing its slots and using the compiled detector::
+
+    RAM_SPEC = RamSpec([
+        Slot(Player, xy=(Ram(39) + 11, 163 - Ram(35))),
+        Slot(Pin, present=Ram(57) < 250, xy=(Table(pin_location)(Ram(57)) + 9, 169 - 2 * Ram(47))),
+        Slot(PlayerScore, hud=True).when(Ram(118) > 15, xy=(38, 9), value=Table(_convert_number)(Ram(118))),
+    ])
+    _detect_objects_ram = RAM_SPEC.detector
+
+The expressions are computed on the RAM bytes as Python ints (numpy int64 in the batched kernels).
+"""
+
+import numpy as np
+from ocatari.ram.game_objects import clear_slot, ensure_object
+
+_TUPLE_ATTRS = ("xy", "wh")
+
+
+class Expr:
+    """
+    An expression of the RAM state, built from :class:`Ram` with the arithmetic, bitwise and comparison
+    operators, :func:`where`, :func:`choose` and :class:`Table`. The comparisons are predicates,
+    combined with `&`, `|` and `~`.
+    """
+
+    __slots__ = ()
+    predicate = False
+
+    def render(self, batch):
+        """
+        The Python source of the expression, on the RAM list `ram` (per frame), or the RAM array `R` (batch).
+
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    def addresses(self):
+        """
+        :return: The RAM addresses read by the expression.
+        :rtype: set of int
+        """
+        return set()
+
+    def tables(self):
+        return []
+
+    def _binop(self, op, other, reverse=False):
+        other = as_expr(other)
+        return BinOp(op, other, self) if reverse else BinOp(op, self, other)
+
+    def __add__(self, o): return self._binop("+", o)
+    def __radd__(self, o): return self._binop("+", o, True)
+    def __sub__(self, o): return self._binop("-", o)
+    def __rsub__(self, o): return self._binop("-", o, True)
+    def __mul__(self, o): return self._binop("*", o)
+    def __rmul__(self, o): return self._binop("*", o, True)
+    def __floordiv__(self, o): return self._binop("//", o)
+    def __mod__(self, o): return self._binop("%", o)
+    def __rshift__(self, o): return self._binop(">>", o)
+    def __lshift__(self, o): return self._binop("<<", o)
+    def __and__(self, o): return self._binop("&", o)
+    def __rand__(self, o): return self._binop("&", o, True)
+    def __or__(self, o): return self._binop("|", o)
+    def __ror__(self, o): return self._binop("|", o, True)
+    def __neg__(self): return Unary("-", self)
+    def __lt__(self, o): return Compare("<", self, as_expr(o))
+    def __le__(self, o): return Compare("<=", self, as_expr(o))
+    def __gt__(self, o): return Compare(">", self, as_expr(o))
+    def __ge__(self, o): return Compare(">=", self, as_expr(o))
+    def __eq__(self, o): return Compare("==", self, as_expr(o))
+    def __ne__(self, o): return Compare("!=", self, as_expr(o))
+    __hash__ = object.__hash__
+
+    def __invert__(self):
+        return Not(self) if self.predicate else Unary("~", self)
+
+    def __bool__(self):
+        raise TypeError(
+            "An expression has no truth value, use & | ~ instead of and, or, not")
+
+    def __repr__(self):
+        return self.render(False)
+
+
+class Const(Expr):
+    """
+    A constant value.
+    """
+
+    __slots__ = ("value", "predicate")
+
+    def __init__(self, value):
+        self.value = value
+        self.predicate = isinstance(value, bool)
+
+    def render(self, batch):
+        return repr(self.value)
+
+
+class Ram(Expr):
+    """
+    The byte at an address of the RAM.
+
+    :param address: The address (0-127)
+    :type address: int
+    """
+
+    __slots__ = ("address",)
+
+    def __init__(self, address):
+        if not 0 <= address < 128:
+            raise ValueError(f"RAM addresses are in [0, 128), got {address}")
+        self.address = address
+
+    def render(self, batch):
+        return f"R[:, {self.address}]" if batch else f"ram[{self.address}]"
+
+    def addresses(self):
+        return {self.address}
+
+
+class _Node(Expr):
+    __slots__ = ("operands",)
+
+    def addresses(self):
+        return set().union(*(o.addresses() for o in self.operands))
+
+    def tables(self):
+        return [t for o in self.operands for t in o.tables()]
+
+
+class BinOp(_Node):
+    __slots__ = ("op", "predicate")
+
+    def __init__(self, op, a, b):
+        self.op, self.operands = op, (a, b)
+        # the bitwise & and | of predicates combine them
+        self.predicate = op in "&|" and a.predicate and b.predicate
+
+    def render(self, batch):
+        a, b = self.operands
+        return f"({a.render(batch)} {self.op} {b.render(batch)})"
+
+
+class Unary(_Node):
+    __slots__ = ("op",)
+
+    def __init__(self, op, a):
+        self.op, self.operands = op, (a,)
+
+    def render(self, batch):
+        return f"({self.op}{self.operands[0].render(batch)})"
+
+
+class Compare(_Node):
+    __slots__ = ("op",)
+    predicate = True
+
+    def __init__(self, op, a, b):
+        self.op, self.operands = op, (a, b)
+
+    def render(self, batch):
+        a, b = self.operands
+        return f"({a.render(batch)} {self.op} {b.render(batch)})"
+
+
+class Not(_Node):
+    __slots__ = ()
+    predicate = True
+
+    def __init__(self, a):
+        self.operands = (a,)
+
+    def render(self, batch):
+        a = self.operands[0].render(batch)
+        return f"(~{a})" if batch else f"(not {a})"
+
+
+class Where(_Node):
+    __slots__ = ("predicate",)
+
+    def __init__(self, cond, a, b):
+        self.operands = (cond, a, b)
+        self.predicate = a.predicate and b.predicate
+
+    def render(self, batch):
+        cond, a, b = (o.render(batch) for o in self.operands)
+        return f"_where({cond}, {a}, {b})" if batch else f"({a} if {cond} else {b})"
+
+
+class Lookup(_Node):
+    __slots__ = ("table",)
+
+    def __init__(self, table, index):
+        self.table, self.operands = table, (index,)
+
+    def render(self, batch):
+        name = f"_T{self.table.id}"
+        return f"{name}_array[{self.operands[0].render(batch)}]" if batch else f"{name}[{self.operands[0].render(batch)}]"
+
+    def tables(self):
+        return [self.table] + super().tables()
+
+
+class Table:
+    """
+    A transform of a byte by a 256 entries table, e.g. the displayed value of a BCD encoded score,
+    computed once from a function of the byte (or given as a sequence). Called on an expression,
+    it gives the expression of the transformed value.
+
+    :param values: A function of the byte values (0-255), or the 256 values.
+    :type values: callable or sequence of int
+    """
+
+    _count = 0
+
+    def __init__(self, values):
+        if callable(values):
+            values = [values(v) for v in range(256)]
+        if len(values) != 256:
+            raise ValueError(f"A table has 256 values, got {len(values)}")
+        self.values = tuple(values)
+        self.array = np.array(self.values)
+        self.id = Table._count
+        Table._count += 1
+
+    def __call__(self, expr):
+        return Lookup(self, as_expr(expr))
+
+
+def as_expr(value):
+    """
+    :return: The value as an expression (constants wrapped in :class:`Const`).
+    :rtype: Expr
+    """
+    return value if isinstance(value, Expr) else Const(value)
+
+
+def where(cond, a, b):
+    """
+    The expression of `a` where the predicate holds, else `b`.
+    """
+    return Where(as_expr(cond), as_expr(a), as_expr(b))
+
+
+def choose(*cases, default):
+    """
+    The value of the first case whose predicate holds (an `if ... elif ... else` chain), the values
+    being expressions or tuples of expressions (e.g. positions).
+
+    :param cases: The (predicate, value) pairs, in order
+    :param default: The value if no predicate holds
+    """
+    result = default
+    for cond, value in reversed(cases):
+        if isinstance(value, tuple):
+            result = tuple(where(cond, v, r) for v, r in zip(value, result))
+        else:
+            result = where(cond, value, result)
+    return result
+
+
+def _as_value(name, value):
+    if name in _TUPLE_ATTRS:
+        if not isinstance(value, tuple) or len(value) != 2:
+            raise ValueError(
+                f"{name} must be a pair of expressions, got {value}")
+        return tuple(as_expr(v) for v in value)
+    return as_expr(value)
+
+
+def forward_fill(values, mask, initial):
+    """
+    The values of the last frame where `mask` was set (the frame itself included), `initial` before the first one.
+
+    :param values: The values of every frame, (N, ...)
+    :param mask: The frames setting the value, (N,)
+    """
+    frames = np.where(mask, np.arange(len(mask)), -1)
+    last = np.maximum.accumulate(frames)
+    filled = values[np.maximum(last, 0)]
+    found = (last >= 0).reshape((-1,) + (1,) * (filled.ndim - 1))
+    return np.where(found, filled, initial)
+
+
+def previous_frames(values, initial):
+    """
+    The values of the previous frames, `initial` for the first one.
+    """
+    shifted = np.empty_like(values)
+    shifted[0] = initial
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def _values(value):
+    return value if isinstance(value, tuple) else (value,)
+
+
+class Slot:
+    """
+    The spec of an object slot: the attributes set from the RAM at every frame, and the conditional updates
+    (see :meth:`when`), applied in order.
+
+    :param cls: The class of the objects of the slot
+    :type cls: type
+    :param hud: Whether the slot is part of the HUD (only extracted with `hud=True`)
+    :type hud: bool
+    :param present: The predicate of the slot holding an object (a new one if it was empty), else it is emptied
+                    (`NoObject`), defaults to an object in every frame.
+    :type present: Expr
+    :param attrs: The attributes set at every frame, e.g. `xy=(Ram(49) - 49, Ram(54) - 14)`, `wh`, `value`,
+                  `visible`... as expressions or constants.
+    """
+
+    def __init__(self, cls, hud=False, present=None, **attrs):
+        self.cls = cls
+        self.hud = hud
+        self.present = None if present is None else as_expr(present)
+        self.updates = []
+        if attrs:
+            values = {k: _as_value(k, v) for k, v in attrs.items()}
+            self.updates.append((None, values))
+
+    def when(self, cond, **attrs):
+        """
+        Adds attributes set only where the predicate holds, the previous values being kept otherwise.
+
+        :return: The slot, to chain the updates
+        :rtype: Slot
+        """
+        values = {k: _as_value(k, v) for k, v in attrs.items()}
+        self.updates.append((as_expr(cond), values))
+        return self
+
+    def expressions(self):
+        exprs = [] if self.present is None else [self.present]
+        for cond, attrs in self.updates:
+            if cond is not None:
+                exprs.append(cond)
+            for value in attrs.values():
+                exprs.extend(_values(value))
+        return exprs
+
+    def addresses(self):
+        """
+        :return: The RAM addresses the slot depends on.
+        :rtype: tuple of int
+        """
+        addresses = set()
+        for expr in self.expressions():
+            addresses.update(expr.addresses())
+        return tuple(sorted(addresses))
+
+    def __repr__(self):
+        return f"Slot({self.cls.__name__}{', hud' if self.hud else ''})"
+
+
+class RamSpec:
+    """
+    The declarative RAM extraction of a game: its slots (the HUD ones extracted with `hud=True` only, in order),
+    compiled once into the per-frame :attr:`detector` (with the signature of `_detect_objects_ram`)
+    and the batched kernel :meth:`batch`.
+
+    :param slots: The slots, in the order of the objects of `_init_objects_ram` (the HUD ones last)
+    :type slots: list of Slot
+
+    :ivar source: The Python source of the compiled detector
+    :vartype source: str
+    """
+
+    def __init__(self, slots):
+        self.slots = list(slots)
+        self._namespace = {
+            "ensure_object": ensure_object,
+            "clear_slot": clear_slot,
+            "_where": np.where}
+        for slot in self.slots:
+            self._namespace[slot.cls.__name__] = slot.cls
+            for expr in slot.expressions():
+                for table in expr.tables():
+                    self._namespace[f"_T{table.id}"] = table.values
+                    self._namespace[f"_T{table.id}_array"] = table.array
+        self.source = self._detector_source()
+        exec(compile(self.source, "<ram spec>", "exec"), self._namespace)
+        self.detector = self._namespace["_detect_objects_ram"]
+        self.detector.spec = self
+        self._batch_exprs = {}
+
+    def game_slots(self, hud=False):
+        """
+        :return: The slots extracted with or without the HUD
+        :rtype: list of Slot
+        """
+        return [slot for slot in self.slots if hud or not slot.hud]
+
+    def _slot_source(self, idx, slot, indent):
+        lines = []
+        if slot.present is not None:
+            lines.append(f"if {slot.present.render(False)}:")
+            lines.append(
+                f"    o = ensure_object(objects, {idx}, {slot.cls.__name__})")
+            body = "    "
+        else:
+            lines.append(f"o = objects[{idx}]")
+            body = ""
+        for cond, attrs in slot.updates:
+            prefix = body
+            if cond is not None:
+                lines.append(f"{body}if {cond.render(False)}:")
+                prefix += "    "
+            for name, value in attrs.items():
+                if isinstance(value, tuple):
+                    lines.append(
+                        f"{prefix}o.{name} = {value[0].render(False)}, {value[1].render(False)}")
+                else:
+                    lines.append(f"{prefix}o.{name} = {value.render(False)}")
+        if slot.present is not None:
+            lines.append("else:")
+            lines.append(f"    clear_slot(objects, {idx})")
+        if len(lines) == 1 and slot.present is None:  # constant object
+            return []
+        return [indent + line for line in lines]
+
+    def _detector_source(self):
+        lines = ["def _detect_objects_ram(objects, ram_state, hud=False):",
+                 "    ram = ram_state.tolist()"]
+        hud_lines = []
+        for idx, slot in enumerate(self.slots):
+            if slot.hud:
+                hud_lines.extend(self._slot_source(idx, slot, "        "))
+            else:
+                lines.extend(self._slot_source(idx, slot, "    "))
+        if hud_lines:
+            lines.append("    if hud:")
+            lines.extend(hud_lines)
+        return "\n".join(lines) + "\n"
+
+    def dependencies(self, hud=False):
+        """
+        The address dependency graph of the slots: the RAM addresses every slot depends on.
+
+        :rtype: dict of int: tuple of int
+        """
+        slots = self.game_slots(hud)
+        return {idx: slot.addresses() for idx, slot in enumerate(slots)}
+
+    def addresses(self, hud=False):
+        """
+        The RAM addresses the extraction depends on, the other ones never change the objects.
+
+        :rtype: tuple of int
+        """
+        return tuple(sorted(set().union(*self.dependencies(hud).values())))
+
+    def _evaluate(self, expr, rams):
+        # by identity, the comparison of expressions being an expression
+        code = self._batch_exprs.get(id(expr))
+        if code is None:
+            code = self._batch_exprs[id(expr)] = compile(
+                expr.render(True), "<ram spec>", "eval")
+        values = eval(code, self._namespace, {"R": rams})
+        return np.broadcast_to(values, (len(rams),))
+
+    def batch(self, rams, objects, hud=False):
+        """
+        The positions and visibility of the slots of recorded RAM states (see :func:`ocatari.batch.extract_batch`),
+        the values kept by the conditional updates being forward filled, and reset by the new objects.
+        Only the slots with the default neurosymbolic representation (their position) are handled.
+
+        :param rams: The RAM states, in order
+        :type rams: np.ndarray of int64, (N, 128)
+        :param objects: The initial objects (as after a reset)
+        :type objects: list of GameObject
+        :return: The positions (N, nb_slots, 2) and visibility (N, nb_slots), or None if a slot is not handled
+        :rtype: (np.ndarray, np.ndarray)
+        """
+        from ocatari.ns_state import _nsrepr_kind, _POSITION
+        slots = self.game_slots(hud)
+        if len(slots) != len(objects):
+            return None
+        n = len(rams)
+        xy = np.zeros((n, len(slots), 2), dtype=np.int64)
+        visible = np.ones((n, len(slots)), dtype=bool)
+        for idx, (slot, initial) in enumerate(zip(slots, objects)):
+            if _nsrepr_kind(slot.cls) != _POSITION:
+                return None
+            if any("xywh" in attrs for _, attrs in slot.updates):
+                return None
+            default = slot.cls()
+            if slot.present is None:
+                present = np.ones(n, dtype=bool)
+                spawned = np.zeros(n, dtype=bool)
+            else:
+                present = self._evaluate(slot.present, rams)
+                spawned = present & ~previous_frames(
+                    present, initial.__class__ is slot.cls)
+            if initial.__class__ is not slot.cls:
+                initial = default
+            # every column is the value of the last update, the one of the new
+            # objects, or the initial one
+            columns = (("x", 0, initial.x, default.x),
+                       ("y", 1, initial.y, default.y),
+                       ("visible", None, initial.visible, default.visible))
+            for name, component, start, reset in columns:
+                values = np.full(n, reset, dtype=np.int64)
+                assigned = spawned.copy()
+                for cond, attrs in slot.updates:
+                    value = attrs.get(name)
+                    if value is None and component is not None and "xy" in attrs:
+                        value = attrs["xy"][component]
+                    if value is None:
+                        continue
+                    mask = present
+                    if cond is not None:
+                        mask = present & self._evaluate(cond, rams)
+                    value = self._evaluate(value, rams)
+                    values = np.where(mask, value, values)
+                    assigned |= mask
+                column = forward_fill(values, assigned, start)
+                if component is None:
+                    visible[:, idx] = present & (column != 0)
+                else:
+                    xy[:, idx, component] = column
+        return xy, visible
+
+    def __repr__(self):
+        return f"RamSpec({self.slots})"
@@ -18,6 +18,8 @@ class Player(GameObject):
     The player spaceship.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.xy = 0, 157
@@ -31,6 +33,8 @@ class PlayerMissile(GameObject):
     The missiles launched be the player.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.xy = 0, 157
@@ -44,6 +48,8 @@ class BombThrower(GameObject):
     The enemy spaceship which throws bombs.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.xy = 0, 157
@@ -57,6 +63,8 @@ class Bomb(GameObject):
     The bombs thrown by enemy spaceship.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.xy = 0, 157
@@ -70,6 +78,8 @@ class FlyingEnemy(GameObject):
     The flying enemy spaceships.
     """
 
+    __slots__ = ("num_frames_invisible",)
+
     def __init__(self):
         super().__init__()
         self.xy = 0, 157
@@ -84,6 +94,8 @@ class PlayerScore(GameObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ("score",)
+
     def __init__(self):
         super().__init__()
         self.xy = 56, 3
@@ -101,6 +113,8 @@ class Lives(GameObject):
     The indicator for the remaining lives of the player (HUD).
     """
 
+    __slots__ = ("lives",)
+
     def __init__(self):
         super().__init__()
         self.visible = True
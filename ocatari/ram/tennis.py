@@ -17,6 +17,8 @@ class Player(GameObject):
     The player figure i.e., the tennis player.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -31,6 +33,8 @@ class Enemy(GameObject):
     The enemy tennis player.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -45,6 +49,8 @@ class Ball(GameObject):
     The tennis ball.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -59,6 +65,8 @@ class BallShadow(GameObject):
     The shadow cast by the ball onto the ground.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -73,6 +81,8 @@ class PlayerScore(GameObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 49, 5
@@ -90,6 +100,8 @@ class EnemyScore(GameObject):
     The enemy's score display (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 113, 5
@@ -9,6 +9,8 @@ MAX_NB_OBJECTS_HUD = {"Player": 1, "Player_Shot": 1, "Enemy_Green": 8, "Enemy_Gr
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Player, self).__init__()
         self._xy = 76, 100
@@ -18,6 +20,8 @@ class Player(GameObject):
 
 
 class Player_Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Player_Shot, self).__init__()
         self._xy = 0, 160
@@ -27,6 +31,8 @@ class Player_Shot(GameObject):
 
 
 class Enemy_Green(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Green, self).__init__()
         self._xy = 0, 160
@@ -36,6 +42,8 @@ class Enemy_Green(GameObject):
 
 
 class Enemy_Green_Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Green_Shot, self).__init__()
         self._xy = 0, 160
@@ -45,6 +53,8 @@ class Enemy_Green_Shot(GameObject):
 
 
 class Enemy_Black(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Black, self).__init__()
         self._xy = 0, 160
@@ -54,6 +64,8 @@ class Enemy_Black(GameObject):
 
 
 class Enemy_Black_Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Black_Shot, self).__init__()
         self._xy = 0, 160
@@ -63,6 +75,8 @@ class Enemy_Black_Shot(GameObject):
 
 
 class Enemy_Yellow(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Yellow, self).__init__()
         self._xy = 0, 160
@@ -72,6 +86,8 @@ class Enemy_Yellow(GameObject):
 
 
 class Enemy_Yellow_Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Yellow_Shot, self).__init__()
         self._xy = 0, 160
@@ -81,6 +97,8 @@ class Enemy_Yellow_Shot(GameObject):
 
 
 class Enemy_Blue(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Blue, self).__init__()
         self._xy = 0, 160
@@ -90,6 +108,8 @@ class Enemy_Blue(GameObject):
 
 
 class Enemy_Blue_Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Blue_Shot, self).__init__()
         self._xy = 0, 160
@@ -99,6 +119,8 @@ class Enemy_Blue_Shot(GameObject):
 
 
 class Enemy_Orange(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Orange, self).__init__()
         self._xy = 0, 160
@@ -108,6 +130,8 @@ class Enemy_Orange(GameObject):
 
 
 class Enemy_Orange_Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Enemy_Orange_Shot, self).__init__()
         self._xy = 0, 160
@@ -117,6 +141,8 @@ class Enemy_Orange_Shot(GameObject):
 
 
 class Score(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 57, 7
@@ -126,6 +152,8 @@ class Score(ValueObject):
 
 
 class Life(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 0, 0
@@ -7,6 +7,8 @@ MAX_NB_OBJECTS_HUD = {}  # 'Score': 1}
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Player, self).__init__()
         self._xy = 76, 100
@@ -16,6 +18,8 @@ class Player(GameObject):
 
 
 class Truck(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Truck, self).__init__()
         self._xy = 76, 100
@@ -25,6 +29,8 @@ class Truck(GameObject):
 
 
 class Flag(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Flag, self).__init__()
         self._xy = 76, 100
@@ -34,6 +40,8 @@ class Flag(GameObject):
 
 
 class Collectable(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Collectable, self).__init__()
         self._xy = 76, 100
@@ -43,6 +51,8 @@ class Collectable(GameObject):
 
 
 class HUD_Flag(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(HUD_Flag, self).__init__()
         self._xy = 57, 7
@@ -52,6 +62,8 @@ class HUD_Flag(ValueObject):
 
 
 class Score(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 57, 6
@@ -61,6 +73,8 @@ class Score(ValueObject):
 
 
 class Life(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 16, 196
@@ -157,6 +157,8 @@ class Green_Collectable(GameObject):
 
 
 class Score(ValueObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super(Score, self).__init__()
         self._xy = 97, 6
@@ -1,4 +1,5 @@
 from .game_objects import GameObject
+from ._helper_methods import _convert_number
 
 """
 RAM extraction for the game Fishing Derby.
@@ -28,8 +29,7 @@ right_flip_map = {128: (83, 184, 13, 6), 144: (
 def compute_score(ram):
     score = 0
     for i in range(3):
-        buf = ram[48+2*i]
-        sc = 10 * (buf // 16) + buf % 16
+        sc = _convert_number(ram[48+2*i])
         score += sc * 100**i
     return score
 
@@ -81,6 +81,8 @@ class Spinner(GameObject):
 
 
 class DropTarget(GameObject):
+    __slots__ = ("value",)
+
     def __init__(self, xy, wh, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.xy = xy
@@ -107,6 +109,8 @@ class Bumper(GameObject):
 
 
 class Score(GameObject):
+    __slots__ = ("value",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.value = 0
@@ -117,6 +121,8 @@ class Score(GameObject):
 
 
 class LifeUsed(GameObject):
+    __slots__ = ("value",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.value = 0
@@ -127,6 +133,8 @@ class LifeUsed(GameObject):
 
 
 class DifficultyLevel(GameObject):
+    __slots__ = ("value",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.xy = 4, 3
@@ -1,4 +1,4 @@
-from .game_objects import GameObject, ValueObject
+from .game_objects import GameObject, ValueObject, spawn_object
 import sys
 
 """
@@ -14,6 +14,8 @@ class Player(GameObject):
     The player figure i.e., the Yar.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -27,6 +29,8 @@ class Enemy(GameObject):
     The enemy Qotile.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -40,6 +44,8 @@ class Swirl(GameObject):
     The Qotile when transformed into a Swirl, charging at the player.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -53,6 +59,8 @@ class Enemy_Missile(GameObject):
     The Destroyer Missles fired by the Qotile.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -66,6 +74,8 @@ class Barrier(GameObject):
     The colorful and glittering neutral zone.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -79,6 +89,8 @@ class Player_Bullet(GameObject):
     The Energy Missles fired by the player.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -92,6 +104,8 @@ class Shield_Block(GameObject):
     The cells of the energy shield protecting the Qotile.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self._xy = 0, 0
@@ -101,6 +115,8 @@ class Shield_Block(GameObject):
 
 
 class Score(ValueObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Score, self).__init__()
         self._xy = 0, 0
@@ -110,6 +126,8 @@ class Score(ValueObject):
 
 
 class Life(GameObject):
+    __slots__ = ()
+
     def __init__(self):
         super(Life, self).__init__()
         self._xy = 0, 0
@@ -153,35 +171,29 @@ def _detect_objects_ram(objects, ram_state, hud=False):
     (x, y, w, h, r, g, b)
     """
     if ram_state[53] > 159:
-        player = Player()
-        objects[0] = player
+        player = spawn_object(objects, 0, Player)
         player.xy = ram_state[32], ram_state[31]+3
         if ram_state[43] >= 145:
-            enemy = Enemy()
+            enemy = spawn_object(objects, 1, Enemy)
             enemy.xy = ram_state[43], ram_state[42]+3
             objects[2] = None
-            objects[1] = enemy
         else:
-            swirl = Swirl()
+            swirl = spawn_object(objects, 2, Swirl)
             swirl.xy = ram_state[43]+4, ram_state[42]+3
-            objects[2] = swirl
             objects[1] = None
         # Enemy Missile
-        e_m = Enemy_Missile()
+        e_m = spawn_object(objects, 3, Enemy_Missile)
         e_m.xy = ram_state[47], ram_state[46]+2
-        objects[3] = e_m
         # Player Missile
         if abs(ram_state[38]-3-ram_state[32]) > 5 and abs(ram_state[37]-ram_state[31]) > 5:
-            p_m = Player_Bullet()
+            p_m = spawn_object(objects, 5, Player_Bullet)
             p_m.xy = ram_state[38]-1, ram_state[37]+4
-            objects[5] = p_m
         else:
             objects[5] = None
         # Adding Barrier
         if ram_state[53] > 159:
-            b = Barrier()
+            b = spawn_object(objects, 4, Barrier)
             b.xy = 52, 4
-            objects[4] = b
         else:
             objects[4] = None
 
@@ -190,8 +202,7 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         for j in range(16):
             for i in range(8):
                 if ram_state[j+1] & 2**i:
-                    block = Shield_Block()
-                    objects[5+(i+(j*8))] = block
+                    block = spawn_object(objects, 5+(i+(j*8)), Shield_Block)
                     if j == 15:
                         block.xy = 128 + (i*4), ram_state[26] + 122 - (j*8)
                         block.wh = 4, 7
@@ -205,36 +216,29 @@ def _detect_objects_ram(objects, ram_state, hud=False):
         if hud:
             # scores ram: 96-98 lives 99
             if ram_state[96] > 15:
-                score = Score()
-                objects[0] = score
+                score = spawn_object(objects, 0, Score)
                 score.xy = 55, 47
                 score.wh = 47, 7
             elif ram_state[96]:
-                score = Score()
-                objects[0] = score
+                score = spawn_object(objects, 0, Score)
                 score.xy = 63, 48
                 score.wh = 39, 7
             elif ram_state[97] > 15:
-                score = Score()
-                objects[0] = score
+                score = spawn_object(objects, 0, Score)
                 score.xy = 71, 48
                 score.wh = 31, 7
             elif ram_state[97]:
-                score = Score()
-                objects[0] = score
+                score = spawn_object(objects, 0, Score)
                 score.xy = 79, 48
                 score.wh = 23, 7
             elif ram_state[98] > 15:
-                score = Score()
-                objects[0] = score
+                score = spawn_object(objects, 0, Score)
                 score.xy = 87, 48
                 score.wh = 15, 7
             elif ram_state[98]:
-                score = Score()
-                objects[0] = score
+                score = spawn_object(objects, 0, Score)
                 score.xy = 95, 48
                 score.wh = 7, 7
 
-            life = Life()
-            objects[1] = life
+            life = spawn_object(objects, 1, Life)
             life.xy = 95, 74
@@ -0,0 +1,160 @@
+"""
+Vectorized pairwise relations between objects: IoU, center distances, overlaps and nearest neighbours
+of all the pairs at once, instead of the pairwise :meth:`ocatari.ram.game_objects.GameObject.iou`,
+`manathan_distance` and `closest_object` calls.
+
+The objects are given as a list of (ram or vision) game objects, an :class:`ocatari.object_table.ObjectTable`,
+or a structured array of `OBJECT_DTYPE` rows of shape (..., nb_objects), e.g. the stacked tables of a vector
+environment (see :func:`ocatari.object_table.stack_tables`), the relations then having the same batch dimensions.
+"""
+
+import numpy as np
+from ocatari.object_table import ObjectTable, OBJECT_DTYPE
+
+METRICS = ("manhattan", "euclidean")
+
+
+def object_rows(objects, categories=None):
+    """
+    The rows (`OBJECT_DTYPE`) of the objects, optionally restricted to some categories.
+
+    :param objects: The objects, as a list of game objects, an ObjectTable or a structured array
+    :type objects: list of GameObject or ObjectTable or np.ndarray
+    :param categories: The categories (class names, e.g. `["Player", "Enemy"]`) of the objects to keep,
+                       for lists and tables only.
+    :type categories: list of str
+
+    :rtype: np.ndarray
+    """
+    if isinstance(objects, np.ndarray):
+        if objects.dtype != OBJECT_DTYPE:
+            raise TypeError(
+                f"Expected an array of OBJECT_DTYPE rows, got {objects.dtype}")
+        if categories is not None:
+            raise TypeError(
+                "The categories can only be selected from objects or an ObjectTable")
+        return objects
+    if not isinstance(objects, ObjectTable):
+        if categories is not None:
+            objects = [
+                o for o in objects if o is not None and o.category in categories]
+        return ObjectTable().update(objects).array
+    if categories is None:
+        return objects.array
+    mask = np.zeros(len(objects), dtype=bool)
+    for name in categories:
+        mask |= objects.category_mask(name)
+    return objects.array[mask]
+
+
+def _pair(objects, others):
+    # The rows of both sides, broadcast to (..., n, 1) and (..., 1, m)
+    a = object_rows(objects)
+    b = a if others is None else object_rows(others)
+    return a[..., :, None], b[..., None, :]
+
+
+def _boxes(rows):
+    x, y = rows["x"].astype(np.float64), rows["y"].astype(np.float64)
+    return x, y, x + rows["w"], y + rows["h"]
+
+
+def _visible_pairs(a, b):
+    return a["visible"] & b["visible"]
+
+
+def _intersections(a, b):
+    ax0, ay0, ax1, ay1 = _boxes(a)
+    bx0, by0, bx1, by1 = _boxes(b)
+    inter_w = np.clip(np.minimum(ax1, bx1) - np.maximum(ax0, bx0), 0, None)
+    inter_h = np.clip(np.minimum(ay1, by1) - np.maximum(ay0, by0), 0, None)
+    return inter_w * inter_h
+
+
+def iou_matrix(objects, others=None, visible_only=True):
+    """
+    The intersection over union of the bounding boxes of every pair of objects.
+
+    :param objects: The objects (see :func:`object_rows`)
+    :param others: The objects to pair them with, defaults to the objects themselves
+    :param visible_only: If True, the pairs with an invisible (or empty) object have an IoU of 0
+    :type visible_only: bool
+
+    :return: The IoU, of shape (..., nb_objects, nb_others)
+    :rtype: np.ndarray
+    """
+    a, b = _pair(objects, others)
+    inter = _intersections(a, b)
+    area_a = a["w"].astype(np.float64) * a["h"]
+    area_b = b["w"].astype(np.float64) * b["h"]
+    union = area_a + area_b - inter
+    iou = np.divide(inter, union, out=np.zeros_like(inter), where=union != 0)
+    if visible_only:
+        iou[~_visible_pairs(a, b)] = 0
+    return iou
+
+
+def overlap_matrix(objects, others=None, visible_only=True):
+    """
+    Whether the bounding boxes of every pair of objects intersect (with a positive area).
+
+    See :func:`iou_matrix` for the parameters.
+
+    :rtype: np.ndarray of bool, (..., nb_objects, nb_others)
+    """
+    a, b = _pair(objects, others)
+    overlap = _intersections(a, b) > 0
+    if visible_only:
+        overlap &= _visible_pairs(a, b)
+    return overlap
+
+
+def distance_matrix(objects, others=None, metric="manhattan",
+                    visible_only=True):
+    """
+    The distances between the centers of the bounding boxes of every pair of objects.
+
+    :param metric: `manhattan` (as :meth:`ocatari.ram.game_objects.GameObject.manathan_distance`) or `euclidean`
+    :type metric: str
+
+    See :func:`iou_matrix` for the other parameters, the pairs with an invisible object are at an infinite distance.
+
+    :rtype: np.ndarray, (..., nb_objects, nb_others)
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric}, expected one of {METRICS}")
+    a, b = _pair(objects, others)
+    dx = (a["x"] + a["w"] / 2) - (b["x"] + b["w"] / 2)
+    dy = (a["y"] + a["h"] / 2) - (b["y"] + b["h"] / 2)
+    if metric == "manhattan":
+        dist = np.abs(dx) + np.abs(dy)
+    else:
+        dist = np.hypot(dx, dy)
+    if visible_only:
+        dist[~_visible_pairs(a, b)] = np.inf
+    return dist
+
+
+def nearest_neighbours(objects, others=None, metric="manhattan",
+                       visible_only=True):
+    """
+    The closest other object of every object (as :meth:`ocatari.ram.game_objects.GameObject.closest_object`),
+    an object not being its own neighbour when `others` is not given.
+
+    See :func:`distance_matrix` for the parameters.
+
+    :return: The indices of the nearest neighbours (-1 if there is none), and their distances (inf if there is none),
+             both of shape (..., nb_objects).
+    :rtype: (np.ndarray, np.ndarray)
+    """
+    dist = distance_matrix(objects, others, metric, visible_only)
+    if others is None:
+        n = dist.shape[-1]
+        dist[..., np.arange(n), np.arange(n)] = np.inf
+    if not dist.shape[-1]:
+        shape = dist.shape[:-1]
+        return np.full(shape, -1, dtype=np.int64), np.full(shape, np.inf)
+    indices = dist.argmin(axis=-1)
+    distances = np.take_along_axis(dist, indices[..., None], axis=-1)[..., 0]
+    indices[np.isinf(distances)] = -1
+    return indices, distances
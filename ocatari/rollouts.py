@@ -0,0 +1,178 @@
+"""
+Batched lookahead rollouts from a snapshot, distributed over a pool of worker processes.
+"""
+
+import numpy as np
+from ocatari.core import OCAtari
+
+
+def run_rollouts(env, snapshot, action_sequences):
+    """
+    Plays every action sequence from the snapshot, in the given environment.
+    An episode ending before the end of its sequence stops it: the remaining steps have
+    a zero reward and state, and are marked as done.
+
+    :param env: The environment, of the game of the snapshot.
+    :type env: OCAtari
+    :param snapshot: The state to start every sequence from (see :meth:`ocatari.core.OCAtari.snapshot`)
+    :type snapshot: ocatari.snapshot.Snapshot
+    :param action_sequences: The actions, of shape (nb_sequences, nb_steps)
+    :type action_sequences: np.ndarray
+
+    :return: The rewards (nb_sequences, nb_steps), the neurosymbolic states after every step
+             (nb_sequences, nb_steps, state_size) and the done flags (nb_sequences, nb_steps).
+    :rtype: (np.ndarray, np.ndarray, np.ndarray)
+    """
+    action_sequences = np.asarray(action_sequences)
+    nb_sequences, nb_steps = action_sequences.shape
+    rewards = np.zeros((nb_sequences, nb_steps), dtype=np.float64)
+    dones = np.zeros((nb_sequences, nb_steps), dtype=np.bool_)
+    states = None
+    for i, actions in enumerate(action_sequences):
+        env.restore(snapshot)
+        for t, action in enumerate(actions):
+            # Only the objects are needed, the stacks are not filled
+            _, reward, terminated, truncated, info = env._step_env(action)
+            state = env._write_ns_state()
+            env._timer.stop("step", info)
+            if states is None:
+                states = np.zeros(
+                    (nb_sequences, nb_steps, len(state)), dtype=np.float32)
+            states[i, t] = state
+            rewards[i, t] = reward
+            if terminated or truncated:
+                dones[i, t:] = True
+                break
+    if states is None:
+        states = np.zeros((nb_sequences, nb_steps, 0), dtype=np.float32)
+    return rewards, states, dones
+
+
+def _rollout_worker(pipe, parent_pipe, env_kwargs):
+    parent_pipe.close()
+    try:
+        env = OCAtari(**env_kwargs)
+        env.reset()
+        pipe.send((None, True))
+    except Exception as err:
+        pipe.send((f"{type(err).__name__}: {err}", False))
+        return
+
+    while True:
+        command, data = pipe.recv()
+        try:
+            if command == "rollout":
+                pipe.send((run_rollouts(env, *data), True))
+            elif command == "close":
+                env.close()
+                pipe.send((None, True))
+                break
+            else:
+                raise RuntimeError(f"Unknown command: {command}")
+        except Exception as err:
+            pipe.send((f"{type(err).__name__}: {err}", False))
+    pipe.close()
+
+
+class RolloutPool:
+    """
+    A pool of worker processes, each with its own (pre-created) OCAtari environment of the same game,
+    evaluating batches of action sequences from a common snapshot, e.g. for planning agents.
+
+    :param env_name: The name of the Atari gymnasium environment e.g. "Pong" or "ALE/Pong-v5"
+    :type env_name: str
+    :param num_workers: The number of worker processes. With 0, the rollouts run in this process.
+    :type num_workers: int
+    :param mode: The detection method type: one of `ram`, `vision`, or `both`
+    :type mode: str
+    :param hud: Whether to include or not objects from the HUD (e.g. scores, lives)
+    :type hud: bool
+    :param context: The multiprocessing start method (e.g. `spawn`, `fork`), defaults to the platform's.
+    :type context: str
+
+    The remaining \\**kwargs are passed to the :class:`ocatari.core.OCAtari` environments.
+    They must match the ones of the environment the snapshots are taken from.
+
+    Example::
+
+        env = OCAtari("ALE/Pong-v5", mode="ram", exact_snapshots=True)
+        env.reset()
+        with RolloutPool("ALE/Pong-v5", num_workers=4, exact_snapshots=True) as pool:
+            rewards, states, dones = pool.rollout(env.snapshot(stacks=False), np.random.randint(6, size=(64, 20)))
+    """
+
+    def __init__(self, env_name, num_workers=2, mode="ram", hud=False,
+                 context=None, **kwargs):
+        self.num_workers = num_workers
+        env_kwargs = dict(env_name=env_name, mode=mode, hud=hud, **kwargs)
+        self.parent_pipes, self.processes = [], []
+        if num_workers == 0:
+            self._env = OCAtari(**env_kwargs)
+            self._env.reset()
+            return
+        import multiprocessing as mp
+        ctx = mp.get_context(context)
+        for i in range(num_workers):
+            parent_pipe, child_pipe = ctx.Pipe()
+            process = ctx.Process(
+                target=_rollout_worker, name=f"OCAtariRolloutWorker-{i}",
+                args=(child_pipe, parent_pipe, env_kwargs), daemon=True)
+            process.start()
+            child_pipe.close()
+            self.parent_pipes.append(parent_pipe)
+            self.processes.append(process)
+        self._receive(self.parent_pipes)
+
+    def _receive(self, pipes):
+        results = [pipe.recv() for pipe in pipes]
+        errors = [msg for msg, success in results if not success]
+        if errors:
+            raise RuntimeError(
+                f"Rollout worker error(s): {'; '.join(dict.fromkeys(errors))}")
+        return [result for result, _ in results]
+
+    def rollout(self, snapshot, action_sequences):
+        """
+        Plays every action sequence from the snapshot, spreading the sequences over the workers
+        (see :func:`run_rollouts` for the returned arrays).
+
+        :param snapshot: The state to start every sequence from (see :meth:`ocatari.core.OCAtari.snapshot`)
+        :type snapshot: ocatari.snapshot.Snapshot
+        :param action_sequences: The actions, of shape (nb_sequences, nb_steps)
+        :type action_sequences: np.ndarray
+        :rtype: (np.ndarray, np.ndarray, np.ndarray)
+        """
+        action_sequences = np.asarray(action_sequences)
+        if action_sequences.ndim != 2:
+            raise ValueError(
+                f"Expected action sequences of shape (nb_sequences, nb_steps), got {action_sequences.shape}")
+        if not self.num_workers:
+            return run_rollouts(self._env, snapshot, action_sequences)
+        chunks = np.array_split(action_sequences, self.num_workers)
+        chunks = [chunk for chunk in chunks if len(chunk)]
+        pipes = self.parent_pipes[:len(chunks)]
+        for pipe, chunk in zip(pipes, chunks):
+            pipe.send(("rollout", (snapshot, chunk)))
+        results = self._receive(pipes)
+        return tuple(np.concatenate(arrays) for arrays in zip(*results))
+
+    def close(self):
+        """
+        Stops the worker processes.
+        """
+        if not self.num_workers:
+            self._env.close()
+            return
+        for pipe, process in zip(self.parent_pipes, self.processes):
+            if process.is_alive():
+                pipe.send(("close", None))
+                pipe.recv()
+            pipe.close()
+            process.join()
+        self.parent_pipes, self.processes = [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
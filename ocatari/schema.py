@@ -0,0 +1,212 @@
+"""
+Per class schemas of the game objects (ram and vision): their public properties, neurosymbolic meanings,
+types and feature names, computed once per class instead of introspecting every object
+(see :func:`object_schema`). Used for the dataset export, the overlay labels and the feature names
+of the neurosymbolic states.
+"""
+
+import dis
+from operator import attrgetter
+
+# Public names that are not properties of the objects (constants and aliases
+# of other properties)
+IGNORED_PROPERTIES = ("properties", "GET_COLOR", "GET_WH", "xy", "wh",
+                      "prev_xy", "h_coords", "xywh")
+_SCHEMAS = {}
+
+
+def _class_properties(cls):
+    # The public, non callable attributes of the class: properties, slots
+    # and class constants
+    names = set()
+    for name in dir(cls):
+        if name.startswith("_") or name in IGNORED_PROPERTIES:
+            continue
+        attr = getattr(cls, name)
+        if isinstance(attr, property) or not callable(attr):
+            names.add(name)
+    return names
+
+
+def _instance_attributes(cls):
+    # The attributes of the objects of the classes without slots: the
+    # annotated ones, and the ones the methods of the class set on their first
+    # argument (`self.name = ...`, e.g. in the constructors)
+    names = set()
+    for klass in cls.__mro__:
+        names.update(getattr(klass, "__annotations__", ()))
+        for attr in vars(klass).values():
+            code = getattr(attr, "__code__", None)
+            if code is None or not code.co_argcount:
+                continue
+            self_name = code.co_varnames[0]
+            loaded = None
+            for instruction in dis.get_instructions(code):
+                if instruction.opname == "STORE_ATTR" and loaded == self_name:
+                    names.add(instruction.argval)
+                loaded = instruction.argval if instruction.opname == "LOAD_FAST" else None
+    return {name for name in names
+            if not name.startswith("_") and name not in IGNORED_PROPERTIES}
+
+
+def _arity(ns_type):
+    # The number of values of a `_ns_types` entry, e.g. 2 for Tuple[int, int]
+    args = getattr(ns_type, "__args__", None)
+    return len(args) if args else 1
+
+
+def ns_feature_names(meaning, types, length):
+    """
+    The names of the values of a neurosymbolic representation of the given length: the entries of the
+    `_ns_meaning` list, expanded according to the `_ns_types` (e.g. `POSITION_0`, `POSITION_1`),
+    or the comma separated names of a `_ns_meaning` string (e.g. `x, y`). If they do not match the length
+    (e.g. a `_nsrepr` overridden without its meaning), the values are named `ns_0`, `ns_1`, ...
+
+    :rtype: tuple of str
+    """
+    if isinstance(meaning, str):
+        names = [m.strip() for m in meaning.split(",")]
+    elif meaning is not None:
+        names = []
+        for i, m in enumerate(meaning):
+            arity = 1
+            if types is not None and i < len(types):
+                arity = _arity(types[i])
+            if arity == 1:
+                names.append(m)
+            else:
+                names.extend(f"{m}_{k}" for k in range(arity))
+    else:
+        names = []
+    if len(names) != length:
+        names = [f"ns_{k}" for k in range(length)]
+    return tuple(names)
+
+
+class ObjectSchema:
+    """
+    The schema of a game object class, computed once from the class (see :func:`object_schema`): its properties,
+    slots, annotations and the attributes its methods set. The attributes the detectors set from outside the class
+    have to be declared by it (e.g. in the constructor).
+
+    :param cls: The game object class
+    :type cls: type
+    :param ns_meaning: The neurosymbolic meaning of the objects, as their `_ns_meaning` property.
+    :type ns_meaning: list or str
+    :param ns_types: The types of the neurosymbolic meanings, as the `_ns_types` property of the objects.
+    :type ns_types: list
+
+    :ivar category: The class name (e.g. `Player`).
+    :vartype category: str
+    :ivar properties: The public properties of the objects (as the former `GameObject.properties`), sorted.
+    :vartype properties: tuple of str
+    :ivar ns_meaning: The neurosymbolic meaning (`_ns_meaning`) of the objects.
+    :vartype ns_meaning: list or str
+    :ivar ns_types: The types of the neurosymbolic meanings (`_ns_types`), None if not defined (vision).
+    :vartype ns_types: list
+    :ivar has_value: Whether the objects have a `value` (e.g. scores, ValueObject).
+    :vartype has_value: bool
+    """
+
+    __slots__ = ("cls", "category", "properties", "ns_meaning", "ns_types",
+                 "has_value", "_getter", "_ns_names")
+
+    def __init__(self, cls, ns_meaning=None, ns_types=None):
+        self.cls = cls
+        self.category = cls.__name__
+        names = _class_properties(cls)
+        if "__dict__" in dir(cls):
+            names.update(_instance_attributes(cls))
+        self.properties = tuple(sorted(names))
+        self.ns_meaning = ns_meaning
+        self.ns_types = ns_types
+        self.has_value = "value" in names
+        self._getter = None
+        if self.properties:
+            self._getter = attrgetter(*self.properties)
+        self._ns_names = {}
+
+    def values(self, obj):
+        """
+        The values of the properties of an object of the class, in the order of :attr:`properties`.
+
+        :rtype: tuple
+        """
+        if self._getter is None:
+            return ()
+        if len(self.properties) == 1:
+            return (self._getter(obj),)
+        return self._getter(obj)
+
+    def as_dict(self, obj):
+        """
+        The properties of an object of the class, by name.
+
+        :rtype: dict
+        """
+        return dict(zip(self.properties, self.values(obj)))
+
+    def ns_names(self, length):
+        """
+        The names of the values of the neurosymbolic representation (`_nsrepr`) of the objects,
+        see :func:`ns_feature_names`.
+
+        :param length: The length of the representation (`len(obj._nsrepr)`)
+        :type length: int
+        :rtype: tuple of str
+        """
+        names = self._ns_names.get(length)
+        if names is None:
+            names = ns_feature_names(self.ns_meaning, self.ns_types, length)
+            self._ns_names[length] = names
+        return names
+
+    def __repr__(self):
+        return f"ObjectSchema({self.category}, properties={list(self.properties)})"
+
+
+def object_schema(obj):
+    """
+    The schema of the class of a game object (ram or vision), computed at the first call for the class.
+    The neurosymbolic meaning and types, properties of the objects, are read from the given one.
+
+    :param obj: A game object
+    :type obj: GameObject
+    :rtype: ObjectSchema
+    """
+    schema = _SCHEMAS.get(obj.__class__)
+    if schema is None:
+        schema = ObjectSchema(obj.__class__,
+                              getattr(obj, "_ns_meaning", None),
+                              getattr(obj, "_ns_types", None))
+        _SCHEMAS[obj.__class__] = schema
+    return schema
+
+
+def export_objects(objects, tables=None):
+    """
+    Appends the properties of the objects (e.g. `env.objects` of a frame) to tables of rows, one table
+    per category, whose columns are the :attr:`ObjectSchema.properties` of the category. The empty slots
+    (None) are skipped. Calling it on every frame of a dataset gives tables that can be loaded at once,
+    e.g. with `pandas.DataFrame.from_records(rows, columns=object_schema(obj).properties)`.
+
+    :param objects: The objects to export
+    :type objects: list of GameObject
+    :param tables: The tables to append the rows to, by category (a new dict if None)
+    :type tables: dict of str: list of tuple
+    :return: The tables
+    :rtype: dict of str: list of tuple
+    """
+    if tables is None:
+        tables = {}
+    for obj in objects:
+        if obj is None:
+            continue
+        schema = _SCHEMAS.get(obj.__class__)
+        if schema is None:
+            schema = object_schema(obj)
+        rows = tables.get(schema.category)
+        if rows is None:
+            rows = tables[schema.category] = []
+        rows.append(schema.values(obj))
+    return tables
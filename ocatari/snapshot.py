@@ -0,0 +1,252 @@
+"""
+Snapshots of OCAtari environments: emulator state, object slots, observation stacks and game module state,
+captured and restored together (see :meth:`ocatari.core.OCAtari.snapshot`).
+"""
+
+import dis
+from copy import deepcopy
+import numpy as np
+from ocatari.ram.game_objects import GameObject as RamGameObject, NoObject as RamNoObject, object_state, \
+    set_object_state
+from ocatari.vision.game_objects import GameObject as VisionGameObject, NoObject as VisionNoObject
+
+# Attribute values copied (one level) with the objects, the others
+# are immutable or shared
+_MUTABLE_TYPES = (list, dict, set, np.ndarray)
+# Empty slots, whose attributes are all immutable
+_EMPTY_TYPES = (RamNoObject, VisionNoObject)
+_OBJECT_TYPES = (RamGameObject, VisionGameObject)
+_MODULE_STATE_NAMES = {}
+
+
+class _Absent:
+    # A global variable of the detection state that is not defined (yet)
+    # in its module
+    __slots__ = ()
+
+    def __repr__(self):
+        return "ABSENT"
+
+
+ABSENT = _Absent()
+# Values of the module state shared by the snapshots, without copy
+_IMMUTABLE_TYPES = (int, float, bool, str, bytes, type(None), _Absent)
+
+
+def assigned_globals(*functions):
+    """
+    The global variables assigned (`global` statements) by the given functions, or their nested functions.
+
+    :rtype: set of str
+    """
+    found = set()
+    codes = [f.__code__ for f in functions if hasattr(f, "__code__")]
+    while codes:
+        code = codes.pop()
+        for instr in dis.get_instructions(code):
+            if instr.opname == "STORE_GLOBAL":
+                found.add(instr.argval)
+        codes.extend(const for const in code.co_consts
+                     if hasattr(const, "co_code"))
+    return found
+
+
+def module_state_names(module):
+    """
+    The global variables of a game module that its functions assign (`global` statements),
+    i.e. the detection state kept outside of the objects.
+
+    :rtype: tuple of str
+    """
+    names = _MODULE_STATE_NAMES.get(module.__name__)
+    if names is None:
+        functions = []
+        for obj in vars(module).values():
+            if getattr(obj, "__module__", None) != module.__name__:
+                continue
+            if isinstance(obj, type):
+                # methods and properties of the game objects
+                for attr in vars(obj).values():
+                    functions.extend([attr, getattr(attr, "fget", None),
+                                      getattr(attr, "fset", None)])
+            else:
+                functions.append(obj)
+        names = tuple(sorted(assigned_globals(*functions)))
+        _MODULE_STATE_NAMES[module.__name__] = names
+    return names
+
+
+def copy_object(obj):
+    """
+    Copies a game object: its attributes, and one level of its mutable attributes (lists, dicts, arrays).
+    """
+    cls = obj.__class__
+    new = cls.__new__(cls)
+    state = object_state(obj)
+    if cls not in _EMPTY_TYPES:
+        for key, value in state.items():
+            if isinstance(value, _MUTABLE_TYPES):
+                state[key] = value.copy()
+    set_object_state(new, state)
+    return new
+
+
+def copy_objects(objects, memo=None):
+    """
+    Copies a list of object slots, in O(objects). An object present in several slots
+    (or lists sharing the same `memo`) is copied once. Empty slots (None) are kept.
+    """
+    if memo is None:
+        memo = {}
+    copied = []
+    for obj in objects:
+        if obj is None:
+            copied.append(obj)
+            continue
+        new = memo.get(id(obj))
+        if new is None:
+            new = memo[id(obj)] = copy_object(obj)
+        copied.append(new)
+    return copied
+
+
+def copy_state(value, memo):
+    """
+    Copies a global variable of a game module: the immutable values are shared, the containers
+    (lists, dicts, sets, tuples, arrays) copied recursively and the game objects copied as the slots
+    (sharing `memo` with :func:`copy_objects`, such that an object in the slots is copied once).
+    Other values are deep copied.
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, list):
+        return [copy_state(v, memo) for v in value]
+    if isinstance(value, dict):
+        return {k: copy_state(v, memo) for k, v in value.items()}
+    if isinstance(value, tuple):
+        copied = tuple(copy_state(v, memo) for v in value)
+        return value if all(c is v for c, v in zip(copied, value)) else copied
+    if isinstance(value, (set, np.ndarray)):
+        return value.copy()
+    if isinstance(value, _OBJECT_TYPES):
+        return copy_objects([value], memo)[0]
+    return deepcopy(value, memo)
+
+
+def _elapsed_steps_wrappers(env):
+    # The wrappers counting the steps of the episode (e.g. TimeLimit)
+    wrappers = []
+    while env is not None:
+        if hasattr(env, "_elapsed_steps"):
+            wrappers.append(env)
+        env = getattr(env, "env", None)
+    return wrappers
+
+
+class Snapshot:
+    """
+    The full state of an OCAtari environment at a given step. It is only read when restoring,
+    such that a snapshot can be restored any number of times.
+
+    :ivar ale_state: The emulator state (including its random generator).
+    :vartype ale_state: ale_py.ALEState
+    :ivar objects: The copied object slots.
+    :vartype objects: list of GameObject
+    :ivar objects_v: The copied vision object slots (mode `both`), else None.
+    :vartype objects_v: list of GameObject
+    :ivar stacks: The frames of the observation stacks, by stack name (`ori`, `dqn`, `obj`), and of the
+                  trajectory history (`history`, captured even without the stacks).
+    :vartype stacks: dict of str: np.ndarray
+    :ivar module_state: The (copied) detection state of the game modules, by (module name, global variable),
+                        see :attr:`ocatari.extraction.ExtractionPlan.module_state`.
+    :vartype module_state: dict
+    :ivar elapsed_steps: The step counters of the time limit wrappers.
+    :vartype elapsed_steps: list of int
+    :ivar sticky: The state of the sticky actions (see :meth:`ocatari.sticky.StickyActionALE.get_state`),
+                  None without sticky actions.
+    :vartype sticky: tuple
+    """
+
+    __slots__ = ("ale_state", "objects", "objects_v", "stacks", "module_state",
+                 "elapsed_steps", "sticky")
+
+    def __init__(self, ale_state, objects, objects_v=None, stacks=None,
+                 module_state=None, elapsed_steps=None, sticky=None):
+        self.ale_state = ale_state
+        self.objects = objects
+        self.objects_v = objects_v
+        self.stacks = stacks or {}
+        self.module_state = module_state or {}
+        self.elapsed_steps = elapsed_steps or []
+        self.sticky = sticky
+
+    def __repr__(self):
+        nb_objects = sum(1 for o in self.objects if o)
+        return (f"Snapshot({nb_objects} objects, stacks={list(self.stacks)}, "
+                f"module_state={list(self.module_state)})")
+
+
+def _plans(env):
+    plans = (getattr(env, "_ram_plan", None),
+             getattr(env, "_vision_plan", None))
+    return [plan for plan in plans if plan is not None]
+
+
+def _stacks(env):
+    return (("ori", env._state_buffer_rgb), ("dqn", env._state_buffer_dqn),
+            ("obj", env._state_buffer_ns))
+
+
+def take_snapshot(env, stacks=True):
+    """
+    Captures the state of an OCAtari environment, see :meth:`ocatari.core.OCAtari.snapshot`.
+    """
+    memo = {}
+    objects = copy_objects(env.objects, memo)
+    objects_v = None
+    if env.mode == "both":
+        objects_v = copy_objects(env.objects_v, memo)
+    frames = {}
+    if stacks:
+        for name, stack in _stacks(env):
+            if stack is not None and len(stack):
+                frames[name] = stack.view().copy()
+    history = getattr(env, "history", None)
+    if history is not None and len(history):
+        frames["history"] = history.frames.copy()
+    module_state = {}
+    for plan in _plans(env):
+        for name, value in plan.module_state.items():
+            key = (plan.module.__name__, name)
+            module_state[key] = copy_state(value, memo)
+    elapsed = [w._elapsed_steps for w in _elapsed_steps_wrappers(env._env)]
+    sticky = env._sticky.get_state() if env._sticky is not None else None
+    return Snapshot(env._ale.cloneState(include_rng=True), objects, objects_v,
+                    frames, module_state, elapsed, sticky)
+
+
+def restore_snapshot(env, snapshot):
+    """
+    Restores a snapshot in an OCAtari environment, see :meth:`ocatari.core.OCAtari.restore`.
+    """
+    env._ale.restoreState(snapshot.ale_state)
+    if snapshot.sticky is not None:
+        env._sticky.set_state(snapshot.sticky)
+    memo = {}
+    # in place, to keep the pooled slots
+    # (see ocatari.ram.game_objects.ObjectSlots)
+    env.objects[:] = copy_objects(snapshot.objects, memo)
+    if snapshot.objects_v is not None:
+        env.objects_v[:] = copy_objects(snapshot.objects_v, memo)
+    for name, stack in _stacks(env):
+        if stack is not None and name in snapshot.stacks:
+            stack.restore(snapshot.stacks[name])
+    history = getattr(env, "history", None)
+    if history is not None and "history" in snapshot.stacks:
+        history.restore(snapshot.stacks["history"])
+    plans = {plan.module.__name__: plan for plan in _plans(env)}
+    for (module_name, name), value in snapshot.module_state.items():
+        plans[module_name].module_state[name] = copy_state(value, memo)
+    wrappers = _elapsed_steps_wrappers(env._env)
+    for wrapper, steps in zip(wrappers, snapshot.elapsed_steps):
+        wrapper._elapsed_steps = steps
@@ -0,0 +1,105 @@
+"""
+Sticky actions (Machado et al., 2018) applied by OCAtari instead of ALE, with `exact_snapshots`
+(see :class:`ocatari.core.OCAtari`). ALE keeps the repeated action outside of its states, such that a restored state
+would continue with the action played before the restore. Applied here, the repeated action and the random generator
+deciding the repetitions are part of the snapshots (see :meth:`ocatari.core.OCAtari.snapshot`).
+"""
+
+import inspect
+from random import Random
+
+# The action ALE repeats after a reset (PLAYER_A_NOOP)
+NOOP = 0
+
+
+def repeat_action_probability(env):
+    """
+    The sticky action probability an ALE environment was made with (0.25 for the v5 ones).
+
+    :param env: The gymnasium environment, e.g. made from `ALE/Pong-v5` or `Pong`
+    :type env: gymnasium.Env
+    :rtype: float
+    """
+    from ale_py.env import AtariEnv
+    kwargs = env.spec.kwargs if env.spec is not None else {}
+    if "repeat_action_probability" in kwargs:
+        return kwargs["repeat_action_probability"]
+    parameters = inspect.signature(AtariEnv).parameters
+    return parameters["repeat_action_probability"].default
+
+
+def use_sticky_actions(env):
+    """
+    Moves the sticky actions of an ALE environment from ALE to a :class:`StickyActionALE`, with the same probability.
+
+    :param env: The gymnasium environment, e.g. made from `ALE/Pong-v5`
+    :type env: gymnasium.Env
+    :return: The sticky actions the environment acts through, None if it has none.
+    :rtype: StickyActionALE
+    """
+    probability = repeat_action_probability(env)
+    if probability <= 0:
+        return None
+    atari_env = env.unwrapped
+    # the settings of ALE are applied when loading the ROM (with the same seed)
+    atari_env.ale.setFloat("repeat_action_probability", 0.)
+    atari_env.load_game()
+    atari_env.ale = StickyActionALE(atari_env.ale, probability)
+    return atari_env.ale
+
+
+class StickyActionALE:
+    """
+    Wraps the ALE interface of an environment (created without sticky actions): at every frame, the previous
+    action is repeated with probability `repeat_action_probability` instead of the given one, as ALE does.
+    The other methods are forwarded to the wrapped interface.
+
+    :param ale: The ALE interface, never repeating the actions itself.
+    :type ale: ale_py.ALEInterface
+    :param repeat_action_probability: The probability to repeat the previous action at every frame.
+    :type repeat_action_probability: float
+    """
+
+    __slots__ = ("ale", "repeat_action_probability", "action", "strength",
+                 "rng")
+
+    def __init__(self, ale, repeat_action_probability):
+        self.ale = ale
+        self.repeat_action_probability = repeat_action_probability
+        self.action = NOOP
+        self.strength = 1.
+        self.rng = Random(ale.getInt("random_seed"))
+
+    def act(self, action, paddle_strength=1.):
+        if self.rng.random() >= self.repeat_action_probability:
+            self.action = action
+            self.strength = paddle_strength
+        return self.ale.act(self.action, self.strength)
+
+    def reset_game(self):
+        self.action = NOOP
+        self.strength = 1.
+        self.ale.reset_game()
+
+    def setInt(self, key, value):
+        # the seed of ALE (see ale_py.env.AtariEnv.seed_game) also
+        # seeds the repetitions
+        if key == "random_seed":
+            self.rng.seed(int(value))
+        self.ale.setInt(key, value)
+
+    def get_state(self):
+        """
+        The repeated action, its paddle strength and the state of the random generator (immutable).
+        """
+        return self.action, self.strength, self.rng.getstate()
+
+    def set_state(self, state):
+        """
+        Restores a state returned by :meth:`get_state`.
+        """
+        self.action, self.strength, rng_state = state
+        self.rng.setstate(rng_state)
+
+    def __getattr__(self, name):
+        return getattr(self.ale, name)
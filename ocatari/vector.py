@@ -0,0 +1,504 @@
+"""
+Vectorized OCAtari environments, stepping many games in lockstep and batching their observations.
+"""
+
+import numpy as np
+import gymnasium as gym
+from gymnasium.vector.utils import batch_space
+from ocatari.core import OCAtari
+from ocatari.object_table import stack_tables
+
+try:
+    from gymnasium.vector import AutoresetMode
+except ImportError:  # gymnasium < 1.1
+    AutoresetMode = None
+
+
+def _get_seeds(seed, num_envs):
+    if seed is None or isinstance(seed, int):
+        seeds = [None if seed is None else seed + i for i in range(num_envs)]
+    else:
+        seeds = list(seed)
+    if len(seeds) != num_envs:
+        raise ValueError(f"Expected {num_envs} seeds, got {len(seeds)}")
+    return seeds
+
+
+class OCAtariVectorEnv(gym.vector.VectorEnv):
+    """
+    A vector environment owning `num_envs` OCAtari instances of the same game, that are stepped in lockstep.
+    The observations of all environments are of shape (num_envs, buffer_window_size, \\*obs_shape),
+    e.g. (num_envs, 4, state_size) for `obs_mode="obj"`. The frames are written into a single preallocated
+    ring buffer (see :class:`ocatari.buffers.FrameStack`): a step writes one frame per environment, and the windows
+    are read as a view on the buffer. Environments that are terminated or truncated are automatically reset.
+    Every environment keeps its own detection state of the game module (see
+    :attr:`ocatari.extraction.ExtractionPlan.module_state`).
+
+    :param env_name: The name of the Atari gymnasium environment e.g. "Pong" or "ALE/Pong-v5"
+    :type env_name: str
+    :param num_envs: The number of environments to run in lockstep.
+    :type num_envs: int
+    :param mode: The detection method type: one of `ram`, `vision`, or `both`
+    :type mode: str
+    :param hud: Whether to include or not objects from the HUD (e.g. scores, lives)
+    :type hud: bool
+    :param obs_mode: The observation mode, `obj` or one of the `dqn` variants (see :class:`ocatari.core.OCAtari`).
+    :type obs_mode: str
+    :param buffer_window_size: The size of the buffer window for observation stacks.
+    :type buffer_window_size: int
+    :param autoreset_mode: `NextStep` (gymnasium default, an env is reset on the step after it finished)
+                           or `SameStep` (reset right away, the final observation is given in `infos["final_obs"]`)
+    :type autoreset_mode: str
+    :param history_length: If given, the trajectory history of every environment is enabled with this length
+                           (see :meth:`ocatari.core.OCAtari.enable_history`).
+    :type history_length: int
+    :param history_features: Whether to append the kinematic features of the history to the `obj` observations.
+    :type history_features: bool
+
+    The remaining \\*args and \\**kwargs will be passed to every :class:`ocatari.core.OCAtari`.
+    """
+
+    def __init__(self, env_name, num_envs, mode="ram", hud=False,
+                 obs_mode="obj", buffer_window_size=4,
+                 autoreset_mode="NextStep", history_length=None,
+                 history_features=False, *args, **kwargs):
+        super().__init__()
+        if obs_mode == "obj":
+            self._write_frame = self._write_frame_obj
+        elif "dqn" in obs_mode:
+            self._write_frame = self._write_frame_dqn
+        else:
+            raise AttributeError(
+                f"obs_mode '{obs_mode}' is not supported by the vector environment")
+        self.envs = [OCAtari(env_name, mode=mode, hud=hud, obs_mode=obs_mode,
+                             buffer_window_size=buffer_window_size,
+                             create_buffer_stacks=[], *args, **kwargs)
+                     for _ in range(num_envs)]
+        if history_length:
+            for env in self.envs:
+                env.enable_history(history_length, history_features)
+        self.num_envs = num_envs
+        self.buffer_window_size = buffer_window_size
+        autoreset_mode = getattr(autoreset_mode, "value", autoreset_mode)
+        self.autoreset_mode = str(autoreset_mode)
+        if self.autoreset_mode not in ("NextStep", "SameStep"):
+            raise ValueError(
+                f"Unsupported autoreset mode: {autoreset_mode}")
+
+        env = self.envs[0]
+        self.metadata = dict(env._env.metadata)
+        self.metadata["autoreset_mode"] = self.autoreset_mode if AutoresetMode is None \
+            else AutoresetMode(self.autoreset_mode)
+        self.render_mode = env.render_mode
+        self.single_observation_space = env._env.observation_space
+        self.single_action_space = env.action_space
+        self.observation_space = batch_space(
+            self.single_observation_space, num_envs)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+
+        # Preallocated buffers, shared by every step. Every frame is written
+        # twice in the ring buffer of 2 * buffer_window_size frames, such that
+        # the windows are the frames [pos, pos + window)
+        frame_shape = self.single_observation_space.shape[1:]
+        self._frames = np.zeros(
+            (num_envs, 2 * buffer_window_size) + frame_shape,
+            dtype=self.single_observation_space.dtype)
+        self._pos = 0
+        self._rewards = np.zeros((num_envs,), dtype=np.float64)
+        self._terminations = np.zeros((num_envs,), dtype=np.bool_)
+        self._truncations = np.zeros((num_envs,), dtype=np.bool_)
+        self._autoreset_envs = np.zeros((num_envs,), dtype=np.bool_)
+
+    @property
+    def _observations(self):
+        # The windows of all environments (oldest frame first), as a view
+        # on the ring buffer
+        return self._frames[:, self._pos:self._pos + self.buffer_window_size]
+
+    def _write_frame_obj(self, i, env):
+        self._write(i, env._write_ns_state())
+
+    def _write_frame_dqn(self, i, env):
+        self._write(i, env._get_dqn_frame())
+
+    def _write(self, i, frame):
+        # Writes the newest frame of an environment, at the end of its window
+        frames, last = self._frames[i], self._pos - 1
+        frames[last] = frame
+        frames[last + self.buffer_window_size] = frames[last]
+
+    def _reset_env(self, i, **kwargs):
+        env = self.envs[i]
+        _, info = env._reset_env(**kwargs)
+        self._write_frame(i, env)
+        # Fill the whole window with the initial frame, as OCAtari does
+        self._frames[i] = self._frames[i, self._pos - 1]
+        env._timer.stop("reset", info)
+        return info
+
+    def _reset(self, seeds, options=None):
+        infos = {}
+        self._pos = 0
+        for i, s in enumerate(seeds):
+            info = self._reset_env(i, seed=s, options=options)
+            infos = self._add_info(infos, info, i)
+        self._rewards[:] = 0
+        self._terminations[:] = False
+        self._truncations[:] = False
+        self._autoreset_envs[:] = False
+        return infos
+
+    def _step(self, actions):
+        # Move every window by one frame at once, the new frames are written at
+        # their last position
+        self._pos = self._pos % self.buffer_window_size + 1
+        infos = {}
+        for i, (env, action) in enumerate(zip(self.envs, actions)):
+            if self._autoreset_envs[i]:  # only happens in NextStep mode
+                info = self._reset_env(i)
+                self._rewards[i] = 0.
+                self._terminations[i] = False
+                self._truncations[i] = False
+            else:
+                (_, self._rewards[i], self._terminations[i],
+                 self._truncations[i], info) = env._step_env(action)
+                self._write_frame(i, env)
+                env._timer.stop("step", info)
+                done = self._terminations[i] or self._truncations[i]
+                if self.autoreset_mode == "SameStep" and done:
+                    final = {"final_obs": self._observations[i].copy(),
+                             "final_info": info}
+                    infos = self._add_info(infos, final, i)
+                    info = self._reset_env(i)
+            infos = self._add_info(infos, info, i)
+
+        if self.autoreset_mode == "NextStep":
+            np.logical_or(self._terminations, self._truncations,
+                          out=self._autoreset_envs)
+        return infos
+
+    def reset(self, *, seed=None, options=None):
+        """
+        Resets all environments and returns the batched initial observations and infos.
+
+        :param seed: A single seed (the i-th env is seeded with `seed + i`) or a list of seeds.
+        :type seed: int or list
+        :param options: Options passed to the reset of every environment.
+        :type options: dict
+        """
+        infos = self._reset(_get_seeds(seed, self.num_envs), options)
+        return self._observations.copy(), infos
+
+    def step(self, actions):
+        """
+        Steps every environment with its action and returns the batched
+        (observations, rewards, terminations, truncations, infos).
+        """
+        infos = self._step(actions)
+        return (self._observations.copy(), self._rewards.copy(),
+                self._terminations.copy(), self._truncations.copy(), infos)
+
+    def render(self):
+        """
+        Returns the rendered frames of every environment.
+        """
+        return tuple(env.render() for env in self.envs)
+
+    @property
+    def objects(self):
+        """
+        The list of detected objects of every environment.
+        """
+        return [env.objects for env in self.envs]
+
+    @property
+    def object_tables(self):
+        """
+        The objects of every environment as a single structured array of shape (num_envs, nb_slots),
+        see :class:`ocatari.object_table.ObjectTable`.
+
+        :rtype: np.ndarray
+        """
+        return stack_tables([env.object_table for env in self.envs])
+
+    def close_extras(self, **kwargs):
+        for env in self.envs:
+            env.close()
+
+
+def _shared_array(raw, shape, dtype):
+    return np.frombuffer(raw, dtype=dtype).reshape(shape)
+
+
+def _merge_infos(infos, worker_infos, start, num_envs):
+    # Writes the batched infos of a worker (for its envs) into the infos
+    # of all envs
+    for key, value in worker_infos.items():
+        if isinstance(value, dict):
+            _merge_infos(infos.setdefault(key, {}), value,
+                         start, num_envs)
+            continue
+        if key not in infos:
+            infos[key] = np.zeros(
+                (num_envs,) + value.shape[1:], dtype=value.dtype)
+        infos[key][start:start + len(value)] = value
+    return infos
+
+
+def _async_worker(pipe, parent_pipe, start, num_envs, env_kwargs, shared):
+    parent_pipe.close()
+    try:
+        venv = OCAtariVectorEnv(num_envs=num_envs, **env_kwargs)
+        # The sub vector env writes its results directly into the shared memory
+        buffers = {}
+        for name, (raw, shape, dtype) in shared.items():
+            buffers[name] = _shared_array(raw, shape, dtype)[
+                start:start + num_envs]
+        venv._frames = buffers["frames"]
+        venv._rewards = buffers["rewards"]
+        venv._terminations = buffers["terminations"]
+        venv._truncations = buffers["truncations"]
+        rams, ns_states = buffers["rams"], buffers["ns_states"]
+        pipe.send((None, True))
+    except Exception as err:
+        pipe.send((f"{type(err).__name__}: {err}", False))
+        return
+
+    while True:
+        command, data = pipe.recv()
+        try:
+            if command == "step":
+                infos = venv._step(data)
+            elif command == "reset":
+                infos = venv._reset(*data)
+            elif command == "close":
+                venv.close()
+                pipe.send((None, True))
+                break
+            else:
+                raise RuntimeError(f"Unknown command: {command}")
+            for j, env in enumerate(venv.envs):
+                rams[j] = env._ale.getRAM()
+                ns_states[j] = env._write_ns_state()
+            pipe.send((infos, True))
+        except Exception as err:
+            pipe.send((f"{type(err).__name__}: {err}", False))
+    pipe.close()
+
+
+class AsyncOCAtariVectorEnv(gym.vector.VectorEnv):
+    """
+    A vector environment distributing `num_envs` OCAtari instances of the same game over worker processes.
+    Every worker steps `envs_per_worker` environments in lockstep (see :class:`OCAtariVectorEnv`) and writes
+    the observation frames, RAM states, rewards, terminations, truncations and neurosymbolic states into shared memory,
+    so that only the actions and infos are sent between the processes. As the workers step in lockstep,
+    the windows of all environments are read at the same position of the shared ring buffer.
+    This is particularly useful for the vision mode, where the object detection is CPU-bound.
+
+    :param env_name: The name of the Atari gymnasium environment e.g. "Pong" or "ALE/Pong-v5"
+    :type env_name: str
+    :param num_envs: The total number of environments.
+    :type num_envs: int
+    :param envs_per_worker: The number of environments stepped by each worker process.
+    :type envs_per_worker: int
+    :param copy: If `False`, the observations returned by `reset` and `step` are (non contiguous) views
+                 on the shared memory, that are overwritten by the next step.
+    :type copy: bool
+    :param context: The multiprocessing start method (e.g. `spawn`, `fork`), defaults to the platform's.
+    :type context: str
+
+    The remaining arguments (`mode`, `hud`, `obs_mode`, `buffer_window_size`, `autoreset_mode`, \\*args and \\**kwargs)
+    are the ones of :class:`OCAtariVectorEnv`.
+    """
+
+    def __init__(self, env_name, num_envs, envs_per_worker=1, mode="ram",
+                 hud=False, obs_mode="obj", buffer_window_size=4,
+                 autoreset_mode="NextStep", copy=True, context=None,
+                 *args, **kwargs):
+        super().__init__()
+        import multiprocessing as mp
+        ctx = mp.get_context(context)
+        self.num_envs = num_envs
+        self.copy = copy
+        env_kwargs = dict(env_name=env_name, mode=mode, hud=hud,
+                          obs_mode=obs_mode,
+                          buffer_window_size=buffer_window_size,
+                          autoreset_mode=autoreset_mode, **kwargs)
+        if args:
+            raise TypeError(
+                "AsyncOCAtariVectorEnv only passes keyword arguments to the environments")
+
+        # A dummy environment, to get the spaces and shapes of the
+        # shared buffers
+        dummy = OCAtariVectorEnv(num_envs=1, **env_kwargs)
+        self.metadata = dummy.metadata
+        self.render_mode = dummy.render_mode
+        self.autoreset_mode = dummy.autoreset_mode
+        self.single_observation_space = dummy.single_observation_space
+        self.single_action_space = dummy.single_action_space
+        self.observation_space = batch_space(
+            self.single_observation_space, num_envs)
+        self.action_space = batch_space(self.single_action_space, num_envs)
+        state_size = len(dummy.envs[0].ns_state)
+        ram_size = len(dummy.envs[0]._ale.getRAM())
+        dummy.close()
+
+        frame_shape = self.single_observation_space.shape[1:]
+        frames_shape = (num_envs, 2 * buffer_window_size) + frame_shape
+        specs = {"frames": (frames_shape, self.single_observation_space.dtype),
+                 "rams": ((num_envs, ram_size), np.uint8),
+                 "ns_states": ((num_envs, state_size), np.float32),
+                 "rewards": ((num_envs,), np.float64),
+                 "terminations": ((num_envs,), np.bool_),
+                 "truncations": ((num_envs,), np.bool_)}
+        self._shared = {}
+        for name, (shape, dtype) in specs.items():
+            dtype = np.dtype(dtype)
+            raw = ctx.RawArray("B", int(np.prod(shape)) * dtype.itemsize)
+            self._shared[name] = (raw, shape, dtype)
+        buffers = {name: _shared_array(*spec)
+                   for name, spec in self._shared.items()}
+        self.buffer_window_size = buffer_window_size
+        self._frames = buffers["frames"]
+        self._pos = 0
+        self._rams = buffers["rams"]
+        self._ns_states = buffers["ns_states"]
+        self._rewards = buffers["rewards"]
+        self._terminations = buffers["terminations"]
+        self._truncations = buffers["truncations"]
+
+        self._worker_slices = [(start, min(envs_per_worker, num_envs - start))
+                               for start in range(0, num_envs, envs_per_worker)]
+        self.parent_pipes, self.processes = [], []
+        for start, n in self._worker_slices:
+            parent_pipe, child_pipe = ctx.Pipe()
+            worker_args = (child_pipe, parent_pipe, start, n, env_kwargs,
+                           self._shared)
+            process = ctx.Process(target=_async_worker,
+                                  name=f"OCAtariWorker-{start}",
+                                  args=worker_args, daemon=True)
+            process.start()
+            child_pipe.close()
+            self.parent_pipes.append(parent_pipe)
+            self.processes.append(process)
+        self._receive_all()
+        self._waiting = None
+
+    def _receive_all(self):
+        results = [pipe.recv() for pipe in self.parent_pipes]
+        errors = [msg for msg, success in results if not success]
+        if errors:
+            raise RuntimeError(
+                "Error(s) in OCAtari worker(s): " + "; ".join(errors))
+        return [msg for msg, _ in results]
+
+    def _gather_infos(self, worker_infos):
+        infos = {}
+        for (start, _), winfos in zip(self._worker_slices, worker_infos):
+            _merge_infos(infos, winfos, start, self.num_envs)
+        return infos
+
+    def _get_obs(self):
+        # The windows of the ring buffer, at the position of the workers
+        # (see OCAtariVectorEnv._step)
+        end = self._pos + self.buffer_window_size
+        observations = self._frames[:, self._pos:end]
+        return observations.copy() if self.copy else observations
+
+    def reset_async(self, seed=None, options=None):
+        """
+        Sends the reset command to all workers, see :meth:`reset`.
+        """
+        seeds = _get_seeds(seed, self.num_envs)
+        for pipe, (start, n) in zip(self.parent_pipes, self._worker_slices):
+            pipe.send(("reset", (seeds[start:start + n], options)))
+        self._waiting = "reset"
+
+    def reset_wait(self):
+        """
+        Waits for the workers to be reset and returns the batched initial observations and infos.
+        """
+        if self._waiting != "reset":
+            raise RuntimeError(
+                "Calling `reset_wait` without any prior call to `reset_async`.")
+        self._waiting = None
+        infos = self._gather_infos(self._receive_all())
+        self._pos = 0
+        return self._get_obs(), infos
+
+    def reset(self, *, seed=None, options=None):
+        """
+        Resets all environments and returns the batched initial observations and infos.
+
+        :param seed: A single seed (the i-th env is seeded with `seed + i`) or a list of seeds.
+        :type seed: int or list
+        :param options: Options passed to the reset of every environment.
+        :type options: dict
+        """
+        self.reset_async(seed, options)
+        return self.reset_wait()
+
+    def step_async(self, actions):
+        """
+        Sends the actions to the workers, that step their environments while the caller continues.
+        """
+        if self._waiting is not None:
+            raise RuntimeError(
+                f"Calling `step_async` while waiting for a pending call to `{self._waiting}` to complete.")
+        actions = np.asarray(actions)
+        for pipe, (start, n) in zip(self.parent_pipes, self._worker_slices):
+            pipe.send(("step", actions[start:start + n]))
+        self._waiting = "step"
+
+    def step_wait(self):
+        """
+        Waits for the workers to finish their step and returns the batched
+        (observations, rewards, terminations, truncations, infos).
+        """
+        if self._waiting != "step":
+            raise RuntimeError(
+                "Calling `step_wait` without any prior call to `step_async`.")
+        self._waiting = None
+        infos = self._gather_infos(self._receive_all())
+        self._pos = self._pos % self.buffer_window_size + 1
+        return (self._get_obs(), self._rewards.copy(),
+                self._terminations.copy(), self._truncations.copy(), infos)
+
+    def step(self, actions):
+        """
+        Steps every environment with its action and returns the batched
+        (observations, rewards, terminations, truncations, infos).
+        """
+        self.step_async(actions)
+        return self.step_wait()
+
+    @property
+    def rams(self):
+        """
+        The RAM states of all environments after the last step, in a (num_envs, 128) array.
+        """
+        return self._rams.copy() if self.copy else self._rams
+
+    @property
+    def ns_states(self):
+        """
+        The neurosymbolic states of all environments after the last step, in a (num_envs, state_size) array.
+        """
+        return self._ns_states.copy() if self.copy else self._ns_states
+
+    def close_extras(self, terminate=False, **kwargs):
+        if self._waiting is not None and not terminate:
+            self._receive_all()
+            self._waiting = None
+        for pipe, process in zip(self.parent_pipes, self.processes):
+            if terminate or not process.is_alive():
+                process.terminate()
+            else:
+                pipe.send(("close", None))
+        if not terminate:
+            for pipe, process in zip(self.parent_pipes, self.processes):
+                if process.is_alive():
+                    pipe.recv()
+        for pipe, process in zip(self.parent_pipes, self.processes):
+            pipe.close()
+            process.join()
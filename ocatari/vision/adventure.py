@@ -17,6 +17,8 @@ class Player(GameObject):
 
 # Each dragon has a different purpose that's why I thought it might be more relevant to have a class for each dragon
 class YellowDragon(GameObject):
+    __slots__ = ("alive",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [223, 192, 111]
@@ -24,6 +26,8 @@ class YellowDragon(GameObject):
 
 
 class GreenDragon(GameObject):
+    __slots__ = ("alive",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [223, 192, 111]
@@ -31,6 +35,8 @@ class GreenDragon(GameObject):
 
 
 class RedDragon(GameObject):
+    __slots__ = ("alive",)
+
     def __init__(self, *args, **kwargs):
         self.rgb = [223, 192, 111]
         self.alive = True
@@ -36,36 +36,48 @@ colored_objects_colors = {
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 236, 236
 
 
 class Building(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 184, 70, 162
 
 
 class Enemy25(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 195, 164, 61
 
 
 class Enemy50(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 195, 164, 61
 
 
 class Enemy75(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 195, 164, 61
 
 
 class Enemy100(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 195, 164, 61
@@ -75,6 +87,8 @@ class Enemy100(GameObject):
 
 
 class Missile(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 236, 236
@@ -91,6 +105,8 @@ class Missile(GameObject):
 
 
 class PlayerScore(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 236, 236
@@ -98,6 +114,8 @@ class PlayerScore(GameObject):
 
 
 class Lives(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
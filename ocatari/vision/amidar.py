@@ -12,6 +12,8 @@ class Player(GameObject):
 
 
 class Warrior(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [135, 183, 84]
@@ -20,6 +22,8 @@ class Warrior(GameObject):
 
 
 class Pig(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [214, 92, 92]
@@ -27,6 +31,8 @@ class Pig(GameObject):
         self.max_frames_invisible = 4
 
 class Shadow(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [1, 1, 1]
@@ -35,6 +41,8 @@ class Shadow(GameObject):
 
 
 class Chicken(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [252, 252, 84]
@@ -43,6 +51,8 @@ class Chicken(GameObject):
 
 #  ---- HUD -----
 class Score(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [252, 252, 84]
@@ -51,6 +61,8 @@ class Score(GameObject):
 
 
 class Life(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [252, 252, 84]
@@ -12,30 +12,40 @@ player_missile_colors = {"blue": [117, 181, 239], "red": [240, 128, 128]}
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 240, 128, 128
 
 
 class PlayerScore(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 184, 50, 50
 
 
 class Lives(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 184, 50, 50
 
 
 class Asteroid(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 180, 122, 48
 
 
 class PlayerMissile(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 117, 181, 239
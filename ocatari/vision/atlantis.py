@@ -30,6 +30,8 @@ objects_colors = {"sentry": [[252, 224, 112], [111, 210, 111], [84, 138, 210], [
 
 
 class Sentry(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 111, 210, 111
@@ -37,6 +39,8 @@ class Sentry(GameObject):
 
 # No clue how the projectiles work
 class Projectile(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 125, 48, 173
@@ -44,42 +48,56 @@ class Projectile(GameObject):
 
 
 class AquaPlane(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 252, 144, 144
 
 
 class DomedPalace(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 240, 170, 103
 
 
 class Generator(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 117, 231, 194
 
 
 class BridgedBazaar(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 214, 214, 214
 
 
 class AcropolisCommandPost(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 227, 151, 89
 
 
 class BanditBomber(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 125, 48, 173
 
 
 class GorgonShip(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 187, 187, 53
@@ -87,12 +105,16 @@ class GorgonShip(GameObject):
 
 # Not implemented in vision due to it having the same colors as the environment
 class Deathray(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 101, 209, 174
 
 
 class Score(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 252, 188, 116
@@ -15,6 +15,8 @@ class Player(GameObject):
 
 
 class Police(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [24, 26, 167]
@@ -23,6 +25,8 @@ class Police(GameObject):
 
 
 class Bank(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [142, 142, 142]
@@ -31,6 +35,8 @@ class Bank(GameObject):
 
 
 class Dynamite(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.num_frames_invisible = -1
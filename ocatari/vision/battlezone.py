@@ -10,54 +10,72 @@ objects_colors = {"player": [[26, 102, 26], [111, 111, 111], [74, 74, 74]], "rad
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [26, 102, 26]
 
 
 class Crosshair(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [0, 0, 0]
 
 
 class Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [236, 236, 236]
 
 
 class Radar(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [111, 210, 111]
 
 
 class Radar_Content(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [236, 236, 236]
 
 
 class Blue_Tank(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [66, 136, 176]
 
 
 class Yellow_Blue_Tank(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [195, 144, 61]
 
 
 class Red_Thing(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [200, 72, 72]
 
 
 class Boss(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [223, 183, 85]
@@ -66,12 +84,16 @@ class Boss(GameObject):
 
 
 class Score(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [252, 252, 84]
 
 
 class Life(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [252, 252, 84]
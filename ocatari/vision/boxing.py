@@ -10,6 +10,8 @@ objects_colors = {
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 214, 214, 214
@@ -17,6 +19,8 @@ class Player(GameObject):
 
 
 class Enemy(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -24,6 +28,8 @@ class Enemy(GameObject):
 
 
 class Clock(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 20, 60, 0
@@ -31,6 +37,8 @@ class Clock(GameObject):
 
 
 class PlayerScore(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 214, 214, 214
@@ -38,6 +46,8 @@ class PlayerScore(GameObject):
 
 
 class EnemyScore(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
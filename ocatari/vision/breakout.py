@@ -9,6 +9,8 @@ block_colors = list(reversed([[66, 72, 200], [72, 160, 72], [162, 162, 42],
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 200, 72, 72
@@ -16,6 +18,8 @@ class Player(GameObject):
 
 
 class Ball(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 200, 72, 72
@@ -23,6 +27,8 @@ class Ball(GameObject):
 
 
 class Block(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 66, 72, 200
@@ -30,6 +36,8 @@ class Block(GameObject):
 
 
 class PlayerScore(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 142, 142, 142
@@ -37,6 +45,8 @@ class PlayerScore(GameObject):
 
 
 class Live(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 142, 142, 142
@@ -44,6 +54,8 @@ class Live(GameObject):
 
 
 class PlayerNumber(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 142, 142, 142
@@ -17,6 +17,8 @@ class Player(GameObject):
     The player figure: Mother Kangaroo.
     """
 
+    __slots__ = ()
+
     def __init__(self, x, y, w, h):
         super(Player, self).__init__(x, y, w, h)
         self._xy = x, y
@@ -30,6 +32,8 @@ class Girlfriend(GameObject):
     Mario's Girlfriend.
     """
 
+    __slots__ = ()
+
     def __init__(self, x, y, w, h):
         super(Girlfriend, self).__init__(x, y, w, h)
         self._xy = x, y
@@ -43,6 +47,8 @@ class Barrel(GameObject):
     The Monkey monkeys.
     """
 
+    __slots__ = ()
+
     def __init__(self, x, y, w, h):
         super(Barrel, self).__init__(x, y, w, h)
         self._xy = x, y
@@ -56,6 +62,8 @@ class Hammer(GameObject):
     The collectable fruits.
     """
 
+    __slots__ = ()
+
     def __init__(self, x, y, w, h):
         super(Hammer, self).__init__(x, y, w, h)
         self._xy = x, y
@@ -69,6 +77,8 @@ class Ladder(GameObject):
     The ladders.
     """
 
+    __slots__ = ()
+
     def __init__(self, x=0, y=0, w=0, h=0):
         super(Ladder, self).__init__(x, y, w, h)
         self._xy = x, y
@@ -83,6 +93,8 @@ class Platform(GameObject):
     The platforms.
     """
 
+    __slots__ = ()
+
     def __init__(self, x=0, y=0, w=8, h=4):
         super(Platform, self).__init__(x, y, w, h)
         self._xy = x, y
@@ -97,6 +109,8 @@ class DonkeyKong(GameObject):
     The donkey kong enemy.
     """
 
+    __slots__ = ()
+
     def __init__(self, x, y, w, h):
         super(DonkeyKong, self).__init__(x, y, w, h)
         self._xy = x, y
@@ -110,6 +124,8 @@ class Score(GameObject):
     The player's score display (HUD).
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, x, y, w, h):
         super(Score, self).__init__(x, y, w, h)
         self._xy = x, y
@@ -124,6 +140,8 @@ class Life(GameObject):
     The player's remaining lives (HUD).
     """
 
+    __slots__ = ()
+
     def __init__(self, x, y, w, h):
         super(Life, self).__init__(x, y, w, h)
         self._xy = x, y
@@ -1,7 +1,6 @@
 from .utils import find_objects
 from .game_objects import GameObject
 import numpy as np
-import matplotlib as plt
 
 objects_colors = {
     "Player": [192, 192, 192], "hud_objs": [0, 0, 0]
@@ -13,6 +12,8 @@ nightcar_colors = [[200, 72, 72]]
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 192, 192, 192
@@ -20,6 +21,8 @@ class Player(GameObject):
 
 
 class Car(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 192, 192, 192
@@ -27,6 +30,8 @@ class Car(GameObject):
 
 
 class PlayerScore(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 132, 144, 252
@@ -34,6 +39,8 @@ class PlayerScore(GameObject):
 
 
 class NumberOfCars(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -41,6 +48,8 @@ class NumberOfCars(GameObject):
 
 
 class Level(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
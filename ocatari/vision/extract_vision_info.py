@@ -1,5 +1,5 @@
-import sys
 from termcolor import colored
+from ocatari.ram.extract_ram_info import load_game_module
 
 
 def detect_objects_vision(objects, obs, game_name, hud):
@@ -9,7 +9,7 @@ def detect_objects_vision(objects, obs, game_name, hud):
         if obj:
             obj._save_prev()
     try:
-        mod = sys.modules[game_module]
+        mod = load_game_module(game_module)
         mod._detect_objects
     except KeyError:
         raise NotImplementedError(
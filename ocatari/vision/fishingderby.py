@@ -8,6 +8,8 @@ objects_colors = {"shark": [0, 0, 0], "fish": [232, 232, 74],
 
 
 class Shark(GameObject):
+    __slots__ = ("direction",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -15,6 +17,8 @@ class Shark(GameObject):
 
 
 class Fish(GameObject):
+    __slots__ = ("hooked",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 232, 232, 74
@@ -22,6 +26,8 @@ class Fish(GameObject):
 
 
 class PlayerOneHook(GameObject):
+    __slots__ = ("hook_position",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 232, 232, 74
@@ -29,12 +35,16 @@ class PlayerOneHook(GameObject):
 
 
 class ScorePlayerTwo(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 167, 26, 26
 
 
 class PlayerTwoHook(GameObject):
+    __slots__ = ("hook_position",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -42,6 +52,8 @@ class PlayerTwoHook(GameObject):
 
 
 class ScorePlayerOne(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 167, 26, 26
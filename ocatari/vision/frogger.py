@@ -34,6 +34,8 @@ class Frog(GameObject):
 
 
 class Log(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 105, 105, 15
@@ -42,6 +44,8 @@ class Log(GameObject):
 
 
 class Alligator(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 105, 105, 15
@@ -50,6 +54,8 @@ class Alligator(GameObject):
 
 
 class Turtle(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, x, y, w, h, rgb=[144, 72, 17]):
         super().__init__(x, y, w, h)
         self.rgb = rgb
@@ -62,6 +68,8 @@ class Turtle(GameObject):
 
 
 class LadyFrog(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 236, 236
@@ -70,6 +78,8 @@ class LadyFrog(GameObject):
 
 
 class Snake(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 82, 126, 45
@@ -78,6 +88,8 @@ class Snake(GameObject):
 
 
 class HappyFrog(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 82, 126, 45
@@ -86,6 +98,8 @@ class HappyFrog(GameObject):
 
 
 class AlligatorHead(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 110, 156, 66
@@ -94,6 +108,8 @@ class AlligatorHead(GameObject):
 
 
 class Fly(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 110, 156, 66
@@ -102,6 +118,8 @@ class Fly(GameObject):
 
 
 class Car(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, x, y, w, h, rgb=[144, 72, 17]):
         super().__init__(x, y, w, h)
         self.rgb = rgb
@@ -1,7 +1,6 @@
 from .utils import find_objects, find_mc_objects, find_objects_in_color_range, match_objects
 from .game_objects import GameObject, NoObject
 import numpy as np
-import matplotlib as plt
 
 
 objects_colors = {
@@ -22,6 +21,8 @@ floors = [[95, 105], [120, 130], [145, 155], [170, 180]]
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 198, 108, 58
@@ -29,6 +30,8 @@ class Player(GameObject):
 
 
 class GreenFish(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 111, 210, 111
@@ -36,6 +39,8 @@ class GreenFish(GameObject):
 
 
 class FrostBite(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 84, 38, 210
@@ -43,6 +48,8 @@ class FrostBite(GameObject):
 
 
 class WhitePlate(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 214, 214, 214
@@ -50,6 +57,8 @@ class WhitePlate(GameObject):
 
 
 class BluePlate(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 84, 138, 210
@@ -57,6 +66,8 @@ class BluePlate(GameObject):
 
 
 class Bird(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 132, 144, 252
@@ -64,6 +75,8 @@ class Bird(GameObject):
 
 
 class Bear(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -71,6 +84,8 @@ class Bear(GameObject):
 
 
 class Crab(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 213, 130, 74
@@ -78,6 +93,8 @@ class Crab(GameObject):
 
 
 class Clam(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 210, 210, 64
@@ -85,6 +102,8 @@ class Clam(GameObject):
 
 
 class House(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 142, 142, 142
@@ -92,6 +111,8 @@ class House(GameObject):
 
 
 class CompletedHouse(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -99,6 +120,8 @@ class CompletedHouse(GameObject):
 
 
 class LifeCount(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 132, 144, 252
@@ -106,6 +129,8 @@ class LifeCount(GameObject):
 
 
 class PlayerScore(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 132, 144, 252
@@ -113,6 +138,8 @@ class PlayerScore(GameObject):
 
 
 class Degree(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 132, 144, 252
@@ -1,7 +1,16 @@
+from ocatari.schema import object_schema
+
+
 class GameObject:
     """
     The Parent Class of every detected object in the Atari games (Vision Processing mode)
+
+    The attributes are stored in slots (no instance dict), the subclasses without `__slots__`
+    get an instance dict for their own additional attributes.
     """
+
+    __slots__ = ("rgb", "_xy", "wh", "_prev_xy", "hud", "_visible")
+
     GET_COLOR = False
     GET_WH = False
 
@@ -234,18 +243,12 @@ class GameObject:
     @property
     def properties(self):
         """
-        All the properties of the object in a list.
+        All the properties of the object in a list, from the schema of its class (see :func:`ocatari.schema.object_schema`).
 
         :return: The properties of the object.
         :rtype: list
         """
-        ignore = ["properties", "GET_COLOR", "GET_WH",
-                  "xy", "wh", "prev_xy", "h_coords", "xywh"]
-        properties = [prop for prop in self.__dir__()]
-        [properties.remove(p) for p in ignore if p in properties]
-        return [prop for prop in properties
-                if not prop.startswith("_") and
-                not callable(self.__getattribute__(prop))]
+        return list(object_schema(self).properties)
 
 
 class NoObject(GameObject):
@@ -253,6 +256,9 @@ class NoObject(GameObject):
     This class represents a non-existent object. It is used to fill in the gaps when no object is detected.
     """
 
+    # the detectors may set attributes (e.g. `value`) on the empty slots, kept in a dict created on demand
+    __slots__ = ("nslen", "__dict__")
+
     def __init__(self, *args, **kwargs):
         super().__init__(0, 0, 0, 0)
         self.nslen = 2
@@ -10,6 +10,8 @@ birdcolors = [[195, 144, 61], [236, 236, 236], [232, 204, 99], [117, 128, 240]]
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 72, 160, 72
@@ -17,6 +19,8 @@ class Player(GameObject):
 
 
 class Gopher(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 72, 44, 0
@@ -24,6 +28,8 @@ class Gopher(GameObject):
 
 
 class Carrot(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 162, 98, 33
@@ -31,6 +37,8 @@ class Carrot(GameObject):
 
 
 class Bird(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 45, 50, 184
@@ -38,6 +46,8 @@ class Bird(GameObject):
 
 
 class Empty_block(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 223, 183, 85
@@ -45,6 +55,8 @@ class Empty_block(GameObject):
 
 
 class Score(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 195, 144, 65
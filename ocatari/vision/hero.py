@@ -96,6 +96,7 @@ class PowerBar(GameObject):
 class BombStock(GameObject):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.value = 0
 
 
 class Life(GameObject):
@@ -9,6 +9,8 @@ enemy_colors = [[200, 72, 72], [210, 182, 86], [232, 204, 99], [82, 126, 45]]
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 45, 50, 184
@@ -16,6 +18,8 @@ class Player(GameObject):
 
 
 class Enemy(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 82, 126, 45
@@ -23,6 +27,8 @@ class Enemy(GameObject):
 
 
 class Ball(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -30,6 +36,8 @@ class Ball(GameObject):
 
 
 class PlayerScore(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 84, 92, 214
@@ -37,6 +45,8 @@ class PlayerScore(GameObject):
 
 
 class EnemyScore(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 200, 96
@@ -44,6 +54,8 @@ class EnemyScore(GameObject):
 
 
 class Timer(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 84, 92, 214
@@ -21,6 +21,8 @@ class Child(GameObject):
 
 
 class Enemy(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 227, 151, 89
@@ -29,6 +31,8 @@ class Enemy(GameObject):
 
 
 class Fruit(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 214, 92, 92
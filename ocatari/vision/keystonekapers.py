@@ -57,6 +57,8 @@ class Moneybag(GameObject):
 
 
 class Elevator(GameObject):
+    __slots__ = ("is_open",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 72, 164, 164
@@ -11,6 +11,8 @@ objects_colors = {'white': [236, 236, 236], 'yellow': [232, 204, 99], 'orange':
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [228, 111, 111]
@@ -18,18 +20,24 @@ class Player(GameObject):
 
 #  ---- enemies -----
 class Skull(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [236, 236, 236]
 
 
 class Spider(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [92, 186, 92]
 
 
 class Snake(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [192, 192, 192]
@@ -37,30 +45,40 @@ class Snake(GameObject):
 
 #  ---- collectable objects -----
 class Key(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [232, 204, 99]
 
 
 class Amulet(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [210, 182, 86]
 
 
 class Torch(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [204, 216, 110]
 
 
 class Sword(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [214, 214, 214]
 
 
 class Ruby(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [213, 130, 74]
@@ -68,18 +86,24 @@ class Ruby(GameObject):
 
 #  ---- others -----
 class Barrier(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [232, 204, 99]
 
 
 class Beam(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [101, 111, 228]
 
 
 class Rope(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [232, 204, 99]
@@ -87,36 +111,48 @@ class Rope(GameObject):
 
 #  ---- HUD -----
 class Life(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [210, 182, 86]
 
 
 class Score(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [236, 236, 236]
 
 
 class Torch_HUD(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [232, 204, 99]
 
 
 class Sword_HUD(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [232, 204, 99]
 
 
 class Key_HUD(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [232, 204, 99]
 
 
 class Amulet_HUD(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = [232, 204, 99]
@@ -1,7 +1,6 @@
 from .utils import find_objects, find_mc_objects, find_rope_segments
 from .game_objects import GameObject
 import numpy as np
-import matplotlib as plt
 
 
 objects_colors = {
@@ -20,6 +19,8 @@ diamondringcolors = [[236, 236, 236], [252, 252, 84]]
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 53, 95, 24
@@ -27,6 +28,8 @@ class Player(GameObject):
 
 
 class Wall(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 167, 26, 26
@@ -34,6 +37,8 @@ class Wall(GameObject):
 
 
 class Logs(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 105, 105, 15
@@ -41,6 +46,8 @@ class Logs(GameObject):
 
 
 class StairPit(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -48,6 +55,8 @@ class StairPit(GameObject):
 
 
 class Pit(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 252, 188, 116
@@ -55,6 +64,8 @@ class Pit(GameObject):
 
 
 class Scorpion(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 236, 236
@@ -62,6 +73,8 @@ class Scorpion(GameObject):
 
 
 class Rope(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 72, 72, 0
@@ -69,6 +82,8 @@ class Rope(GameObject):
 
 
 class Snake(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 167, 26, 26
@@ -76,6 +91,8 @@ class Snake(GameObject):
 
 
 class Tarpit(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -83,6 +100,8 @@ class Tarpit(GameObject):
 
 
 class Waterhole(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 45, 109, 152
@@ -90,6 +109,8 @@ class Waterhole(GameObject):
 
 
 class Crocodile(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 20, 60, 0
@@ -97,6 +118,8 @@ class Crocodile(GameObject):
 
 
 class GoldenBar(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 252, 252, 84
@@ -104,6 +127,8 @@ class GoldenBar(GameObject):
 
 
 class SilverBar(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 142, 142, 142
@@ -111,6 +136,8 @@ class SilverBar(GameObject):
 
 
 class Fire(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 200, 96
@@ -118,6 +145,8 @@ class Fire(GameObject):
 
 
 class MoneyBag(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 111, 111, 111
@@ -125,6 +154,8 @@ class MoneyBag(GameObject):
 
 
 class DiamondRing(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 236, 236
@@ -132,6 +163,8 @@ class DiamondRing(GameObject):
 
 
 class LifeCount(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 214, 214, 214
@@ -139,6 +172,8 @@ class LifeCount(GameObject):
 
 
 class PlayerScore(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 214, 214, 214
@@ -146,6 +181,8 @@ class PlayerScore(GameObject):
 
 
 class Timer(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 214, 214, 214
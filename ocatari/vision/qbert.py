@@ -13,66 +13,88 @@ cubes_colors = [[45, 87, 176], [210, 210, 64],
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 181, 83, 40
 
 
 class Cube(GameObject):
+    __slots__ = ()
+
     def __init__(self, color, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = color
 
 
 class Disk(GameObject):
+    __slots__ = ()
+
     def __init__(self, color, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = color
 
 
 class PurpleBall(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 146, 70, 192
 
 
 class RedBall(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 223, 183, 85
 
 
 class GreenBall(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 50, 132, 50
 
 
 class Coily(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 146, 70, 192
 
 
 class Sam(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 50, 132, 50
 
 
 class FlyingDiscs(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 223, 183, 85
 
 
 class Score(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 210, 210, 64
 
 
 class Lives(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 210, 210, 64
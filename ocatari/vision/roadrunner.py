@@ -19,6 +19,8 @@ stonecolors = [[181, 83, 40], [198, 108, 58], [198, 108, 58]]
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 101, 111, 228
@@ -26,6 +28,8 @@ class Player(GameObject):
 
 
 class Enemy(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 198, 108, 58
@@ -33,6 +37,8 @@ class Enemy(GameObject):
 
 
 class BirdSeeds(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 84, 92, 214
@@ -40,6 +46,8 @@ class BirdSeeds(GameObject):
 
 
 class Truck(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 198, 108, 58
@@ -47,6 +55,8 @@ class Truck(GameObject):
 
 
 class RoadCrack(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 181, 83, 40
@@ -54,6 +64,8 @@ class RoadCrack(GameObject):
 
 
 class AcmeMine(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 84, 92, 214
@@ -61,6 +73,8 @@ class AcmeMine(GameObject):
 
 
 class Turret(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 66, 72, 200
@@ -68,6 +82,8 @@ class Turret(GameObject):
 
 
 class TurretBall(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 198, 108, 58
@@ -75,6 +91,8 @@ class TurretBall(GameObject):
 
 
 class Stone(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 181, 83, 40
@@ -82,6 +100,8 @@ class Stone(GameObject):
 
 
 class Cactus(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 187, 187, 53
@@ -89,6 +109,8 @@ class Cactus(GameObject):
 
 
 class Sign(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -96,6 +118,8 @@ class Sign(GameObject):
 
 
 class SteelShotSign(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 214, 92, 92
@@ -103,6 +127,8 @@ class SteelShotSign(GameObject):
 
 
 class AcmeMineSign(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 84, 92, 214
@@ -110,6 +136,8 @@ class AcmeMineSign(GameObject):
 
 
 class Bird(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 252, 188, 116
@@ -117,6 +145,8 @@ class Bird(GameObject):
 
 
 class PlayerScore(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -10,6 +10,8 @@ logo_c = [0, 0, 0]
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 214, 92, 92
@@ -17,6 +19,8 @@ class Player(GameObject):
 
 
 class Flag(GameObject):
+    __slots__ = ()
+
     def __init__(self, x, y, w, h, rgb):
         super().__init__(x, y, w, h)
         self.rgb = rgb
@@ -24,6 +28,8 @@ class Flag(GameObject):
 
 
 class Tree(GameObject):
+    __slots__ = ()
+
     def __init__(self, x, y, w, h, rgb):
         super().__init__(x, y, w, h)
         self.rgb = rgb
@@ -31,6 +37,8 @@ class Tree(GameObject):
 
 
 class Mogul(GameObject):
+    __slots__ = ()
+
     def __init__(self, x, y, w, h, rgb):
         super().__init__(x, y, w, h)
         self.rgb = rgb
@@ -38,6 +46,8 @@ class Mogul(GameObject):
 
 
 class Clock(GameObject):
+    __slots__ = ()
+
     def __init__(self, x, y, w, h):
         super().__init__(x, y, w, h)
         self.rgb = 0, 0, 0
@@ -45,6 +55,8 @@ class Clock(GameObject):
 
 
 class Score(GameObject):
+    __slots__ = ()
+
     def __init__(self, x, y, w, h):
         super().__init__(x, y, w, h)
         self.rgb = 0, 0, 0
@@ -38,6 +38,8 @@ class Shield(GameObject):
 
 
 class Bullet(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 142, 142, 142
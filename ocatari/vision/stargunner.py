@@ -33,6 +33,8 @@ class Bomb(GameObject):
 
 
 class FlyingEnemy(GameObject):
+    __slots__ = ("max_frames_invisible", "num_frames_invisible")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 10, 10, 10
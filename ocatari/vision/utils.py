@@ -1,11 +1,7 @@
 import numpy as np
 import cv2
-from skimage.morphology import (disk, square)  # noqa
-from skimage.morphology import (erosion, dilation, opening, closing, white_tophat, skeletonize)  # noqa
-import matplotlib.pyplot as plt
 from termcolor import colored
 from collections import Counter
-from scipy.optimize import linear_sum_assignment
 from .game_objects import NoObject
 import warnings
 
@@ -89,6 +85,7 @@ def mark_point(image_array, x, y, color=(255, 0, 0), size=1, show=False, cross=T
                     and x + i < 160 and y + j < 210:
                 image_array[y + j, x + i] = color
     if show:
+        import matplotlib.pyplot as plt
         plt.imshow(image_array)
         plt.show()
 
@@ -143,6 +140,7 @@ def showim(image):
     :param image: The image to mark the point on
     :type image: np.array
     """
+    import matplotlib.pyplot as plt
     plt.imshow(image)
     plt.show()
 
@@ -599,6 +597,7 @@ def find_objects_in_color_range(image, color_min, color_max, size=None, tol_s=10
     """    
     mask = cv2.inRange(image[miny:maxy, minx:maxx, :], np.array(color_min), np.array(color_max))
     if closing_active:
+        from skimage.morphology import closing, square
         closed = closing(mask, square(closing_dist))
         # closed = closing(closed, square(closing_dist))
     else:
@@ -684,6 +683,7 @@ def match_objects(prev_objects, objects_bb, start_idx, max_obj, ObjClass):
                 raise IndexError
     else:
         try:
+            from scipy.optimize import linear_sum_assignment
             cost_matrix = compute_cm(prev_objects[start_idx: start_idx+max_obj], objects_bb)
             obj_idx, bbs_idx = linear_sum_assignment(cost_matrix)
             for i in range(max_obj):
@@ -741,6 +741,7 @@ def match_blinking_objects(prev_objects, objects_bb, start_idx, max_obj, ObjClas
                     if flag:
                         objects_bb += [o.xywh]
                     o.num_frames_invisible += 1
+            from scipy.optimize import linear_sum_assignment
             cost_matrix = compute_cm(prev_objects[start_idx: start_idx+max_obj], objects_bb)
             obj_idx, bbs_idx = linear_sum_assignment(cost_matrix)
             for i in range(max_obj):
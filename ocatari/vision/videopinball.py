@@ -9,6 +9,8 @@ X_MAX_GAMEZONE = 153
 
 
 class Flipper(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 236, 236
@@ -16,6 +18,8 @@ class Flipper(GameObject):
 
 
 class Ball(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 104, 72, 198
@@ -23,6 +27,8 @@ class Ball(GameObject):
 
 
 class Spinner(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 236, 236, 236
@@ -30,6 +36,8 @@ class Spinner(GameObject):
 
 
 class DropTarget(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 210, 164, 74
@@ -37,6 +45,8 @@ class DropTarget(GameObject):
 
 
 class Plunger(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 187, 159, 71
@@ -44,6 +54,8 @@ class Plunger(GameObject):
 
 
 class Bumper(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 104, 72, 198
@@ -51,6 +63,8 @@ class Bumper(GameObject):
 
 
 class Score(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         value = 0
@@ -59,6 +73,8 @@ class Score(GameObject):
 
 
 class LifeUsed(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         value = 0
@@ -67,6 +83,8 @@ class LifeUsed(GameObject):
 
 
 class DifficultyLevel(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         value = 1
@@ -10,6 +10,8 @@ barrier_colors = [[162, 134, 56], [200, 72, 72], [82, 126, 45]]
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 169, 128, 240
@@ -17,6 +19,8 @@ class Player(GameObject):
 
 
 class Enemy(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 240, 240, 240
@@ -24,6 +28,8 @@ class Enemy(GameObject):
 
 
 class Swirl(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 181, 83, 40
@@ -31,6 +37,8 @@ class Swirl(GameObject):
 
 
 class Enemy_Missile(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 169, 128, 240
@@ -38,6 +46,8 @@ class Enemy_Missile(GameObject):
 
 
 class Barrier(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 163, 57, 21
@@ -45,6 +55,8 @@ class Barrier(GameObject):
 
 
 class Player_Bullet(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 169, 128, 240
@@ -52,6 +64,8 @@ class Player_Bullet(GameObject):
 
 
 class Shield_Block(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 163, 57, 21
@@ -59,6 +73,8 @@ class Shield_Block(GameObject):
 
 
 class Canon(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 163, 57, 21
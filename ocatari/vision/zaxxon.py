@@ -15,6 +15,8 @@ objects_colors = {"player": [213, 130, 74],
 
 
 class Player(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 213, 130, 74
@@ -22,6 +24,8 @@ class Player(GameObject):
 
 
 class Player_Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 213, 130, 74
@@ -29,6 +33,8 @@ class Player_Shot(GameObject):
 
 
 class Player_Shadow(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 0, 0, 0
@@ -36,6 +42,8 @@ class Player_Shadow(GameObject):
 
 
 class Hostile_Fighter(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 72, 160, 72
@@ -43,6 +51,8 @@ class Hostile_Fighter(GameObject):
 
 
 class Hostile_Shot(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 210, 164, 74
@@ -50,6 +60,8 @@ class Hostile_Shot(GameObject):
 
 
 class Hostile_Orange(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 213, 130, 74
@@ -57,6 +69,8 @@ class Hostile_Orange(GameObject):
 
 
 class Tower(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 146, 70, 192
@@ -64,6 +78,8 @@ class Tower(GameObject):
 
 
 class Fuel_Tank(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 110, 156, 66
@@ -71,6 +87,8 @@ class Fuel_Tank(GameObject):
 
 
 class Sentry(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 162, 162, 42
@@ -78,6 +96,8 @@ class Sentry(GameObject):
 
 
 class Satellite(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 184, 50, 50
@@ -85,6 +105,8 @@ class Satellite(GameObject):
 
 
 class Zaxxon(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 136, 146, 62
@@ -92,6 +114,8 @@ class Zaxxon(GameObject):
 
 
 class Score(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 198, 108, 58
@@ -99,6 +123,8 @@ class Score(GameObject):
 
 
 class Life(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 162, 162, 42
@@ -106,6 +132,8 @@ class Life(GameObject):
 
 
 class Fuel(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 162, 162, 42
@@ -113,6 +141,8 @@ class Fuel(GameObject):
 
 
 class Altitude(GameObject):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.rgb = 24, 59, 157
@@ -0,0 +1,73 @@
+"""
+Measures the batched offline extraction (see :func:`ocatari.batch.extract_batch`): the time per frame of the
+per-frame path and of the vectorized kernels, on RAM states recorded with random actions, checking that both
+give the same states.
+
+Usage:
+    python scripts/benchmarks/batch.py -g Pong Breakout SpaceInvaders -s 5000 -r 20
+"""
+
+import argparse
+import time
+import numpy as np
+
+
+def record_rams(game, steps=5000, seed=0):
+    """
+    Records the RAM states of random play, from the reset (the episodes following each other).
+
+    :rtype: np.ndarray of uint8, (steps + 1, 128)
+    """
+    from ocatari.core import OCAtari
+    env = OCAtari(f"ALE/{game}-v5", mode="ram", hud=False, obs_mode="obj")
+    env.reset(seed=seed)
+    env.action_space.seed(seed)
+    rams = [env.get_ram().copy()]
+    for _ in range(steps):
+        obs, reward, truncated, terminated, info = env.step(
+            env.action_space.sample())
+        if terminated or truncated:
+            env.reset(seed=seed)
+        rams.append(env.get_ram().copy())
+    env.close()
+    return np.array(rams)
+
+
+def run_game(game, steps=5000, repeat=20, hud=False, seed=0):
+    """
+    :return: The time per frame of the per-frame path and of the batch extraction, in microseconds.
+    :rtype: (float, float)
+    """
+    from ocatari.batch import extract_batch, extract_frames
+    rams = record_rams(game, steps, seed)
+    t0 = time.perf_counter()
+    frames = extract_frames(game, rams, hud)
+    per_frame = (time.perf_counter() - t0) / len(rams) * 1e6
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        batch = extract_batch(game, rams, hud)
+    batched = (time.perf_counter() - t0) / repeat / len(rams) * 1e6
+    if not all(np.array_equal(a, b) for a, b in zip(frames, batch)):
+        raise AssertionError(
+            f"The batch extraction of {game} differs from the per-frame path")
+    return per_frame, batched
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="OCAtari batched extraction benchmark")
+    parser.add_argument("-g", "--games", type=str, nargs="+",
+                        default=["Pong", "Breakout", "Freeway", "Boxing",
+                                 "Tennis", "SpaceInvaders"])
+    parser.add_argument("-s", "--steps", type=int, default=5000)
+    parser.add_argument("-r", "--repeat", type=int, default=20)
+    parser.add_argument("--hud", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'game':<16}{'per frame':>12}{'batch':>12}{'speedup':>10}  (us/frame)")
+    for game in args.games:
+        per_frame, batched = run_game(
+            game, args.steps, args.repeat, args.hud, args.seed)
+        print(
+            f"{game:<16}{per_frame:>12.2f}{batched:>12.3f}{per_frame / batched:>9.0f}x")
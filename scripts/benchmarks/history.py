@@ -0,0 +1,55 @@
+"""
+Measures the cost of the trajectory history (see :meth:`ocatari.core.OCAtari.enable_history`): the time per step
+(obj observations) without the history, with the history, and with its kinematic features in the observations.
+
+Usage:
+    python scripts/benchmarks/history.py -g Pong Seaquest SpaceInvaders -s 5000 -l 8
+"""
+
+import argparse
+import time
+
+CONFIGS = {"off": None, "history": False, "features": True}
+
+
+def run_config(game, features, steps=5000, length=8, seed=0):
+    """
+    Measures the steps of a game, without the history (features None), or with it.
+
+    :return: The mean time per step, in microseconds.
+    :rtype: float
+    """
+    from ocatari.core import OCAtari
+    env = OCAtari(f"ALE/{game}-v5", mode="ram", hud=False, obs_mode="obj")
+    if features is not None:
+        env.enable_history(length, obs_features=features)
+    env.reset(seed=seed)
+    env.action_space.seed(seed)
+    actions = [env.action_space.sample() for _ in range(steps)]
+    total = 0.
+    for action in actions:
+        t0 = time.perf_counter()
+        obs, reward, truncated, terminated, info = env.step(action)
+        total += time.perf_counter() - t0
+        if terminated or truncated:
+            env.reset(seed=seed)
+    env.close()
+    return total / steps * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="OCAtari trajectory history benchmark")
+    parser.add_argument("-g", "--games", type=str, nargs="+",
+                        default=["Pong", "Seaquest", "SpaceInvaders"])
+    parser.add_argument("-s", "--steps", type=int, default=5000)
+    parser.add_argument("-l", "--length", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    header = "".join(f"{name:>12}" for name in CONFIGS)
+    print(f"{'game':<16}" + header + "  (us/step)")
+    for game in args.games:
+        times = [run_config(game, features, args.steps, args.length,
+                            args.seed) for features in CONFIGS.values()]
+        print(f"{game:<16}" + "".join(f"{t:>12.1f}" for t in times))
@@ -0,0 +1,83 @@
+"""
+Memory and attribute access time of the game objects (ram and vision): the bytes allocated per object
+and the time of the common accesses (`x`, `xy`, `xywh`, `dx`, setting `xy`, `_save_prev`, `properties`).
+
+Usage:
+    python scripts/benchmarks/objects.py -n 100000
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+ACCESSES = {
+    "x": "obj.x",
+    "xy": "obj.xy",
+    "xywh": "obj.xywh",
+    "dx": "obj.dx",
+    "set xy": "obj.xy = 3, 4",
+    "_save_prev": "obj._save_prev()",
+    "properties": "obj.properties",
+}
+
+
+def _classes():
+    from ocatari.ram import game_objects as ram
+    from ocatari.ram.pong import Player, PlayerScore
+    from ocatari.vision import game_objects as vision
+    return {
+        "ram.GameObject": lambda: ram.GameObject(),
+        "ram.NoObject": lambda: ram.NoObject(),
+        "ram.ValueObject": lambda: ram.ValueObject(),
+        "ram.pong.Player": lambda: Player(),
+        "ram.pong.PlayerScore": lambda: PlayerScore(),
+        "vision.GameObject": lambda: vision.GameObject(1, 2, 3, 4),
+        "vision.NoObject": lambda: vision.NoObject(),
+    }
+
+
+def object_size(make, n=100000):
+    """
+    The bytes allocated per object (including its instance dict and attributes, if any).
+
+    :rtype: float
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [make() for _ in range(n)]
+    for obj in objects:
+        obj._save_prev()  # prev_xy set, as after the first step
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return (size - n * 8) / n  # without the list
+
+
+def access_times(make, number=200000):
+    """
+    The time (in nanoseconds) of every access of `ACCESSES`.
+
+    :rtype: dict
+    """
+    obj = make()
+    obj._save_prev()
+    times = {}
+    for name, stmt in ACCESSES.items():
+        best = min(timeit.repeat(stmt, globals={"obj": obj}, number=number,
+                                 repeat=3))
+        times[name] = best / number * 1e9
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="OCAtari game objects benchmark")
+    parser.add_argument("-n", "--number", type=int, default=100000,
+                        help="Number of objects (memory).")
+    args = parser.parse_args()
+
+    header = "".join(f"{name:>12}" for name in ACCESSES)
+    print(f"{'class':<24}{'bytes':>8}" + header + "  (ns)")
+    for name, make in _classes().items():
+        times = access_times(make)
+        print(f"{name:<24}{object_size(make, args.number):>8.0f}" +
+              "".join(f"{times[a]:>12.1f}" for a in ACCESSES))
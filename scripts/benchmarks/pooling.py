@@ -0,0 +1,64 @@
+"""
+Measures the object slot pooling of the RAM extraction (see :class:`ocatari.ram.game_objects.ObjectSlots`):
+the extraction time per frame and the number of allocated objects (distinct objects put in the slots),
+with the pooled slots and with plain lists (every appearing object and `NoObject` newly allocated).
+
+Usage:
+    python scripts/benchmarks/pooling.py -g Seaquest Krull Alien CrazyClimber -s 5000
+"""
+
+import argparse
+import time
+
+POOLED_GAMES = ["Seaquest", "Breakout", "SpaceInvaders", "Krull", "Alien",
+                "CrazyClimber", "YarsRevenge"]
+
+
+def run_config(game, pooled, steps=5000, seed=0):
+    """
+    Measures the extraction of a game, with pooled slots or plain lists.
+
+    :return: The mean extraction time (in microseconds) and the number of objects allocated by the detector
+             (distinct objects put in the slots, per 1000 frames).
+    :rtype: dict
+    """
+    from ocatari.core import OCAtari
+    env = OCAtari(f"ALE/{game}-v5", mode="ram", hud=True, obs_mode="ori")
+    env.reset(seed=seed)
+    env.action_space.seed(seed)
+    actions = [env.action_space.sample() for _ in range(steps)]
+    # the distinct objects (kept alive, such that their ids are not reused)
+    seen = {}
+    total = 0.
+    for action in actions:
+        if not pooled:
+            env.objects = list(env.objects)
+        obs, reward, terminated, truncated, info = env._env.step(action)
+        t0 = time.perf_counter()
+        env.detect_objects()
+        total += time.perf_counter() - t0
+        for obj in env.objects:
+            seen[id(obj)] = obj
+        if terminated or truncated:
+            env.reset(seed=seed)
+    env.close()
+    return {"extraction_us": total / steps * 1e6,
+            "objects_per_1000": len(seen) / steps * 1000}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="OCAtari object slot pooling benchmark")
+    parser.add_argument("-g", "--games", type=str, nargs="+",
+                        default=POOLED_GAMES)
+    parser.add_argument("-s", "--steps", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'game':<16}{'plain lists':>24}{'pooled slots':>24}")
+    for game in args.games:
+        plain = run_config(game, False, args.steps, args.seed)
+        pooled = run_config(game, True, args.steps, args.seed)
+        print(f"{game:<16}" + "".join(
+            f"{row['extraction_us']:>8.1f}us {row['objects_per_1000']:>7.1f} obj/1k"
+            for row in (plain, pooled)))
@@ -0,0 +1,114 @@
+"""
+Measures the RAM extraction cache (see :meth:`ocatari.core.OCAtari.enable_ram_cache`): the extraction time
+per frame without and with the cache, and its hit rate, on two workloads:
+
+- `play`: random actions, restarting the episode when it ends (few repeated frames),
+- `replay`: lookahead rollouts, i.e. a snapshot restored before every one of a few action sequences
+  (as in :class:`ocatari.rollouts.RolloutPool`), where the same frames come back.
+
+Every (game, cache) configuration runs in its own interpreter, as the game modules keep a detection state.
+
+Usage:
+    python scripts/benchmarks/ram_cache.py -g Hero MontezumaRevenge ChopperCommand
+    python scripts/benchmarks/ram_cache.py -g Pong -s 5000 --maxsize 1024
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+WORKLOADS = ["play", "replay"]
+
+
+def _timed_detection(env, action, times):
+    obs, reward, terminated, truncated, info = env._env.step(action)
+    t0 = time.perf_counter()
+    env.detect_objects()
+    times.append(time.perf_counter() - t0)
+    return terminated or truncated
+
+
+def run_config(game, workload, cache, steps=3000, maxsize=4096, seed=0):
+    """
+    Measures the extraction of a game on a workload, with or without the cache.
+
+    :return: The mean extraction time (in microseconds) and the cache statistics.
+    :rtype: dict
+    """
+    from ocatari.core import OCAtari
+    env = OCAtari(f"ALE/{game}-v5", mode="ram", hud=False, obs_mode="ori")
+    if cache:
+        env.enable_ram_cache(maxsize)
+    env.reset(seed=seed)
+    env.action_space.seed(seed)
+    times = []
+    if workload == "play":
+        for _ in range(steps):
+            if _timed_detection(env, env.action_space.sample(), times):
+                env.reset(seed=seed)
+    else:
+        for _ in range(50):
+            env.step(env.action_space.sample())
+        snapshot = env.snapshot(stacks=False)
+        sequences = [[env.action_space.sample() for _ in range(50)]
+                     for _ in range(8)]
+        while len(times) < steps:
+            for actions in sequences:
+                env.restore(snapshot)
+                for action in actions:
+                    if _timed_detection(env, action, times):
+                        break
+    env.close()
+    return {"game": game, "workload": workload, "cache": cache,
+            "extraction_us": sum(times) / len(times) * 1e6,
+            "stats": env.ram_cache_stats()}
+
+
+def run_isolated(game, workload, cache, steps, maxsize, seed=0):
+    config = json.dumps({"game": game, "workload": workload, "cache": cache,
+                         "steps": steps, "maxsize": maxsize, "seed": seed})
+    command = [sys.executable, os.path.abspath(__file__), "--worker", config]
+    proc = subprocess.run(command, capture_output=True, text=True)
+    try:
+        return json.loads(proc.stdout.strip().splitlines()[-1])
+    except (IndexError, json.JSONDecodeError):
+        return {"game": game, "workload": workload, "cache": cache, "error": (
+            proc.stderr.strip().splitlines() or ["worker failed"])[-1]}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="OCAtari RAM extraction cache benchmark")
+    parser.add_argument("-g", "--games", type=str, nargs="+",
+                        default=["Hero", "MontezumaRevenge",
+                                 "ChopperCommand", "Pong"])
+    parser.add_argument("-w", "--workloads", type=str, nargs="+",
+                        default=WORKLOADS, choices=WORKLOADS)
+    parser.add_argument("-s", "--steps", type=int, default=3000)
+    parser.add_argument("--maxsize", type=int, default=4096)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--worker", type=str, default=None,
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        print(json.dumps(run_config(**json.loads(args.worker))))
+        sys.exit(0)
+
+    print(f"{'game':<18}{'workload':<10}{'no cache':>10}{'cache':>10}{'speedup':>9}{'hit rate':>10}")
+    for game in args.games:
+        for workload in args.workloads:
+            base = run_isolated(game, workload, False, args.steps,
+                                args.maxsize, args.seed)
+            cached = run_isolated(game, workload, True, args.steps,
+                                  args.maxsize, args.seed)
+            error = base.get("error") or cached.get("error")
+            if error:
+                print(f"{game:<18}{workload:<10}  failed: {error}")
+                continue
+            print(
+                f"{game:<18}{workload:<10}{base['extraction_us']:>8.1f}us{cached['extraction_us']:>8.1f}us"
+                f"{base['extraction_us'] / cached['extraction_us']:>8.2f}x{cached['stats']['hit_rate']:>10.1%}")
@@ -0,0 +1,77 @@
+"""
+Measures the batched lookahead rollouts (see :class:`ocatari.rollouts.RolloutPool`): the time per branch
+(restoring the snapshot, then playing its actions) in this process and over worker processes,
+next to the time of the steps alone.
+
+Usage:
+    python scripts/benchmarks/rollouts.py -g Pong Breakout Seaquest -b 256 -s 10 -w 0 4
+"""
+
+import argparse
+import time
+import numpy as np
+
+
+def run_config(game, num_workers, branches=256, steps=10, seed=0):
+    """
+    Measures the rollouts of `branches` random action sequences of `steps` steps, from a snapshot of a random play.
+
+    :return: The mean time per branch, in microseconds.
+    :rtype: float
+    """
+    from ocatari.core import OCAtari
+    from ocatari.rollouts import RolloutPool
+    env = OCAtari(f"ALE/{game}-v5", mode="ram", exact_snapshots=True)
+    env.reset(seed=seed)
+    env.action_space.seed(seed)
+    for _ in range(60):
+        env.step(env.action_space.sample())
+    snapshot = env.snapshot(stacks=False)
+    action_sequences = np.random.default_rng(seed).integers(
+        env.action_space.n, size=(branches, steps))
+    with RolloutPool(f"ALE/{game}-v5", num_workers=num_workers, mode="ram",
+                     exact_snapshots=True) as pool:
+        # warmup
+        pool.rollout(snapshot, action_sequences[:max(num_workers, 1)])
+        t0 = time.perf_counter()
+        pool.rollout(snapshot, action_sequences)
+        total = time.perf_counter() - t0
+    env.close()
+    return total / branches * 1e6
+
+
+def step_time(game, steps=1000, seed=0):
+    """
+    The mean time of a step (RAM extraction), in microseconds.
+    """
+    from ocatari.core import OCAtari
+    env = OCAtari(f"ALE/{game}-v5", mode="ram")
+    env.reset(seed=seed)
+    env.action_space.seed(seed)
+    actions = [env.action_space.sample() for _ in range(steps)]
+    t0 = time.perf_counter()
+    for action in actions:
+        env.step(action)
+    total = time.perf_counter() - t0
+    env.close()
+    return total / steps * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OCAtari rollouts benchmark")
+    parser.add_argument("-g", "--games", type=str, nargs="+",
+                        default=["Pong", "Breakout", "Seaquest"])
+    parser.add_argument("-b", "--branches", type=int, default=256)
+    parser.add_argument("-s", "--steps", type=int, default=10)
+    parser.add_argument("-w", "--workers", type=int, nargs="+", default=[0, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    header = "".join(f"{f'{w} workers':>12}" for w in args.workers)
+    print(f"{'game':<16}{'steps only':>12}" + header + "  (us/branch)")
+    for game in args.games:
+        steps_only = step_time(game, seed=args.seed) * args.steps
+        times = [run_config(game, w, args.branches, args.steps,
+                            args.seed) for w in args.workers]
+        print(f"{game:<16}{steps_only:>12.0f}" +
+              "".join(f"{t:>12.0f}" for t in times))
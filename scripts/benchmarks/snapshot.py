@@ -0,0 +1,71 @@
+"""
+Measures the cost of the snapshots (see :meth:`ocatari.core.OCAtari.snapshot`): the time of taking and restoring
+a snapshot, next to the emulator state alone (ALE's cloneState/restoreState) and to a step.
+The snapshots are taken along a random play, with and without the observation stacks.
+
+Usage:
+    python scripts/benchmarks/snapshot.py -g Pong MontezumaRevenge Qbert Atlantis -n 1000
+    python scripts/benchmarks/snapshot.py -g Hero -o ori
+"""
+
+import argparse
+import time
+
+COLUMNS = ["step", "ale_clone", "ale_restore", "snapshot", "restore",
+           "snapshot_stacks", "restore_stacks"]
+
+
+def _mean_us(function, args):
+    clock = time.perf_counter
+    total = 0.
+    for arg in args:
+        t0 = clock()
+        function(arg)
+        total += clock() - t0
+    return total / len(args) * 1e6
+
+
+def run_config(game, nb=1000, obs_mode="obj", seed=0):
+    """
+    Measures the snapshots of a game, at `nb` states of a random play.
+
+    :return: The mean times, in microseconds, by column (see `COLUMNS`).
+    :rtype: dict
+    """
+    from ocatari.core import OCAtari
+    env = OCAtari(f"ALE/{game}-v5", mode="ram", hud=False, obs_mode=obs_mode,
+                  exact_snapshots=True)
+    env.reset(seed=seed)
+    env.action_space.seed(seed)
+    actions = [env.action_space.sample() for _ in range(nb)]
+    ale = env._ale
+    times = {"step": _mean_us(env.step, actions)}
+    states = [ale.cloneState(include_rng=True) for _ in range(nb)]
+    times["ale_clone"] = _mean_us(lambda _: ale.cloneState(include_rng=True),
+                                  range(nb))
+    times["ale_restore"] = _mean_us(ale.restoreState, states)
+    for suffix, stacks in (("", False), ("_stacks", True)):
+        snapshots = []
+        times["snapshot" + suffix] = _mean_us(
+            lambda _: snapshots.append(env.snapshot(stacks)), range(nb))
+        times["restore" + suffix] = _mean_us(env.restore, snapshots)
+    env.close()
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OCAtari snapshot benchmark")
+    parser.add_argument("-g", "--games", type=str, nargs="+",
+                        default=["Pong", "MontezumaRevenge", "Qbert",
+                                 "Atlantis"])
+    parser.add_argument("-o", "--obs_mode", type=str, default="obj")
+    parser.add_argument("-n", "--nb", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    header = "".join(f"{name:>16}" for name in COLUMNS)
+    print(f"{'game':<18}" + header + "  (us)")
+    for game in args.games:
+        times = run_config(game, args.nb, args.obs_mode, args.seed)
+        print(f"{game:<18}" + "".join(f"{times[name]:>16.1f}"
+                                      for name in COLUMNS))
@@ -0,0 +1,82 @@
+"""
+Measures the startup cost of OCAtari: the time and peak memory (RSS) of importing `ocatari.core`
+and creating a first environment, in a fresh interpreter (as for a spawned worker process).
+It also lists the optional GUI/plotting dependencies that got loaded, which should be none for
+a headless environment (no `render_mode`, `obj` or `ram` observations).
+
+Usage:
+    python scripts/benchmarks/startup.py -g Pong -r 5
+    python scripts/benchmarks/startup.py -g Pong -o dqn
+    python scripts/benchmarks/startup.py --max-import 1.5   # exits with 1 if the import is slower
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from statistics import median
+
+STARTUP_CODE = """
+import json, resource, sys, time
+rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.perf_counter()
+import ocatari.core
+t1 = time.perf_counter()
+rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+env = ocatari.core.OCAtari({game!r}, mode={mode!r}, hud=False, obs_mode={obs_mode!r})
+env.reset()
+t2 = time.perf_counter()
+rss2 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+games = [m for m in sys.modules if m.startswith(("ocatari.ram.", "ocatari.vision."))
+         and not m.endswith(("game_objects", "utils", "extract_ram_info", "extract_vision_info"))]
+optional = [m for m in {optional!r} if m in sys.modules]
+print(json.dumps({{"import": t1 - t0, "env": t2 - t1, "rss_base": rss0, "rss_import": rss1,
+                  "rss_env": rss2, "game_modules": games, "optional_modules": optional}}))
+"""
+
+# GUI, plotting and image processing dependencies, not needed for
+# headless RAM mode
+OPTIONAL_MODULES = ["pygame", "cv2", "matplotlib", "skimage", "scipy", "torch"]
+
+
+def measure_startup(game="Pong", mode="ram", obs_mode="obj"):
+    """
+    Returns the import and environment creation times (in seconds) and the peak RSS (in kB, Linux)
+    of a fresh interpreter, as well as the game modules and optional dependencies it loaded.
+    """
+    code = STARTUP_CODE.format(game=game, mode=mode, obs_mode=obs_mode,
+                               optional=OPTIONAL_MODULES)
+    out = subprocess.run([sys.executable, "-c", code],
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="OCAtari startup time benchmark")
+    parser.add_argument("-g", "--game", type=str, default="Pong")
+    parser.add_argument("-m", "--mode", type=str, default="ram",
+                        choices=["ram", "vision", "both"])
+    parser.add_argument("-o", "--obs_mode", type=str, default="obj")
+    parser.add_argument("-r", "--repeats", type=int, default=5)
+    parser.add_argument("--max-import", type=float, default=None,
+                        help="Fail if the median import time (in seconds) "
+                             "exceeds this value.")
+    args = parser.parse_args()
+
+    runs = [measure_startup(args.game, args.mode,
+                            args.obs_mode) for _ in range(args.repeats)]
+    import_time = median(r["import"] for r in runs)
+    env_time = median(r["env"] for r in runs)
+    print(f"import ocatari.core: {import_time * 1000:8.1f} ms")
+    print(f"OCAtari({args.game!r}): {env_time * 1000:8.1f} ms")
+    print(
+        f"peak RSS: interpreter {runs[-1]['rss_base'] / 1024:.1f} MB, "
+        f"after import {median(r['rss_import'] for r in runs) / 1024:.1f} MB, "
+        f"after reset {median(r['rss_env'] for r in runs) / 1024:.1f} MB")
+    print(f"game modules loaded: {', '.join(runs[-1]['game_modules'])}")
+    print(
+        f"optional dependencies loaded: {', '.join(runs[-1]['optional_modules']) or 'none'}")
+    if args.max_import is not None and import_time > args.max_import:
+        print(f"Import time above the allowed {args.max_import} s")
+        sys.exit(1)
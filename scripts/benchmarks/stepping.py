@@ -0,0 +1,260 @@
+"""
+Stepping benchmark of OCAtari: steps/second, per-step latency percentiles and memory,
+for every game of `AVAILABLE_GAMES` across the extraction modes and the observation modes.
+The raw emulation (the underlying gymnasium/ALE env, stepped with the same actions) is measured
+separately, such that the OCAtari overhead (object extraction, observations) is reported on its own.
+
+Every configuration runs in a fresh interpreter by default (use --in-process to avoid it),
+such that the memory measurements are not polluted by the previous configurations.
+
+Usage:
+    python scripts/benchmarks/stepping.py -g Pong Breakout -m ram -o obj dqn --output baseline.json
+    python scripts/benchmarks/stepping.py --output current.csv --baseline baseline.json
+    python scripts/benchmarks/stepping.py --load current.json --baseline baseline.json --tolerance 0.15
+
+With --baseline, the configurations whose steps/second dropped by more than the tolerance
+are reported as regressions, and the script exits with 1.
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+import numpy as np
+
+MODES = ["ram", "vision", "both"]
+OBS_MODES = ["obj", "dqn", "ori", "masked_dqn_bin", "masked_dqn_grayscale",
+             "masked_dqn_pixels"]
+FIELDS = ["game", "mode", "obs_mode", "steps", "steps_per_s",
+          "raw_steps_per_s", "p50_us", "p90_us", "p99_us", "raw_p50_us",
+          "overhead_us", "rss_mb", "peak_rss_mb", "error"]
+
+
+def _rss_mb():
+    # current resident set size (Linux), or the peak one elsewhere
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * \
+                os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        return _peak_rss_mb()
+
+
+def _peak_rss_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _step_latencies(step, actions, reset):
+    latencies = np.empty(len(actions))
+    clock = time.perf_counter
+    for i, action in enumerate(actions):
+        t0 = clock()
+        out = step(action)
+        latencies[i] = clock() - t0
+        if out[2] or out[3]:
+            reset()
+    return latencies
+
+
+def run_config(game, mode, obs_mode, steps=1000, warmup=100, seed=0):
+    """
+    Benchmarks a single (game, mode, obs_mode) configuration.
+
+    :return: A row of results (see `FIELDS`), with the latencies in microseconds and the memory in MB.
+    :rtype: dict
+    """
+    from ocatari.core import OCAtari
+    row = {"game": game, "mode": mode, "obs_mode": obs_mode, "steps": steps}
+    try:
+        env = OCAtari(f"ALE/{game}-v5", mode=mode, obs_mode=obs_mode, hud=True)
+        env.action_space.seed(seed)
+        actions = [env.action_space.sample() for _ in range(warmup + steps)]
+        # Raw emulation: the base env, stepped without any object extraction
+        env._env.reset(seed=seed)
+        raw = _step_latencies(env._env.step, actions,
+                              lambda: env._env.reset(seed=seed))[warmup:]
+        # OCAtari: emulation + extraction + observations
+        env.reset(seed=seed)
+        lat = _step_latencies(env.step, actions,
+                              lambda: env.reset(seed=seed))[warmup:]
+        env.close()
+    except Exception as err:
+        row["error"] = re.sub(r"\x1b\[[0-9;]*m", "",
+                              f"{type(err).__name__}: {err}")
+        return row
+    row.update({
+        "steps_per_s": len(lat) / lat.sum(),
+        "raw_steps_per_s": len(raw) / raw.sum(),
+        "p50_us": np.percentile(lat, 50) * 1e6,
+        "p90_us": np.percentile(lat, 90) * 1e6,
+        "p99_us": np.percentile(lat, 99) * 1e6,
+        "raw_p50_us": np.percentile(raw, 50) * 1e6,
+        "overhead_us": (lat.mean() - raw.mean()) * 1e6,
+        "rss_mb": _rss_mb(),
+        "peak_rss_mb": _peak_rss_mb(),
+        "error": "",
+    })
+    return row
+
+
+def run_isolated(game, mode, obs_mode, steps=1000, warmup=100, seed=0):
+    """
+    Runs :func:`run_config` in a fresh interpreter.
+    """
+    config = json.dumps({"game": game, "mode": mode, "obs_mode": obs_mode,
+                         "steps": steps, "warmup": warmup, "seed": seed})
+    command = [sys.executable, os.path.abspath(__file__), "--worker", config]
+    proc = subprocess.run(command, capture_output=True, text=True)
+    try:
+        return json.loads(proc.stdout.strip().splitlines()[-1])
+    except (IndexError, json.JSONDecodeError):
+        return {"game": game, "mode": mode, "obs_mode": obs_mode, "steps": steps,
+                "error": (proc.stderr.strip().splitlines() or ["worker failed"])[-1]}
+
+
+def metadata():
+    import gymnasium
+    import ale_py
+    return {"python": platform.python_version(),
+            "platform": platform.platform(), "processor": platform.processor(),
+            "numpy": np.__version__, "gymnasium": gymnasium.__version__,
+            "ale_py": ale_py.__version__,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S")}
+
+
+def save_results(results, path):
+    """
+    Saves the results as JSON (with the machine metadata) or CSV, depending on the extension.
+    """
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(
+                f, fieldnames=FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(results["results"])
+    else:
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+def load_results(path):
+    if path.endswith(".csv"):
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            for key in FIELDS[3:-1]:
+                row[key] = float(row[key]) if row.get(key) else None
+        return {"meta": {}, "results": rows}
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(results, baseline, tolerance=0.1):
+    """
+    Compares the steps/second of every configuration with the baseline.
+
+    :return: The configurations slower than the baseline by more than `tolerance` (relative),
+             as (game, mode, obs_mode, baseline steps/s, current steps/s) tuples.
+    :rtype: list
+    """
+    def key(row):
+        return row["game"], row["mode"], row["obs_mode"]
+
+    reference = {
+        key(row): row for row in baseline["results"] if not row.get("error")}
+    regressions = []
+    print(f"{'game':<18}{'mode':<8}{'obs_mode':<22}{'baseline':>10}{'current':>10}{'ratio':>8}")
+    for row in results["results"]:
+        ref = reference.get(key(row))
+        if ref is None:
+            continue
+        if row.get("error"):
+            print(
+                f"{row['game']:<18}{row['mode']:<8}{row['obs_mode']:<22}  now failing: {row['error']}")
+            regressions.append(key(row) + (ref["steps_per_s"], 0.))
+            continue
+        ratio = row["steps_per_s"] / ref["steps_per_s"]
+        flag = "  <- regression" if ratio < 1 - tolerance else ""
+        print(
+            f"{row['game']:<18}{row['mode']:<8}{row['obs_mode']:<22}"
+            f"{ref['steps_per_s']:>10.0f}{row['steps_per_s']:>10.0f}{ratio:>8.2f}{flag}")
+        if flag:
+            regressions.append(key(row) +
+                               (ref["steps_per_s"], row["steps_per_s"]))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OCAtari stepping benchmark")
+    parser.add_argument("-g", "--games", type=str, nargs="+", default=None,
+                        help="Games to benchmark, defaults to all the "
+                             "available games.")
+    parser.add_argument("-m", "--modes", type=str, nargs="+", default=MODES,
+                        choices=MODES)
+    parser.add_argument("-o", "--obs_modes", type=str, nargs="+",
+                        default=OBS_MODES, choices=OBS_MODES)
+    parser.add_argument("-s", "--steps", type=int, default=1000)
+    parser.add_argument("-w", "--warmup", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--in-process", action="store_true",
+                        help="Run all the configurations in this interpreter "
+                             "(faster, memory not isolated).")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Results file (.json or .csv).")
+    parser.add_argument("--load", type=str, default=None,
+                        help="Load the results from this file instead of "
+                             "running the benchmark.")
+    parser.add_argument("--baseline", type=str, default=None,
+                        help="Compare the steps/second with this saved "
+                             "results file.")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="Relative slowdown reported as a regression.")
+    parser.add_argument("--worker", type=str, default=None,
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        print(json.dumps(run_config(**json.loads(args.worker))))
+        sys.exit(0)
+
+    if args.load:
+        results = load_results(args.load)
+    else:
+        if args.games is None:
+            from ocatari.core import AVAILABLE_GAMES
+            args.games = AVAILABLE_GAMES
+        run = run_config if args.in_process else run_isolated
+        results = {"meta": metadata(), "results": []}
+        for game in args.games:
+            for mode in args.modes:
+                for obs_mode in args.obs_modes:
+                    row = run(game, mode, obs_mode, args.steps, args.warmup,
+                              args.seed)
+                    results["results"].append(row)
+                    if row.get("error"):
+                        print(
+                            f"{game:<18}{mode:<8}{obs_mode:<22} failed: {row['error']}")
+                    else:
+                        print(
+                            f"{game:<18}{mode:<8}{obs_mode:<22}{row['steps_per_s']:>9.0f} steps/s "
+                            f"(raw {row['raw_steps_per_s']:.0f}), p50 {row['p50_us']:.0f} us, "
+                            f"p99 {row['p99_us']:.0f} us, overhead {row['overhead_us']:.0f} us, "
+                            f"RSS {row['rss_mb']:.0f} MB")
+        if args.output:
+            save_results(results, args.output)
+            print(f"Results saved in {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, load_results(args.baseline),
+                              args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.tolerance:.0%}")
+            sys.exit(1)
+        print("No regression")
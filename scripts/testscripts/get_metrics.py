@@ -30,6 +30,7 @@ from metrics_utils import *
 import pickle
 import sys
 import inspect
+import importlib
 
 
 figlet = Figlet()
@@ -63,7 +64,7 @@ if ONLYBOTHDEFINEDOBJECTS:
     for mode in ["ram", "vision"]:
         mod_path = f"ocatari.{mode}.{game_name.lower()}"
         classes.append([el[0] for el in inspect.getmembers(
-            sys.modules[mod_path], inspect.isclass)])
+            importlib.import_module(mod_path), inspect.isclass)])
     classes_in_both = set.intersection(set(classes[0]) & set(classes[1]))
 
 
@@ -3,6 +3,7 @@ from metrics_utils import *
 from tqdm import tqdm
 import sys
 import inspect
+import importlib
 import random
 
 NB_SAMPLES = 100
@@ -20,7 +21,7 @@ for game in AVAILABLE_GAMES:
         for mode in ["ram", "vision"]:
             mod_path = f"ocatari.{mode}.{game.lower()}"
             classes.append([el[0] for el in inspect.getmembers(
-                sys.modules[mod_path], inspect.isclass)])
+                importlib.import_module(mod_path), inspect.isclass)])
         classes_in_both = set.intersection(set(classes[0]) & set(classes[1]))
     try:
         env = OCAtari(game, mode="both", render_mode='rgb_array', hud=True)
@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+from ocatari.batch import extract_batch, extract_frames, batch_games
+from ocatari.core import OCAtari
+
+BATCH_GAMES = ["Pong", "Breakout", "Freeway", "Boxing", "Tennis",
+               "SpaceInvaders"]
+
+
+def _record(game, steps=300, seed=0):
+    env = OCAtari(f"ALE/{game}-v5", mode="ram", hud=True, obs_mode="obj")
+    env.reset(seed=seed)
+    env.action_space.seed(seed)
+    rams, states = [env.get_ram().copy()], [env.ns_state.copy()]
+    for _ in range(steps):
+        obs, reward, terminated, truncated, info = env.step(
+            env.action_space.sample())
+        if terminated or truncated:
+            break
+        rams.append(env.get_ram().copy())
+        states.append(env.ns_state.copy())
+    env.close()
+    return np.array(rams), np.array(states)
+
+
+def _random_rams(n=2000, high=256, seed=0):
+    rams = np.random.default_rng(seed).integers(
+        0, high, (n, 128), dtype=np.uint8)
+    # the block and alien bitmap rows the detectors handle
+    rams[:, :6] &= 63
+    rams[:, 18:24] &= 63
+    return rams
+
+
+def test_batch_games():
+    assert batch_games() == sorted(g.lower() for g in BATCH_GAMES)
+
+
+@pytest.mark.parametrize("game", BATCH_GAMES + ["Skiing"])
+def test_frames_match_env(game):
+    """
+    Test that the per-frame path gives the neurosymbolic states of an environment replaying the RAM states.
+    """
+    rams, states = _record(game)
+    frames, _ = extract_frames(game, rams, hud=True)
+    assert np.array_equal(frames, states)
+
+
+@pytest.mark.parametrize("game", BATCH_GAMES)
+@pytest.mark.parametrize("hud", [False, True])
+def test_batch_matches_frames(game, hud):
+    """
+    Test the vectorized kernels frame for frame against the detectors, on recorded and random RAM states
+    (the small values repeating often, for the objects depending on the previous frames).
+    """
+    for rams in (_record(game)[0], _random_rams(), _random_rams(high=4)):
+        states, visible = extract_batch(game, rams, hud)
+        expected_states, expected_visible = extract_frames(game, rams, hud)
+        assert states.shape == expected_states.shape
+        assert np.array_equal(states, expected_states)
+        assert np.array_equal(visible, expected_visible)
+
+
+def test_fallback():
+    """
+    Test the per-frame path for the games without kernel.
+    """
+    rams = _record("Skiing", 50)[0]
+    batch = extract_batch("Skiing", rams)
+    frames = extract_frames("Skiing", rams)
+    assert all(np.array_equal(a, b) for a, b in zip(batch, frames))
+    with pytest.raises(ValueError):
+        extract_batch("Pong", np.zeros((10, 64), dtype=np.uint8))
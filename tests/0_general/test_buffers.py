@@ -0,0 +1,54 @@
+import pytest
+import numpy as np
+from collections import deque
+from ocatari.buffers import FrameStack
+from ocatari.core import OCAtari
+
+
+def test_frame_stack_matches_deque():
+    """
+    Test that the frame stack returns the same windows as a deque.
+    """
+    stack = FrameStack(4, np.int16)
+    reference = deque([], maxlen=4)
+    for i in range(11):
+        frame = np.arange(5) * i
+        stack.append(frame)
+        reference.append(frame)
+        assert len(stack) == len(reference)
+        assert np.array_equal(np.array(stack), np.array(reference))
+    stack.fill(np.ones(5))
+    assert np.array_equal(stack.view(), np.ones((4, 5)))
+
+
+@pytest.mark.parametrize("obs_mode, shape, dtype",
+                         [("dqn", (4, 84, 84), np.uint8), ("obj", (4, 6), np.float32)])
+def test_observation_stack(obs_mode, shape, dtype):
+    """
+    Test that the observation stack is shifted at every step.
+    """
+    env = OCAtari(env_name="ALE/Pong-v5", mode="ram", obs_mode=obs_mode)
+    obs, _ = env.reset(seed=0)
+    assert obs.shape == shape and obs.dtype == dtype
+    for _ in range(5):
+        new_obs, *_ = env.step(0)
+        assert np.array_equal(new_obs[:-1], obs[1:])
+        obs = new_obs
+    env.close()
+
+
+def test_rgb_capture_on_demand():
+    """
+    Test that RGB frames are only stacked when requested.
+    """
+    env = OCAtari(env_name="ALE/Pong-v5", mode="ram", obs_mode="obj")
+    env.reset(seed=0)
+    assert not env.create_rgb_stack and env._state_buffer_rgb is None
+    env.step(0)
+    assert env.aggregated_render().shape == (210, 160, 3)
+    env.add_buffer_stack("ori")
+    for _ in range(4):
+        env.step(0)
+    assert len(env._state_buffer_rgb) == 4
+    assert env.aggregated_render().shape == (210, 160, 3)
+    env.close()
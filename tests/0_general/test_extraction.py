@@ -0,0 +1,40 @@
+import pytest
+import numpy as np
+from ocatari.core import OCAtari
+from ocatari.extraction import ExtractionPlan, register_detector, unregister_detector
+from ocatari.ram.pong import _detect_objects_ram as pong_detector
+
+
+def test_extraction_plan_binds_game_detector():
+    """
+    Test that the extraction plan resolves the game module's detector once.
+    """
+    plan = ExtractionPlan("Pong", hud=False, mode="ram")
+    assert plan.detector is pong_detector
+    objects = plan.init_objects()
+    assert [o.category for o in objects] == ["Player", "Ball", "Enemy"]
+    with pytest.raises(NotImplementedError):
+        ExtractionPlan("Zaxxon", hud=False, mode="ram")
+
+
+def test_registered_detector():
+    """
+    Test that a registered detector is used by the environments created afterwards.
+    """
+    calls = []
+
+    def counting_detector(objects, ram_state, hud):
+        calls.append(len(ram_state))
+        return pong_detector(objects, ram_state, hud)
+
+    register_detector("Pong", counting_detector)
+    try:
+        env = OCAtari(env_name="ALE/Pong-v5", mode="ram", obs_mode="obj")
+        env.reset()
+        env.step(0)
+        assert calls == [128, 128]
+    finally:
+        unregister_detector("Pong")
+    env = OCAtari(env_name="ALE/Pong-v5", mode="ram", obs_mode="obj")
+    assert env._ram_plan.detector is pong_detector
+    env.close()
@@ -0,0 +1,57 @@
+import pickle
+import pytest
+from ocatari.ram.game_objects import GameObject, NoObject, ValueObject, object_state, set_object_state
+from ocatari.ram.pong import Player, PlayerScore
+from ocatari.vision import game_objects as vision
+
+
+def _moved(obj):
+    obj.xy = 10, 20
+    obj._save_prev()
+    obj.xy = 13, 18
+    return obj
+
+
+@pytest.mark.parametrize("make", [GameObject, ValueObject, NoObject, Player,
+                                  lambda: PlayerScore(ten=True),
+                                  lambda: vision.GameObject(1, 2, 3, 4),
+                                  vision.NoObject])
+def test_objects_pickle(make):
+    """
+    Test that the (slots based) game objects keep their attributes when pickled.
+    """
+    obj = _moved(make())
+    copy = pickle.loads(pickle.dumps(obj))
+    assert type(copy) is type(obj)
+    assert object_state(copy) == object_state(obj)
+    assert (copy.xy, copy.dx, copy.dy,
+            copy.wh) == (obj.xy, obj.dx, obj.dy, obj.wh)
+
+
+def test_objects_have_no_instance_dict():
+    """
+    Test that the base objects and the game objects declaring their attributes store them in slots only.
+    """
+    for obj in (GameObject(), ValueObject(), Player(),
+                vision.GameObject(0, 0, 1, 1)):
+        assert not hasattr(obj, "__dict__")
+    player = Player()
+    player._above_10 = True
+    assert object_state(player)["_above_10"]
+
+
+def test_object_state_round_trip():
+    """
+    Test that the state of an object, set on a new one, gives an equal object, including the attributes
+    set on the empty slots.
+    """
+    value = ValueObject()
+    value.value = 7
+    value._save_prev()
+    value.value = 9
+    new = ValueObject.__new__(ValueObject)
+    set_object_state(new, object_state(value))
+    assert (new.value, new.prev_value, new.value_diff) == (9, 7, 2)
+    empty = NoObject()
+    empty.value = 3
+    assert object_state(empty)["value"] == 3
@@ -0,0 +1,39 @@
+import numpy as np
+from ocatari.ram._helper_methods import _convert_number, convert_numbers, number_to_bitfield, \
+    numbers_to_bitfields, bitfield_to_number, BITFIELDS, REVERSED_BITFIELDS
+
+
+def test_convert_number():
+    """
+    Test the BCD lookup table against the decimal reading of the hexadecimal digits.
+    """
+    for n in range(256):
+        expected = int(hex(n)[2:]) if (n >> 4) < 10 and (n & 15) < 10 else 0
+        assert _convert_number(n) == _convert_number(np.uint8(n)) == expected
+    assert _convert_number(0x1234) == 1234
+    assert _convert_number(0x12a4) == 0
+    assert _convert_number(-5) == 0
+    numbers = np.arange(256, dtype=np.uint8).reshape(16, 16)
+    assert convert_numbers(numbers).tolist() == [
+        [_convert_number(n) for n in row] for row in numbers.tolist()]
+
+
+def test_bitfields():
+    """
+    Test the bitfield tables, their vectorized form and the conversion back to numbers.
+    """
+    for n in range(256):
+        bits = [int(b) for b in format(n, "08b")]
+        assert number_to_bitfield(n) == list(BITFIELDS[n]) == bits
+        reversed_bits = number_to_bitfield(np.uint8(n), reverse=True)
+        assert reversed_bits == list(REVERSED_BITFIELDS[n]) == bits[::-1]
+        assert bitfield_to_number(bits) == n
+        assert bitfield_to_number(bits[::-1], flip=True) == n
+    rng = np.random.default_rng(0)
+    numbers = rng.integers(0, 256, (10, 6), dtype=np.uint8)
+    for reverse in (False, True):
+        fields = numbers_to_bitfields(numbers, reverse)
+        assert fields.shape == (10, 6, 8)
+        expected = [[number_to_bitfield(n, reverse) for n in row]
+                    for row in numbers.tolist()]
+        assert fields.tolist() == expected
@@ -0,0 +1,97 @@
+import pytest
+import numpy as np
+from ocatari.core import OCAtari
+from ocatari.history import TrajectoryHistory, FEATURES
+from ocatari.ram.game_objects import GameObject
+from ocatari.vector import OCAtariVectorEnv
+
+
+def _record(history, positions, visible=None):
+    objects = []
+    for i, (x, y) in enumerate(positions):
+        obj = GameObject()
+        obj.xywh = x, y, 1, 1
+        obj.visible = True if visible is None else visible[i]
+        objects.append(obj)
+    history.record(objects)
+
+
+def test_kinematics():
+    """
+    Test the velocity, acceleration and smoothed velocity on known trajectories, and the slots not tracked long enough.
+    """
+    history = TrajectoryHistory(4)
+    # slot 0: uniform motion, slot 1: accelerated,
+    # slot 2: reappears in the last frame
+    _record(history, [(0, 0), (0, 0), (50, 50)])
+    for t in range(1, 4):
+        _record(history, [(2 * t, -t), (t * t, 0),
+                (50 + t, 50)], visible=[True, True, t == 3])
+    assert history.frames.shape == (4, 3, 3)
+    assert history.tracked_frames().tolist() == [4, 4, 1]
+    assert history.velocity.tolist() == [[2, -1], [5, 0], [0, 0]]
+    assert history.acceleration.tolist() == [[0, 0], [2, 0], [0, 0]]
+    assert np.allclose(history.smoothed_velocity, [[2, -1], [3, 0], [0, 0]])
+    assert history.features().shape == (3, len(FEATURES))
+
+
+def test_fill_and_clear():
+    """
+    Test that the first frame fills the history (no motion), and that clearing it restarts from the next frame.
+    """
+    history = TrajectoryHistory(3)
+    _record(history, [(5, 5)])
+    assert len(history) == 3
+    assert not history.features().any()
+    _record(history, [(8, 5)])
+    history.clear()
+    _record(history, [(20, 5)])
+    assert not history.features().any()
+    with pytest.raises(ValueError):
+        TrajectoryHistory(1)
+
+
+@pytest.mark.parametrize("env_name", ["ALE/Pong-v5", "ALE/Seaquest-v5"])
+def test_env_history(env_name):
+    """
+    Test that the history velocities are the ones of the objects, that the features are appended to the obj
+    observations, and that the history is restored with the snapshots.
+    """
+    env = OCAtari(env_name, mode="ram", hud=False, obs_mode="obj")
+    state_size = len(env.ns_state)
+    env.enable_history(6, obs_features=True)
+    obs, _ = env.reset(seed=0)
+    nb_slots = len(env.objects)
+    assert obs.shape == env.observation_space.shape == (
+        4, state_size + 6 * nb_slots)
+    for _ in range(50):
+        obs, *_ = env.step(env.action_space.sample())
+        moving = env.history.tracked_frames() > 1
+        table = env.object_table
+        assert np.array_equal(env.history.velocity[moving], table.dxy[moving])
+        assert np.array_equal(obs[-1, state_size:],
+                              env.history.features().ravel())
+    snapshot = env.snapshot(stacks=False)
+    features = env.history.features().copy()
+    for _ in range(10):
+        env.step(env.action_space.sample())
+    env.restore(snapshot)
+    assert np.array_equal(env.history.features(), features)
+    env.disable_history()
+    assert env.step(0)[0].shape == (4, state_size)
+    env.close()
+
+
+def test_vector_history():
+    """
+    Test the history features in the vector environment observations.
+    """
+    envs = OCAtariVectorEnv("ALE/Pong-v5", num_envs=2, history_length=4,
+                            history_features=True)
+    obs, _ = envs.reset(seed=0)
+    for _ in range(10):
+        obs, *_ = envs.step(envs.action_space.sample())
+    for i, env in enumerate(envs.envs):
+        assert np.array_equal(
+            obs[i, -1, -6 * len(env.objects):], env.history.features().ravel())
+    envs.close()
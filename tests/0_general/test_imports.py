@@ -0,0 +1,72 @@
+import subprocess
+import sys
+import json
+
+
+def _loaded_modules(code):
+    code += "\nimport sys, json\nprint(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                         text=True, check=True).stdout
+    return set(json.loads(out.strip().splitlines()[-1]))
+
+
+def test_game_modules_loaded_on_demand():
+    """
+    Test that importing OCAtari does not import all the game modules, nor the plotting libraries.
+    """
+    modules = _loaded_modules(
+        "import ocatari.core\nimport ocatari.ram\nimport ocatari.vision")
+    assert "ocatari.ram.hero" not in modules
+    assert "ocatari.vision.pong" not in modules
+    for heavy in ("matplotlib", "skimage", "scipy"):
+        assert heavy not in modules, f"{heavy} should only be imported when needed."
+
+
+def test_game_modules_without_plotting():
+    """
+    Test that none of the game modules imports the plotting libraries when imported.
+    """
+    modules = _loaded_modules(
+        "import importlib, pkgutil, ocatari.ram, ocatari.vision\n"
+        "for package in (ocatari.ram, ocatari.vision):\n"
+        "    for module in pkgutil.iter_modules(package.__path__):\n"
+        "        importlib.import_module(f'{package.__name__}.{module.name}')")
+    assert "ocatari.vision.frostbite" in modules and "ocatari.ram.hero" in modules
+    for heavy in ("matplotlib", "skimage"):
+        assert heavy not in modules, f"{heavy} should only be imported when needed."
+
+
+def test_only_requested_game_is_loaded():
+    """
+    Test that creating an environment only loads its own game module.
+    """
+    modules = _loaded_modules(
+        "from ocatari.core import OCAtari\nOCAtari('ALE/Pong-v5', mode='ram')")
+    assert "ocatari.ram.pong" in modules
+    assert "ocatari.ram.hero" not in modules
+
+
+def test_game_modules_still_resolvable():
+    """
+    Test that the game modules are still reachable as attributes of the packages.
+    """
+    import ocatari.ram
+    import ocatari.vision
+    from ocatari.ram import freeway
+    assert ocatari.ram.hero.__name__ == "ocatari.ram.hero"
+    assert freeway.MAX_NB_OBJECTS
+    assert "pong" in dir(ocatari.vision)
+
+
+def test_headless_profile():
+    """
+    Test that a headless RAM mode environment loads neither the rendering nor the image processing libraries.
+    """
+    modules = _loaded_modules(
+        "from ocatari.core import OCAtari\nenv = OCAtari('ALE/Pong-v5', mode='ram')\nenv.reset()\nenv.step(0)")
+    for gui in ("pygame", "cv2", "matplotlib", "ocatari.utils"):
+        assert gui not in modules, f"{gui} should only be imported when rendering."
+    modules = _loaded_modules(
+        "from ocatari.core import OCAtari\nenv = OCAtari('ALE/Pong-v5', mode='ram', obs_mode='dqn')\nenv.reset()")
+    assert "cv2" in modules
+    assert "pygame" not in modules
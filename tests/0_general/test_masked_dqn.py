@@ -0,0 +1,62 @@
+import numpy as np
+from ocatari.core import OCAtari
+from ocatari.ram.extract_ram_info import (get_class_dict,
+                                          get_masked_dqn_bin_state,
+                                          get_masked_dqn_gray_state,
+                                          get_masked_dqn_pix_state)
+
+
+def _reference_masked_state(objects, value):
+    # Per pixel rasterization, as the masked states were originally computed
+    state = np.zeros((210, 160))
+    for o in objects:
+        x, y, w, h = o.xywh
+        if x + w > 0 and y + h > 0:
+            for i in range(max(0, y), min(y + h, 209)):
+                for j in range(max(0, x), min(x + w, 159)):
+                    state[i, j] = value(o, i, j)
+    return state
+
+
+def test_masked_states_match_reference():
+    """
+    Test that the slice based rasterization gives the same masked states as the per pixel one.
+    """
+    env = OCAtari("ALE/Breakout-v5", mode="ram", hud=True)
+    env.reset(seed=0)
+    classes = list(dict.fromkeys(get_class_dict("Breakout")))
+    out = np.zeros((210, 160), dtype=np.uint8)
+
+    def gray_level(o, i, j):
+        return 255 * (1 + classes.index(o.category)) // len(classes)
+
+    for _ in range(50):
+        env.step(env.action_space.sample())
+        objects = [o for o in env.objects if o]
+        gray = env._ale.getScreenGrayscale()
+        assert np.array_equal(
+            get_masked_dqn_bin_state(env.objects, out=out),
+            _reference_masked_state(objects, lambda o, i, j: 255))
+        assert np.array_equal(
+            get_masked_dqn_gray_state(env.objects, classes, out=out),
+            _reference_masked_state(objects, gray_level))
+        assert np.array_equal(
+            get_masked_dqn_pix_state(env.objects, gray, out=out),
+            _reference_masked_state(objects, lambda o, i, j: gray[i, j]))
+    env.close()
+
+
+def test_masked_dqn_direct():
+    """
+    Test that the masked states can be rasterized directly at 84x84.
+    """
+    env = OCAtari("ALE/Breakout-v5", mode="ram", obs_mode="masked_dqn_bin",
+                  masked_dqn_direct=True)
+    obs, _ = env.reset(seed=0)
+    assert obs.shape == (4, 84, 84) and obs.dtype == np.uint8
+    for _ in range(10):
+        obs, *_ = env.step(env.action_space.sample())
+    assert env.get_dqn_state().shape == (84, 84)
+    # each visible object covers at least one pixel
+    assert obs[-1].any()
+    env.close()
@@ -0,0 +1,44 @@
+import pytest
+import numpy as np
+from itertools import chain
+from ocatari.core import OCAtari
+from ocatari.ns_state import NSStateLayout
+from ocatari.ram.game_objects import GameObject, NoObject
+
+
+@pytest.mark.parametrize("env_name",
+                         ["ALE/Pong-v5", "ALE/Breakout-v5", "ALE/Skiing-v5"])
+def test_ns_state_matches_chained_representations(env_name):
+    """
+    Test that the neurosymbolic state written with the slot layout equals the chained object representations.
+    """
+    env = OCAtari(env_name, mode="ram", hud=True)
+    env.reset(seed=0)
+    for _ in range(100):
+        obs, *_ = env.step(env.action_space.sample())
+        expected = list(chain.from_iterable([o._nsrepr for o in env.objects]))
+        assert np.array_equal(env.ns_state, expected)
+        assert np.array_equal(obs[-1], expected)
+    env.close()
+
+
+class _Oriented(GameObject):
+    @property
+    def _nsrepr(self):
+        return [self.x, self.y, 7]
+
+
+def test_layout_recompiles_on_new_length():
+    """
+    Test that the layout is recompiled if an object with a longer representation takes a slot.
+    """
+    obj = GameObject()
+    obj.xy = 3, 4
+    objects = [obj, NoObject()]
+    layout = NSStateLayout(objects)
+    state = layout.write(objects)
+    assert list(state) == [3, 4, 0, 0]
+    objects[1] = _Oriented()
+    objects[1].xy = 5, 6
+    assert list(layout.write(objects)) == [3, 4, 5, 6, 7]
+    assert len(layout) == 5
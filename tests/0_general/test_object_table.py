@@ -0,0 +1,72 @@
+import pytest
+import numpy as np
+from ocatari.core import OCAtari
+from ocatari.object_table import ObjectTable, EMPTY
+from ocatari.ram.extract_ram_info import get_masked_dqn_bin_state
+from ocatari.ram.game_objects import GameObject, NoObject, ValueObject
+from ocatari.ram.pitfall import Timer
+from ocatari.vector import OCAtariVectorEnv
+
+
+@pytest.mark.parametrize("env_name", ["ALE/Seaquest-v5", "ALE/Breakout-v5",
+                                      "ALE/SpaceInvaders-v5"])
+@pytest.mark.parametrize("mode", ["ram", "vision"])
+def test_table_matches_objects(env_name, mode):
+    """
+    Test that the vectorized positions, velocities and masks of the table are the ones of the objects.
+    """
+    env = OCAtari(env_name, mode=mode, hud=True, obs_mode="ori")
+    env.reset(seed=0)
+    env.action_space.seed(0)
+    for _ in range(100):
+        env.step(env.action_space.sample())
+        table = env.object_table
+        assert len(table) == len(env.objects)
+        assert table.xywh.tolist() == [list(o.xywh) for o in env.objects]
+        assert table.dxy.tolist() == [[o.dx, o.dy] for o in env.objects]
+        assert table.visible.tolist() == [bool(o) for o in env.objects]
+        categories = [o.category for o in env.objects if o]
+        assert [row.category for row in table if row] == categories
+        for shape in ((210, 160), (84, 84)):
+            mask = get_masked_dqn_bin_state(env.objects, shape=shape)
+            assert np.array_equal(table.binary_mask(shape), mask)
+    env.close()
+
+
+def test_table_rows():
+    """
+    Test the row views, values and empty slots of a table.
+    """
+    obj, score = GameObject(), ValueObject()
+    obj.xywh = 10, 20, 4, 8
+    obj._save_prev()
+    obj.xy = 12, 18
+    obj.rgb = 1, 2, 3
+    score.value = 42
+    table = ObjectTable(["GameObject"]).update([obj, None, NoObject(), score])
+    assert table.categories == ["GameObject", "ValueObject"]
+    assert table.category.tolist() == [0, EMPTY, EMPTY, 1]
+    assert table.category_mask("ValueObject").tolist() == [
+        False, False, False, True]
+    row = table[0]
+    assert (row.xy, row.prev_xy, row.dx, row.dy, row.rgb, row.value) == (
+        (12, 18), (10, 20), 2, -2, (1, 2, 3), None)
+    assert table[-1].value == 42 and not table[1] and not table[2]
+    assert table.positions.tolist() == [[12, 18], [0, 0], [0, 0], [0, 0]]
+    assert table.bounding_boxes[0].tolist() == [12, 18, 16, 26]
+    timer = Timer()
+    timer.value = 12.5
+    assert table.update([timer])[0].value == 12.5
+
+
+def test_vector_object_tables():
+    """
+    Test that the vector environments stack the tables of their environments.
+    """
+    envs = OCAtariVectorEnv("ALE/Pong-v5", num_envs=2, mode="ram")
+    envs.reset(seed=0)
+    envs.step(envs.action_space.sample())
+    tables = envs.object_tables
+    assert tables.shape == (2, len(envs.envs[0].objects))
+    assert tables["x"][1].tolist() == [o.x for o in envs.envs[1].objects]
+    envs.close()
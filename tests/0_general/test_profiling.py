@@ -0,0 +1,62 @@
+from ocatari.core import OCAtari
+from ocatari.profiling import StageStats, BIN_EDGES_US
+
+
+def test_profiling_stats():
+    """
+    Test that the profiled step/reset record every stage, and can be attached to the info.
+    """
+    env = OCAtari("ALE/Pong-v5", mode="ram", obs_mode="obj")
+    env.enable_profiling(info=True)
+    # one step/reset, with timing hooks
+    assert "step" not in vars(env) and "reset" not in vars(env)
+    _, info = env.reset(seed=0)
+    assert set(info["profiling"]) == {"env_reset", "init_objects",
+                                      "detect_objects", "reset_buffer",
+                                      "reset"}
+    for _ in range(20):
+        *_, info = env.step(0)
+    assert set(info["profiling"]) == {"env_step", "detect_objects",
+                                      "fill_buffer", "step"}
+    stats = env.profiling_stats(clear=True)
+    assert stats["game"] == "Pong"
+    stages = stats["stages"]
+    assert stages["step"]["count"] == 20 and stages["detect_objects"]["count"] == 21
+    assert sum(stages["step"]["hist"]) == 20
+    assert stages["env_step"]["total_s"] <= stages["step"]["total_s"]
+    assert env.profiling_stats()["stages"] == {}
+    env.disable_profiling()
+    *_, info = env.step(0)
+    assert "profiling" not in info
+    assert env.profiling_stats()["stages"] == {}
+    env.close()
+
+
+def test_profiling_render():
+    """
+    Test that render is timed through the same hook, without replacing the method.
+    """
+    env = OCAtari("ALE/Pong-v5", mode="ram", obs_mode="obj",
+                  render_mode="rgb_array")
+    env.reset(seed=0)
+    env.enable_profiling(info=True)
+    assert "render" not in vars(env)
+    frame = env.render()
+    assert frame.shape == (210, 160, 3)
+    assert env.profiling_stats()["stages"]["render"]["count"] == 1
+    env.disable_profiling()
+    env.render()
+    assert env.profiling_stats()["stages"]["render"]["count"] == 1
+    env.close()
+
+
+def test_stage_percentiles():
+    """
+    Test the percentiles estimated from the histogram.
+    """
+    stats = StageStats()
+    for us in [10] * 90 + [1000] * 10:
+        stats.add(us * 1e-6)
+    assert 10 <= stats.percentile(50) * 1e6 < 10 * 2 ** 0.25
+    assert stats.percentile(99) == stats.max
+    assert len(stats.hist) == len(BIN_EDGES_US) - 1
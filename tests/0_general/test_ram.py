@@ -74,3 +74,111 @@ def test_ram_state_reset():
     assert np.array_equal(
         initial_ram, reset_ram), "RAM state should be reset to initial values."
     env.close()
+
+
+def test_hero_walls():
+    """
+    Test that the H.E.R.O. walls come from the table of the current screen, and are only rebuilt when it changes.
+    """
+    from ocatari.ram import hero
+    ram = np.zeros(128, dtype=np.uint8)
+    objects_map, hero.walls_screen = {}, None
+    ram[117], ram[28] = 4, 1
+    hero.add_walls_to_object_list(ram, objects_map)
+    assert [o.xywh for o in objects_map.values()] == list(hero.LAVA_WALLS[4, 1] + hero.WALLS[4, 1])
+    assert all(isinstance(objects_map[f"lava wall {i}"], hero.LavaWall) for i in range(len(hero.LAVA_WALLS[4, 1])))
+    walls = list(objects_map.values())
+    hero.add_walls_to_object_list(ram, objects_map)
+    assert list(objects_map.values()) == walls
+    ram[28] = 0
+    hero.add_walls_to_object_list(ram, objects_map)
+    assert [o.xywh for o in objects_map.values()] == list(hero.WALLS[4, 0])
+    assert all(type(o) is hero.Wall for o in objects_map.values())
+    assert len(hero.WALLS) == 256
+
+
+def test_montezuma_room_layout():
+    """
+    Test that the static objects of a Montezuma's Revenge room are placed when entering it, and kept while in it.
+    """
+    from ocatari.ram import montezumarevenge as mr
+    ram = np.zeros(128, dtype=np.uint8)
+    ram[3] = 1
+    objects = mr._init_objects_ram(hud=False)
+    mr._detect_objects_ram(objects, ram, hud=False)
+    walls = objects[25:29]
+    assert [o.xywh for o in walls] == [box for slot, cls, box, *_ in mr.ROOM_LAYOUTS[1] if cls is mr.Wall]
+    mr._detect_objects_ram(objects, ram, hud=False)
+    assert all(a is b for a, b in zip(objects[25:29], walls))
+    # new slots in the same room
+    objects = mr._init_objects_ram(hud=False)
+    mr._detect_objects_ram(objects, ram, hud=False)
+    assert [o.xywh for o in objects[25:29]] == [o.xywh for o in walls]
+    ram[3] = 16  # dark without the torch
+    mr._detect_objects_ram(objects, ram, hud=False)
+    assert not any(objects[23:53])
+    ram[65] = 128
+    mr._detect_objects_ram(objects, ram, hud=False)
+    assert objects[38].xywh == (0, 93, 160, 1)
+
+
+def test_montezuma_lit_rooms():
+    """
+    Test the skull of room 18 and that the objects of room 22 are kept while in it.
+    """
+    from ocatari.ram import montezumarevenge as mr
+    ram = np.zeros(128, dtype=np.uint8)
+    ram[3], ram[65] = 18, 128
+    ram[76], ram[46], ram[47] = 32, 200, 81
+    objects = mr._init_objects_ram(hud=False)
+    mr._detect_objects_ram(objects, ram, hud=False)
+    assert type(objects[8]) is mr.Skull and objects[8].xy == (80, 53)
+    assert objects[32].xywh == (0, 94, 36, 1) and objects[33].xywh == (124, 94, 36, 1)
+    ram[3], ram[49], ram[44], ram[45] = 22, 2, 21, 240
+    for _ in range(2):  # the items are placed from the frame after entering the room
+        mr._detect_objects_ram(objects, ram, hud=False)
+    sword, ladder = objects[3], objects[29]
+    assert type(sword) is mr.Sword and type(ladder) is mr.Ladder and type(objects[39]) is mr.Disappearing_Platform
+    mr._detect_objects_ram(objects, ram, hud=False)
+    assert objects[3] is sword and objects[29] is ladder
+
+
+def test_montezuma_room_objects():
+    """
+    Test the beams of room 0, the rope and the disappearing platforms of room 8 and the wall of room 20.
+    """
+    from ocatari.ram import montezumarevenge as mr
+    ram = np.zeros(128, dtype=np.uint8)
+    objects = mr._init_objects_ram(hud=False)
+    mr._detect_objects_ram(objects, ram, hud=False)
+    # the beams are detected from the frame entering the room
+    assert all(type(o) is mr.Beam for o in objects[15:21])
+    ram[3] = 8
+    mr._detect_objects_ram(objects, ram, hud=False)
+    assert objects[23].xywh == (80, 96, 1, 51)
+    assert all(type(o) is mr.Disappearing_Platform for o in objects[39:51]) and not objects[51]
+    ram[34] = 144
+    mr._detect_objects_ram(objects, ram, hud=False)
+    assert not any(objects[39:51])
+    assert objects[36].xywh == (112, 93, 48, 3) and objects[37].xywh == (4, 173, 152, 1)
+    ram[3], ram[65] = 20, 128
+    mr._detect_objects_ram(objects, ram, hud=False)
+    assert objects[25].xywh == (156, 52, 3, 42) and not objects[29]
+
+
+def test_pitfall_scenes():
+    """
+    Test that the static objects of a Pitfall scene are built when entering it, and reused while in it.
+    """
+    from ocatari.ram import pitfall
+    ram = np.zeros(128, dtype=np.uint8)
+    ram[20] = 1
+    objects = pitfall._init_objects_ram()
+    pitfall._detect_objects_ram(objects, ram)
+    pits = objects[7:9]
+    assert [type(o) for o in pits] == [pitfall.Pit, pitfall.Pit] and objects[19].xywh == (8, 180, 152, 1)
+    pitfall._detect_objects_ram(objects, ram)
+    assert objects[7] is pits[0] and objects[8] is pits[1]
+    ram[20] = 3
+    pitfall._detect_objects_ram(objects, ram)
+    assert objects[7] is None and objects[13].xy == (48, 120) and objects[21].xywh == (112, 125, 48, 8)
@@ -0,0 +1,51 @@
+import pytest
+from ocatari.core import OCAtari
+
+
+def _replay(env, snapshot, sequences):
+    frames = []
+    for actions in sequences:
+        env.restore(snapshot)
+        for action in actions:
+            env.step(action)
+            frames.append(([repr(o) for o in env.objects], [
+                          (o.dx, o.dy) for o in env.objects if o]))
+    return frames
+
+
+@pytest.mark.parametrize("env_name", ["ALE/Pong-v5", "ALE/ChopperCommand-v5",
+                                      "ALE/Hero-v5"])
+def test_cached_extraction_matches_detector(env_name):
+    """
+    Test that replaying rollouts from a snapshot with the RAM cache gives the objects and velocities of the detector.
+    """
+    env = OCAtari(env_name, mode="ram", obs_mode="ori")
+    env.reset(seed=0)
+    for _ in range(50):
+        env.step(env.action_space.sample())
+    snapshot = env.snapshot(stacks=False)
+    sequences = [[env.action_space.sample() for _ in range(30)]
+                 for _ in range(4)]
+    reference = _replay(env, snapshot, sequences)
+    env.enable_ram_cache()
+    for _ in range(3):
+        assert _replay(env, snapshot, sequences) == reference
+    stats = env.ram_cache_stats()
+    assert stats["hits"] > 0 and stats["hits"] + \
+        stats["misses"] == 3 * len(reference)
+    env.close()
+
+
+def test_cache_bounded_and_disabled():
+    env = OCAtari("ALE/Pong-v5", mode="ram", obs_mode="ori")
+    env.enable_ram_cache(maxsize=8)
+    env.reset(seed=0)
+    for _ in range(100):
+        env.step(env.action_space.sample())
+    stats = env.ram_cache_stats()
+    assert stats["size"] <= 8 and stats["misses"] > 0
+    env.disable_ram_cache()
+    assert env.ram_cache_stats() is None
+    vision = OCAtari("ALE/Pong-v5", mode="vision", obs_mode="ori")
+    with pytest.raises(ValueError):
+        vision.enable_ram_cache()
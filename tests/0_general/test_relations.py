@@ -0,0 +1,60 @@
+import pytest
+import numpy as np
+from ocatari.core import OCAtari
+from ocatari.object_table import stack_tables
+from ocatari.relations import iou_matrix, overlap_matrix, distance_matrix, nearest_neighbours, object_rows
+
+
+@pytest.mark.parametrize("env_name",
+                         ["ALE/Seaquest-v5", "ALE/SpaceInvaders-v5"])
+@pytest.mark.parametrize("mode", ["ram", "vision"])
+def test_relations_match_pairwise_methods(env_name, mode):
+    """
+    Test that the relation matrices of the visible objects match the pairwise methods of the objects.
+    """
+    env = OCAtari(env_name, mode=mode, hud=True, obs_mode="ori")
+    env.reset(seed=0)
+    env.action_space.seed(0)
+    for _ in range(60):
+        env.step(env.action_space.sample())
+        objects = [o for o in env.objects if o]
+        iou, dist = iou_matrix(objects), distance_matrix(objects)
+        for i, o in enumerate(objects):
+            for j, other in enumerate(objects):
+                assert iou[i, j] == pytest.approx(o.iou(other))
+                assert dist[i, j] == pytest.approx(o.manathan_distance(other))
+            others = objects[:i] + objects[i + 1:]
+            if others:
+                closest = o.closest_object(others)[1]
+                idx, d = nearest_neighbours(objects)
+                assert d[i] == pytest.approx(o.manathan_distance(closest))
+                assert objects[idx[i]] is not o
+        assert np.array_equal(overlap_matrix(objects), iou > 0)
+    env.close()
+
+
+def test_relations_batch_and_categories():
+    """
+    Test the relations of stacked tables (batch dimension), of category subsets and of the empty slots.
+    """
+    envs = [OCAtari("ALE/Seaquest-v5", mode="ram", hud=True) for _ in range(2)]
+    for seed, env in enumerate(envs):
+        env.reset(seed=seed)
+        env.action_space.seed(seed)
+        for _ in range(100):
+            env.step(env.action_space.sample())
+    tables = stack_tables([env.object_table for env in envs])
+    batched = iou_matrix(tables)
+    idx, _ = nearest_neighbours(tables, metric="euclidean")
+    for i, env in enumerate(envs):
+        assert np.array_equal(batched[i], iou_matrix(env.objects))
+        nearest = nearest_neighbours(env.objects, metric="euclidean")[0]
+        assert np.array_equal(idx[i], nearest)
+    table = envs[0].object_table
+    players = object_rows(table, ["Player"])
+    assert len(players) == 1 and players["visible"].all()
+    assert distance_matrix(players, table).shape == (1, len(table))
+    empty = ~table.visible
+    assert (iou_matrix(table)[empty] == 0).all()
+    assert np.isinf(distance_matrix(table)[empty]).all()
+    assert (nearest_neighbours(table)[0][empty] == -1).all()
@@ -0,0 +1,74 @@
+import pytest
+import numpy as np
+from ocatari.core import OCAtari
+from ocatari.rollouts import RolloutPool
+
+
+def _sequential(env, snapshot, action_sequences):
+    rewards, states = [], []
+    for actions in action_sequences:
+        env.restore(snapshot)
+        rewards.append([])
+        states.append([])
+        for action in actions:
+            _, reward, *_ = env.step(action)
+            rewards[-1].append(reward)
+            states[-1].append(env.ns_state)
+    return np.array(rewards), np.array(states, dtype=np.float32)
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_rollouts_match_sequential_steps(num_workers):
+    """
+    Test that the pooled rollouts give the rewards and states of stepping the environment from the snapshot.
+    """
+    env = OCAtari("ALE/Pong-v5", mode="ram")
+    env.reset(seed=0)
+    for _ in range(60):
+        env.step(env.action_space.sample())
+    snapshot = env.snapshot(stacks=False)
+    rng = np.random.default_rng(0)
+    action_sequences = rng.integers(env.action_space.n, size=(5, 20))
+    with RolloutPool("ALE/Pong-v5", num_workers=num_workers, mode="ram") as pool:
+        rewards, states, dones = pool.rollout(snapshot, action_sequences)
+        assert rewards.shape == (5, 20) and dones.shape == (5, 20)
+        assert not dones.any()
+        expected_rewards, expected_states = _sequential(
+            env, snapshot, action_sequences)
+        assert np.array_equal(rewards, expected_rewards)
+        assert np.array_equal(states, expected_states)
+        # the snapshot is left untouched, the same rollouts can be replayed
+        replay = pool.rollout(snapshot, action_sequences)[1]
+        assert np.array_equal(replay, states)
+    env.close()
+
+
+def test_rollout_pool_reports_worker_errors():
+    with pytest.raises(RuntimeError, match="Rollout worker error"):
+        RolloutPool("ALE/NotAGame-v5", num_workers=1)
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_rollouts_sticky_actions(num_workers):
+    """
+    Test that the rollouts restore the repeated action of the sticky actions with the snapshot,
+    whatever the environments played before.
+    """
+    env = OCAtari("ALE/Breakout-v5", mode="ram", exact_snapshots=True,
+                  repeat_action_probability=0.9)
+    env.reset(seed=0)
+    for action in [3] * 40 + [2] * 3:
+        env.step(action)
+    snapshot = env.snapshot(stacks=False)
+    rng = np.random.default_rng(0)
+    action_sequences = rng.integers(env.action_space.n, size=(4, 10))
+    with RolloutPool("ALE/Breakout-v5", num_workers=num_workers, mode="ram",
+                     exact_snapshots=True,
+                     repeat_action_probability=0.9) as pool:
+        _, states, _ = pool.rollout(snapshot, action_sequences)
+        _, reversed_states, _ = pool.rollout(snapshot,
+                                             action_sequences[::-1])
+        assert np.array_equal(reversed_states, states[::-1])
+        assert np.array_equal(_sequential(env, snapshot, action_sequences)[1],
+                              states)
+    env.close()
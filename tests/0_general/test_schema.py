@@ -0,0 +1,111 @@
+import pytest
+from ocatari.core import OCAtari
+from ocatari.ram.game_objects import GameObject, NoObject, ValueObject
+from ocatari.ram.skiing import Player as SkiingPlayer
+from ocatari.schema import object_schema, export_objects, ns_feature_names
+from ocatari.vision import game_objects as vision
+
+
+def _dir_properties(obj):
+    # The former dir() based GameObject.properties
+    ignore = ["properties", "GET_COLOR", "GET_WH", "xy", "wh", "prev_xy",
+              "h_coords", "xywh"]
+    return sorted(p for p in dir(obj)
+                  if p not in ignore and not p.startswith("_")
+                  and not callable(getattr(obj, p)))
+
+
+@pytest.mark.parametrize("env_name", ["ALE/Pong-v5", "ALE/Seaquest-v5",
+                                      "ALE/Berzerk-v5", "ALE/Pacman-v5",
+                                      "ALE/SpaceInvaders-v5",
+                                      "ALE/FishingDerby-v5"])
+@pytest.mark.parametrize("mode", ["ram", "vision"])
+def test_schema_properties(env_name, mode):
+    """
+    Test that the schema properties of the detected objects are the ones found by introspecting them,
+    including the attributes the detectors set after the schemas are computed from the initial objects.
+    """
+    env = OCAtari(env_name, mode=mode, hud=True, obs_mode="ori")
+    for obj in env.objects:
+        if obj is not None:
+            object_schema(obj)
+    env.reset(seed=0)
+    env.action_space.seed(0)
+    for _ in range(300):
+        env.step(env.action_space.sample())
+        for obj in env.objects:
+            if obj is not None:
+                assert obj.properties == _dir_properties(obj)
+    env.close()
+
+
+def test_schema_cached_per_class():
+    """
+    Test that the schema is computed once per class, and its values and ns names.
+    """
+    score = ValueObject()
+    score.value = 12
+    schema = object_schema(score)
+    assert object_schema(ValueObject()) is schema
+    assert schema.has_value and not object_schema(GameObject()).has_value
+    assert schema.as_dict(score)["value"] == 12
+    assert schema.ns_names(2) == ("POSITION_0", "POSITION_1")
+    skiing_names = ("POSITION_0", "POSITION_1", "ORIENTATION")
+    assert object_schema(SkiingPlayer()).ns_names(3) == skiing_names
+    assert object_schema(vision.GameObject(0, 0, 1,
+                                           1)).ns_names(2) == ("x", "y")
+    assert ns_feature_names(["POSITION"], None, 3) == ("ns_0", "ns_1", "ns_2")
+
+
+def test_schema_from_class():
+    """
+    Test that the schema is computed from the class, whatever its first object: the attributes annotated or set
+    by the methods of the class are properties, the ones set on an object only are not.
+    """
+    class Fish(GameObject):
+        hooked: bool
+
+        def __init__(self):
+            super().__init__()
+            self.caught = False
+
+        def hook(self):
+            self.hooked = True
+
+    fish = Fish()
+    fish.extra = 1
+    properties = object_schema(fish).properties
+    assert {"caught", "hooked", "x", "rgb"} <= set(properties)
+    assert "extra" not in properties
+
+
+def test_export_objects():
+    """
+    Test that the exported rows are grouped by category, with the properties of the schemas as columns.
+    """
+    obj = GameObject()
+    obj.xywh = 3, 4, 5, 6
+    tables = export_objects([obj, None, NoObject(), obj])
+    assert set(tables) == {"GameObject", "NoObject"}
+    columns = object_schema(obj).properties
+    assert len(tables["GameObject"]) == 2
+    row = dict(zip(columns, tables["GameObject"][0]))
+    assert (row["x"], row["y"], row["w"], row["h"]) == (3, 4, 5, 6)
+    export_objects([obj], tables)
+    assert len(tables["GameObject"]) == 3
+
+
+def test_ns_feature_names():
+    """
+    Test that the feature names match the neurosymbolic state, including the history features.
+    """
+    env = OCAtari("ALE/Skiing-v5", mode="ram", obs_mode="obj")
+    env.reset(seed=0)
+    names = env.ns_feature_names
+    assert len(names) == len(env.ns_state)
+    assert names[:3] == ["Player_0_POSITION_0",
+                         "Player_0_POSITION_1", "Player_0_ORIENTATION"]
+    env.enable_history(4, obs_features=True)
+    assert len(env.ns_feature_names) == len(env.ns_state)
+    assert env.ns_feature_names[-1].endswith("_svy")
+    env.close()
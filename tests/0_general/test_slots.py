@@ -0,0 +1,90 @@
+import pytest
+from ocatari.core import OCAtari
+from ocatari.ram.game_objects import GameObject, NoObject, ObjectSlots, spawn_object, ensure_object, \
+    clear_slot, reset_slots
+
+
+class _Enemy(GameObject):
+    def __init__(self):
+        super().__init__()
+        self.wh = 8, 4
+        self.rgb = [1, 2, 3]
+
+
+def test_slots_reuse_their_objects():
+    """
+    Test that a pooled slot reuses its object of a given class, reinitialized, and that reset restores the initial objects.
+    """
+    objects = ObjectSlots([_Enemy(), NoObject()])
+    enemy, empty = objects
+    enemy.xy = 10, 20
+    enemy.rgb.append(4)
+    clear_slot(objects, 0)
+    assert type(objects[0]) is NoObject
+    new = spawn_object(objects, 0, _Enemy)
+    assert objects[0] is new and new.xy == (0, 0) and new.rgb == [
+        1, 2, 3] and new.prev_xy == (0, 0)
+    assert spawn_object(objects, 0, _Enemy) is new
+    assert ensure_object(objects, 0, _Enemy) is new
+    clear_slot(objects, -1)
+    assert objects[-1] is empty
+    spawn_object(objects, -1, _Enemy)
+    objects.append(_Enemy())
+    assert reset_slots(objects)
+    assert len(objects) == 2
+    assert type(objects[0]) is _Enemy and type(objects[1]) is NoObject
+    assert objects[0].xy == (0, 0) and objects[0].rgb == [1, 2, 3]
+
+
+def test_plain_lists_get_new_objects():
+    """
+    Test that the helpers allocate new objects for plain lists, which are not reset in place.
+    """
+    objects = [_Enemy(), NoObject()]
+    enemy = objects[0]
+    assert spawn_object(objects, 0, _Enemy) is not enemy
+    assert not reset_slots(objects)
+
+
+POOLED_ENVS = ["ALE/Seaquest-v5", "ALE/Breakout-v5", "ALE/SpaceInvaders-v5",
+               "ALE/Krull-v5", "ALE/Alien-v5", "ALE/CrazyClimber-v5",
+               "ALE/YarsRevenge-v5"]
+
+
+@pytest.mark.parametrize("env_name", POOLED_ENVS)
+def test_slots_keep_their_objects(env_name):
+    """
+    Test that the detectors using the pool keep one object per slot and class, across respawns and resets.
+    """
+    env = OCAtari(env_name, mode="ram", hud=True, obs_mode="ori")
+    env.reset(seed=0)
+    env.action_space.seed(0)
+    owners = {}
+    respawned = 0
+    for _ in range(300):
+        present = [bool(o) for o in env.objects]
+        _, _, terminated, truncated, _ = env.step(env.action_space.sample())
+        if terminated or truncated:
+            env.reset()
+        for idx, obj in enumerate(env.objects):
+            if obj:
+                owner = owners.setdefault((idx, type(obj)), obj)
+                assert owner is obj, f"slot {idx} got a new {type(obj).__name__}"
+                respawned += idx < len(present) and not present[idx]
+    assert respawned
+    env.close()
+
+
+@pytest.mark.parametrize("env_name", POOLED_ENVS + ["ALE/Boxing-v5"])
+def test_reset_in_place_matches_new_objects(env_name):
+    """
+    Test that the objects after a reset are the ones of a new environment.
+    """
+    env = OCAtari(env_name, mode="ram", hud=True, obs_mode="ori")
+    env.reset(seed=0)
+    initial = [repr(o) for o in env.objects]
+    for _ in range(300):
+        env.step(env.action_space.sample())
+    env.reset(seed=0)
+    assert [repr(o) for o in env.objects] == initial
+    env.close()
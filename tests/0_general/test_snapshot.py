@@ -0,0 +1,136 @@
+import pytest
+import numpy as np
+import gymnasium as gym
+from ocatari.core import OCAtari
+from ocatari.buffers import FrameStack
+
+
+def _rollout(env, actions):
+    steps = []
+    for action in actions:
+        obs, reward, *_ = env.step(action)
+        steps.append((obs, reward, [repr(o) for o in env.objects],
+                      [(o.dx, o.dy) for o in env.objects if o]))
+    return steps
+
+
+@pytest.mark.parametrize("env_name, mode, obs_mode", [
+    ("ALE/Pong-v5", "ram", "obj"), ("ALE/Atlantis-v5", "ram", "obj"),
+    ("ALE/Centipede-v5", "ram", "ori"), ("ALE/Freeway-v5", "vision", "obj")])
+def test_snapshot_restore(env_name, mode, obs_mode):
+    """
+    Test that restoring a snapshot (several times) replays the same observations, objects and velocities.
+    """
+    env = OCAtari(env_name, mode=mode, obs_mode=obs_mode,
+                  create_buffer_stacks=["dqn"])
+    env.reset(seed=0)
+    env.action_space.seed(0)
+    for _ in range(100):
+        env.step(env.action_space.sample())
+    snapshot = env.snapshot()
+    actions = [env.action_space.sample() for _ in range(30)]
+    reference = _rollout(env, actions)
+    for _ in range(2):
+        env.restore(snapshot)
+        for (obs, reward, objects, velocities), ref in zip(
+                _rollout(env, actions), reference):
+            assert np.array_equal(obs, ref[0])
+            assert reward == ref[1] and objects == ref[2] and velocities == ref[3]
+    env.close()
+
+
+def test_snapshot_sticky_actions():
+    """
+    Test that a restored snapshot does not depend on the actions played since it was taken,
+    the action repeated by the sticky actions being restored with the emulator state.
+    """
+    env = OCAtari("ALE/Breakout-v5", mode="ram", obs_mode="obj",
+                  exact_snapshots=True, repeat_action_probability=0.9)
+    env.reset(seed=0)
+    for _ in range(40):
+        env.step(3)  # LEFT, the paddle is still moving when the snapshot is taken
+    for _ in range(3):
+        env.step(2)  # RIGHT
+    snapshot = env.snapshot()
+    replays = []
+    for action in (3, 0, 2):
+        for _ in range(30):
+            env.step(action)
+        env.restore(snapshot)
+        replays.append([env.step(0)[0].copy() for _ in range(6)])
+    for replay in replays[1:]:
+        assert all(np.array_equal(a, b) for a, b in zip(replay, replays[0]))
+    env.close()
+
+
+def test_sticky_actions_seeded():
+    """
+    Test that the sticky actions applied by OCAtari are seeded by the reset.
+    """
+    env = OCAtari("ALE/Breakout-v5", mode="ram", obs_mode="obj",
+                  exact_snapshots=True)
+    assert env._sticky is not None and env._sticky.repeat_action_probability == 0.25
+    assert env._ale.getFloat("repeat_action_probability") == 0.
+    runs = []
+    for _ in range(2):
+        env.reset(seed=3)
+        runs.append([env.step(a % 4)[0].copy() for a in range(60)])
+    assert all(np.array_equal(a, b) for a, b in zip(*runs))
+    assert OCAtari("ALE/Breakout-v5", mode="ram", exact_snapshots=True,
+                   repeat_action_probability=0.)._sticky is None
+    env.close()
+
+
+def test_default_sticky_actions():
+    """
+    Test that, without exact snapshots, the sticky actions are the ones of ALE: the seeded rollouts are
+    the ones of the gymnasium environment.
+    """
+    env = OCAtari("ALE/Breakout-v5", mode="ram", obs_mode="ori")
+    assert env._sticky is None
+    assert env._ale.getFloat("repeat_action_probability") == 0.25
+    ale_env = gym.make("ALE/Breakout-v5", obs_type="ram")
+    for e in (env, ale_env):
+        e.reset(seed=3)
+    for a in range(200):
+        env.step(a % 4)
+        obs, *_ = ale_env.step(a % 4)
+        assert np.array_equal(env.get_ram(), obs)
+    ale_env.close()
+    env.close()
+
+
+@pytest.mark.parametrize("env_name", ["Pong", "Breakout"])
+def test_bare_game_name(env_name):
+    """
+    Test that the environments made from a bare game name (resolved by gymnasium to the v4 environments,
+    without sticky actions) can use the sticky actions of OCAtari.
+    """
+    env = OCAtari(env_name, mode="ram", exact_snapshots=True)
+    assert env._sticky is None
+    env.reset(seed=0)
+    env.step(0)
+    env.close()
+    env = OCAtari(env_name, mode="ram", exact_snapshots=True,
+                  repeat_action_probability=0.25)
+    assert env._sticky.repeat_action_probability == 0.25
+    env.close()
+
+
+def test_frame_stack_restore():
+    """
+    Test that a frame stack restored from a view continues as the original one.
+    """
+    stack = FrameStack(4, np.int16, (2,))
+    for i in range(6):
+        stack.append([i, i])
+    saved = stack.view().copy()
+    other = FrameStack(4, np.int16, (2,))
+    other.restore(saved)
+    for stk in (stack, other):
+        stk.append([9, 9])
+    assert np.array_equal(stack.view(), other.view())
+    partial = FrameStack(4, np.int16)
+    partial.restore(saved[:2])
+    partial.append([9, 9])
+    assert np.array_equal(partial.view(), [[2, 2], [3, 3], [9, 9]])
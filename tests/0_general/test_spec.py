@@ -0,0 +1,123 @@
+import pytest
+import numpy as np
+from ocatari.batch import extract_batch, extract_frames
+from ocatari.extraction import ExtractionPlan
+from ocatari.ram.game_objects import GameObject, NoObject, ObjectSlots
+from ocatari.ram.spec import RamSpec, Slot, Ram, Table, choose, where
+
+SPEC_GAMES = ["DoubleDunk", "Bowling"]
+
+
+class Thing(GameObject):
+    __slots__ = ()
+
+
+class Score(GameObject):
+    __slots__ = ("value",)
+
+    def __init__(self):
+        super().__init__()
+        self._xy = 10, 5
+        self.value = 0
+
+
+def _spec():
+    return RamSpec([
+        Slot(Thing, xy=(Ram(3) - 10, 200 - 2 * Ram(4)),
+             wh=(4, where(Ram(5) > 100, 8, 4))),
+        Slot(Thing, present=(Ram(6) != 0) & ~(Ram(7) == 3),
+             xy=(Ram(6), Ram(7) >> 1)),
+        Slot(Thing).when(Ram(8) < 128,
+                         xy=choose((Ram(9) == 0, (1, 2)),
+                                   (Ram(9) < 10, (3, 4)), default=(5, 6))),
+        Slot(Score, hud=True,
+             value=Table(lambda v: v % 16)(Ram(10))).when(Ram(11) > 0, x=40),
+    ])
+
+
+def _objects(hud):
+    return ObjectSlots([Thing(), NoObject(), Thing()] +
+                       ([Score()] if hud else []))
+
+
+def _random_rams(n=500, high=256, seed=0):
+    return np.random.default_rng(seed).integers(
+        0, high, (n, 128), dtype=np.uint8)
+
+
+def test_detector():
+    """
+    Test the compiled per-frame detector on a RAM state.
+    """
+    spec = _spec()
+    ram = np.zeros(128, dtype=np.uint8)
+    ram[3:12] = 30, 20, 150, 7, 9, 200, 5, 0x2b, 0
+    objects = _objects(True)
+    spec.detector(objects, ram, hud=True)
+    assert objects[0].xy == (20, 160) and objects[0].wh == (4, 8)
+    assert objects[1].__class__ is Thing and objects[1].xy == (7, 4)
+    assert objects[2].xy == (0, 0)  # not updated, ram[8] >= 128
+    assert objects[3].xy == (10, 5) and objects[3].value == 11
+    ram[6], ram[8], ram[11] = 0, 0, 1
+    spec.detector(objects, ram, hud=True)
+    assert objects[1].__class__ is NoObject
+    assert objects[2].xy == (3, 4)
+    assert objects[3].xy == (40, 5)
+    with pytest.raises(TypeError):
+        Slot(Thing, present=Ram(1) > 0 and Ram(2) > 0)
+
+
+def test_dependencies():
+    spec = _spec()
+    assert spec.dependencies() == {0: (3, 4, 5), 1: (6, 7), 2: (8, 9)}
+    assert spec.addresses(hud=True) == (3, 4, 5, 6, 7, 8, 9, 10, 11)
+    with pytest.raises(ValueError):
+        Ram(128)
+
+
+@pytest.mark.parametrize("hud", [False, True])
+def test_batch(hud):
+    """
+    Test the batched kernel frame for frame against the compiled detector.
+    """
+    spec = _spec()
+    for rams in (_random_rams(), _random_rams(high=4)):
+        objects = _objects(hud)
+        xy, visible = spec.batch(rams.astype(np.int64), _objects(hud), hud)
+        for t, ram in enumerate(rams):
+            spec.detector(objects, ram, hud)
+            assert visible[t].tolist() == [bool(o) for o in objects]
+            assert [tuple(p) for p in xy[t][visible[t]]] == [
+                o.xy for o in objects if o]
+
+
+@pytest.mark.parametrize("game", SPEC_GAMES)
+@pytest.mark.parametrize("hud", [False, True])
+def test_spec_games(game, hud):
+    """
+    Test that the games described by a spec use its detector and batched kernel.
+    """
+    plan = ExtractionPlan(game, hud)
+    assert plan.detector is plan.module.RAM_SPEC.detector
+    slots = plan.module.RAM_SPEC.game_slots(hud)
+    assert [s.cls for s in slots] == [type(o) for o in plan.init_objects()]
+    for rams in (_random_rams(), _random_rams(high=4)):
+        states, visible = extract_batch(game, rams, hud)
+        expected_states, expected_visible = extract_frames(game, rams, hud)
+        assert np.array_equal(states, expected_states)
+        assert np.array_equal(visible, expected_visible)
+
+
+def test_spec_cache():
+    """
+    Test that the RAM cache of a spec detector is keyed on the addresses it depends on.
+    """
+    plan = ExtractionPlan("Bowling", False)
+    plan.enable_cache()
+    assert plan.cache.addresses.tolist() == list(plan.module.RAM_SPEC.addresses())
+    objects = plan.init_objects()
+    ram = _random_rams(1)[0]
+    for value in range(4):
+        ram[0] = value  # not read by the detector
+        plan(objects, ram)
+    assert plan.cache.stats()["hits"] == 2
@@ -0,0 +1,113 @@
+import pytest
+import numpy as np
+from ocatari.core import OCAtari
+from ocatari.vector import OCAtariVectorEnv, AsyncOCAtariVectorEnv
+
+
+@pytest.mark.parametrize("obs_mode, frame_shape",
+                         [("obj", (6,)), ("dqn", (84, 84))])
+def test_vector_shapes(obs_mode, frame_shape):
+    """
+    Test the batched observation, reward and termination shapes.
+    """
+    envs = OCAtariVectorEnv("ALE/Pong-v5", 3, mode="ram", obs_mode=obs_mode)
+    obs, infos = envs.reset(seed=0)
+    assert obs.shape == (3, 4) + frame_shape
+    assert obs.shape == envs.observation_space.shape
+    obs, rewards, terminations, truncations, infos = envs.step(
+        envs.action_space.sample())
+    assert obs.shape == (3, 4) + frame_shape
+    assert rewards.shape == terminations.shape == truncations.shape == (3,)
+    envs.close()
+
+
+def test_vector_matches_single_env():
+    """
+    Test that the vector environment produces the same object stacks as independent OCAtari environments.
+    """
+    envs = OCAtariVectorEnv("ALE/Pong-v5", 2, mode="ram",
+                            obs_mode="obj", repeat_action_probability=0.)
+    single = OCAtari("ALE/Pong-v5", mode="ram", obs_mode="obj",
+                     repeat_action_probability=0.)
+    obs, _ = envs.reset(seed=3)
+    sobs, _ = single.reset(seed=3)
+    assert np.array_equal(obs[0], sobs)
+    for t in range(50):
+        obs, *_ = envs.step(np.array([t % 6, 0]))
+        sobs, *_ = single.step(t % 6)
+        assert np.array_equal(obs[0], sobs)
+    envs.close()
+    single.close()
+
+
+def test_vector_autoreset():
+    """
+    Test that finished environments are automatically reset.
+    """
+    envs = OCAtariVectorEnv("ALE/Pong-v5", 2, mode="ram", obs_mode="obj",
+                            autoreset_mode="SameStep", max_episode_steps=10)
+    envs.reset(seed=0)
+    for _ in range(10):
+        obs, rewards, terminations, truncations, infos = envs.step(
+            envs.action_space.sample())
+    assert truncations.all()
+    assert "final_obs" in infos
+    assert infos["final_obs"][0].shape == (4, 6)
+    envs.close()
+
+
+@pytest.mark.parametrize("envs_per_worker", [1, 2])
+def test_async_vector_matches_sync(envs_per_worker):
+    """
+    Test that the subprocess vector environment produces the same observations and RAM as the sync one.
+    """
+    aenvs = AsyncOCAtariVectorEnv("ALE/Pong-v5", 3,
+                                  envs_per_worker=envs_per_worker, mode="ram",
+                                  obs_mode="obj", repeat_action_probability=0.)
+    envs = OCAtariVectorEnv("ALE/Pong-v5", 3, mode="ram",
+                            obs_mode="obj", repeat_action_probability=0.)
+    aobs, _ = aenvs.reset(seed=1)
+    obs, _ = envs.reset(seed=1)
+    assert np.array_equal(aobs, obs)
+    for t in range(20):
+        actions = np.array([t % 6, 1, 2])
+        aobs, arewards, *_ = aenvs.step(actions)
+        obs, rewards, *_ = envs.step(actions)
+        assert np.array_equal(aobs, obs)
+        assert np.array_equal(arewards, rewards)
+    assert np.array_equal(aenvs.rams[1], envs.envs[1].get_ram())
+    assert np.array_equal(aenvs.ns_states, obs[:, -1])
+    aenvs.close()
+    envs.close()
+
+
+@pytest.mark.parametrize("game", ["Atlantis", "Centipede", "ChopperCommand",
+                                  "Hero", "MontezumaRevenge", "Qbert",
+                                  "Riverraid"])
+def test_vector_module_state(game):
+    """
+    Test that the environments of a vector environment do not share the detection state of the game module,
+    each one detecting the objects of an environment stepped on its own.
+    """
+    actions = np.random.default_rng(0).integers(18, size=(150, 2))
+    references = []
+    for i in range(2):
+        single = OCAtari(f"ALE/{game}-v5", mode="ram", obs_mode="dqn",
+                         repeat_action_probability=0.)
+        single.reset(seed=i)
+        objects = [repr(single.objects)]
+        for a in actions[:, i]:
+            single.step(a % single.action_space.n)
+            objects.append(repr(single.objects))
+        references.append(objects)
+        single.close()
+    envs = OCAtariVectorEnv(f"ALE/{game}-v5", 2, mode="ram", obs_mode="dqn",
+                            repeat_action_probability=0.)
+    envs.reset(seed=[0, 1])
+    objects = [[repr(o) for o in envs.objects]]
+    for a in actions:
+        envs.step(a % envs.single_action_space.n)
+        objects.append([repr(o) for o in envs.objects])
+    for i in range(2):
+        assert [o[i] for o in objects] == references[i]
+    envs.close()